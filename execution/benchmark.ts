@@ -0,0 +1,474 @@
+/**
+ * 데이터 세탁소 처리량 벤치마크 (Benchmark Harness)
+ *
+ * test_data/의 실무형 카오스 파일을 1만/10만/100만 행으로 합성 확장한 뒤,
+ * 고정된 프롬프트/옵션 프리셋(심화 테스트 시나리오 A-1~A-8 포함)으로
+ * 파싱 → 프롬프트 컴파일 → 정제(테이블 경로) → 이슈 검사 → 변경 통계 → 내보내기 단계를 각각 측정합니다.
+ *
+ * 실행:
+ *   npm run bench                                               # 전체 (10000,100000,1000000행)
+ *   npm run bench -- --sizes 10000 --datasets tax,shopping --scenarios preset-basic,A-7
+ *   npm run bench:baseline                                      # 현재 결과를 기준값으로 저장
+ *
+ * 옵션:
+ *   --sizes        확장할 행 수 (쉼표 구분)
+ *   --datasets     데이터셋 id (marketing, shopping, real_estate, tax, large_complex)
+ *   --scenarios    시나리오 id (preset-basic, preset-full, column-auto, A-1 ~ A-8)
+ *   --stages       측정할 단계 (parse, compile, clean, issues, diff, export-csv, export-xlsx)
+ *   --repeat       단계별 반복 횟수 (최고 기록 사용, 기본: 100만 행 미만 3회 / 이상 1회)
+ *   --threshold    허용 처리량 하락 비율 (기본 0.2 = 20%), 넘으면 종료 코드 1
+ *   --baseline     기준값 JSON 경로 (기본 execution/benchmark_baseline.json, 없으면 종료 코드 1)
+ *   --out          이번 실행 결과 JSON 경로 (기본 .tmp/benchmark_result.json)
+ *   --update-baseline  비교 대신 이번 결과로 기준값을 덮어씀
+ *
+ * 메모리: 단계 시작 직전에 GC를 강제로 실행하고, 단계 종료 시점의 힙 증가량(heapMB)과
+ * 프로세스 최대 RSS(peakRssMB, 실행 전체의 최고치)를 기록합니다.
+ * 힙 증가량은 단계 중 GC가 돌면 실제 최고치보다 작게 나올 수 있으므로 같은 환경의 기준값과 비교하는 용도로만 사용합니다.
+ */
+import fs from 'fs';
+import path from 'path';
+import v8 from 'v8';
+import vm from 'vm';
+import os from 'os';
+import { performance } from 'perf_hooks';
+import Papa from 'papaparse';
+import * as XLSX from 'xlsx';
+import { DataRow, ProcessingOptions, ColumnSpecificOptions } from '../src/types';
+import { processTableTracked } from '../src/lib/core/processors';
+import { compileCleaningPlan, planCache } from '../src/lib/core/plan';
+import { detectTableIssues, diffCountsFromChanges, finalizeDiffStats, recommendColumnFormat } from '../src/lib/core/analyzers';
+import { ChangeSet, forEachChange } from '../src/lib/core/changes';
+import { DataTable, tableFromRows, getTableRows } from '../src/lib/core/table';
+import { sampleTable } from '../src/lib/core/sampling';
+
+const ROOT = path.resolve(__dirname, '..');
+const TEST_DATA = path.join(ROOT, 'test_data');
+const SCALE_SEED = 20240126;       // 합성 확장 난수 시드 (같은 입력이면 항상 같은 데이터)
+const COMPILE_REPEAT = 200;        // 컴파일 단계는 행 수와 무관하므로 여러 번 반복해 초당 컴파일 수로 측정
+const WARMUP_ROUNDS = 5;           // 데이터셋마다 원본 행으로 미리 실행하는 횟수 (측정 제외)
+const MIN_COMPARE_MS = 5;          // 이보다 짧게 끝난 단계는 타이머 오차가 커서 회귀 판정에서 제외
+
+const defaultOptions: ProcessingOptions = {
+    removeWhitespace: false, formatMobile: false, formatGeneralPhone: false, formatDate: false, formatDateTime: false,
+    formatNumber: false, cleanEmail: false, formatZip: false, highlightChanges: false, cleanGarbage: false,
+    cleanAmount: false, cleanName: false, formatBizNum: false, formatCorpNum: false, formatUrl: false,
+    maskPersonalData: false, formatTrackingNum: false, cleanOrderId: false, formatTaxDate: false, formatAccountingNum: false,
+    cleanAreaUnit: false, cleanSnsId: false, formatHashtag: false, cleanCompanyName: false, removePosition: false,
+    extractDong: false, maskAccount: false, maskCard: false, maskName: false, maskEmail: false, maskAddress: false,
+    maskPhoneMid: false, categoryAge: false, truncateDate: false, restoreExponential: false, extractBuilding: false,
+    normalizeSKU: false, unifyUnit: false, standardizeCurrency: false, removeHtml: false, removeEmoji: false,
+    toUpperCase: false, toLowerCase: false, useAI: false, autoDetect: false
+};
+
+// 자주 쓰는 체크박스 조합
+const basicOptions: ProcessingOptions = {
+    ...defaultOptions,
+    removeWhitespace: true, formatMobile: true, formatGeneralPhone: true, formatDate: true, formatNumber: true,
+    cleanEmail: true, cleanGarbage: true, cleanAmount: true, autoDetect: true
+};
+
+// 대소문자 변환/AI를 제외한 모든 체크박스 (최악의 경우)
+const fullOptions: ProcessingOptions = Object.fromEntries(
+    Object.keys(defaultOptions).map(k => [k, !['toUpperCase', 'toLowerCase', 'useAI', 'formatDateTime'].includes(k)])
+) as unknown as ProcessingOptions;
+
+interface Dataset {
+    id: string;
+    file: string;
+}
+
+interface Scenario {
+    id: string;
+    prompt: string;
+    options: ProcessingOptions;
+    columnOptions?: 'auto';   // auto: 원본 데이터의 추천 포맷을 컬럼 옵션으로 사용
+}
+
+const DATASETS: Dataset[] = [
+    { id: 'marketing', file: 'marketing_chaos.csv' },
+    { id: 'shopping', file: 'shopping_chaos.csv' },
+    { id: 'real_estate', file: 'real_estate_chaos.csv' },
+    { id: 'tax', file: 'tax_chaos.csv' },
+    { id: 'large_complex', file: 'large_complex_data.xlsx' },
+];
+
+// directives/advanced_test_plan.md 심화 시나리오 + 옵션 프리셋
+const SCENARIOS: Scenario[] = [
+    { id: 'preset-basic', prompt: '', options: basicOptions },
+    { id: 'preset-full', prompt: '', options: fullOptions },
+    { id: 'column-auto', prompt: '', options: defaultOptions, columnOptions: 'auto' },
+    { id: 'A-1', prompt: '주소에서 구/군만 남겨줘', options: defaultOptions },
+    { id: 'A-2', prompt: '대괄호 [포함] 텍스트 제거하고 지워줘', options: defaultOptions },
+    { id: 'A-3', prompt: '연락처 컬럼 앞에 [VIP] 붙여줘', options: defaultOptions },
+    { id: 'A-4', prompt: '대문자로 바꾸고 뒤에 _FIXED 붙여', options: defaultOptions },
+    { id: 'A-5', prompt: "1000이 넘는 값은 'VIP'로 바꿔", options: defaultOptions },
+    { id: 'A-6', prompt: '이메일에서 도메인만 남겨줘', options: defaultOptions },
+    { id: 'A-7', prompt: '날짜를 yyyymmdd 붙여서 포맷으로', options: defaultOptions },
+    { id: 'A-8', prompt: '회사 이름에서 주식회사랑 (주) 싹다 지워', options: defaultOptions },
+];
+
+const STAGES = ['parse', 'compile', 'clean', 'issues', 'diff', 'export-csv', 'export-xlsx'] as const;
+type Stage = typeof STAGES[number];
+
+interface StageSample {
+    rows: number;          // 처리한 단위 수 (compile 단계는 컴파일 횟수)
+    ms: number;            // 반복 중 최고 기록
+    rowsPerSec: number;
+    heapMB: number;
+    peakRssMB: number;
+}
+
+interface BenchmarkFile {
+    version: 1;
+    createdAt: string;
+    environment: { node: string; platform: string; cpus: number; cpuModel: string };
+    results: Record<string, StageSample>;
+}
+
+interface BenchmarkArgs {
+    sizes: number[];
+    datasets: string[];
+    scenarios: string[];
+    stages: Stage[];
+    repeat: number | null;
+    threshold: number;
+    baseline: string;
+    out: string;
+    updateBaseline: boolean;
+}
+
+function parseArgs(argv: string[]): BenchmarkArgs {
+    const args: BenchmarkArgs = {
+        sizes: [10000, 100000, 1000000],
+        datasets: DATASETS.map(d => d.id),
+        scenarios: SCENARIOS.map(s => s.id),
+        stages: [...STAGES],
+        repeat: null,
+        threshold: 0.2,
+        baseline: path.join(ROOT, 'execution', 'benchmark_baseline.json'),
+        out: path.join(ROOT, '.tmp', 'benchmark_result.json'),
+        updateBaseline: false,
+    };
+    const list = (v: string) => v.split(',').map(s => s.trim()).filter(Boolean);
+    for (let i = 0; i < argv.length; i++) {
+        const flag = argv[i];
+        if (flag === '--update-baseline') { args.updateBaseline = true; continue; }
+        const value = argv[++i];
+        if (value === undefined) throw new Error(`${flag} 값이 없습니다.`);
+        switch (flag) {
+            case '--sizes': args.sizes = list(value).map(Number); break;
+            case '--datasets': args.datasets = list(value); break;
+            case '--scenarios': args.scenarios = list(value); break;
+            case '--stages': args.stages = list(value) as Stage[]; break;
+            case '--repeat': args.repeat = Number(value); break;
+            case '--threshold': args.threshold = Number(value); break;
+            case '--baseline': args.baseline = path.resolve(value); break;
+            case '--out': args.out = path.resolve(value); break;
+            default: throw new Error(`알 수 없는 옵션: ${flag}`);
+        }
+    }
+    const unknown = [
+        ...args.datasets.filter(id => !DATASETS.some(d => d.id === id)),
+        ...args.scenarios.filter(id => !SCENARIOS.some(s => s.id === id)),
+        ...args.stages.filter(s => !STAGES.includes(s)),
+        ...args.sizes.filter(n => !(n > 0)).map(String),
+    ];
+    if (unknown.length > 0) throw new Error(`알 수 없는 값: ${unknown.join(', ')}`);
+    return args;
+}
+
+// --- 측정 도구 ---
+
+v8.setFlagsFromString('--expose_gc');
+const forceGC = vm.runInNewContext('gc') as () => void;
+
+function peakRssMB(): number {
+    return process.resourceUsage().maxRSS / 1024; // KB -> MB
+}
+
+/**
+ * 단계를 repeat번 실행하고 가장 빠른 기록과 그때의 힙 증가량을 반환합니다.
+ * 각 실행 직전에 setup을 호출해 캐시 등 이전 실행의 영향을 지웁니다.
+ */
+function measure<T>(rows: number, repeat: number, fn: () => T, setup?: () => void): { result: T; sample: StageSample } {
+    let best: StageSample | null = null;
+    let result!: T;
+    for (let r = 0; r < repeat; r++) {
+        setup?.();
+        result = undefined as unknown as T; // 이전 결과를 먼저 해제
+        forceGC();
+        const heapBefore = process.memoryUsage().heapUsed;
+        const t0 = performance.now();
+        result = fn();
+        const ms = performance.now() - t0;
+        const heapMB = Math.max(0, process.memoryUsage().heapUsed - heapBefore) / 1048576;
+        if (!best || ms < best.ms) {
+            best = { rows, ms, rowsPerSec: rows / Math.max(ms / 1000, 1e-9), heapMB, peakRssMB: 0 };
+        }
+    }
+    (best as StageSample).peakRssMB = peakRssMB();
+    return { result, sample: best as StageSample };
+}
+
+// --- 합성 데이터 ---
+
+// 재현 가능한 32비트 난수 (mulberry32)
+function createRandom(seed: number): () => number {
+    let a = seed >>> 0;
+    return () => {
+        a = (a + 0x6D2B79F5) >>> 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * 셀 값의 숫자 하나를 무작위로 바꿔 형식(노이즈)은 유지하면서 고유값 분포만 넓힙니다.
+ * 같은 행을 그대로 반복하면 고유값 메모가 모두 적중해 실제보다 빠르게 측정되기 때문입니다.
+ */
+function perturb(value: DataRow[string], random: () => number): DataRow[string] {
+    if (typeof value === 'number') return Number.isInteger(value) ? value + Math.floor(random() * 10) : value;
+    if (typeof value !== 'string' || random() < 0.5) return value;
+    const digits: number[] = [];
+    for (let i = 0; i < value.length; i++) {
+        const c = value.charCodeAt(i);
+        if (c >= 48 && c <= 57) digits.push(i);
+    }
+    if (digits.length === 0) return value;
+    const at = digits[Math.floor(random() * digits.length)];
+    return value.slice(0, at) + Math.floor(random() * 10) + value.slice(at + 1);
+}
+
+/**
+ * 원본 행을 순환 반복해 size행으로 확장합니다. (첫 바퀴는 원본 그대로)
+ */
+function scaleRows(seed: DataRow[], size: number): DataRow[] {
+    const random = createRandom(SCALE_SEED);
+    const rows: DataRow[] = new Array(size);
+    for (let i = 0; i < size; i++) {
+        const src = seed[i % seed.length];
+        if (i < seed.length) {
+            rows[i] = { ...src };
+            continue;
+        }
+        const row: DataRow = {};
+        for (const key in src) row[key] = perturb(src[key], random);
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// parsers.ts의 parseFile과 같은 설정
+function parseCsvText(text: string): DataRow[] {
+    return Papa.parse<DataRow>(text, { header: true, skipEmptyLines: true }).data;
+}
+
+function parseXlsxBuffer(buffer: Buffer): DataRow[] {
+    const workbook = XLSX.read(buffer, { type: 'buffer' });
+    return XLSX.utils.sheet_to_json<DataRow>(workbook.Sheets[workbook.SheetNames[0]]);
+}
+
+// exporters.ts의 downloadData와 같은 직렬화 (파일 저장 대신 메모리 버퍼)
+function writeXlsxBuffer(rows: DataRow[]): Buffer {
+    const workbook = XLSX.utils.book_new();
+    XLSX.utils.book_append_sheet(workbook, XLSX.utils.json_to_sheet(rows), 'Sheet1');
+    return XLSX.write(workbook, { type: 'buffer', bookType: 'xlsx' });
+}
+
+function loadSeed(dataset: Dataset): DataRow[] {
+    const file = path.join(TEST_DATA, dataset.file);
+    return dataset.file.endsWith('.csv')
+        ? parseCsvText(fs.readFileSync(file, 'utf8'))
+        : parseXlsxBuffer(fs.readFileSync(file));
+}
+
+function autoColumnOptions(seed: DataRow[]): ColumnSpecificOptions {
+    const options: ColumnSpecificOptions = {};
+    // 화면과 같은 표본으로 추천
+    const sample = getTableRows(sampleTable(tableFromRows(seed)).table);
+    for (const key of Object.keys(seed[0] || {})) {
+        const format = recommendColumnFormat(sample, key);
+        if (format) options[key] = format;
+    }
+    return options;
+}
+
+// --- 실행 ---
+
+function resultKey(dataset: string, size: number, scenario: string, stage: Stage): string {
+    return `${dataset}/${size}/${scenario}/${stage}`;
+}
+
+function readBenchmarkFile(file: string): BenchmarkFile | null {
+    if (!fs.existsSync(file)) return null;
+    return JSON.parse(fs.readFileSync(file, 'utf8')) as BenchmarkFile;
+}
+
+function writeBenchmarkFile(file: string, results: Record<string, StageSample>) {
+    const cpus = os.cpus();
+    const payload: BenchmarkFile = {
+        version: 1,
+        createdAt: new Date().toISOString(),
+        environment: { node: process.version, platform: `${process.platform}-${process.arch}`, cpus: cpus.length, cpuModel: cpus[0]?.model || '' },
+        results,
+    };
+    fs.mkdirSync(path.dirname(file), { recursive: true });
+    fs.writeFileSync(file, JSON.stringify(payload, null, 2) + '\n');
+}
+
+function formatRate(n: number): string {
+    return n >= 1e6 ? `${(n / 1e6).toFixed(2)}M` : n >= 1e3 ? `${(n / 1e3).toFixed(1)}k` : n.toFixed(1);
+}
+
+function report(key: string, sample: StageSample, unit: string = 'rows/s') {
+    console.log(
+        `  ${key.padEnd(48)} ${sample.ms.toFixed(1).padStart(10)} ms  ${formatRate(sample.rowsPerSec).padStart(8)} ${unit}` +
+        `  heap +${sample.heapMB.toFixed(1)}MB  rss ${sample.peakRssMB.toFixed(0)}MB`
+    );
+}
+
+function runBenchmark(args: BenchmarkArgs): Record<string, StageSample> {
+    const results: Record<string, StageSample> = {};
+    const want = (stage: Stage) => args.stages.includes(stage);
+    const record = (key: string, sample: StageSample, unit?: string) => {
+        results[key] = sample;
+        report(key, sample, unit);
+    };
+
+    const scenarios = SCENARIOS.filter(s => args.scenarios.includes(s.id));
+    for (const dataset of DATASETS.filter(d => args.datasets.includes(d.id))) {
+        const seed = loadSeed(dataset);
+        const seedTable = tableFromRows(seed);
+        const headers = Object.keys(seed[0] || {});
+        const columnOptions = autoColumnOptions(seed);
+        console.log(`\n📂 ${dataset.file} (원본 ${seed.length}행, ${headers.length}개 컬럼)`);
+
+        // JIT 예열: 측정 순서(앞서 실행한 데이터셋/시나리오)에 따라 결과가 달라지지 않도록 원본으로 미리 실행
+        for (let i = 0; i < WARMUP_ROUNDS; i++) {
+            for (const scenario of scenarios) {
+                planCache.clear();
+                const { processedData } = processTableTracked(seedTable, scenario.prompt, scenario.options, [], scenario.columnOptions === 'auto' ? columnOptions : {});
+                detectTableIssues(processedData, {}, scenario.options);
+            }
+        }
+
+        for (const size of args.sizes) {
+            const repeat = args.repeat ?? (size >= 1000000 ? 1 : 3);
+            let data = scaleRows(seed, size);
+
+            // 1. 파싱: 확장 데이터를 원래 형식으로 직렬화해 두고(측정 제외) 파싱만 측정
+            if (want('parse')) {
+                const parsed = dataset.file.endsWith('.csv')
+                    ? (text => measure(size, repeat, () => parseCsvText(text)))(Papa.unparse(data))
+                    : (buffer => measure(size, repeat, () => parseXlsxBuffer(buffer)))(writeXlsxBuffer(data));
+                data = parsed.result; // 이후 단계는 실제 업로드와 같이 파싱된 값(타입 포함)을 사용
+                record(resultKey(dataset.id, size, '-', 'parse'), parsed.sample);
+            }
+            // 앱과 같이 업로드 시점에 컬럼 테이블로 인코딩 (측정 제외)
+            const table = tableFromRows(data);
+
+            for (const scenario of scenarios) {
+                const colOpts = scenario.columnOptions === 'auto' ? columnOptions : {};
+                const key = (stage: Stage) => resultKey(dataset.id, size, scenario.id, stage);
+
+                // 2. 프롬프트 컴파일 (캐시를 거치지 않는 순수 컴파일 비용)
+                if (want('compile')) {
+                    const { sample } = measure(COMPILE_REPEAT, repeat, () => {
+                        for (let i = 0; i < COMPILE_REPEAT; i++) compileCleaningPlan(scenario.prompt, headers, scenario.options, [], colOpts);
+                    });
+                    record(key('compile'), sample, 'plans/s');
+                }
+
+                // 3. 정제 (앱과 같은 테이블 경로, 변경 기록 포함, 매 반복마다 계획 캐시/고유값 메모를 비움)
+                const cleaned = measure(size, want('clean') ? repeat : 1,
+                    () => processTableTracked(table, scenario.prompt, scenario.options, [], colOpts),
+                    () => planCache.clear());
+                if (want('clean')) record(key('clean'), cleaned.sample);
+                const processedData: DataTable = cleaned.result.processedData;
+                const changes: ChangeSet = cleaned.result.changes;
+
+                // 4. 이슈 검사 (정제 결과 기준, 원본 이슈는 앱에서 캐시됨)
+                let issueCount = 0;
+                if (want('issues')) {
+                    const { result, sample } = measure(size, repeat, () => detectTableIssues(processedData, {}, scenario.options));
+                    issueCount = result.length;
+                    record(key('issues'), sample);
+                }
+
+                // 5. 변경 통계 + 하이라이트용 변경 셀 순회
+                if (want('diff')) {
+                    const { sample } = measure(size, repeat, () => {
+                        let visited = 0;
+                        forEachChange(changes, () => { visited++; });
+                        return { stats: finalizeDiffStats(diffCountsFromChanges(changes), 0, issueCount), visited };
+                    });
+                    record(key('diff'), sample);
+                }
+
+                // 6. 내보내기 (직렬화 라이브러리 입력인 행 배열 변환은 측정 제외)
+                if (want('export-csv') || want('export-xlsx')) {
+                    const rows = getTableRows(processedData);
+                    if (want('export-csv')) record(key('export-csv'), measure(size, repeat, () => Papa.unparse(rows)).sample);
+                    if (want('export-xlsx')) record(key('export-xlsx'), measure(size, repeat, () => writeXlsxBuffer(rows)).sample);
+                }
+            }
+        }
+    }
+    return results;
+}
+
+/**
+ * 기준값과 비교해 처리량이 threshold보다 많이 떨어진 단계를 반환합니다.
+ * 기준값에 없는 항목과 MIN_COMPARE_MS보다 빨리 끝난 항목은 비교하지 않습니다.
+ */
+function findRegressions(baseline: BenchmarkFile, results: Record<string, StageSample>, threshold: number) {
+    const regressions: { key: string; baseline: number; current: number; drop: number }[] = [];
+    for (const [key, sample] of Object.entries(results)) {
+        const base = baseline.results[key];
+        if (!base || sample.ms < MIN_COMPARE_MS) continue;
+        const drop = 1 - sample.rowsPerSec / base.rowsPerSec;
+        if (drop > threshold) regressions.push({ key, baseline: base.rowsPerSec, current: sample.rowsPerSec, drop });
+    }
+    return regressions;
+}
+
+function main() {
+    const args = parseArgs(process.argv.slice(2));
+    console.log("=========================================");
+    console.log("⏱️  데이터 세탁소 처리량 벤치마크");
+    console.log("=========================================");
+    console.log(`행 수: ${args.sizes.join(', ')} / 시나리오: ${args.scenarios.length}개 / 단계: ${args.stages.join(', ')}`);
+
+    const results = runBenchmark(args);
+    writeBenchmarkFile(args.out, results);
+    console.log(`\n📝 결과 저장: ${path.relative(ROOT, args.out)}`);
+
+    if (args.updateBaseline) {
+        // 일부만 측정한 경우 나머지 기준값은 유지
+        const previous = readBenchmarkFile(args.baseline);
+        writeBenchmarkFile(args.baseline, { ...(previous?.results || {}), ...results });
+        console.log(`📌 기준값 갱신: ${path.relative(ROOT, args.baseline)} (${Object.keys(results).length}개 항목)`);
+        return;
+    }
+
+    // 기준값은 장비마다 다르므로 저장소에 두지 않음 -> 없으면 비교하지 못한 것이므로 실패로 알림
+    const baseline = readBenchmarkFile(args.baseline);
+    if (!baseline) {
+        console.error(`❌ [FAIL] 기준값 파일이 없습니다. 같은 장비에서 npm run bench:baseline으로 먼저 생성하세요. (${path.relative(ROOT, args.baseline)})`);
+        process.exitCode = 1;
+        return;
+    }
+    const regressions = findRegressions(baseline, results, args.threshold);
+    if (regressions.length === 0) {
+        console.log(`✅ [PASS] 모든 단계가 기준값 대비 ${(args.threshold * 100).toFixed(0)}% 이내입니다.`);
+        return;
+    }
+    for (const r of regressions) {
+        console.error(`❌ [FAIL] ${r.key}: ${formatRate(r.baseline)} -> ${formatRate(r.current)} (-${(r.drop * 100).toFixed(1)}%)`);
+    }
+    process.exitCode = 1;
+}
+
+main();
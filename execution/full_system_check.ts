@@ -1,10 +1,20 @@
-import { processDataLocal, detectDataIssues } from '../src/lib/core/processors';
+import { processDataLocal } from '../src/lib/core/processors';
+import { detectDataIssues } from '../src/lib/core/analyzers';
 // Note: In a real environment, we'd need to handle imports carefully. 
 // Since we are running ad-hoc, we'll assume relative imports work or use a simplified approach for testing.
 
 // Mock types for the script to run independently if needed, 
 // but we'll try to import from the source.
 import { DataRow, ProcessingOptions, ColumnSpecificOptions } from '../src/types';
+import { tableFromRows, getTableRows, headTable } from '../src/lib/core/table';
+import { syntheticRows } from '../src/lib/core/performance';
+import { forEachChange, ChangeSet } from '../src/lib/core/changes';
+import { ShardRequest, processShard, splitIntoShards, mergeShardResults } from '../src/lib/core/sharding';
+import { getCleaningPlan } from '../src/lib/core/plan';
+import { createCleaningSnapshot, planIncremental, applyIncremental } from '../src/lib/core/incremental';
+import { encodeTableColumns, decodeTableColumns } from '../src/lib/core/tableCache';
+import { DuplicateReport, findDuplicates } from '../src/lib/core/dedup';
+import { SafePattern, compileSafePattern } from '../src/lib/core/safeRegex';
 
 const defaultOptions: ProcessingOptions = {
     removeWhitespace: false, formatMobile: false, formatGeneralPhone: false, formatDate: false, formatDateTime: false,
@@ -25,6 +35,50 @@ const testData: DataRow[] = [
     { id: 4, name: "박영희!!!", tel: "010-0000-0000", email: "park@yahoo.com", address: "<html>부산광역시 해운대구</html>", amount: "123.45", date: "20240125" }
 ];
 
+// 셀 변경 기록을 (행, 열, 사유) 목록으로 펼침 (결과 비교용)
+const listChanges = (changes: ChangeSet) => {
+    const list: number[][] = [];
+    forEachChange(changes, (row, col, reason) => list.push([row, col, reason]));
+    return list;
+};
+
+// 중복 검사 결과를 정답 개체 번호와 비교: 같은 개체 행 쌍 중 같은 그룹으로 묶인 비율(재현율)과 다른 개체끼리 묶인 쌍 수
+function duplicateRecall(report: DuplicateReport, labels: number[], exactOnly: boolean[] = []) {
+    const group = new Int32Array(labels.length).fill(-1);
+    report.groups.forEach((g, gi) => g.rows.forEach(r => { group[r] = gi; }));
+    const members = new Map<number, number[]>();
+    labels.forEach((label, r) => {
+        if (exactOnly.length && !exactOnly[r]) return;
+        const list = members.get(label) || [];
+        list.push(r);
+        members.set(label, list);
+    });
+    let pairs = 0, found = 0, falsePairs = 0;
+    for (const list of members.values()) {
+        for (let a = 0; a < list.length; a++) {
+            for (let b = a + 1; b < list.length; b++) {
+                pairs++;
+                if (group[list[a]] >= 0 && group[list[a]] === group[list[b]]) found++;
+            }
+        }
+    }
+    for (const g of report.groups) {
+        for (let a = 0; a < g.rows.length; a++) {
+            for (let b = a + 1; b < g.rows.length; b++) if (labels[g.rows[a]] !== labels[g.rows[b]]) falsePairs++;
+        }
+    }
+    return { recall: pairs ? found / pairs : 1, falsePairs };
+}
+
+// 두 값이 같은지 비교하고, 다르면 처음 다른 항목만 보여줌 (큰 결과의 로그 폭주 방지)
+const firstDiff = (got: unknown[], expected: unknown[]) => {
+    const n = Math.max(got.length, expected.length);
+    for (let i = 0; i < n; i++) {
+        if (JSON.stringify(got[i]) !== JSON.stringify(expected[i])) return { index: i, got: got[i], expected: expected[i] };
+    }
+    return null;
+};
+
 async function runCheck() {
     console.log("=========================================");
     console.log("🚀 데이터 세탁소 전 기능 자동 점검 시작");
@@ -105,6 +159,159 @@ async function runCheck() {
     assert("잠금 컬럼 보호 확인", lockedProcessed[0].name === " 홍길동   ", lockedProcessed[0].name, " 홍길동   ");
     console.log("");
 
+    // --- 5. 샤드 병렬 정제 점검 (sharding.ts) ---
+    console.log("[5] 샤드 병렬 정제: 여러 샤드로 나눠도 단일 샤드와 결과 동일");
+    const shardTable = tableFromRows(syntheticRows(3000, 1));
+    const shardOptions = { ...defaultOptions, autoDetect: true, removeWhitespace: true, formatMobile: true, cleanEmail: true };
+    const shardRequest: ShardRequest = {
+        prompt: "가입일은 yyyy.mm.dd 형식으로", options: shardOptions, lockedColumns: [], columnLimits: { 메모: 8 },
+        columnOptions: {}, headers: shardTable.headers, scanOriginal: true,
+    };
+    const runShards = (shardCount: number, firstShardRows: number) => {
+        const shards = splitIntoShards(shardTable, shardCount, firstShardRows);
+        // 워커 결과는 순서 없이 도착하므로 거꾸로 넘겨 병합 순서를 확인
+        const results = shards.map(s => processShard(s.task, shardRequest)).reverse();
+        return mergeShardResults(results, shardTable, shards, shardRequest.columnLimits, shardOptions);
+    };
+    const single = runShards(1, Infinity);
+    const sharded = runShards(4, 500);
+    const rowDiff = firstDiff(getTableRows(sharded.processedData), getTableRows(single.processedData));
+    assert("샤드 병합 행 순서/값", rowDiff === null, rowDiff, null);
+    assert("샤드 병합 정제 결과 이슈", firstDiff(sharded.issues, single.issues) === null, sharded.issues.length, single.issues.length);
+    assert("샤드 병합 원본 이슈", firstDiff(sharded.originalIssues, single.originalIssues) === null, sharded.originalIssues.length, single.originalIssues.length);
+    assert("샤드 병합 통계", JSON.stringify(sharded.stats) === JSON.stringify(single.stats), sharded.stats, single.stats);
+    const changeDiff = firstDiff(listChanges(sharded.changes), listChanges(single.changes));
+    assert("샤드 병합 셀 변경 기록", changeDiff === null && single.stats.changedCells > 0, changeDiff, null);
+    console.log("");
+
+    // --- 6. 증분 재정제 점검 (incremental.ts) ---
+    console.log("[6] 증분 재정제: 설정 하나만 바꾼 결과가 전체 재정제와 동일");
+    type RunSettings = { prompt: string; options: ProcessingOptions; columnOptions: ColumnSpecificOptions; locked: string[]; limits: Record<string, number> };
+    const incTable = tableFromRows(syntheticRows(2000, 7));
+    const fullRun = (s: RunSettings) => {
+        const shards = splitIntoShards(incTable, 1, Infinity);
+        const results = shards.map(sh => processShard(sh.task, {
+            prompt: s.prompt, options: s.options, lockedColumns: s.locked, columnLimits: s.limits,
+            columnOptions: s.columnOptions, headers: incTable.headers, scanOriginal: true,
+        }));
+        return mergeShardResults(results, incTable, shards, s.limits, s.options);
+    };
+    const base: RunSettings = {
+        prompt: "메모에서 '확인필요' 지워줘",
+        options: { ...defaultOptions, removeWhitespace: true, formatMobile: true },
+        columnOptions: {}, locked: [], limits: {},
+    };
+    // [이름, 바꾼 설정, 다시 정제할 컬럼 수 (-1이면 1개 이상)]
+    const incCases: [string, RunSettings, number][] = [
+        ["체크박스 옵션", { ...base, options: { ...base.options, formatDate: true } }, -1],
+        ["컬럼 옵션", { ...base, columnOptions: { 구매금액: 'amountKrn' } }, 1],
+        ["프롬프트", { ...base, prompt: "메모에서 '주문' 지워줘" }, -1],
+        ["잠금 컬럼", { ...base, locked: ['연락처'] }, 1],
+        ["길이 제한", { ...base, limits: { 메모: 6 } }, 0],
+    ];
+    const before = fullRun(base);
+    const beforePlan = getCleaningPlan(base.prompt, incTable.headers, base.options, base.locked, base.columnOptions);
+    for (const [name, next, cleanCount] of incCases) {
+        const snapshot = createCleaningSnapshot(incTable, beforePlan, base.limits, base.options, before);
+        const plan = getCleaningPlan(next.prompt, incTable.headers, next.options, next.locked, next.columnOptions);
+        const target = planIncremental(snapshot, incTable, plan, next.limits, next.options);
+        const expected = fullRun(next);
+        if (!target) {
+            assert(`증분 재정제 (${name})`, false, "전체 재정제로 전환", "증분 재정제");
+            continue;
+        }
+        const result = applyIncremental(snapshot, plan, target, next.limits, next.options);
+        const diff = firstDiff(getTableRows(result.processedData), getTableRows(expected.processedData))
+            || firstDiff(result.issues, expected.issues)
+            || firstDiff(result.snapshot.baselineIssues, expected.originalIssues)
+            || firstDiff(listChanges(result.changes), listChanges(expected.changes))
+            || firstDiff([result.stats], [expected.stats]);
+        const cleaned = target.cleanColumns.length;
+        const countOk = cleanCount < 0 ? cleaned > 0 : cleaned === cleanCount;
+        assert(`증분 재정제 (${name}, 다시 정제 ${cleaned}개 컬럼)`, diff === null && countOk, diff || cleaned, null);
+    }
+    console.log("");
+
+    console.log("[7] 파싱 결과 캐시: 저장 형식으로 바꿨다 되돌린 테이블이 원본과 동일");
+    const cacheRows: DataRow[] = [
+        ...syntheticRows(500, 3),
+        { 고객명: null, 금액: 0, 동의: true, 비고: '' },
+        { 금액: -1.5e-7, 동의: false, 비고: '😀 이모지\n줄바꿈' },
+    ];
+    const cacheTable = tableFromRows(cacheRows);
+    for (const [name, table] of [['전체', cacheTable], ['앞 구간 뷰', headTable(cacheTable, 100)]] as const) {
+        const { columns, bytes } = encodeTableColumns('digest', table);
+        // IndexedDB에서 읽은 순서와 무관하게 컬럼 번호로 되돌림
+        const decoded = decodeTableColumns(table, [...columns].reverse());
+        const diff = firstDiff(decoded.headers, table.headers) || firstDiff(getTableRows(decoded), getTableRows(table));
+        const codesOk = columns.every(c => c.codes.length === table.rowCount);
+        assert(`캐시 왕복 (${name}, ${table.rowCount}행, ${bytes} bytes)`, diff === null && codesOk, diff || 'codes length', null);
+    }
+    console.log("");
+
+    console.log("[8] 중복 검사: 표기만 다른 같은 거래처는 묶고, 이름만 같은 다른 거래처는 묶지 않음");
+    // 거래처 2000곳 x 표기 변형 4개 (법인 표기/띄어쓰기/전화번호 형식/대소문자, 마지막은 상호 한 글자 오타)
+    // + 10곳마다 상호만 같고 연락처/이메일이 다른 거래처 (섞은 순서)
+    const syllables = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허';
+    let dedupSeed = 42;
+    const nextRandom = () => { dedupSeed = (dedupSeed * 1664525 + 1013904223) >>> 0; return dedupSeed / 2 ** 32; };
+    const dedupFixture: { row: DataRow; label: number; exact: boolean }[] = [];
+    for (let e = 0; e < 2000; e++) {
+        const name = Array.from({ length: 4 }, () => syllables[Math.floor(nextRandom() * syllables.length)]).join('') + '상사';
+        const digits = String(10000000 + Math.floor(nextRandom() * 89999999));
+        const phone = `010-${digits.slice(0, 4)}-${digits.slice(4)}`;
+        const email = `user${e}@example.com`;
+        const typo = name.slice(0, 3) + syllables[(syllables.indexOf(name[3]) + 1) % syllables.length] + name.slice(4);
+        dedupFixture.push(
+            { row: { 업체명: `(주)${name}`, 연락처: phone, 이메일: email }, label: e, exact: true },
+            { row: { 업체명: `주식회사 ${name}`, 연락처: '010' + digits, 이메일: email.toUpperCase() }, label: e, exact: true },
+            { row: { 업체명: `${name.slice(0, 2)} ${name.slice(2)}`, 연락처: `+82 ${phone.slice(1)}`, 이메일: ` ${email} ` }, label: e, exact: true },
+            { row: { 업체명: typo, 연락처: phone, 이메일: email }, label: e, exact: false },
+        );
+        if (e % 10 === 0) {
+            dedupFixture.push({ row: { 업체명: `(주)${name}`, 연락처: `010-${digits.slice(4)}-${digits.slice(0, 4)}`, 이메일: `other${e}@example.org` }, label: -1 - e, exact: true });
+        }
+    }
+    for (let i = dedupFixture.length - 1; i > 0; i--) {
+        const j = Math.floor(nextRandom() * (i + 1));
+        [dedupFixture[i], dedupFixture[j]] = [dedupFixture[j], dedupFixture[i]];
+    }
+    const dedupTable = tableFromRows(dedupFixture.map(f => f.row));
+    const dedupLabels = dedupFixture.map(f => f.label);
+    const dedupKeys = ['업체명', '연락처', '이메일'];
+    const exactOnly = duplicateRecall(findDuplicates(dedupTable, dedupKeys, { nearDuplicates: false }), dedupLabels, dedupFixture.map(f => f.exact));
+    assert("중복 검사 (정규화 후 같은 값, 재현율 100%)", exactOnly.recall === 1 && exactOnly.falsePairs === 0, exactOnly, { recall: 1, falsePairs: 0 });
+    const near = duplicateRecall(findDuplicates(dedupTable, dedupKeys), dedupLabels);
+    assert(`중복 검사 (오타 포함 유사 중복, 재현율 ${(near.recall * 100).toFixed(2)}%)`, near.recall >= 0.99 && near.falsePairs === 0, near, { recall: '>= 0.99', falsePairs: 0 });
+    console.log("");
+
+    console.log("[9] 사용자 정규식 NFA: 빈 일치/게으른 반복/빈 반복 캡처가 내장 RegExp와 동일");
+    // 같은 패턴을 NFA로만 실행 (캐시된 객체는 바꾸지 않음)
+    const linear = (pattern: SafePattern) => Object.assign(Object.create(Object.getPrototypeOf(pattern)), pattern, { mode: 'linear' }) as SafePattern;
+    const regexAtoms = ['a', 'b', 'A', '.', '[ab]', '[^a]', '\\d', '\\s', '\\b', '^', '$', '(a|)', '(a|b)', '(b?a?)', '(?:ab|a)', '(a)', ''];
+    const regexQuantifiers = ['', '', '*', '+', '?', '*?', '+?', '??', '{0,2}', '{1,2}?'];
+    let regexSeed = 7;
+    const regexRandom = () => { regexSeed = (regexSeed * 1664525 + 1013904223) >>> 0; return regexSeed / 2 ** 32; };
+    const pick = <T,>(items: T[]) => items[Math.floor(regexRandom() * items.length)];
+    let regexChecked = 0;
+    let regexMismatch: string | null = null;
+    for (let i = 0; i < 3000; i++) {
+        // 빈 원자에는 반복을 붙이지 않음 (앞 반복과 붙으면 문법 오류)
+        const source = Array.from({ length: 1 + Math.floor(regexRandom() * 3) }, () => pick(regexAtoms))
+            .map(atom => atom + (atom && regexRandom() < 0.6 ? pick(regexQuantifiers) : '')).join('');
+        const flags = pick(['g', '', 'gi', 'i']);
+        const template = pick(['-', '<$&>', '[$1]', '$`|']);
+        const text = Array.from({ length: Math.floor(regexRandom() * 9) }, () => pick(['a', 'a', 'b', ' ', '1'])).join('');
+        const pattern = compileSafePattern(source, flags);
+        if (!pattern || pattern.mode === 'rejected') continue;
+        regexChecked++;
+        const expected = text.replace(new RegExp(source, flags), template);
+        const got = linear(pattern).replace(text, template);
+        if (got !== expected && !regexMismatch) regexMismatch = JSON.stringify({ source, flags, template, text, got, expected });
+    }
+    assert(`정규식 NFA 퍼징 (${regexChecked}개 패턴)`, regexMismatch === null && regexChecked > 2000, regexMismatch || regexChecked, null);
+    console.log("");
+
     console.log("=========================================");
     console.log(`📊 점검 완료: ${passedTests}/${totalTests} 케이스 통과`);
     console.log("=========================================");
@@ -0,0 +1,96 @@
+"""
+데이터세탁소 배치 정제 엔진 (Headless)
+
+브라우저 엔진(`src/lib/core/processors.ts`)과 동일한 규칙으로 CSV/XLSX를 스트리밍 정제합니다.
+실행 예:  cd execution && python -m laundry_engine input.csv output.csv --prompt "..."
+일괄 정제:  cd execution && python -m laundry_engine ../intake/ ../.tmp/intake_clean/ --batch
+작업 서비스:  cd execution && python -m laundry_engine.service --port 8765
+"""
+from .analyzers import DiffCounts, IssueScanner, finalize_diff_stats
+from .batch import BatchResult, BatchTask, clean_batch, collect_tasks, merge_stats, schedule_tasks
+from .capacity import Calibration, CapacityPlan, auto_plan, get_calibration, measure_throughput, plan_capacity
+from .columnar import process_columns, process_data_columnar
+from .exporters import CsvChunkWriter, XlsxChunkWriter, open_writer
+from .keywords import PROMPT_KEYWORDS, PROMPT_MATCHER, KeywordMatcher
+from .memo import MemoStats, ValueMemo
+from .models import ColumnLimits, ColumnSpecificOptions, DataIssue, DataRow, ProcessingOptions, ProcessingStats
+from .nlp import PromptAnalysis, analyze_prompt
+from .parsers import DEFAULT_CHUNK_SIZE, iter_chunks, list_sheets, open_csv, open_table, open_xlsx
+from .parallel import clean_chunks_parallel
+from .pipeline import MODES, CleanResult, clean_chunks, clean_file
+from .plan import CleaningPlan, ColumnPlan, PlanCache, compile_plan, get_plan, plan_cache
+from .profiler import STAGES, CleaningProfiler, RuleProfile, merge_profiles
+from .processors import process_data_local, process_row, process_value
+from .table_cache import CachedTable, TableCache, file_digest
+from .transforms import Transform, apply_single_column_option, build_column_transforms
+from .utils import GARBAGE_REGEX, normalize_date, normalize_datetime, parse_korean_amount
+
+__all__ = [
+    'DiffCounts',
+    'IssueScanner',
+    'finalize_diff_stats',
+    'BatchResult',
+    'BatchTask',
+    'clean_batch',
+    'collect_tasks',
+    'merge_stats',
+    'schedule_tasks',
+    'Calibration',
+    'CapacityPlan',
+    'auto_plan',
+    'get_calibration',
+    'measure_throughput',
+    'plan_capacity',
+    'process_columns',
+    'process_data_columnar',
+    'CsvChunkWriter',
+    'XlsxChunkWriter',
+    'open_writer',
+    'PROMPT_KEYWORDS',
+    'PROMPT_MATCHER',
+    'KeywordMatcher',
+    'MemoStats',
+    'ValueMemo',
+    'ColumnLimits',
+    'ColumnSpecificOptions',
+    'DataIssue',
+    'DataRow',
+    'ProcessingOptions',
+    'ProcessingStats',
+    'PromptAnalysis',
+    'analyze_prompt',
+    'DEFAULT_CHUNK_SIZE',
+    'iter_chunks',
+    'list_sheets',
+    'open_csv',
+    'open_table',
+    'open_xlsx',
+    'clean_chunks_parallel',
+    'MODES',
+    'CleanResult',
+    'clean_chunks',
+    'clean_file',
+    'CleaningPlan',
+    'ColumnPlan',
+    'PlanCache',
+    'compile_plan',
+    'get_plan',
+    'plan_cache',
+    'STAGES',
+    'CleaningProfiler',
+    'RuleProfile',
+    'merge_profiles',
+    'apply_single_column_option',
+    'process_data_local',
+    'process_row',
+    'process_value',
+    'CachedTable',
+    'TableCache',
+    'file_digest',
+    'Transform',
+    'build_column_transforms',
+    'GARBAGE_REGEX',
+    'normalize_date',
+    'normalize_datetime',
+    'parse_korean_amount',
+]
@@ -0,0 +1,127 @@
+"""
+명령줄 실행 진입점
+
+예:
+  cd execution
+  python -m laundry_engine ../test_data/tax_chaos.csv ../.tmp/tax_clean.csv \
+      --prompt "날짜는 yyyy.mm.dd 형식으로" --options '{"formatNumber": true}'
+
+일괄 정제 (폴더/여러 파일의 모든 시트 -> 결과 폴더, 시트별 결과 + report.json):
+  python -m laundry_engine ../intake/2024-05/ ../.tmp/2024-05_clean/ --batch --workers 0
+
+규칙/단계별 실행 통계 (JSON 프로파일):
+  python -m laundry_engine ../test_data/tax_chaos.csv ../.tmp/tax_clean.csv --profile ../.tmp/tax_profile.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Optional
+
+from .batch import BATCH_EXTENSIONS, clean_batch
+from .capacity import DEFAULT_CALIBRATION_PATH, auto_plan
+from .models import ProcessingOptions
+from .pipeline import MODES, CleanResult, clean_file
+from .table_cache import DEFAULT_CACHE_DIR, TableCache
+
+
+def _load_json(value: Optional[str]) -> Any:
+    """JSON 문자열 또는 JSON 파일 경로를 읽습니다."""
+    if not value:
+        return None
+    if os.path.isfile(value):
+        with open(value, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return json.loads(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='laundry_engine', description='데이터세탁소 배치 정제 엔진')
+    parser.add_argument('input', nargs='+', help='정제할 CSV/XLSX 파일 (일괄 정제는 파일 여러 개 또는 폴더)')
+    parser.add_argument('output', help='결과 CSV/XLSX 파일 (확장자로 형식 결정, 일괄 정제는 결과 폴더)')
+    parser.add_argument('--prompt', default='', help='자연어 정제 명령')
+    parser.add_argument('--options', help='ProcessingOptions JSON (문자열 또는 파일, camelCase 키)')
+    parser.add_argument('--column-options', help='컬럼별 옵션 JSON (예: {"Date": "date"})')
+    parser.add_argument('--locked', default='', help='잠금 컬럼 (쉼표 구분)')
+    parser.add_argument('--chunk-size', type=int, default=0, help='청크당 행 수 (0: 측정한 처리량/메모리로 자동)')
+    parser.add_argument('--mode', choices=MODES, default='row', help='실행 방식 (columnar: 컬럼 단위 벡터 실행)')
+    parser.add_argument('--memo-stats', action='store_true', help='고유값 메모 적중률 출력')
+    parser.add_argument('--workers', type=int, default=1, help='병렬 정제 프로세스 수 (0: CPU 코어 수)')
+    parser.add_argument('--calibrate', action='store_true', help='저장된 측정값을 버리고 처리량을 다시 측정')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='XLSX 파싱 결과 캐시 폴더')
+    parser.add_argument('--no-cache', action='store_true', help='파싱 결과 캐시와 측정값 파일을 읽지도 쓰지도 않음')
+    parser.add_argument('--batch', action='store_true', help='모든 시트를 일괄 정제 (입력이 여러 개이거나 폴더이면 자동)')
+    parser.add_argument('--format', choices=BATCH_EXTENSIONS, help='일괄 정제 결과 형식 (없으면 입력과 같은 형식)')
+    parser.add_argument('--profile', metavar='PATH', help='규칙/단계별 실행 통계를 JSON 프로파일로 저장')
+    return parser
+
+
+def _write_profile(path: str, profile: Optional[dict]) -> None:
+    if profile is None:
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    stages = ', '.join(f'{name} {ms / 1000:.2f}초' for name, ms in profile['stages'].items())
+    print(f'📊 {stages} -> {path}')
+    for r in profile['rules'][:5]:
+        print(f'  - {r["column"]} / {r["step"]}: {r["ms"] / 1000:.2f}초 (실행 {r["calls"]}, 셀 {r["cells"]}, 변경 {r["changed"]})')
+
+
+def _run_batch(args: argparse.Namespace, options: ProcessingOptions, column_options: Any, locked: list, chunk_size: int) -> int:
+    def report(result: CleanResult) -> None:
+        sheet = f' [{result.sheet}]' if result.sheet is not None else ''
+        print(f'  - {os.path.basename(result.input_path)}{sheet}: {result.total_rows}행 ({result.elapsed:.2f}초) -> {result.output_path}')
+
+    batch = clean_batch(args.input, args.output, args.prompt, options, locked, column_options, chunk_size, args.mode, args.workers,
+                        output_format=args.format, cache_dir=None if args.no_cache else args.cache_dir, on_result=report,
+                        profile=bool(args.profile))
+    for task, error in batch.failures:
+        sheet = f' [{task.sheet}]' if task.sheet is not None else ''
+        print(f'  ⚠️  {os.path.basename(task.input_path)}{sheet}: {error}')
+    print(f'✅ {len(batch.results)}개 시트 {batch.total_rows}행 일괄 정제 완료 (실패 {len(batch.failures)}개, 워커 {batch.workers}개, '
+          f'{batch.elapsed:.2f}초) -> {batch.report_path}')
+    if args.profile:
+        _write_profile(args.profile, batch.profile())
+    return 1 if batch.failures else 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        options = ProcessingOptions.from_dict(_load_json(args.options))
+    except ValueError as e:
+        parser.error(str(e))
+    column_options = _load_json(args.column_options) or {}
+    locked = [c.strip() for c in args.locked.split(',') if c.strip()]
+
+    chunk_size = args.chunk_size
+    if chunk_size <= 0 or args.calibrate:
+        plan = auto_plan(args.workers, args.mode, refresh=args.calibrate, cache_path=None if args.no_cache else DEFAULT_CALIBRATION_PATH)
+        print(f'⚙️  처리량 {plan.rows_per_second:,}행/초, 행당 {plan.bytes_per_row:,}B, 메모리 {plan.memory_budget_mb:,}MB 기준 청크 {plan.chunk_size:,}행 (워커 {plan.workers}개)')
+        if chunk_size <= 0:
+            chunk_size = plan.chunk_size
+
+    if args.batch or len(args.input) > 1 or os.path.isdir(args.input[0]):
+        return _run_batch(args, options, column_options, locked, chunk_size)
+
+    if os.path.exists(args.output) and os.path.samefile(args.input[0], args.output):
+        parser.error('output must differ from input (the input would be truncated while it is being read)')
+    cache = None if args.no_cache else TableCache(args.cache_dir)
+    result = clean_file(args.input[0], args.output, args.prompt, options, locked, column_options, chunk_size, args.mode, args.workers,
+                        cache=cache, profile=bool(args.profile))
+    cached = ' (캐시에서 읽음)' if cache and cache.hits else ''
+    print(f'✅ {result.total_rows}행 정제 완료 ({result.chunks}개 청크 x {result.chunk_size:,}행, {result.elapsed:.2f}초){cached} -> {result.output_path}')
+    if args.memo_stats:
+        for s in result.memo_stats:
+            state = ' (캐시 해제: 고유값 위주)' if s.bypassed else ''
+            print(f'  - {s.column} / {s.step}: 적중률 {s.hit_rate:.1%} (적중 {s.hits}, 계산 {s.misses}, 보관 {s.size}, 제거 {s.evictions}){state}')
+    if args.profile:
+        _write_profile(args.profile, result.profile)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+이슈 검사 / 품질 통계 (스트리밍)
+
+`src/lib/core/analyzers.ts`의 단일 패스 검사(`scanValue` → `finalizeIssueScan`)와 통계(`finalizeDiffStats`)를
+같은 규칙으로 옮긴 것입니다. 청크마다 `IssueScanner.scan`으로 행 번호를 누적하고, 끝에 한 번 이슈로 확정하므로
+파일 전체를 메모리에 올리지 않습니다. 검사 결과는 값과 컬럼 규칙으로만 정해지므로 컬럼마다 고유값 판정을 캐시합니다.
+이슈는 웹 앱의 `DataIssue` JSON과 같은 camelCase 키의 딕셔너리입니다.
+"""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .models import ColumnLimits, DataIssue, DataRow, ProcessingOptions, ProcessingStats
+from .utils import GARBAGE_REGEX, js_str
+
+ADDRESS_INDICATORS = ('시 ', '군 ', '구 ', '동 ', '로 ', '길 ')
+
+# 이슈 검사용 정규식 (analyzers.ts와 동일, JS의 \d는 ASCII 숫자만 의미하므로 [0-9]로 씀)
+PHONE_LETTERS = re.compile(r'[A-Za-z가-힣]')
+PHONE_NON_DIGIT = re.compile(r'[^0-9-]')
+DATE_YEAR_FIRST = re.compile(r'^((19|20)[0-9]{2}[-./년\s]|(19|20)[0-9]{6}$)')
+DATE_YEAR_LAST = re.compile(r'^([0-9]{1,2})[/\-.]([0-9]{1,2})[/\-.]((?:19|20)[0-9]{2})$')
+DATE_SHORT = re.compile(r'^([0-9]{2})[/\-.]([0-9]{1,2})[/\-.]([0-9]{1,2})$')
+DATE_KOREAN_UNIT = re.compile(r'년|월|일')
+DATE_RELATIVE = re.compile(r'오늘|어제|그저께')
+MIXED_TEXT = re.compile(r'[가-힣a-zA-Z]')
+YEAR = re.compile(r'((?:19|20)[0-9]{2})')
+DATE_TIME = re.compile(r'[:오전후ampm]', re.IGNORECASE)
+EMAIL_REGEX = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+ZIP_TEXT = re.compile(r'[^0-9\s-]')
+AMOUNT_COL = re.compile(r'금액|가격|비용|price|amount', re.IGNORECASE)
+NAME_NOISE = re.compile(r'[0-9!@#$%^&*()_+={}\[\]|\\;:\'",<>?/~`]')
+BIZ_NUM_FORMAT = re.compile(r'^[0-9]{3}-[0-9]{2}-[0-9]{5}$')
+BIZ_NUM_FIRST = re.compile(r'[0-9]{3}-[0-9]{2}-[0-9]{5}|[0-9]{10}')
+RRN_DIGITS = re.compile(r'[0-9]{6}[1-4][0-9]{6}')
+CARD_COL = re.compile(r'카드|card', re.IGNORECASE)
+CARD_SEPARATORS = re.compile(r'[-\s]')
+NON_NUMERIC = re.compile(r'[^0-9]')
+EMAIL_NAMING = re.compile(r'email|이메일')
+
+# 행 목록을 모으는 검사 항목 (analyzers.ts의 INDEX_FIELDS와 같은 순서)
+INDEX_FIELDS = (
+    'relevant', 'length_exceeded', 'whitespace', 'phone_letters', 'phone_non_digits', 'date_like', 'date_relative', 'date_mixed',
+    'email_invalid', 'zip_text', 'zip_bad_format', 'garbage', 'amount_non_numeric', 'name_noise', 'address_missing',
+    'biz_num_invalid', 'rrn_unmasked', 'url_no_protocol', 'card_invalid',
+)
+_BIT = {name: 1 << i for i, name in enumerate(INDEX_FIELDS)}
+_INDEX_MASK = (1 << len(INDEX_FIELDS)) - 1
+_EMAIL_LIKE = 1 << len(INDEX_FIELDS)
+_ADDRESS_VALID = 1 << (len(INDEX_FIELDS) + 1)
+_BIZ_NUM = 1 << (len(INDEX_FIELDS) + 2)
+_URL_LIKE = 1 << (len(INDEX_FIELDS) + 3)
+_PHONE_DASH = 1 << (len(INDEX_FIELDS) + 4)
+_PHONE_NO_DASH = 1 << (len(INDEX_FIELDS) + 5)
+_DATE_DOT = 1 << (len(INDEX_FIELDS) + 6)
+_DATE_DASH = 1 << (len(INDEX_FIELDS) + 7)
+_DATE_SLASH = 1 << (len(INDEX_FIELDS) + 8)
+_DATE_TIME = 1 << (len(INDEX_FIELDS) + 9)
+
+# 컬럼 하나의 고유값 판정 캐시 상한 (넘으면 비우고 다시 채움)
+MASK_CACHE_SIZE = 50_000
+
+
+@dataclass
+class ColumnRules:
+    """컬럼명/검사 조건으로 결정되는 검사 대상 여부 (컬럼마다 한 번만 판단)"""
+    limit: int
+    ignore_commas: bool
+    is_phone_col: bool
+    is_email_col: bool
+    is_zip_col: bool
+    is_amount_col: bool
+    is_name_col: bool
+    is_address_col: bool
+    is_url_col: bool
+    is_card_col: bool
+
+    @classmethod
+    def for_column(cls, key: str, limits: ColumnLimits, options: ProcessingOptions) -> 'ColumnRules':
+        lower = key.lower()
+        limit = limits.get(key) or 0
+        return cls(
+            limit=limit if limit > 0 else 0,
+            ignore_commas=options.format_number,
+            is_phone_col='연락처' in key or '전화번호' in key or 'phone' in lower,
+            is_email_col='email' in lower or '이메일' in key,
+            is_zip_col='우편번호' in key or 'zip' in lower or 'postal' in lower,
+            is_amount_col=bool(AMOUNT_COL.search(key)),
+            is_name_col=any(k in key for k in ('이름', '고객명', '성함', '성명')),
+            is_address_col='주소' in lower or 'address' in lower,
+            is_url_col=('url' in lower or 'web' in lower or '사이트' in key or '주소' in key) and '이메일' not in key and 'email' not in key,
+            is_card_col=bool(CARD_COL.search(key)),
+        )
+
+
+@dataclass
+class ColumnIssueScan:
+    """컬럼 하나의 검사 중간 결과 (행 번호는 파일 전체 기준)"""
+    rows: Dict[str, List[int]] = field(default_factory=lambda: {name: [] for name in INDEX_FIELDS})
+    total_length: int = 0
+    whitespace_sample: Optional[str] = None
+    phone_has_dash: bool = False
+    phone_has_no_dash: bool = False
+    date_has_dot: bool = False
+    date_has_dash: bool = False
+    date_has_slash: bool = False
+    date_has_time: bool = False
+    email_like: int = 0
+    address_valid: int = 0
+    biz_num: int = 0
+    url_like: int = 0
+
+
+def scan_value(rules: ColumnRules, val: str) -> int:
+    """셀 값 하나를 모든 검사 규칙으로 판정해 결과 비트를 반환합니다. (빈 값이면 0)"""
+    trimmed = val.strip()
+    if trimmed == '':
+        return 0
+    mask = _BIT['relevant']
+
+    digits = [c for c in val if '0' <= c <= '9']
+    digit_count = len(digits)
+    has_dash = '-' in val
+
+    # 0. 최대 길이 검사
+    if rules.limit and len(val.replace(',', '') if rules.ignore_commas else val) > rules.limit:
+        mask |= _BIT['length_exceeded']
+
+    # 1. 공백 검사
+    if trimmed != val:
+        mask |= _BIT['whitespace']
+
+    # 2. 전화번호 검사
+    if rules.is_phone_col:
+        if PHONE_LETTERS.search(val):
+            mask |= _BIT['phone_letters']
+        if PHONE_NON_DIGIT.search(val) or ''.join(digits[:2]) == '82':
+            mask |= _BIT['phone_non_digits']
+        if has_dash:
+            mask |= _PHONE_DASH
+        elif digit_count >= 9:
+            mask |= _PHONE_NO_DASH
+
+    # 3. 날짜/일시 검사
+    if not rules.is_email_col:
+        is_relative = bool(DATE_RELATIVE.search(val))
+        if is_relative or DATE_YEAR_FIRST.search(val) or DATE_YEAR_LAST.search(val) or DATE_SHORT.search(val) or DATE_KOREAN_UNIT.search(val):
+            mask |= _BIT['date_like']
+            if is_relative:
+                mask |= _BIT['date_relative']
+            if MIXED_TEXT.search(val) and YEAR.search(val):
+                mask |= _BIT['date_mixed']
+            if '.' in val:
+                mask |= _DATE_DOT
+            if has_dash:
+                mask |= _DATE_DASH
+            if '/' in val:
+                mask |= _DATE_SLASH
+            if DATE_TIME.search(val):
+                mask |= _DATE_TIME
+
+    # 4. 이메일 검사
+    has_at = '@' in val
+    if has_at:
+        mask |= _EMAIL_LIKE
+        if not EMAIL_REGEX.search(val):
+            mask |= _BIT['email_invalid']
+
+    # 5. 우편번호
+    if rules.is_zip_col:
+        if ZIP_TEXT.search(val):
+            mask |= _BIT['zip_text']
+        if digit_count != 5 or trimmed != val:
+            mask |= _BIT['zip_bad_format']
+
+    # 6. 가비지 데이터
+    if GARBAGE_REGEX.search(val):
+        mask |= _BIT['garbage']
+
+    # 7. 금액 컬럼의 텍스트
+    if rules.is_amount_col and (digit_count == 0 or (MIXED_TEXT.search(val) and '원' not in val and ',' not in val)):
+        mask |= _BIT['amount_non_numeric']
+
+    # 8. 이름 내 노이즈
+    if rules.is_name_col and NAME_NOISE.search(val):
+        mask |= _BIT['name_noise']
+
+    # 9. 주소 (평균 길이는 호출측에서 집계)
+    if rules.is_address_col:
+        if any(ind in val for ind in ADDRESS_INDICATORS):
+            mask |= _ADDRESS_VALID
+        else:
+            mask |= _BIT['address_missing']
+
+    # 10. 사업자등록번호 (판정은 첫 행 기준으로 확정 시 수행)
+    if digit_count == 10:
+        mask |= _BIZ_NUM
+        if not BIZ_NUM_FORMAT.search(val):
+            mask |= _BIT['biz_num_invalid']
+
+    # 11. 마스킹되지 않은 주민번호
+    if digit_count == 13 and '*' not in val and RRN_DIGITS.search(''.join(digits)):
+        mask |= _BIT['rrn_unmasked']
+
+    # 12. URL
+    if rules.is_url_col and not has_at and '.' in val:
+        mask |= _URL_LIKE
+        if not val.startswith('http'):
+            mask |= _BIT['url_no_protocol']
+
+    # 13. 카드번호
+    if rules.is_card_col:
+        clean = CARD_SEPARATORS.sub('', val)
+        if len(clean) < 10 or len(clean) > 19 or NON_NUMERIC.search(clean):
+            mask |= _BIT['card_invalid']
+
+    return mask
+
+
+def _record(col: ColumnIssueScan, rules: ColumnRules, mask: int, val: str, row: int) -> None:
+    bits = mask & _INDEX_MASK
+    while bits:
+        low = bits & -bits
+        col.rows[INDEX_FIELDS[low.bit_length() - 1]].append(row)
+        bits ^= low
+    if mask & _BIT['whitespace'] and col.whitespace_sample is None:
+        col.whitespace_sample = val
+    if rules.is_address_col:
+        col.total_length += len(val)
+    if mask & _EMAIL_LIKE:
+        col.email_like += 1
+    if mask & _ADDRESS_VALID:
+        col.address_valid += 1
+    if mask & _BIZ_NUM:
+        col.biz_num += 1
+    if mask & _URL_LIKE:
+        col.url_like += 1
+    if mask & _PHONE_DASH:
+        col.phone_has_dash = True
+    if mask & _PHONE_NO_DASH:
+        col.phone_has_no_dash = True
+    if mask & _DATE_DOT:
+        col.date_has_dot = True
+    if mask & _DATE_DASH:
+        col.date_has_dash = True
+    if mask & _DATE_SLASH:
+        col.date_has_slash = True
+    if mask & _DATE_TIME:
+        col.date_has_time = True
+
+
+class IssueScanner:
+    """
+    청크 단위로 이슈 후보를 누적하는 검사기 (scanIssues + mergeIssueScans)
+    청크는 파일 순서대로 넘겨야 하며, 행 번호는 지금까지 검사한 행 수만큼 이어집니다.
+    """
+
+    def __init__(self, headers: Sequence[str], column_limits: Optional[ColumnLimits] = None, options: Optional[ProcessingOptions] = None) -> None:
+        self.headers = [h for h in headers if h != 'id']
+        self.column_limits = dict(column_limits or {})
+        self.options = options or ProcessingOptions()
+        self.row_count = 0
+        self.first_values: Dict[str, str] = {}
+        self.columns = {key: ColumnIssueScan() for key in self.headers}
+        self._rules = {key: ColumnRules.for_column(key, self.column_limits, self.options) for key in self.headers}
+        self._masks: Dict[str, Dict[str, int]] = {key: {} for key in self.headers}
+
+    def scan(self, rows: Iterable[DataRow]) -> None:
+        offset = self.row_count
+        rows = rows if isinstance(rows, list) else list(rows)
+        if offset == 0 and rows:
+            self.first_values = {key: js_str(rows[0].get(key)) for key in self.headers}
+        for key in self.headers:
+            col = self.columns[key]
+            rules = self._rules[key]
+            masks = self._masks[key]
+            for i, row in enumerate(rows):
+                val = js_str(row.get(key))
+                mask = masks.get(val)
+                if mask is None:
+                    if len(masks) >= MASK_CACHE_SIZE:
+                        masks.clear()
+                    mask = masks[val] = scan_value(rules, val)
+                if mask:
+                    _record(col, rules, mask, val, offset + i)
+        self.row_count += len(rows)
+
+    def issues(self) -> List[DataIssue]:
+        """검사 결과를 최종 이슈 목록으로 확정합니다. (finalizeIssueScan과 같은 판정)"""
+        return finalize_issues(self)
+
+
+def _issue(column: str, type_: str, message: str, rows: List[int], suggestion: Optional[Dict[str, bool]] = None, **extra: Any) -> DataIssue:
+    issue: DataIssue = {'column': column, 'type': type_, 'message': message}
+    if suggestion:
+        issue['suggestion'] = suggestion
+    issue.update(extra)
+    issue['affectedRows'] = rows
+    return issue
+
+
+def finalize_issues(scanner: IssueScanner) -> List[DataIssue]:
+    issues: List[DataIssue] = []
+    if scanner.row_count == 0:
+        return issues
+    comma_note = ' (천단위 콤마 실시간 보정 적용됨)' if scanner.options.format_number else ''
+
+    for key in scanner.headers:
+        col = scanner.columns[key]
+        rows = col.rows
+        relevant = rows['relevant']
+        if not relevant:
+            continue
+        lower = key.lower()
+
+        # 0. 최대 길이
+        if rows['length_exceeded']:
+            limit = scanner.column_limits.get(key)
+            issues.append(_issue(key, 'error', f"'{key}' 컬럼의 데이터가 설정된 최대 길이({limit}자)를 초과했습니다.{comma_note}",
+                                 rows['length_exceeded'], fixType='maxLength'))
+
+        # 1. 공백
+        if rows['whitespace']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 불필요한 공백이 포함된 데이터가 있습니다. (예: \"{col.whitespace_sample}\")",
+                                 rows['whitespace'], {'removeWhitespace': True}))
+
+        # 2. 전화번호
+        phone = {'formatMobile': True, 'formatGeneralPhone': True}
+        if rows['phone_letters']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 비정상적인 문자(가짜 번호 가능성)가 포함되어 있습니다.", rows['phone_letters'], phone))
+        elif rows['phone_non_digits']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 텍스트가 섞여 있거나 국가번호(82)가 포함되어 있습니다.", rows['phone_non_digits'], phone))
+        elif col.phone_has_dash and col.phone_has_no_dash:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 전화번호 형식이 일관되지 않습니다.", relevant, phone))
+
+        # 3. 날짜/일시
+        if rows['date_like']:
+            inconsistent = sum((col.date_has_dot, col.date_has_dash, col.date_has_slash)) > 1
+            sugg = {'formatDateTime': True} if col.date_has_time else {'formatDate': True}
+            suffix = '일시 형식으로 표준화할 수 있습니다.' if col.date_has_time else '날짜 형식으로 통일할 수 있습니다.'
+            if rows['date_relative']:
+                issues.append(_issue(key, 'info', f"'{key}' 컬럼에 '어제', '오늘' 등 상대적 날짜가 있습니다. {suffix}", rows['date_relative'], sugg))
+            elif rows['date_mixed'] or inconsistent:
+                issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 일관되지 않은 날짜/일시 형식이 있습니다.",
+                                     rows['date_mixed'] or rows['date_like'], sugg))
+
+        # 4. 이메일 (컬럼명이 이메일이거나 절반 이상이 유효한 이메일일 때만)
+        if col.email_like > 0:
+            valid = col.email_like - len(rows['email_invalid'])
+            likely = bool(EMAIL_NAMING.search(lower)) or valid > col.email_like * 0.5
+            if likely and rows['email_invalid']:
+                issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 유효하지 않은 이메일 형식이 있습니다.", rows['email_invalid'], {'cleanEmail': True}))
+
+        # 5. 우편번호
+        if rows['zip_text']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 숫자가 아닌 문자열 데이터가 섞여 있습니다. 자동 정제가 불가능하니 직접 수정해 주세요.", rows['zip_text']))
+        elif rows['zip_bad_format']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼의 우편번호 형식이 표준(5자리)과 다릅니다.", rows['zip_bad_format'], {'formatZip': True}))
+
+        # 6. 가비지
+        if rows['garbage']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 깨진 문자열이나 무의미한 데이터가 있습니다.", rows['garbage'], {'cleanGarbage': True}))
+
+        # 7. 금액
+        if rows['amount_non_numeric']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 텍스트가 섞여 있어 합계 계산이 불가능할 수 있습니다.", rows['amount_non_numeric'], {'cleanAmount': True}))
+
+        # 8. 이름 노이즈
+        if rows['name_noise']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼의 이름에 숫자나 특수문자가 섞여 있습니다.", rows['name_noise'], {'cleanName': True}))
+
+        # 9. 주소
+        if '주소' in lower or 'address' in lower:
+            avg_len = col.total_length / len(relevant)
+            if 0 < avg_len < 6:
+                issues.append(_issue(key, 'warning', f"'{key}' 컬럼의 데이터 길이가 너무 짧아 자동 정제가 어렵습니다. (평균 {_js_round(avg_len)}자) 원본 데이터를 확인 후 직접 수정해 주세요.", relevant))
+            elif col.address_valid < len(relevant) * 0.5:
+                issues.append(_issue(key, 'warning', f"'{key}' 컬럼의 주소 형식이 불완전해 보입니다. AI 정제를 제안합니다.", rows['address_missing'],
+                                     promptSuggestion=f"'{key}' 컬럼의 주소를 도로명 주소 형식으로 정제하고 시/도, 시/군/구로 분리해줘"))
+
+        # 10. 사업자등록번호 (첫 행이 사업자번호 형식일 때만)
+        if BIZ_NUM_FIRST.search(scanner.first_values.get(key, '')):
+            if col.biz_num > len(relevant) * 0.5 and rows['biz_num_invalid']:
+                issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 사업자등록번호 형식이 아닌 데이터가 있습니다.", rows['biz_num_invalid'], {'formatBizNum': True}))
+
+        # 11. 주민번호
+        if rows['rrn_unmasked']:
+            issues.append(_issue(key, 'error', f"'{key}' 컬럼에 마스킹되지 않은 주민등록번호가 감지되었습니다. 개인정보 보호를 위해 마스킹을 권장합니다.",
+                                 rows['rrn_unmasked'], {'maskPersonalData': True}))
+
+        # 12. URL
+        if rows['url_no_protocol'] and len(rows['url_no_protocol']) > col.url_like * 0.5:
+            issues.append(_issue(key, 'info', f"'{key}' 컬럼의 웹 사이트 주소에 프로토콜(http/https)이 누락되어 있습니다.", rows['url_no_protocol'], {'formatUrl': True}))
+
+        # 13. 카드번호
+        if rows['card_invalid']:
+            issues.append(_issue(key, 'warning', f"'{key}' 컬럼에 유효하지 않은 카드번호(길이 부적합 등)가 있습니다.", rows['card_invalid']))
+
+    return issues
+
+
+def detect_pattern_issues(rejected_patterns: Iterable[str]) -> List[DataIssue]:
+    """실행 시간을 보장할 수 없어 적용하지 않은 프롬프트 패턴을 이슈로 만듭니다 (safe_regex.py, detectPatternIssues와 동일)."""
+    return [{
+        'column': '정제 요청',
+        'type': 'warning',
+        'message': f'"{source}" 패턴은 데이터에 따라 처리 시간이 급격히 늘 수 있어 적용하지 않았습니다. '
+                   '역참조(\\1)나 전후방 탐색((?=...)) 없이 다시 입력해 주세요.',
+    } for source in rejected_patterns]
+
+
+def _js_round(value: float) -> int:
+    """`Math.round`와 같은 반올림 (파이썬 round는 짝수 쪽으로 반올림)"""
+    return math.floor(value + 0.5)
+
+
+def _js_string(value: object) -> str:
+    """`String(value)`와 동일한 비교용 문자열 (None은 'undefined')"""
+    if value is None:
+        return 'undefined'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e21:
+        return str(int(value))
+    return str(value)
+
+
+@dataclass
+class DiffCounts:
+    """셀 단위 변화량 집계 (청크마다 누적)"""
+    rows: int = 0
+    cells: int = 0
+    empty_cells: int = 0
+    changed_cells: int = 0
+
+    def add(self, original: Sequence[DataRow], processed: Sequence[DataRow], headers: Sequence[str]) -> None:
+        """countDiff와 같이 정제 결과의 빈 셀과 원본과 다른 셀을 셉니다."""
+        self.rows += len(processed)
+        self.cells += len(processed) * len(headers)
+        for orig, row in zip(original, processed):
+            for h in headers:
+                val = row.get(h)
+                if not js_str(val).strip():
+                    self.empty_cells += 1
+                if _js_string(val) != _js_string(orig.get(h)):
+                    self.changed_cells += 1
+
+
+def finalize_diff_stats(counts: DiffCounts, initial_issues: int, final_issues: int) -> ProcessingStats:
+    """변화량 집계와 이슈 수로 품질 통계를 계산합니다. (finalizeDiffStats와 같은 공식)"""
+    stats = ProcessingStats(resolved_issues=max(0, initial_issues - final_issues))
+    if counts.rows == 0:
+        return stats
+    stats.total_rows = counts.rows
+    stats.changed_cells = counts.changed_cells
+    stats.completeness = _js_round((counts.cells - counts.empty_cells) / counts.cells * 100) if counts.cells else 0
+    stats.validity = max(0, min(100, 100 - _js_round(final_issues / stats.total_rows * 100)))
+    stats.quality_score = _js_round(stats.completeness * 0.4 + stats.validity * 0.6)
+    return stats
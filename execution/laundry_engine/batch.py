@@ -0,0 +1,285 @@
+"""
+여러 파일/시트 일괄 정제 (Batch)
+
+폴더나 파일 목록에 있는 CSV/XLSX의 모든 시트를 같은 프롬프트/옵션으로 정제해 시트마다 결과 파일을 쓰고,
+시트별 이슈와 품질 통계를 모은 보고서(report.json)를 남깁니다. 웹 앱의 `src/lib/batch.ts`와 같은 방식입니다.
+
+프롬프트는 부모 프로세스에서 한 번 분석해 워커에 넘기고, 워커는 헤더 구성별로 정제 계획을 컴파일해 재사용합니다 (plan_cache).
+작업 순서는 시트 크기(CSV 파일 크기, 압축을 푼 시트 XML 크기)로 정합니다.
+  - 워커 한 개 몫(전체 크기 / 워커 수)보다 큰 시트는 먼저, 청크 단위로 모든 워커에 나눠 정제합니다 (parallel.py).
+  - 나머지 시트는 큰 것부터 워커에 하나씩 배정해(LPT) 마지막에 큰 시트 하나만 남아 도는 일이 없게 합니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+from .capacity import auto_plan
+from .models import ColumnLimits, ColumnSpecificOptions, DataIssue, ProcessingOptions, ProcessingStats
+from .nlp import PromptAnalysis, analyze_prompt
+from .parallel import resolve_workers
+from .parsers import file_extension, list_sheets
+from .pipeline import CleanResult, clean_file
+from .profiler import merge_profiles
+from .table_cache import TableCache
+
+# 일괄 정제 대상 확장자
+BATCH_EXTENSIONS = ('csv', 'xlsx')
+# 보고서 파일 이름 (결과 폴더 안)
+REPORT_NAME = 'report.json'
+# 보고서에 남기는 이슈별 행 번호 수 (전체 행 목록은 결과가 크면 보고서가 지나치게 커짐)
+REPORT_SAMPLE_ROWS = 20
+
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+@dataclass(frozen=True)
+class BatchTask:
+    """시트 하나의 정제 작업"""
+    input_path: str
+    sheet: Optional[str]   # XLSX 시트 이름 (CSV는 None)
+    output_path: str
+    size: int              # 예상 크기 (바이트, 작업 순서 기준)
+
+
+@dataclass
+class BatchResult:
+    """일괄 정제 결과 (시트별 결과는 collect_tasks 순서)"""
+    output_dir: str
+    results: List[CleanResult] = field(default_factory=list)
+    failures: List[Tuple[BatchTask, str]] = field(default_factory=list)
+    workers: int = 1
+    elapsed: float = 0.0
+    report_path: Optional[str] = None
+
+    @property
+    def total_rows(self) -> int:
+        return sum(r.total_rows for r in self.results)
+
+    def profile(self) -> Optional[Dict[str, Any]]:
+        """시트별 프로파일을 합친 프로파일 (profile=True로 정제했을 때만)"""
+        return merge_profiles(r.profile for r in self.results)
+
+    def to_report(self) -> Dict[str, Any]:
+        """보고서 딕셔너리 (웹 앱과 같은 camelCase 키)"""
+        issue_counts = {'error': 0, 'warning': 0, 'info': 0}
+        sheets = []
+        for r in self.results:
+            for issue in r.issues:
+                issue_counts[issue['type']] = issue_counts.get(issue['type'], 0) + 1
+            sheets.append({
+                'input': r.input_path,
+                'sheet': r.sheet,
+                'output': r.output_path,
+                'rows': r.total_rows,
+                'elapsed': round(r.elapsed, 3),
+                'stats': r.stats.to_dict() if r.stats else None,
+                'issues': [_report_issue(issue) for issue in r.issues],
+                **({'profile': r.profile} if r.profile else {}),
+            })
+        merged = merge_stats([r.stats for r in self.results if r.stats])
+        profile = self.profile()
+        return {
+            'summary': {
+                'files': len({r.input_path for r in self.results} | {t.input_path for t, _ in self.failures}),
+                'sheets': len(self.results),
+                'failed': len(self.failures),
+                'totalRows': self.total_rows,
+                'workers': self.workers,
+                'elapsed': round(self.elapsed, 3),
+                'stats': merged.to_dict() if merged else None,
+                'issueCounts': issue_counts,
+                **({'profile': profile} if profile else {}),
+            },
+            'sheets': sheets,
+            'failures': [{'input': t.input_path, 'sheet': t.sheet, 'error': error} for t, error in self.failures],
+        }
+
+
+def _report_issue(issue: DataIssue) -> Dict[str, Any]:
+    rows = issue.get('affectedRows', [])
+    item = {k: v for k, v in issue.items() if k != 'affectedRows'}
+    item['affectedCount'] = len(rows)
+    item['sampleRows'] = list(rows[:REPORT_SAMPLE_ROWS])
+    return item
+
+
+def merge_stats(stats: Sequence[ProcessingStats]) -> Optional[ProcessingStats]:
+    """시트별 품질 통계를 합칩니다. 건수는 더하고, 점수/비율은 행 수로 가중 평균합니다."""
+    if not stats:
+        return None
+    rows = sum(s.total_rows for s in stats)
+
+    def weighted(name: str) -> int:
+        if rows == 0:
+            return 0
+        return round(sum(getattr(s, name) * s.total_rows for s in stats) / rows)
+
+    return ProcessingStats(
+        total_rows=rows,
+        changed_cells=sum(s.changed_cells for s in stats),
+        resolved_issues=sum(s.resolved_issues for s in stats),
+        quality_score=weighted('quality_score'),
+        completeness=weighted('completeness'),
+        validity=weighted('validity'),
+    )
+
+
+def _iter_input_files(inputs: Iterable[str]) -> List[str]:
+    """입력 경로를 파일 목록으로 펼칩니다. 폴더는 바로 아래의 CSV/XLSX 파일을 이름 순서로 (임시 파일 제외)."""
+    files: List[str] = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full = os.path.join(path, name)
+                if name.startswith(('.', '~$')) or not os.path.isfile(full):
+                    continue
+                if file_extension(name) in BATCH_EXTENSIONS:
+                    files.append(full)
+        else:
+            files.append(path)
+    return files
+
+
+def collect_tasks(inputs: Iterable[str], output_dir: str, output_format: Optional[str] = None) -> List[BatchTask]:
+    """
+    입력 파일들의 시트를 작업 목록으로 만듭니다.
+    결과 파일은 output_dir 아래 `<파일 이름>.<형식>`(CSV) 또는 `<파일 이름>__<시트 이름>.<형식>`(XLSX)이며,
+    output_format이 없으면 입력과 같은 형식으로 씁니다. 이름이 겹치면 뒤에 번호를 붙입니다.
+    """
+    if output_format is not None and output_format not in BATCH_EXTENSIONS:
+        raise ValueError(f'Unsupported output format: {output_format}')
+    tasks: List[BatchTask] = []
+    used: set = set()
+    for path in _iter_input_files(inputs):
+        ext = file_extension(path)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        try:
+            sheets = list_sheets(path)
+        except (OSError, ValueError, zipfile.BadZipFile, ElementTree.ParseError):
+            # 읽을 수 없는 파일도 작업으로 남겨 실행 단계에서 실패로 보고
+            sheets = [(None, 0)]
+        for sheet, size in sheets:
+            base = stem if sheet is None else f'{stem}__{_UNSAFE_NAME.sub("_", sheet).strip("_") or "sheet"}'
+            name, n = base, 1
+            while name.lower() in used:
+                n += 1
+                name = f'{base}_{n}'
+            used.add(name.lower())
+            tasks.append(BatchTask(path, sheet, os.path.join(output_dir, f'{name}.{output_format or ext}'), size))
+    return tasks
+
+
+def schedule_tasks(tasks: Sequence[BatchTask], workers: int) -> Tuple[List[BatchTask], List[BatchTask]]:
+    """
+    (청크 단위로 나눠 정제할 큰 시트, 시트 단위로 워커에 배정할 나머지)를 각각 큰 것부터 반환합니다.
+    워커 한 개 몫보다 큰 시트를 시트 단위로 배정하면 그 시트가 끝날 때까지 다른 워커가 쉬게 되므로 따로 나눕니다.
+    """
+    ordered = sorted(tasks, key=lambda t: t.size, reverse=True)
+    if workers <= 1:
+        return [], ordered
+    share = sum(t.size for t in ordered) / workers
+    large = [t for t in ordered if t.size > share]
+    return large, [t for t in ordered if t.size <= share]
+
+
+# 워커 프로세스 전역 상태 (_init_batch_worker에서 설정)
+_batch_settings: Dict[str, Any] = {}
+_batch_cache: Optional[TableCache] = None
+
+
+def _init_batch_worker(settings: Dict[str, Any], cache_dir: Optional[str]) -> None:
+    global _batch_settings, _batch_cache
+    _batch_settings = settings
+    _batch_cache = TableCache(cache_dir) if cache_dir else None
+
+
+def _clean_task(task: BatchTask, workers: int = 1) -> CleanResult:
+    return clean_file(task.input_path, task.output_path, workers=workers, cache=_batch_cache, sheet=task.sheet, **_batch_settings)
+
+
+def clean_batch(
+    inputs: Iterable[str],
+    output_dir: str,
+    prompt: str = '',
+    options: Optional[ProcessingOptions] = None,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+    chunk_size: int = 0,
+    mode: str = 'row',
+    workers: int = 0,
+    column_limits: Optional[ColumnLimits] = None,
+    analyze: bool = True,
+    output_format: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    on_result: Optional[Callable[[CleanResult], None]] = None,
+    profile: bool = False,
+) -> BatchResult:
+    """
+    파일/폴더 목록의 모든 시트를 정제해 output_dir에 시트별 결과와 보고서(report.json)를 씁니다.
+    workers가 0 이하이면 CPU 코어 수만큼 워커를 사용합니다. analyze=True이면 시트별 이슈/품질 통계를 보고서에 담습니다.
+    읽거나 정제하지 못한 시트는 건너뛰고 보고서의 failures에 남깁니다. on_result는 시트가 끝날 때마다 호출됩니다.
+    profile=True이면 시트별/전체 프로파일을 보고서에 담습니다 (profiler.py).
+    """
+    started = time.perf_counter()
+    workers = resolve_workers(workers)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = collect_tasks(inputs, output_dir, output_format)
+    result = BatchResult(output_dir=output_dir, workers=workers)
+
+    nlp: PromptAnalysis = analyze_prompt(prompt)
+    if chunk_size <= 0:
+        chunk_size = auto_plan(workers, mode).chunk_size
+    settings = {
+        'prompt': nlp,
+        'options': options or ProcessingOptions(),
+        'locked_columns': tuple(locked_columns),
+        'column_options': dict(column_options or {}),
+        'chunk_size': chunk_size,
+        'mode': mode,
+        'column_limits': column_limits,
+        'analyze': analyze,
+        'profile': profile,
+    }
+    done: Dict[BatchTask, CleanResult] = {}
+    failed: Dict[BatchTask, str] = {}
+
+    def finish(task: BatchTask, run: Callable[[], CleanResult]) -> None:
+        try:
+            done[task] = run()
+        except Exception as e:  # 파일 하나의 오류로 전체 일괄 작업을 멈추지 않음
+            failed[task] = f'{type(e).__name__}: {e}'
+            return
+        if on_result:
+            on_result(done[task])
+
+    large, small = schedule_tasks(tasks, workers)
+    _init_batch_worker(settings, cache_dir)
+    for task in large:
+        finish(task, lambda task=task: _clean_task(task, workers))
+
+    if workers == 1 or len(small) <= 1:
+        for task in small:
+            finish(task, lambda task=task: _clean_task(task))
+    elif small:
+        pool_size = min(workers, len(small))
+        with ProcessPoolExecutor(max_workers=pool_size, initializer=_init_batch_worker, initargs=(settings, cache_dir)) as pool:
+            # 큰 시트부터 제출 (대기열은 제출 순서대로 빈 워커에 배정)
+            futures: Dict[Future, BatchTask] = {pool.submit(_clean_task, task): task for task in small}
+            for future in as_completed(futures):
+                finish(futures[future], future.result)
+
+    result.results = [done[t] for t in tasks if t in done]
+    result.failures = [(t, failed[t]) for t in tasks if t in failed]
+    result.elapsed = time.perf_counter() - started
+    result.report_path = os.path.join(output_dir, REPORT_NAME)
+    with open(result.report_path, 'w', encoding='utf-8') as f:
+        json.dump(result.to_report(), f, ensure_ascii=False, indent=2)
+    return result
@@ -0,0 +1,233 @@
+"""
+처리 용량 계획 (Capacity Planner)
+
+`src/lib/core/performance.ts`와 같은 방식입니다. 정제 커널을 합성 행에 잠깐 실행해
+처리량(행/초)과 행당 메모리를 측정하고, 이 값으로 청크 크기를 정합니다.
+청크 하나가 CHUNK_SECONDS 안에 끝나고, 동시에 메모리에 올라가는 청크들(입력 + 결과)이
+사용 가능한 메모리의 MEMORY_RATIO를 넘지 않는 크기를 고릅니다.
+측정 결과는 프로세스 안에서 재사용하고, CLI는 사용자 캐시 디렉터리에 저장해 다음 배치 작업에서도 재사용합니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from .columnar import process_columns
+from .models import DataRow, ProcessingOptions
+from .parallel import PENDING_PER_WORKER, resolve_workers
+from .plan import compile_plan
+
+CALIBRATION_VERSION = 1
+# 저장된 측정값 유효 기간 (초)
+CALIBRATION_TTL = 7 * 24 * 60 * 60
+DEFAULT_CALIBRATION_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'laundry_engine', 'calibration.json')
+
+# 측정 행 수: 측정 시간이 MIN_MEASURE_SECONDS를 넘을 때까지 두 배씩 늘림
+WARMUP_ROWS = 200
+MEASURE_ROWS = 1000
+MAX_MEASURE_ROWS = 16000
+MIN_MEASURE_SECONDS = 0.05
+# 메모리 측정 행 수 (tracemalloc은 실행을 느리게 하므로 처리량 측정과 따로 실행)
+MEMORY_ROWS = 1000
+
+# 청크 하나의 목표 처리 시간
+CHUNK_SECONDS = 0.5
+MIN_CHUNK_SIZE = 1000
+MAX_CHUNK_SIZE = 100_000
+# 사용 가능한 메모리 중 청크에 쓰는 비율
+MEMORY_RATIO = 0.25
+# 사용 가능한 메모리를 알 수 없을 때 가정하는 값 (MB)
+DEFAULT_MEMORY_MB = 2048
+
+# 측정에 쓰는 체크박스 조합 (performance.ts의 CALIBRATION_OPTIONS와 동일)
+CALIBRATION_OPTIONS = ProcessingOptions(
+    remove_whitespace=True, format_mobile=True, format_general_phone=True, format_date=True, format_number=True,
+    clean_email=True, clean_garbage=True, clean_amount=True, clean_name=True, auto_detect=True,
+)
+
+_SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤']
+_CITIES = ['서울시 강남구', '부산광역시 해운대구', '경기도 성남시 분당구', '대구 수성구', '인천 남동구']
+
+# 프로세스 안에서 측정값 재사용 (mode별)
+_calibrations: Dict[str, 'Calibration'] = {}
+
+
+@dataclass(frozen=True)
+class Calibration:
+    """정제 커널 측정 결과"""
+    rows_per_second: int    # 프로세스 하나의 처리량
+    bytes_per_row: int      # 입력 행 + 정제 결과 행의 메모리
+    mode: str = 'row'
+    measured_at: float = 0.0
+    version: int = CALIBRATION_VERSION
+
+
+@dataclass(frozen=True)
+class CapacityPlan:
+    """측정값으로 정한 배치 실행 설정"""
+    chunk_size: int
+    workers: int
+    rows_per_second: int
+    bytes_per_row: int
+    memory_budget_mb: int
+
+
+def synthetic_rows(count: int, seed: int = 0) -> List[DataRow]:
+    """측정용 합성 행 (performance.ts의 syntheticRows와 같은 값)"""
+    rows: List[DataRow] = []
+    for i in range(count):
+        n = i + seed
+        mid = str(1000 + (n * 7919) % 9000)
+        last = str(1000 + (n * 104729) % 9000)
+        phone = f'010{mid}{last}' if n % 3 == 0 else f'010 {mid} {last}' if n % 3 == 1 else f'010-{mid}-{last}'
+        date = f'2024.{n % 12 + 1}.{n % 28 + 1}' if n % 2 == 0 else f'2023-{n % 12 + 1:02d}-{n % 28 + 1:02d}'
+        rows.append({
+            '고객명': f' {_SURNAMES[n % len(_SURNAMES)]}민{chr(0xAC00 + (n * 31) % 11172)} ',
+            '연락처': phone,
+            '이메일': f' USER{n}@Example.COM ' if n % 5 == 0 else f'user{n}@example.com',
+            '가입일': date,
+            '구매금액': f'{n % 90 + 1}만원' if n % 4 == 0 else str((n * 137) % 10_000_000),
+            '주소': f'{_CITIES[n % len(_CITIES)]} {n % 300}번길 {n % 50}',
+            '메모': f'★확인필요★ #{n}' if n % 7 == 0 else f'주문 {n}',
+        })
+    return rows
+
+
+def _clean(rows: List[DataRow], mode: str) -> List[DataRow]:
+    # 측정마다 새로 컴파일해 이전 측정의 고유값 메모가 적중하지 않도록 함
+    plan = compile_plan('', list(rows[0]), CALIBRATION_OPTIONS)
+    if mode == 'columnar':
+        return process_columns(plan, rows)
+    return [plan.process_row(row) for row in rows]
+
+
+def measure_throughput(mode: str = 'row') -> Calibration:
+    """정제 커널을 합성 행에 실행해 처리량과 행당 메모리를 측정합니다. (약 0.1~0.5초)"""
+    _clean(synthetic_rows(WARMUP_ROWS), mode)
+
+    rows = MEASURE_ROWS
+    seed = WARMUP_ROWS
+    while True:
+        data = synthetic_rows(rows, seed)
+        started = time.perf_counter()
+        _clean(data, mode)
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_MEASURE_SECONDS or rows >= MAX_MEASURE_ROWS:
+            break
+        seed += rows
+        rows *= 2
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        data = synthetic_rows(MEMORY_ROWS, seed + rows)
+        cleaned = _clean(data, mode)
+        used = tracemalloc.get_traced_memory()[0] - before
+        del data, cleaned
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return Calibration(
+        rows_per_second=round(rows / max(elapsed, 1e-6)),
+        bytes_per_row=max(1, round(used / MEMORY_ROWS)),
+        mode=mode,
+        measured_at=time.time(),
+    )
+
+
+def available_memory_mb() -> int:
+    """사용 가능한 물리 메모리 (MB). 알 수 없으면 DEFAULT_MEMORY_MB"""
+    try:
+        pages = os.sysconf('SC_AVPHYS_PAGES')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        if pages > 0 and page_size > 0:
+            return pages * page_size // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        pass
+    return DEFAULT_MEMORY_MB
+
+
+def plan_capacity(calibration: Calibration, workers: int = 1, memory_budget_mb: Optional[int] = None) -> CapacityPlan:
+    """
+    측정값으로 청크 크기를 정합니다.
+    병렬 실행은 워커마다 PENDING_PER_WORKER개 청크가 대기하므로 그만큼 메모리 몫을 나눕니다 (parallel.py).
+    """
+    workers = resolve_workers(workers)
+    if memory_budget_mb is None:
+        memory_budget_mb = int(available_memory_mb() * MEMORY_RATIO)
+    in_flight = 1 if workers == 1 else workers * PENDING_PER_WORKER
+    by_time = calibration.rows_per_second * CHUNK_SECONDS
+    by_memory = memory_budget_mb * 1024 * 1024 / (calibration.bytes_per_row * in_flight)
+    chunk_size = int(min(by_time, by_memory)) // 1000 * 1000
+    return CapacityPlan(
+        chunk_size=max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, chunk_size)),
+        workers=workers,
+        rows_per_second=calibration.rows_per_second,
+        bytes_per_row=calibration.bytes_per_row,
+        memory_budget_mb=memory_budget_mb,
+    )
+
+
+def _load_saved(path: str) -> Dict[str, dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        return saved if isinstance(saved, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def get_calibration(mode: str = 'row', refresh: bool = False, cache_path: Optional[str] = DEFAULT_CALIBRATION_PATH) -> Calibration:
+    """
+    저장된 측정값을 반환하고, 없거나 오래되었으면 다시 측정해 저장합니다.
+    cache_path가 None이면 파일에 저장하지 않습니다 (프로세스 안에서만 재사용).
+    """
+    if not refresh and mode in _calibrations:
+        return _calibrations[mode]
+
+    saved = _load_saved(cache_path) if cache_path else {}
+    entry = saved.get(mode)
+    calibration: Optional[Calibration] = None
+    if not refresh and isinstance(entry, dict):
+        try:
+            candidate = Calibration(**entry)
+            if candidate.version == CALIBRATION_VERSION and time.time() - candidate.measured_at < CALIBRATION_TTL:
+                calibration = candidate
+        except TypeError:
+            pass
+
+    if calibration is None:
+        calibration = measure_throughput(mode)
+        if cache_path:
+            saved[mode] = asdict(calibration)
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(saved, f)
+            except OSError:
+                pass  # 저장 실패(읽기 전용 홈 등)는 이번 실행에만 사용
+
+    _calibrations[mode] = calibration
+    return calibration
+
+
+def auto_plan(
+    workers: int = 1,
+    mode: str = 'row',
+    memory_budget_mb: Optional[int] = None,
+    refresh: bool = False,
+    cache_path: Optional[str] = None,
+) -> CapacityPlan:
+    """
+    측정값(저장된 값 우선)으로 배치 실행 설정을 정합니다.
+    라이브러리 호출(clean_file, clean_batch)은 측정값을 프로세스 안에서만 재사용하고,
+    CLI처럼 cache_path를 넘긴 경우에만 파일에 저장합니다.
+    """
+    return plan_capacity(get_calibration(mode, refresh, cache_path), workers, memory_budget_mb)
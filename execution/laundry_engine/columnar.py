@@ -0,0 +1,103 @@
+"""
+컬럼 모드 정제 실행기
+
+행(dict)마다 모든 컬럼의 단계를 실행하는 대신, 청크를 컬럼별 배열로 펼친 뒤
+정제 계획(plan.py)의 단계를 컬럼 전체에 한 번씩 적용합니다.
+벡터 커널(kernels.py)이 있는 단계(연락처, 공백, 날짜, 금액, 조건부 치환)는 컬럼 단위로 실행되고,
+나머지 단계는 같은 셀 함수를 map으로 일괄 실행하므로 결과는 행 모드와 동일합니다.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import kernels
+from .models import ColumnSpecificOptions, DataRow, ProcessingOptions
+from .nlp import PromptAnalysis
+from .plan import CleaningPlan, ColumnPlan, get_plan
+from .transforms import Transform
+from .utils import js_str
+
+
+def uniform_keys(data: Sequence[DataRow]) -> Optional[Tuple[str, ...]]:
+    """모든 행의 키 순서가 같으면 그 키 목록을, 아니면 None을 반환합니다 (행 모드로 대체)."""
+    if not data:
+        return ()
+    keys = tuple(data[0])
+    for row in data:
+        if tuple(row) != keys:
+            return None
+    return keys
+
+
+def rows_to_columns(data: Sequence[DataRow]) -> List[tuple]:
+    """키 순서가 같은 행 목록을 컬럼별 값 배열로 펼칩니다."""
+    return list(zip(*map(dict.values, data)))
+
+
+def columns_to_rows(keys: Sequence[str], columns: Sequence[Sequence[object]]) -> List[DataRow]:
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def _run(steps: Sequence[Transform], values: List[str]) -> List[str]:
+    """단계를 순서대로 컬럼 전체에 적용합니다 (연속된 커널 단계는 Arrow 배열을 그대로 이어받음)."""
+    col: kernels.Column = values
+    for step in steps:
+        if step.kernel is not None:
+            try:
+                col = step.kernel(kernels.to_column(col))
+                continue
+            except (UnicodeError, *kernels.KernelError):
+                # Arrow로 표현할 수 없는 값(홑 서로게이트 등) -> 셀 함수로 처리
+                pass
+        col = list(map(step.fn, kernels.to_list(col)))
+    return kernels.to_list(col)
+
+
+def apply_column(plan: ColumnPlan, raw_values: Sequence[object]) -> List[object]:
+    """컬럼 계획을 컬럼 전체 값에 적용합니다. 잠금 컬럼은 원본 값을 그대로 반환합니다."""
+    if plan.locked:
+        return list(raw_values)
+    values = list(map(js_str, raw_values))
+    if not plan.transforms:
+        return values
+    if plan.missing_fill is None:
+        return _run(plan.transforms, values)
+
+    # 원본 값이 없는(None) 셀은 결측치 채우기 값에서 이어서 처리 (ColumnPlan.apply와 동일)
+    missing = [i for i, raw in enumerate(raw_values) if raw is None]
+    if not missing:
+        return _run(plan.transforms, values)
+    values = _run(plan.transforms[:plan.missing_start], values)
+    for i in missing:
+        values[i] = plan.missing_fill
+    return _run(plan.transforms[plan.missing_start:], values)
+
+
+def process_columns(plan: CleaningPlan, data: List[DataRow]) -> List[DataRow]:
+    """
+    정제 계획을 컬럼 단위로 적용해 청크를 정제합니다.
+    행마다 키 구성이 다른 청크(초과 필드 등)는 행 모드로 처리합니다.
+    """
+    keys = uniform_keys(data)
+    if not data or keys is None:
+        return [plan.process_row(row) for row in data]
+    columns = rows_to_columns(data)
+    cleaned = [
+        col if key is None else apply_column(plan.columns.get(key) or plan.column(key), col)
+        for key, col in zip(keys, columns)
+    ]
+    return columns_to_rows(keys, cleaned)
+
+
+def process_data_columnar(
+    data: List[DataRow],
+    prompt: Union[str, PromptAnalysis],
+    options: ProcessingOptions,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+) -> List[DataRow]:
+    """process_data_local의 컬럼 모드 버전 (결과 동일)"""
+    if not data:
+        return []
+    plan = get_plan(prompt, [k for k in data[0] if k is not None], options, locked_columns, column_options)
+    return process_columns(plan, data)
@@ -0,0 +1,179 @@
+"""
+파일 내보내기 (스트리밍)
+
+`src/lib/core/exporters.ts`의 다운로드와 같은 형식(CSV: UTF-8 BOM, 최소 따옴표 / XLSX: 쓰기 전용 인라인 문자열 시트)으로
+정제된 청크를 도착하는 즉시 디스크에 기록합니다.
+"""
+from __future__ import annotations
+
+import csv
+import math
+import re
+import zipfile
+from typing import Iterable, List, Optional, Union
+from xml.sax.saxutils import escape
+
+from .models import CellValue, DataRow
+from .parsers import file_extension
+
+
+class CsvChunkWriter:
+    """청크 단위로 행을 추가 기록하는 CSV 작성기 (with 문 지원)"""
+
+    def __init__(self, path: str, headers: List[str], bom: bool = True):
+        self.path = path
+        self.headers = headers
+        self.rows_written = 0
+        # 한글 깨짐 방지를 위해 웹 앱과 동일하게 BOM을 붙임
+        self._handle = open(path, 'w', encoding='utf-8-sig' if bom else 'utf-8', newline='')
+        self._writer = csv.DictWriter(self._handle, fieldnames=headers, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write_rows(self, rows: Iterable[DataRow]) -> None:
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows_written += 1
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+    def __enter__(self) -> 'CsvChunkWriter':
+        return self
+
+    def __exit__(self, *exc: Optional[BaseException]) -> None:
+        self.close()
+
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES = (
+    _XML_HEADER + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK_RELS = (
+    f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+_STYLES = (
+    f'{_XML_HEADER}<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+# XML에 쓸 수 없는 제어 문자는 엑셀 방식(_xHHHH_)으로 표기하고, 원래 있던 _xHHHH_ 문자열은 _x005F_로 보호
+_INVALID_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_ESCAPED_CHAR = re.compile(r'_x([0-9a-fA-F]{4})_')
+
+
+def _escape_text(text: str) -> str:
+    if '_x' in text:
+        text = _ESCAPED_CHAR.sub(r'_x005F_x\1_', text)
+    text = _INVALID_XML.sub(lambda m: f'_x{ord(m.group(0)):04X}_', text)
+    return escape(text, {'"': '&quot;'})
+
+
+def _column_name(index: int) -> str:
+    name = ''
+    n = index + 1
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def _cell_xml(ref: str, value: Optional[CellValue]) -> str:
+    if value is None:
+        return ''
+    if value is True or value is False:
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    text = str(value)
+    space = ' xml:space="preserve"' if text[:1].isspace() or text[-1:].isspace() else ''
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{_escape_text(text)}</t></is></c>'
+
+
+class XlsxChunkWriter:
+    """
+    청크 단위로 행을 추가 기록하는 쓰기 전용 XLSX 작성기 (with 문 지원)
+    시트 XML을 zip 항목 스트림에 바로 압축해 쓰므로, 메모리에는 현재 청크만 남습니다.
+    """
+
+    def __init__(self, path: str, headers: List[str], sheet_name: str = 'Sheet1'):
+        self.path = path
+        self.headers = headers
+        self.rows_written = 0
+        self._refs = [_column_name(i) for i in range(len(headers))]
+        self._archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        try:
+            self._archive.writestr('[Content_Types].xml', _CONTENT_TYPES)
+            self._archive.writestr('_rels/.rels', _ROOT_RELS)
+            self._archive.writestr('xl/workbook.xml', (
+                f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+                f'<sheets><sheet name="{_escape_text(sheet_name)}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+            ))
+            self._archive.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+            self._archive.writestr('xl/styles.xml', _STYLES)
+            # 크기를 미리 알 수 없으므로 4GB를 넘어도 되도록 zip64로 연다
+            self._sheet = self._archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True)
+            header = ''.join(_cell_xml(f'{ref}1', h) for ref, h in zip(self._refs, headers))
+            self._write(f'{_XML_HEADER}<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheetData><row r="1">{header}</row>')
+        except Exception:
+            self._archive.close()
+            raise
+
+    def _write(self, text: str) -> None:
+        self._sheet.write(text.encode('utf-8'))
+
+    def write_rows(self, rows: Iterable[DataRow]) -> None:
+        parts: List[str] = []
+        for row in rows:
+            r = self.rows_written + 2
+            cells = ''.join(_cell_xml(f'{ref}{r}', row.get(h)) for ref, h in zip(self._refs, self.headers))
+            parts.append(f'<row r="{r}">{cells}</row>')
+            self.rows_written += 1
+        self._write(''.join(parts))
+
+    def close(self) -> None:
+        if self._sheet.closed:
+            return
+        self._write('</sheetData></worksheet>')
+        self._sheet.close()
+        self._archive.close()
+
+    def __enter__(self) -> 'XlsxChunkWriter':
+        return self
+
+    def __exit__(self, *exc: Optional[BaseException]) -> None:
+        self.close()
+
+
+def open_writer(path: str, headers: List[str]) -> Union[CsvChunkWriter, XlsxChunkWriter]:
+    """확장자에 따라 CSV/XLSX 청크 작성기를 선택합니다."""
+    ext = file_extension(path)
+    if ext == 'csv':
+        return CsvChunkWriter(path, headers)
+    if ext == 'xlsx':
+        return XlsxChunkWriter(path, headers)
+    raise ValueError('Unsupported file type')
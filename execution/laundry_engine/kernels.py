@@ -0,0 +1,148 @@
+"""
+컬럼 단위 벡터 커널
+
+컬럼 모드(columnar.py)에서 한 컬럼 전체에 한 번에 적용되는 정제 단계 구현입니다.
+pyarrow가 설치되어 있으면 Arrow 문자열 배열 위에서 C++ 커널(RE2 정규식)로 실행하고,
+없으면 고유값만 한 번씩 계산하는 순수 파이썬 커널만 사용합니다 (나머지 단계는 셀 함수로 일괄 처리).
+pyarrow는 선택 의존성입니다 (`execution/requirements-arrow.txt`).
+모든 커널은 같은 단계의 셀 함수(Transform.fn)와 동일한 결과를 내야 합니다.
+"""
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Union
+
+from .utils import JS_WHITESPACE
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow가 없으면 순수 파이썬 커널만 사용
+    pa = None
+    pc = None
+
+ARROW_AVAILABLE = pa is not None
+
+# 커널 실행 중 Arrow가 처리하지 못한 입력 -> 셀 함수로 대체 실행
+KernelError = (pa.ArrowException,) if ARROW_AVAILABLE else ()
+
+Column = Union[List[str], 'pa.Array']
+Kernel = Callable[[Column], Column]
+
+# RE2 문법용 JS 공백 문자 클래스 본문
+_RE2_SPACE = ''.join(f'\\x{{{ord(c):04x}}}' for c in JS_WHITESPACE)
+_RE2_MOBILE = r'^(01[016789])([0-9]{3,4})([0-9]{4})$'
+_RE2_PHONE_SEOUL = r'^([0-9]{2})([0-9]{3,4})([0-9]{4})$'
+_RE2_PHONE_AREA = r'^([0-9]{3})([0-9]{3,4})([0-9]{4})$'
+# JS parseFloat가 숫자/점/마이너스만 남긴 문자열에서 읽어내는 앞부분
+_RE2_FLOAT_PREFIX = r'^(?P<n>-?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+))'
+
+
+def to_column(values: Column) -> Column:
+    """커널 입력 형식으로 변환합니다 (Arrow 사용 시 문자열 배열)."""
+    if ARROW_AVAILABLE and isinstance(values, list):
+        return pa.array(values, type=pa.string())
+    return values
+
+
+def to_list(col: Column) -> List[str]:
+    return col if isinstance(col, list) else col.to_pylist()
+
+
+def factorized(fn: Callable[[str], str]) -> Kernel:
+    """고유값에만 fn을 적용한 뒤 전체 컬럼으로 펼치는 커널 (날짜/금액처럼 반복값이 많은 단계용)"""
+    if ARROW_AVAILABLE:
+        def arrow_kernel(col: 'pa.Array') -> 'pa.Array':
+            encoded = pc.dictionary_encode(col)
+            mapped = pa.array([fn(v) for v in encoded.dictionary.to_pylist()], type=pa.string())
+            return mapped.take(encoded.indices)
+        return arrow_kernel
+
+    def list_kernel(col: List[str]) -> List[str]:
+        table = {v: fn(v) for v in dict.fromkeys(col)}
+        return list(map(table.__getitem__, col))
+    return list_kernel
+
+
+def whitespace_kernel() -> Optional[Kernel]:
+    """`val.replace(/\\s+/g, ' ').trim()`"""
+    if not ARROW_AVAILABLE:
+        return None
+
+    def kernel(col: 'pa.Array') -> 'pa.Array':
+        col = pc.replace_substring_regex(col, f'[{_RE2_SPACE}]+', ' ')
+        return pc.utf8_trim(col, characters=' ')
+    return kernel
+
+
+def comma_removal_kernel() -> Optional[Kernel]:
+    """`val.replace(/,/g, '')`"""
+    if not ARROW_AVAILABLE:
+        return None
+    return lambda col: pc.replace_substring(col, ',', '')
+
+
+def hyphen_removal_kernel() -> Optional[Kernel]:
+    """`val.replace(/[-.\\s]/g, '')`"""
+    if not ARROW_AVAILABLE:
+        return None
+    return lambda col: pc.replace_substring_regex(col, f'[-.{_RE2_SPACE}]', '')
+
+
+def phone_kernel(allow_mobile: bool, allow_general: bool) -> Optional[Kernel]:
+    """연락처 포맷 통일 (휴대폰 010-0000-0000 / 일반 02-000-0000, 031-000-0000)"""
+    if not ARROW_AVAILABLE:
+        return None
+
+    def kernel(col: 'pa.Array') -> 'pa.Array':
+        digits = pc.replace_substring_regex(col, '[^0-9]', '')
+        digits = pc.replace_substring_regex(digits, '^82', '0', max_replacements=1)
+        is_mobile = pc.starts_with(digits, pattern='01')
+        result = col
+        general_scope = None
+        if allow_mobile:
+            length = pc.utf8_length(digits)
+            ok = pc.and_(is_mobile, pc.and_(pc.greater_equal(length, 10), pc.less_equal(length, 11)))
+            result = pc.if_else(ok, pc.replace_substring_regex(digits, _RE2_MOBILE, r'\1-\2-\3'), result)
+            general_scope = pc.invert(is_mobile)
+        if allow_general:
+            is_seoul = pc.starts_with(digits, pattern='02')
+            matches = pc.if_else(
+                is_seoul,
+                pc.match_substring_regex(digits, _RE2_PHONE_SEOUL),
+                pc.match_substring_regex(digits, _RE2_PHONE_AREA),
+            )
+            ok = pc.and_(pc.starts_with(digits, pattern='0'), matches)
+            if general_scope is not None:
+                ok = pc.and_(ok, general_scope)
+            formatted = pc.if_else(
+                is_seoul,
+                pc.replace_substring_regex(digits, _RE2_PHONE_SEOUL, r'\1-\2-\3'),
+                pc.replace_substring_regex(digits, _RE2_PHONE_AREA, r'\1-\2-\3'),
+            )
+            result = pc.if_else(ok, formatted, result)
+        return result
+    return kernel
+
+
+_COMPARE = {
+    'ge': 'greater_equal',
+    'le': 'less_equal',
+    'gt': 'greater',
+    'lt': 'less',
+    'eq': 'equal',
+}
+
+
+def numeric_condition_kernel(operator: str, value: float, replacement: str) -> Optional[Kernel]:
+    """조건부 치환 ("price가 10000 이상이면 'High'로 바꿔")"""
+    if not ARROW_AVAILABLE or operator not in _COMPARE:
+        return None
+    compare = getattr(pc, _COMPARE[operator])
+
+    def kernel(col: 'pa.Array') -> 'pa.Array':
+        cleaned = pc.replace_substring_regex(col, '[^0-9.-]', '')
+        prefix = pc.struct_field(pc.extract_regex(cleaned, _RE2_FLOAT_PREFIX), [0])
+        numbers = pc.cast(prefix, pa.float64())
+        hit = pc.fill_null(compare(numbers, value), False)
+        return pc.if_else(hit, replacement, col)
+    return kernel
@@ -0,0 +1,233 @@
+"""
+프롬프트 키워드 사전 + 단일 패스 매처
+
+`src/lib/core/keywords.ts`와 같은 표와 같은 방식입니다. 부분 일치 그룹은 Aho-Corasick 오토마타 하나로
+컴파일되어 프롬프트를 한 번만 훑으면서 등장한 그룹과 토큰(공백 구분)별 그룹을 함께 표시합니다.
+키워드를 추가할 때는 양쪽 표를 같은 값으로 수정해야 합니다.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set
+
+# 부분 일치 그룹 (프롬프트 안에 하나라도 포함되면 해당 그룹이 등장한 것으로 봄)
+PROMPT_KEYWORDS: Dict[str, Sequence[str]] = {
+    # 동사류
+    'action': ('지워', '제거', '삭제', '없애', '정리', '닦아', '통일', '표준', '바꿔', '변경', '추출', '분리', '남겨', '따로', '빼', '치환', '수정', '교체', '변환'),
+    'remove_verb': ('제거', '삭제', '빼', '지워', '없애'),
+    'clean_verb': ('제거', '삭제', '빼', '지워', '없애', '지우', '정리', '정규화'),
+    'special_verb': ('제거', '삭제', '빼', '지워', '정리', '정규화'),
+    'bracket_verb': ('제거', '삭제', '내용삭제', '지워', '빼', '없애', '지우', '정리', '정규화'),
+    'pattern_remove_verb': ('제거', '삭제', '빼', '지워', '없애', '지우', '안보이게'),
+    'unmask_verb': ('제거', '삭제', '해제', '풀어', '보이게', '표시'),
+    'extract_verb': ('추출', '분리', '남겨', '따로'),
+    'sido_verb': ('추출', '분리', '남겨', '따로', '앞에'),
+    'domain_verb': ('추출', '분리', '남겨'),
+    'mapping_verb': ('변경', '변환', '교체', '바꿔', '수정', '치환', '통일', '->', ':', '=>'),
+    'change_verb': ('바꿔', '변경', '치환', '수정'),
+    'error_empty_verb': ('빈칸', '공백', '삭제', '지워', 'empty', 'blank'),
+
+    # 대상/기능
+    'hyphen': ('하이픈', '대시', '-'),
+    'comma': ('콤마', '쉼표', ','),
+    'mask': ('마스킹', '가림', '별표'),
+    'mask_any': ('마스킹', '가림', '별표', '숨김'),
+    'mask_star': ('마스킹', '별표'),
+    'mask_hide': ('마스킹', '가림'),
+    'mask_target': ('계좌', '카드', '번호'),
+    'mask_part': ('뒷자리', '중간'),
+    'sido': ('시/도', '시도', '광역'),
+    'gungu': ('구/군', '구군', '시/군/구'),
+    'dong': ('동/읍/면', '동읍면', '상세주소'),
+    'only_digits': ('숫자만', '숫자 추출', '숫자남겨'),
+    'only_korean': ('한글만', '한글 추출', '한글남겨'),
+    'only_english': ('영어만', '영문만', 'english only'),
+    'special': ('특수문자', '기호'),
+    'bracket': ('괄호', 'bracket'),
+    'company': ('업체명', '회사명', '상호', '주식회사', '(주)'),
+    'position': ('직함', '직위', '직책', '네임'),
+    'lower': ('소문자', 'lowercase', '소문자변경'),
+    'upper': ('대문자', 'uppercase', '대문자변경'),
+    'html': ('html', '태그', 'tag'),
+    'emoji': ('이모지', '이모티콘', 'emoji'),
+    'domain': ('도메인', 'domain'),
+    'date': ('날짜', 'date', '일시'),
+    'date_only': ('날짜', 'date'),
+    'date_slash': ('yyyy/mm/dd', '/'),
+    'date_dot': ('yyyy.mm.dd', '.', '점'),
+    'date_hyphen': ('yyyy-mm-dd', '하이픈', '-', '대시'),
+    'date_compact': ('yyyymmdd', '붙여서'),
+    'error': ('오류', '에러', '잘못', 'fail', 'error'),
+    'numeric_op': ('이상', '이하', '초과', '미만', '크면', '작으면', '같으면'),
+    'whitespace': ('공백', '스페이스', '빈칸'),
+    'garbage': ('가비지', '쓰레기'),
+    'middle': ('중간',),
+    'name': ('성함', '이름'),
+    'email': ('이메일', 'email'),
+    'address': ('주소',),
+    'address_detail': ('상세', '뒷부분'),
+    'age': ('나이', 'age'),
+    'age_category': ('범주', '연령대'),
+    'truncate': ('절삭', '연월', '일 제거'),
+    'exponential': ('지수', 'exponential', 'E+'),
+    'building': ('건물명', '아파트명', '빌딩명'),
+    'sku': ('sku', '모델명', '상품코드'),
+    'unit': ('단위 제거', '수치화', '숫자만'),
+    'currency': ('통화', '화폐', '부호 제거'),
+
+    # V4 토큰 파서: 토큰 단위로 판정 (비교 연산자는 ge > le > gt > lt > eq 순으로 우선)
+    'null_word': ('비어', '없으', '공백', '빈값', 'null'),
+    'op_ge': ('이상', '크거나'),
+    'op_le': ('이하', '작거나'),
+    'op_gt': ('초과', '크면'),
+    'op_lt': ('미만', '작으면'),
+    'op_eq': ('같으면', '동일'),
+    'token_action': ('바꿔', '바꾸', '변경', '치환', '수정', '설정', '채워', '넣어'),
+
+    # 타겟 모호성 검사 (checkNLPTargetAmbiguity)
+    'ambiguity_action': (
+        '제거', '삭제', '빼', '지워', '없애', '지우', '정리',
+        '변경', '변환', '교체', '바꿔', '수정', '치환',
+        '대문자', '소문자', 'uppercase', 'lowercase',
+        '패딩', '채워', 'prefix', 'suffix', '붙여', '앞에', '뒤에'
+    ),
+    'global_quantifier': ('전부', '싹', '모두', '다', '전체', 'all', '싹다', '모든'),
+}
+
+# 완전 일치 단어 목록 (타겟 후보/토큰 전체가 이 단어인지 판정)
+PROMPT_WORDS: Dict[str, Sequence[str]] = {
+    # 타겟으로 보지 않는 수량사
+    'quantifiers': ('전부', '싹', '모두', '다', '전체', 'all', '싹다', '값', '데이터', '내용', '모든'),
+    # 연결어(채우고, 하고 등)가 타겟으로 오인되는 것을 방지하기 위한 블랙리스트
+    'invalid_targets': ('채우고', '하고', '한뒤', '해서', '넣고', '바꾸고', '지우고', '없애고', '변경하고', '삭제하고', '된다면', '있으면', '없으면', '아니면', '그리고', '그런다음', '이어서'),
+    # 일반 명사 (타겟 컬럼명으로 보지 않음)
+    'noise_words': ('패턴', '문구', '단어', '텍스트', '값', '데이터', '내용', '항목', '정보', '필드', '컬럼'),
+    # 패턴으로 쓰지 않는 조사
+    'object_particles': ('을', '를', '이', '가', '은', '는'),
+    # 토큰 끝에서 떼어내는 주격/보조사 (컬럼명 추출)
+    'subject_particles': ('이', '가', '은', '는'),
+    # 값과 동사 사이에 홀로 온 조사 ("'High' 로 바꿔")
+    'standalone_particles': ('으로', '로'),
+}
+
+class KeywordScan:
+    """한 번의 스캔 결과: 등장한 그룹과 토큰별 그룹"""
+
+    __slots__ = ('groups', 'tokens', '_token_groups')
+
+    def __init__(self, groups: Set[str], tokens: List[str], token_groups: List[Optional[Set[str]]]) -> None:
+        self.groups = groups
+        self.tokens = tokens
+        self._token_groups = token_groups
+
+    def has(self, group: str) -> bool:
+        """프롬프트에 그룹의 키워드가 하나라도 포함되어 있는지"""
+        return group in self.groups
+
+    def token_has(self, i: int, group: str) -> bool:
+        """i번째 토큰 안에 그룹의 키워드가 포함되어 있는지"""
+        found = self._token_groups[i]
+        return found is not None and group in found
+
+
+class KeywordMatcher:
+    """키워드 표를 컴파일한 Aho-Corasick 오토마타"""
+
+    def __init__(self, table: Mapping[str, Sequence[str]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = [frozenset()]
+        self._depth: List[int] = [0]
+
+        # 1. 트라이 구성
+        outputs: List[Set[str]] = [set()]
+        for group, keywords in table.items():
+            for keyword in keywords:
+                state = 0
+                for ch in keyword:
+                    nxt = self._goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._depth.append(self._depth[state] + 1)
+                        outputs.append(set())
+                        self._goto[state][ch] = nxt
+                    state = nxt
+                outputs[state].add(group)
+
+        # 2. 너비 우선으로 실패 링크와 출력 병합
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch)
+                self._fail[nxt] = target if target is not None and target != nxt else 0
+                outputs[nxt] |= outputs[self._fail[nxt]]
+                queue.append(nxt)
+        self._output = [frozenset(o) for o in outputs]
+
+    def scan(self, text: str) -> KeywordScan:
+        r"""
+        텍스트를 한 번 훑어 등장한 그룹을 표시하고, 공백으로 나눈 토큰(re.split(r'\s+')과 동일)마다
+        토큰 안에 완전히 들어 있는 키워드의 그룹을 표시합니다.
+        """
+        goto, fail, output, depth = self._goto, self._fail, self._output, self._depth
+        groups: Set[str] = set()
+        tokens: List[str] = []
+        token_groups: List[Optional[Set[str]]] = [None]
+        token_start = 0
+        in_space = False
+        state = 0
+
+        for i, ch in enumerate(text):
+            if ch.isspace():  # re의 \s와 같은 판정 (유니코드 공백)
+                # 공백 구간이 시작되면 토큰을 닫음
+                if not in_space:
+                    tokens.append(text[token_start:i])
+                    token_groups.append(None)
+                in_space = True
+            elif in_space:
+                token_start = i
+                in_space = False
+
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+
+            out = output[state]
+            if not out:
+                continue
+            groups |= out
+            if in_space:
+                continue
+
+            # 토큰 표시: 현재 토큰 안에서 시작하는 가장 긴 일치를 찾으면 그보다 짧은 일치(출력에 병합됨)도 모두 토큰 안에 있음
+            s = state
+            while s and i - depth[s] + 1 < token_start:
+                s = fail[s]
+            if s and output[s]:
+                found = token_groups[len(tokens)]
+                if found is None:
+                    found = token_groups[len(tokens)] = set()
+                found |= output[s]
+        tokens.append('' if in_space else text[token_start:])
+        return KeywordScan(groups, tokens, token_groups)
+
+
+# 모듈 로드 시 한 번만 컴파일
+PROMPT_MATCHER = KeywordMatcher(PROMPT_KEYWORDS)
+
+QUANTIFIER_WORDS = frozenset(PROMPT_WORDS['quantifiers'])
+INVALID_TARGET_WORDS = frozenset(PROMPT_WORDS['invalid_targets'])
+NOISE_WORDS = frozenset(PROMPT_WORDS['noise_words'])
+OBJECT_PARTICLES = frozenset(PROMPT_WORDS['object_particles'])
+STANDALONE_PARTICLES = frozenset(PROMPT_WORDS['standalone_particles'])
+SUBJECT_PARTICLE_SUFFIX = re.compile('(' + '|'.join(PROMPT_WORDS['subject_particles']) + ')$')
@@ -0,0 +1,80 @@
+"""
+고유값 메모이제이션 (Distinct-value Memo)
+
+`src/lib/core/memo.ts`와 같은 방식입니다. 날짜/금액/지역/업체명처럼 고유값이 적은 컬럼은
+비용이 큰 정제 단계를 고유값마다 한 번만 계산해 재사용하고, 문자 수 상한을 넘으면 오래된 항목부터 비웁니다.
+고유값이 대부분인 컬럼은 적중률이 낮으면 캐시를 끄고 원래 함수만 실행합니다.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, NamedTuple
+
+# 단계 하나당 저장 상한 (키 + 결과 문자 수)
+DEFAULT_MEMO_MAX_CHARS = 500_000
+# 이 횟수만큼 새 값을 계산한 시점에 적중률을 확인
+BYPASS_CHECK_AFTER = 4096
+BYPASS_MIN_HIT_RATE = 0.05
+
+
+class MemoStats(NamedTuple):
+    """컬럼/단계별 메모 적중 통계"""
+    column: str
+    step: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bypassed: bool
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ValueMemo:
+    """정제 함수 하나를 감싸는 고유값 캐시 (호출 가능 객체로 Transform.fn에 그대로 사용)"""
+
+    def __init__(self, column: str, step: str, fn: Callable[[str], str], max_chars: int = DEFAULT_MEMO_MAX_CHARS) -> None:
+        self.column = column
+        self.step = step
+        self.fn = fn
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = False
+        self._cache: Dict[str, str] = {}
+        self._chars = 0
+
+    def __call__(self, val: str) -> str:
+        if self.bypassed:
+            return self.fn(val)
+        cached = self._cache.get(val)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = self.fn(val)
+        self._cache[val] = result
+        self._chars += len(val) + len(result)
+        if self._chars > self.max_chars:
+            self._evict()
+        if self.misses == BYPASS_CHECK_AFTER and self.hits < (self.hits + self.misses) * BYPASS_MIN_HIT_RATE:
+            self.bypassed = True
+            self._cache.clear()
+            self._chars = 0
+        return result
+
+    def _evict(self) -> None:
+        """오래된 항목부터 상한의 절반이 될 때까지 비웁니다 (dict 삽입 순서 사용)."""
+        target = self.max_chars // 2
+        cache = self._cache
+        while self._chars > target and cache:
+            key = next(iter(cache))
+            self._chars -= len(key) + len(cache.pop(key))
+            self.evictions += 1
+
+    def stats(self) -> MemoStats:
+        return MemoStats(self.column, self.step, self.hits, self.misses, self.evictions, len(self._cache), self.bypassed)
@@ -0,0 +1,123 @@
+"""
+정제 엔진 데이터 모델
+
+`src/types/index.ts`의 타입을 파이썬으로 옮긴 것입니다.
+웹 앱/프리셋에서 쓰는 camelCase 키(JSON)를 그대로 받을 수 있도록 변환 함수를 제공합니다.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional, Union
+
+# 기본 데이터 행 타입 (컬럼명 -> 값)
+CellValue = Union[str, int, float, bool, None]
+DataRow = Dict[str, CellValue]
+
+# 컬럼별 정제 옵션 (ColumnOptionType 문자열, 예: 'date', 'mobile', 'amountKrn')
+ColumnOptionType = Optional[str]
+ColumnSpecificOptions = Dict[str, ColumnOptionType]
+
+# 컬럼별 최대 길이 제약 조건 (컬럼명 -> 최대 길이)
+ColumnLimits = Dict[str, int]
+
+# 데이터 이슈 (웹 앱의 DataIssue와 같은 camelCase 키: column, type, message, suggestion, promptSuggestion, fixType, affectedRows)
+DataIssue = Dict[str, Any]
+
+
+def _camel_to_snake(name: str) -> str:
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+@dataclass(frozen=True)
+class ProcessingOptions:
+    """데이터 정제 옵션 (웹 앱의 전역 체크박스와 1:1 대응)"""
+    remove_whitespace: bool = False      # 앞뒤 공백 제거
+    format_mobile: bool = False          # 휴대폰 번호 포맷 통일
+    format_general_phone: bool = False   # 일반 전화번호 포맷 통일
+    format_date: bool = False            # 날짜 형식 통일
+    format_date_time: bool = False       # 일시 형식 통일
+    format_number: bool = False          # 숫자 천단위 콤마
+    clean_email: bool = False            # 이메일 정제
+    format_zip: bool = False             # 우편번호 형식 통일
+    highlight_changes: bool = False      # 변경 사항 하이라이트 (Excel 다운로드 시)
+    clean_garbage: bool = False          # 가비지 데이터 제거
+    clean_amount: bool = False           # 금액 데이터 정제
+    clean_name: bool = False             # 이름 정제
+    format_biz_num: bool = False         # 사업자등록번호 포맷
+    format_corp_num: bool = False        # 법인등록번호 포맷
+    format_url: bool = False             # URL 표준화
+    mask_personal_data: bool = False     # 개인정보 마스킹 (주민번호 등)
+    format_tracking_num: bool = False    # 운송장번호 정제
+    clean_order_id: bool = False         # 주문번호 특수문자 제거
+    format_tax_date: bool = False        # 세무 신고용 날짜 (8자리)
+    format_accounting_num: bool = False  # 회계 음수 표기 변환
+    clean_area_unit: bool = False        # 면적 단위 제거
+    clean_sns_id: bool = False           # SNS ID 추출
+    format_hashtag: bool = False         # 해시태그 표준화
+    clean_company_name: bool = False     # 업체명 정규화
+    remove_position: bool = False        # 이름 내 직함 제거
+    extract_dong: bool = False           # 동읍면 추출
+    mask_account: bool = False           # 계좌번호 마스킹
+    mask_card: bool = False              # 카드번호 마스킹
+    mask_name: bool = False              # 성함 마스킹
+    mask_email: bool = False             # 이메일 마스킹
+    mask_address: bool = False           # 상세 주소 마스킹
+    mask_phone_mid: bool = False         # 연락처 중간자리 마스킹
+    category_age: bool = False           # 나이 범주화
+    truncate_date: bool = False          # 날짜 절삭
+    restore_exponential: bool = False    # 엑셀 지수 표기 복원
+    extract_building: bool = False       # 건물명 추출
+    normalize_sku: bool = False          # SKU/모델명 표준화
+    unify_unit: bool = False             # 단위 수치화
+    standardize_currency: bool = False   # 통화 표준화
+    remove_html: bool = False            # HTML 태그 제거
+    remove_emoji: bool = False           # 이모지 제거
+    to_upper_case: bool = False          # 대문자 변환
+    to_lower_case: bool = False          # 소문자 변환
+    use_ai: bool = False                 # 자연어 스마트 정제 엔진 사용 여부
+    auto_detect: bool = False            # 데이터 형식 자동 감지
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping[str, Any]]) -> 'ProcessingOptions':
+        """
+        웹 앱/프리셋 JSON(camelCase) 또는 snake_case 딕셔너리에서 옵션을 생성합니다.
+        모르는 옵션 이름이 있으면 ValueError (오타로 옵션이 조용히 꺼지지 않도록).
+        """
+        if not data:
+            return cls()
+        known = {f.name for f in fields(cls)}
+        values = {}
+        unknown = []
+        for key, value in data.items():
+            name = key if key in known else _camel_to_snake(key)
+            if name in known:
+                values[name] = bool(value)
+            else:
+                unknown.append(key)
+        if unknown:
+            raise ValueError(f'Unknown processing options: {", ".join(unknown)}')
+        return cls(**values)
+
+
+@dataclass
+class ProcessingStats:
+    """데이터 처리 통계 (웹 앱의 ProcessingStats)"""
+    total_rows: int = 0        # 전체 행 수
+    changed_cells: int = 0     # 변경된 셀의 수
+    resolved_issues: int = 0   # 해결된 이슈의 수
+    quality_score: int = 0     # 데이터 건강도 점수 (0-100)
+    completeness: int = 0      # 데이터 완결성 (결측치 없는 비율 %)
+    validity: int = 0          # 데이터 유효성 (이슈 없는 비율 %)
+
+    def to_dict(self) -> Dict[str, int]:
+        """웹 앱과 같은 camelCase 키의 딕셔너리"""
+        return {
+            'totalRows': self.total_rows,
+            'changedCells': self.changed_cells,
+            'resolvedIssues': self.resolved_issues,
+            'qualityScore': self.quality_score,
+            'completeness': self.completeness,
+            'validity': self.validity,
+        }
@@ -0,0 +1,420 @@
+"""
+자연어 프롬프트 분석기
+
+`processDataLocal`의 [NLP 분석] 블록과 V4 통합 토큰 파서(`patch_processors_v4.py`)를
+파이썬으로 옮긴 것입니다. 프롬프트는 실행마다 한 번만 분석되며, 결과(`PromptAnalysis`)는
+모든 청크/행에서 재사용됩니다.
+"""
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from .keywords import (
+    INVALID_TARGET_WORDS,
+    OBJECT_PARTICLES,
+    PROMPT_MATCHER,
+    QUANTIFIER_WORDS,
+    STANDALONE_PARTICLES,
+    SUBJECT_PARTICLE_SUFFIX,
+    KeywordScan,
+)
+from .safe_regex import SafePattern, compile_safe_pattern
+from .utils import parse_float
+
+
+@dataclass(frozen=True)
+class NumericCondition:
+    """조건부 치환 규칙 (예: "price가 10000 이상이면 'High'로 바꿔")"""
+    column: str
+    value: float
+    operator: str  # 'ge' | 'le' | 'gt' | 'lt' | 'eq'
+    target_value: str
+
+
+@dataclass(frozen=True)
+class NullFilling:
+    """결측치 채우기 규칙 (예: "grade가 비어있으면 'Unknown'으로 채워")"""
+    column: str
+    fill_value: str
+
+
+@dataclass(frozen=True)
+class PatternMapping:
+    """패턴 치환 규칙. 사용자 패턴은 safe_regex를 거쳐 실행합니다 (백트래킹 폭주 방지)."""
+    pattern: SafePattern
+    replacement: str
+
+
+@dataclass
+class PromptAnalysis:
+    """프롬프트 분석 결과. processDataLocal이 루프 밖에서 계산하던 모든 값을 담습니다."""
+    prompt: str = ''
+    has_action: bool = False
+
+    wants_hyphen_removal: bool = False
+    wants_comma_removal: bool = False
+    wants_unmask: bool = False
+    wants_sido: bool = False
+    wants_gungu: bool = False
+    wants_only_digits: bool = False
+    wants_only_korean: bool = False
+    wants_only_english: bool = False
+    wants_no_special: bool = False
+    wants_no_brackets: bool = False
+    target_no_brackets: Optional[str] = None
+    wants_company_clean: bool = False
+    target_company_clean: Optional[str] = None
+    wants_position_removal: bool = False
+    target_position_removal: Optional[str] = None
+    wants_dong_extraction: bool = False
+    wants_masking: bool = False
+    wants_lower: bool = False
+    wants_upper: bool = False
+    wants_no_html: bool = False
+    target_no_html: Optional[str] = None
+    wants_no_emoji: bool = False
+    target_no_emoji: Optional[str] = None
+    wants_domain: bool = False
+
+    prefix_value: Optional[str] = None
+    prefix_target: Optional[str] = None
+    suffix_value: Optional[str] = None
+    suffix_target: Optional[str] = None
+    padding_len: int = 0
+    padding_target: Optional[str] = None
+
+    all_potential_targets: Tuple[str, ...] = ()
+    upper_target: Optional[str] = None
+    lower_target: Optional[str] = None
+
+    mappings: Dict[str, str] = field(default_factory=dict)
+    pattern_mappings: List[PatternMapping] = field(default_factory=list)
+    # 실행 시간을 보장할 수 없어 적용하지 않은 사용자 패턴 (이슈로 보고)
+    rejected_patterns: List[str] = field(default_factory=list)
+
+    nlp_date_separator: Optional[str] = None
+    nlp_use_empty_separator: bool = False
+    wants_empty_on_error: bool = False
+
+    numeric_conditions: List[NumericCondition] = field(default_factory=list)
+    null_fillings: List[NullFilling] = field(default_factory=list)
+
+    # 행 루프 안에서 매번 호출되던 filterBy 결과를 미리 계산한 값
+    wants_whitespace: bool = False
+    wants_garbage: bool = False
+    wants_mask_middle: bool = False
+    wants_name_mask: bool = False
+    wants_email_mask: bool = False
+    wants_address_mask: bool = False
+    wants_age_category: bool = False
+    wants_truncate_date: bool = False
+    wants_exponential: bool = False
+    wants_building: bool = False
+    wants_sku: bool = False
+    wants_unit: bool = False
+    wants_currency: bool = False
+
+    @property
+    def date_separator(self) -> Optional[str]:
+        """자연어로 지정된 날짜 구분자. 지정이 없으면 None, '붙여서'는 빈 문자열입니다."""
+        if self.nlp_use_empty_separator:
+            return ''
+        return self.nlp_date_separator
+
+
+# ---------------------------------------------------------------------------
+# 정규식 (processors.ts와 동일)
+# ---------------------------------------------------------------------------
+
+_NAME = r'[가-힣a-zA-Z0-9_\(\)]'
+_PREFIX_RE = re.compile(
+    rf"(?:({_NAME}+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?(?:앞에|앞에다가|prefix)\s*['\"]?([^'\"]+)['\"]?\s*"
+    r'(?:붙여|붙이|추가|넣어|넣으|끼워|끼우|삽입)',
+    re.IGNORECASE,
+)
+_SUFFIX_RE = re.compile(
+    rf"(?:({_NAME}+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?(?:뒤에|뒤에다가|suffix)\s*['\"]?([^'\"]+)['\"]?\s*"
+    r'(?:붙여|붙이|추가|넣어|넣으|끼워|끼우|삽입|붙이고|넣고)',
+    re.IGNORECASE,
+)
+_PADDING_RE = re.compile(
+    rf'(?:({_NAME}+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?([0-9]+)\s*(?:자리|글자)(?:\s*로)?'
+    r'(?:\s*(?:0|영|공|제로|공백))?(?:\s*(?:으로))?\s*(?:맞춰|맞추|패딩|padding|채워|채우|만들어|만들|늘려|늘리)'
+)
+_TARGETS_RE = re.compile(
+    rf'({_NAME}+)(?:\s*(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에|쪽|부분|랑|와|과|하고|및|and|or|,))'
+)
+_UPPER_RE = re.compile(rf'(?:({_NAME}+)(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에)?\s*)?(?:대문자|uppercase)')
+_LOWER_RE = re.compile(rf'(?:({_NAME}+)(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에)?\s*)?(?:소문자|lowercase)')
+
+_QUOTED_REMOVAL_RE = re.compile(
+    r"['\"\[\]]([^'\"\[\]]+)['\"\[\]]\s*(?:패턴|문구|단어|텍스트|값)?(?:은|는|이|가|을|를)?\s*(?:제거|삭제|지워|없애)"
+)
+_UNQUOTED_REMOVAL_RE = re.compile(
+    r'([^\s가-힣0-9]{1,3}[^\s가-힣]*)\s*(?:패턴|문구|단어|텍스트|값)?(?:은|는|이|가|을|를)?\s*(?:제거|삭제|지워|없애)'
+)
+_MAPPING_RE = re.compile(
+    r'([\[\]%A-Za-z0-9가-힣_\-@./()+]+)(?:\s*(?:컬럼|필드|데이터|값|문구|텍스트|형식|패턴|의))*\s*'
+    r"(?:는|은|->|:|를|을|=>)\s*([\[\]%A-Za-z0-9가-힣_\-\s/.@()+!?'\"\"]+)",
+    re.IGNORECASE,
+)
+_ADVERB_RE = re.compile(r'무조건|전부|싹다|모두|절대')
+_MAPPING_SUFFIX_RE = re.compile(
+    r'(?:으로|로|라고|하게|으로\s+변경|로\s+변경|로\s+수정|변경\s*해\s*줘|변경해줘|해\s*줘|해줘|형식으로|형식|포맷으로|포맷'
+    r'|으로\s*바꿔|바꿔줘|바꿔|하고|해주고|니다|입니다|요)$'
+)
+_EMPTY_WORDS = ('빈칸', '공백', 'empty', 'blank', '없음', '제거')
+
+_NUMBER_TOKEN = re.compile(r'^[0-9,]+$')
+_QUOTED_VALUE = re.compile(r"['\"]([^'\"]+)['\"]")
+_TRAILING_RO = re.compile(r'(으)?로$')
+# 비교 연산자 토큰 그룹 (앞의 것이 우선)
+_OPERATOR_GROUPS = (('op_ge', 'ge'), ('op_le', 'le'), ('op_gt', 'gt'), ('op_lt', 'lt'), ('op_eq', 'eq'))
+
+
+def _escape_js_regex(text: str) -> str:
+    return re.sub(r'[-/\\^$*+?.()|\[\]{}]', lambda m: '\\' + m.group(0), text)
+
+
+@functools.lru_cache(maxsize=64)
+def _conjunctive_regex(keyword_pattern: str) -> Pattern[str]:
+    """키워드 목록별 정규식 (analyze_prompt마다 다시 만들지 않음)"""
+    # 연결어 반복 안에 \s+를 두면 공백이 길게 이어진 프롬프트에서 백트래킹이 지수적으로 늘어나므로 \s 한 글자씩 반복
+    intervener = r'(?:(?:[^\s]+)(?:이랑|하고|와|과|,|\s)+)?'
+    return re.compile(
+        rf'({_NAME}+)(?:에서|의|쪽|부분)?(?:에)?\s*(?:있는|들어있는)?\s*{intervener}(?:{keyword_pattern})',
+        re.IGNORECASE,
+    )
+
+
+def extract_conjunctive_target(lower_prompt: str, keywords: List[str]) -> Optional[str]:
+    """복합 문장에서 타겟 컬럼을 추출합니다 (예: "msg랑 memo에서 html 제거")."""
+    m = _conjunctive_regex('|'.join(keywords)).search(lower_prompt)
+    return m.group(1) if m else None
+
+
+def _resolve_target(target: Optional[str], primary: Optional[str], invalid: bool = False) -> Optional[str]:
+    """수량사(전부, 모두 등)나 연결어가 타겟으로 잡히면 첫 번째 컬럼 후보로 대체합니다."""
+    if not target or target in QUANTIFIER_WORDS or (invalid and target in INVALID_TARGET_WORDS):
+        return primary
+    return target
+
+
+def _parse_tokens(scan: KeywordScan, result: PromptAnalysis) -> None:
+    """[Revised Logic V4] 통합 토큰 파서 (Numeric + Null + Actions). 토큰별 키워드는 스캔에서 이미 표시됨"""
+    tokens = scan.tokens
+
+    # 각 토큰 뒤의 첫 동작 토큰 위치 (뒤에서부터 한 번에 계산)
+    next_action = [-1] * len(tokens)
+    for k in range(len(tokens) - 2, -1, -1):
+        next_action[k] = k + 1 if scan.token_has(k + 1, 'token_action') else next_action[k + 1]
+
+    def find_action_value(start: int) -> str:
+        action_idx = next_action[start]
+        if action_idx == -1:
+            return ''
+        target_idx = action_idx - 1
+        if target_idx > start and tokens[target_idx] in STANDALONE_PARTICLES:
+            target_idx -= 1
+        possible = tokens[target_idx]
+        quote = _QUOTED_VALUE.search(possible)
+        return quote.group(1) if quote else _TRAILING_RO.sub('', possible, count=1)
+
+    def previous_column(i: int) -> str:
+        return SUBJECT_PARTICLE_SUFFIX.sub('', tokens[i - 1], count=1).strip() if i > 0 else ''
+
+    for i, token in enumerate(tokens):
+        # --- A. Numeric Condition Logic ---
+        if _NUMBER_TOKEN.match(token):
+            val_num = parse_float(token.replace(',', ''))
+            if val_num == val_num:
+                operator = None
+                for j in (1, 2):
+                    if i + j >= len(tokens):
+                        break
+                    operator = next((op for group, op in _OPERATOR_GROUPS if scan.token_has(i + j, group)), None)
+                    if operator:
+                        break
+
+                if operator:
+                    col = previous_column(i)
+                    target = find_action_value(i)
+                    if col and target:
+                        result.numeric_conditions.append(NumericCondition(col, val_num, operator, target))
+
+        # --- B. Null Filling Logic ---
+        if scan.token_has(i, 'null_word'):
+            col = previous_column(i)
+            fill_val = find_action_value(i)
+            if col and fill_val:
+                result.null_fillings.append(NullFilling(col, fill_val))
+
+
+def _add_pattern(result: PromptAnalysis, source: str, flags: str, replacement: str) -> None:
+    """문법 오류 패턴은 기존처럼 무시하고, 실행 시간을 보장할 수 없는 패턴은 따로 모아 이슈로 보고합니다."""
+    pattern = compile_safe_pattern(source, flags)
+    if pattern is None:
+        return
+    if pattern.mode == 'rejected':
+        if source not in result.rejected_patterns:
+            result.rejected_patterns.append(source)
+        return
+    result.pattern_mappings.append(PatternMapping(pattern, replacement))
+
+
+def _parse_mappings(prompt: str, lower_prompt: str, result: PromptAnalysis, filter_by) -> None:
+    """패턴 제거 및 A->B 치환 매핑을 추출합니다. [Rule 4, 5]"""
+    if filter_by('pattern_remove_verb'):
+        # 1. 따옴표/대괄호로 감싼 패턴 (우선)
+        for m in _QUOTED_REMOVAL_RE.finditer(lower_prompt):
+            p = m.group(1)
+            if '%d' in p:
+                p = p.replace('%d', r'\d+')
+            _add_pattern(result, p, 'g', '')
+
+        # 2. 따옴표 없는 패턴 (예: "_%d 패턴 제거")
+        for m in _UNQUOTED_REMOVAL_RE.finditer(lower_prompt):
+            p = m.group(1)
+            if '%d' in p:
+                p = p.replace('%d', r'\d+')
+            if p and p not in OBJECT_PARTICLES:
+                _add_pattern(result, p, 'g', '')
+
+    if filter_by('mapping_verb'):
+        for m in _MAPPING_RE.finditer(prompt):
+            source = m.group(1).strip().lower()
+            to = _ADVERB_RE.sub('', m.group(2).strip()).strip()
+
+            # 후속 조사 및 서술어 반복 제거 ('으로 바꿔줘' 등)
+            prev = None
+            while to != prev:
+                prev = to
+                to = _MAPPING_SUFFIX_RE.sub('', to, count=1).strip()
+
+            to = re.sub(r"^['\"]|['\"]$", '', to)
+            to = re.sub(r'[,;.]$', '', to, count=1).strip()
+
+            if to in _EMPTY_WORDS:
+                to = ''
+            if not source:
+                continue
+            if '%' in source:
+                regex_str = _escape_js_regex(source)
+                regex_str = re.sub(r'(?:\\\[)?%d(?:\\\])?', lambda _m: r'\d+', regex_str)
+                regex_str = re.sub(r'(?:\\\[)?%s(?:\\\])?', lambda _m: '.+', regex_str)
+                regex_str = re.sub(r'(?:\\\[)?%([0-9]+)d(?:\\\])?', lambda g: r'\d{' + g.group(1) + '}', regex_str)
+                regex_str = re.sub(r'(?:\\\[)?%([0-9]+)s(?:\\\])?', lambda g: '.{' + g.group(1) + '}', regex_str)
+                _add_pattern(result, f'^{regex_str}$', 'i', to)
+            else:
+                result.mappings[source] = to
+
+
+def analyze_prompt(prompt: str) -> PromptAnalysis:
+    """
+    자연어 프롬프트를 분석하여 정제 루프에서 사용할 플래그/타겟/규칙을 계산합니다.
+    processDataLocal의 루프 이전 단계와 동일한 결과를 반환합니다.
+    """
+    lower_prompt = prompt.lower()
+    # 키워드 표(keywords.py)의 모든 그룹을 한 번의 스캔으로 판정
+    scan = PROMPT_MATCHER.scan(lower_prompt)
+    filter_by = scan.has
+
+    r = PromptAnalysis(prompt=prompt)
+    r.has_action = filter_by('action')
+
+    # --- [NLP 분석] ---
+    r.wants_hyphen_removal = filter_by('hyphen') and filter_by('remove_verb')
+    r.wants_comma_removal = filter_by('comma') and filter_by('remove_verb')
+    r.wants_unmask = filter_by('mask') and filter_by('unmask_verb')
+    r.wants_sido = filter_by('sido') and filter_by('sido_verb')
+    r.wants_gungu = filter_by('gungu') and filter_by('extract_verb')
+    r.wants_only_digits = filter_by('only_digits')
+    r.wants_only_korean = filter_by('only_korean')
+    r.wants_only_english = filter_by('only_english')
+    r.wants_no_special = filter_by('special') and filter_by('special_verb')
+    r.wants_no_brackets = filter_by('bracket') and filter_by('bracket_verb')
+    if r.wants_no_brackets:
+        r.target_no_brackets = extract_conjunctive_target(lower_prompt, ['괄호', 'bracket'])
+
+    r.wants_company_clean = filter_by('company') and filter_by('clean_verb')
+    if r.wants_company_clean:
+        r.target_company_clean = extract_conjunctive_target(lower_prompt, ['업체명', '회사명', '상호', '주식회사', r'\(주\)'])
+
+    r.wants_position_removal = filter_by('position') and filter_by('clean_verb')
+    if r.wants_position_removal:
+        r.target_position_removal = extract_conjunctive_target(lower_prompt, ['직함', '직위', '직책', '네임'])
+    r.wants_dong_extraction = filter_by('dong') and filter_by('extract_verb')
+    r.wants_masking = filter_by('mask_any') and (filter_by('mask_target') or filter_by('mask_part'))
+
+    r.wants_lower = filter_by('lower')
+    r.wants_upper = filter_by('upper')
+    r.wants_no_html = filter_by('html') and filter_by('clean_verb')
+    if r.wants_no_html:
+        r.target_no_html = extract_conjunctive_target(lower_prompt, ['html', '태그', 'tag'])
+    r.wants_no_emoji = filter_by('emoji') and filter_by('clean_verb')
+    if r.wants_no_emoji:
+        r.target_no_emoji = extract_conjunctive_target(lower_prompt, ['이모지', '이모티콘', 'emoji'])
+    r.wants_domain = filter_by('domain') and filter_by('domain_verb')
+
+    prefix_match = _PREFIX_RE.search(prompt)
+    suffix_match = _SUFFIX_RE.search(prompt)
+    padding_match = _PADDING_RE.search(lower_prompt)
+    if padding_match and padding_match.group(2):
+        r.padding_len = int(padding_match.group(2))
+        r.padding_target = padding_match.group(1) or None
+
+    # [New] Contextual Target Extractor: 수량사가 아닌 첫 번째 컬럼 후보
+    r.all_potential_targets = tuple(m.group(1) for m in _TARGETS_RE.finditer(lower_prompt))
+    primary_target = next((t for t in r.all_potential_targets if t not in QUANTIFIER_WORDS), None)
+
+    if r.wants_upper:
+        m = _UPPER_RE.search(lower_prompt)
+        r.upper_target = _resolve_target(m.group(1) if m else None, primary_target)
+    if r.wants_lower:
+        m = _LOWER_RE.search(lower_prompt)
+        r.lower_target = _resolve_target(m.group(1) if m else None, primary_target)
+
+    if prefix_match:
+        r.prefix_value = prefix_match.group(2)
+        r.prefix_target = _resolve_target(prefix_match.group(1), primary_target, invalid=True)
+    if suffix_match:
+        r.suffix_value = suffix_match.group(2)
+        r.suffix_target = _resolve_target(suffix_match.group(1), primary_target, invalid=True)
+
+    _parse_mappings(prompt, lower_prompt, r, filter_by)
+
+    # 날짜 포맷 NLP (프로그램 기본 포맷을 잠시 덮어씀) [Rule 5]
+    if filter_by('date'):
+        if filter_by('date_slash'):
+            r.nlp_date_separator = '/'
+        elif filter_by('date_dot'):
+            r.nlp_date_separator = '.'
+        elif filter_by('date_hyphen'):
+            r.nlp_date_separator = '-'
+        elif filter_by('date_compact'):
+            r.nlp_use_empty_separator = True
+    r.wants_empty_on_error = filter_by('error') and filter_by('error_empty_verb')
+
+    trigger_numeric_ops = filter_by('numeric_op')
+    trigger_actions = filter_by('change_verb')
+    if trigger_numeric_ops or trigger_actions or filter_by('null_word'):
+        _parse_tokens(scan, r)
+
+    # 행 루프 안의 filterBy 호출들
+    r.wants_whitespace = filter_by('whitespace') and r.has_action
+    r.wants_garbage = filter_by('garbage')
+    r.wants_mask_middle = filter_by('middle')
+    r.wants_name_mask = filter_by('name') and filter_by('mask_star')
+    r.wants_email_mask = filter_by('email') and filter_by('mask_star')
+    r.wants_address_mask = filter_by('address') and filter_by('address_detail') and filter_by('mask_hide')
+    r.wants_age_category = filter_by('age') and filter_by('age_category')
+    r.wants_truncate_date = filter_by('date_only') and filter_by('truncate')
+    r.wants_exponential = filter_by('exponential')
+    r.wants_building = filter_by('building')
+    r.wants_sku = filter_by('sku')
+    r.wants_unit = filter_by('unit')
+    r.wants_currency = filter_by('currency')
+    return r
@@ -0,0 +1,90 @@
+"""
+멀티코어 샤드 정제
+
+청크(샤드)를 ProcessPoolExecutor의 워커 프로세스에 나눠 정제하고, 결과는 입력 순서대로 내보냅니다.
+정제 계획의 셀 함수(클로저)는 프로세스 간에 전달할 수 없으므로, 분석된 프롬프트와 헤더/옵션만 넘겨
+워커마다 초기화 시점에 한 번 컴파일합니다. 동시에 처리 중인 청크 수를 제한해 메모리 사용량은 스트리밍과 같이 일정합니다.
+프로파일러를 넘기면 워커가 청크마다 규칙 통계를 결과와 함께 돌려보내고, 부모 프로파일러에 합칩니다 (profiler.py).
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .columnar import process_columns
+from .models import DataRow
+from .plan import CleaningPlan, compile_plan
+from .profiler import CleaningProfiler
+
+# 워커당 대기열에 올려 둘 청크 수 (먼저 끝난 워커가 쉬지 않도록)
+PENDING_PER_WORKER = 2
+
+# 워커 프로세스 전역 상태 (_init_worker에서 설정)
+_worker_plan: Optional[CleaningPlan] = None
+_worker_mode = 'row'
+_worker_profiler: Optional[CleaningProfiler] = None
+
+
+def resolve_workers(workers: int) -> int:
+    """워커 수를 확정합니다. 0 이하는 CPU 코어 수를 사용합니다."""
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _init_worker(plan_args: tuple, mode: str, profile: bool = False) -> None:
+    global _worker_plan, _worker_mode, _worker_profiler
+    _worker_plan = compile_plan(*plan_args)
+    _worker_mode = mode
+    if profile:
+        _worker_profiler = CleaningProfiler()
+        _worker_plan = _worker_profiler.instrument(_worker_plan)
+
+
+def _clean_shard(chunk: List[DataRow]) -> List[DataRow]:
+    plan = _worker_plan
+    if _worker_mode == 'columnar':
+        return process_columns(plan, chunk)
+    return [plan.process_row(row) for row in chunk]
+
+
+def _clean_shard_profiled(chunk: List[DataRow]) -> Tuple[List[DataRow], Dict[str, Any]]:
+    cleaned = _clean_shard(chunk)
+    return cleaned, _worker_profiler.drain()
+
+
+def clean_chunks_parallel(
+    chunks: Iterable[List[DataRow]],
+    plan: CleaningPlan,
+    workers: int = 0,
+    mode: str = 'row',
+    profiler: Optional[CleaningProfiler] = None,
+) -> Iterator[List[DataRow]]:
+    """
+    청크를 워커 프로세스에서 병렬 정제하여, 입력 순서대로 정제된 청크를 내보냅니다.
+    workers가 0 이하이면 CPU 코어 수만큼 워커를 사용합니다.
+    profiler를 주면 워커의 규칙 통계를 합칩니다 (단계 시간은 호출하는 쪽에서 측정).
+    """
+    workers = resolve_workers(workers)
+    plan_args = (plan.nlp, list(plan.columns), plan.options, plan.locked_columns, plan.column_options)
+    max_pending = workers * PENDING_PER_WORKER
+    initargs = (plan_args, mode, profiler is not None)
+    shard_fn = _clean_shard_profiled if profiler else _clean_shard
+
+    def collect(future: Future) -> List[DataRow]:
+        if profiler is None:
+            return future.result()
+        cleaned, profile = future.result()
+        profiler.add(profile, stages=False)
+        return cleaned
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(shard_fn, chunk))
+            if len(pending) >= max_pending:
+                yield collect(pending.popleft())
+        while pending:
+            yield collect(pending.popleft())
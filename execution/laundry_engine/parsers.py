@@ -0,0 +1,392 @@
+"""
+파일 파서 (스트리밍)
+
+`src/lib/core/parsers.ts`의 `parseFile`과 같은 규칙(첫 줄 헤더, 빈 줄 건너뛰기)으로
+CSV/XLSX를 읽되, 전체를 메모리에 올리지 않고 일정 크기의 청크 단위로 흘려보냅니다.
+XLSX는 표준 라이브러리(zipfile)로 시트 XML을 풀면서 <row> 단위로 읽습니다 (`core/xlsxStream.ts`와 같은 규칙).
+"""
+from __future__ import annotations
+
+import codecs
+import csv
+import os
+import re
+import zipfile
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+from xml.etree import ElementTree
+
+from .models import CellValue, DataRow
+
+# 청크당 행 수. 행 하나가 수 KB를 넘지 않는 일반적인 시트에서 수십 MB 이내로 유지됩니다.
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def iter_chunks(rows: Iterable[DataRow], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[DataRow]]:
+    """행 이터레이터를 최대 chunk_size 행의 리스트로 묶습니다."""
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_csv_rows(handle, reader: csv.DictReader) -> Iterator[DataRow]:
+    try:
+        for row in reader:
+            # 헤더보다 많은 필드(restkey=None)는 웹 앱과 동일하게 버림
+            row.pop(None, None)
+            yield row
+    finally:
+        handle.close()
+
+
+def open_csv(path: str, encoding: str = 'utf-8-sig') -> Tuple[List[str], Iterator[DataRow]]:
+    """
+    CSV 파일을 열어 (헤더 목록, 행 이터레이터)를 반환합니다.
+    파일은 이터레이터가 끝까지 소비되거나 정리될 때 닫힙니다.
+    """
+    handle = open(path, 'r', encoding=encoding, newline='')
+    try:
+        reader = csv.DictReader(handle, restval='')
+        headers = list(reader.fieldnames or [])
+    except Exception:
+        handle.close()
+        raise
+    return headers, _iter_csv_rows(handle, reader)
+
+
+_ESCAPED_CHAR = re.compile(r'_x([0-9a-fA-F]{4})_')
+_NUMERIC_ENTITY = re.compile(r'&#(x[0-9a-fA-F]+|\d+);')
+_TEXT = re.compile(r'<t(?:\s[^>]*)?>(.*?)</t>', re.S)
+_PHONETIC = re.compile(r'<rPh[\s>].*?</rPh>', re.S)
+# 일반적인 셀 형태: <c r="A1" s="1" t="s"><v>0</v></c>, 수식 셀, 인라인 문자열 셀
+_SIMPLE_CELL = re.compile(
+    r'<c r="([A-Z]+)\d+"(?: s="\d+")?(?: t="(\w+)")?(?:/>|>(?:<f>[^<]*</f>|<f [^>]*/>)?'
+    r'(?:(<v>)([^<]*)</v>|(<is>)<t(?: xml:space="preserve")?>([^<]*)</t></is>)?</c>)')
+_CELL_REF = re.compile(r'\sr="([A-Z]+)\d*"')
+_CELL_TYPE = re.compile(r'\st="(\w+)"')
+_TAG_END = ' \t\r\n>/'
+_DIMENSION = re.compile(r'<dimension\s[^>]*ref="([A-Z]+)\d*(?::([A-Z]+)\d*)?"')
+# 압축을 풀어 한 번에 해석하는 시트 XML 크기
+_XML_READ_SIZE = 1 << 20
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 뗀 태그 이름 (Transitional/Strict OOXML 공통 처리)"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _unescape(text: str) -> str:
+    """XML 엔티티와 엑셀의 _xHHHH_ 문자 표기를 원래 문자로 되돌립니다."""
+    if '&' in text:
+        if '&#' in text:
+            text = _NUMERIC_ENTITY.sub(
+                lambda m: chr(int(m.group(1)[1:], 16) if m.group(1)[0] == 'x' else int(m.group(1))), text)
+        text = (text.replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
+                .replace('&apos;', "'").replace('&amp;', '&'))
+    if '_x' in text:
+        text = _ESCAPED_CHAR.sub(lambda m: chr(int(m.group(1), 16)), text)
+    return text
+
+
+def _column_index(ref: str) -> int:
+    col = 0
+    for ch in ref:
+        col = col * 26 + (ord(ch) - 64)
+    return col - 1
+
+
+def _rich_text(xml: str) -> str:
+    """<si>/<is> 안의 텍스트 (서식 있는 텍스트는 이어 붙이고, 후리가나(rPh)는 제외)"""
+    if '<rPh' in xml:
+        xml = _PHONETIC.sub('', xml)
+    return _unescape(''.join(_TEXT.findall(xml)))
+
+
+def _find_tag(buf: str, open_tag: str, start: int) -> int:
+    i = buf.find(open_tag, start)
+    while i >= 0:
+        nxt = buf[i + len(open_tag):i + len(open_tag) + 1]
+        # 태그 이름 뒤 글자가 아직 도착하지 않았으면 여기서 멈춤 (다음 조각과 이어서 판단)
+        if not nxt or nxt in _TAG_END:
+            return i
+        i = buf.find(open_tag, i + 1)
+    return -1
+
+
+def _scan_elements(handle, tag: str, on_head: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+    """
+    압축을 푼 XML 스트림에서 <tag ...>...</tag> 요소를 도착하는 대로 하나씩 꺼냅니다. (같은 이름의 중첩 요소는 없다고 가정)
+    on_head는 첫 요소 앞부분(시트 머리말)을 한 번 받습니다.
+    """
+    open_tag, close_tag = f'<{tag}', f'</{tag}>'
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    while True:
+        data = handle.read(_XML_READ_SIZE)
+        buf += decoder.decode(data, final=not data)
+        pos = 0
+        while True:
+            start = _find_tag(buf, open_tag, pos)
+            if start < 0 or start + len(open_tag) >= len(buf):
+                pos = max(pos, len(buf) - len(open_tag)) if start < 0 else start
+                break
+            gt = buf.find('>', start)
+            if gt < 0:
+                pos = start
+                break
+            end = gt + 1
+            if buf[gt - 1] != '/':
+                close_at = buf.find(close_tag, gt)
+                if close_at < 0:
+                    pos = start
+                    break
+                end = close_at + len(close_tag)
+            if on_head is not None:
+                on_head(buf[:start])
+                on_head = None
+            yield buf[start:end]
+            pos = end
+        buf = buf[pos:]
+        if not data:
+            return
+
+
+def _resolve_target(target: str) -> str:
+    return target[1:] if target.startswith('/') else 'xl/' + target.lstrip('./')
+
+
+def _locate_parts(archive: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """시트 목록 [(시트 이름, zip 경로)] (통합 문서 순서)과 공유 문자열 표의 zip 경로"""
+    names = set(archive.namelist())
+    shared: Optional[str] = 'xl/sharedStrings.xml' if 'xl/sharedStrings.xml' in names else None
+    if 'xl/workbook.xml' not in names or 'xl/_rels/workbook.xml.rels' not in names:
+        return [('Sheet1', 'xl/worksheets/sheet1.xml')], shared
+
+    targets: Dict[str, str] = {}
+    for rel in ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels')):
+        target = rel.get('Target')
+        if not target:
+            continue
+        targets[rel.get('Id', '')] = _resolve_target(target)
+        if rel.get('Type', '').endswith('/sharedStrings'):
+            shared = _resolve_target(target)
+    sheets: List[Tuple[str, str]] = []
+    for elem in ElementTree.fromstring(archive.read('xl/workbook.xml')).iter():
+        if _local(elem.tag) == 'sheet':
+            rel_id = next((v for k, v in elem.attrib.items() if _local(k) == 'id'), None)
+            if rel_id in targets:
+                sheets.append((elem.get('name', ''), targets[rel_id]))
+    return sheets or [('Sheet1', 'xl/worksheets/sheet1.xml')], shared
+
+
+def _convert_value(kind: str, raw: str, shared: List[str]) -> Optional[CellValue]:
+    """<v> 값을 셀 형식에 따라 변환합니다. (SheetJS `sheet_to_json` 기본값과 같이 숫자/불리언은 그대로, 오류 셀은 None)"""
+    if kind == 'n' or not kind:
+        try:
+            num = float(raw)
+        except ValueError:
+            return None
+        # JS 숫자와 같이 정수 값은 소수점 없이 표시되도록 int로 변환
+        return int(num) if num.is_integer() and abs(num) < 1e21 else num
+    if kind == 's':
+        index = int(raw)
+        return shared[index] if index < len(shared) else ''
+    if kind == 'b':
+        return raw == '1'
+    if kind == 'e':
+        return None
+    return _unescape(raw)   # str(수식 문자열), d(ISO 날짜)
+
+
+def _iter_cells_general(xml: str, shared: List[str]) -> Iterator[Tuple[int, CellValue]]:
+    """속성 순서나 서식 있는 텍스트 등 일반적인 형태가 아닌 셀이 있는 행을 태그 단위로 해석합니다."""
+    col = -1
+    pos = 0
+    while True:
+        start = _find_tag(xml, '<c', pos)
+        if start < 0:
+            return
+        gt = xml.find('>', start)
+        if gt < 0:
+            return
+        attrs = xml[start + 2:gt]
+        ref = _CELL_REF.search(attrs)
+        col = _column_index(ref.group(1)) if ref else col + 1
+        if xml[gt - 1] == '/':
+            pos = gt + 1
+            continue
+        end = xml.find('</c>', gt)
+        if end < 0:
+            return
+        body = xml[gt + 1:end]
+        pos = end + 4
+
+        kind_match = _CELL_TYPE.search(attrs)
+        kind = kind_match.group(1) if kind_match else 'n'
+        if kind == 'inlineStr':
+            if '<is' in body:
+                yield col, _rich_text(body)
+            continue
+        v = _find_tag(body, '<v', 0)
+        if v < 0:
+            continue
+        v_gt = body.find('>', v)
+        value = _convert_value(kind, '' if body[v_gt - 1] == '/' else body[v_gt + 1:body.find('</v>', v_gt)], shared)
+        if value is not None:
+            yield col, value
+
+
+def _iter_row_cells(xml: str, shared: List[str]) -> Iterator[Tuple[int, CellValue]]:
+    """
+    <row> 요소의 셀을 (컬럼 번호, 값) 쌍으로 해석합니다. 값이 없는 셀과 오류 셀은 건너뜁니다.
+    엑셀/SheetJS가 쓰는 일반적인 셀 형태는 정규식 한 번으로 추출하고, 그렇지 않은 셀이 섞인 행만 태그 단위로 해석합니다.
+    """
+    cells = _SIMPLE_CELL.findall(xml)
+    if len(cells) != xml.count('<c'):
+        yield from _iter_cells_general(xml, shared)
+        return
+    for ref, kind, has_value, raw, has_inline, inline in cells:
+        if kind == 'inlineStr':
+            if has_inline:
+                yield _column_index(ref), _unescape(inline)
+        elif has_value:
+            value = _convert_value(kind, raw, shared)
+            if value is not None:
+                yield _column_index(ref), value
+
+
+class _HeaderNamer:
+    """SheetJS `sheet_to_json`과 같은 헤더 이름 규칙 (빈 칸은 __EMPTY, 중복은 _1, _2 ...)"""
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> str:
+        counter = self._counts.get(value, 0)
+        if not counter:
+            self._counts[value] = 1
+            return value
+        while True:
+            name = f'{value}_{counter}'
+            counter += 1
+            if name not in self._counts:
+                break
+        self._counts[value] = counter
+        self._counts[name] = 1
+        return name
+
+
+def _header_text(value: Optional[CellValue]) -> str:
+    if value is None:
+        return '__EMPTY'
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _iter_xlsx_rows(archive: zipfile.ZipFile, sheet: str, shared: List[str]) -> Iterator[Union[List[str], DataRow]]:
+    """첫 값으로 헤더 목록을, 이후 데이터 행을 내보냅니다."""
+    name_header = _HeaderNamer()
+    headers: Optional[List[str]] = None
+    first_col = 0
+    dimension: List[Tuple[int, int]] = []
+
+    def read_dimension(head: str) -> None:
+        # 시트 범위가 있으면 헤더 행의 빈 칸도 SheetJS처럼 __EMPTY 컬럼으로 취급
+        m = _DIMENSION.search(head)
+        if m:
+            dimension.append((_column_index(m.group(1)), _column_index(m.group(2) or m.group(1))))
+
+    with archive.open(sheet) as handle:
+        for xml in _scan_elements(handle, 'row', read_dimension):
+            if headers is None:
+                values = dict(_iter_row_cells(xml, shared))
+                if not values:
+                    continue
+                first_col, last_col = min(values), max(values)
+                if dimension:
+                    first_col = min(first_col, dimension[0][0])
+                    last_col = max(last_col, dimension[0][1])
+                headers = [name_header(_header_text(values.get(c))) for c in range(first_col, last_col + 1)]
+                yield headers
+                continue
+
+            row: DataRow = {}
+            for col, value in _iter_row_cells(xml, shared):
+                idx = col - first_col
+                if idx < 0:
+                    continue
+                while len(headers) <= idx:
+                    headers.append(name_header('__EMPTY'))
+                row[headers[idx]] = value
+            if row:
+                yield row
+    if headers is None:
+        yield []
+
+
+def open_xlsx(path: str, sheet: Optional[str] = None) -> Tuple[List[str], Iterator[DataRow]]:
+    """
+    XLSX 파일의 시트를 열어 (헤더 목록, 행 이터레이터)를 반환합니다. sheet를 주지 않으면 첫 번째 시트입니다.
+    메모리에는 공유 문자열 표와 현재 읽기 구간만 유지되며, 파일은 이터레이터가 끝까지 소비되거나 정리될 때 닫힙니다.
+    헤더 행보다 오른쪽에서 처음 등장하는 열은 __EMPTY 이름으로 헤더 목록에 추가됩니다.
+    """
+    archive = zipfile.ZipFile(path)
+    try:
+        sheets, shared_path = _locate_parts(archive)
+        sheet_path = sheets[0][1] if sheet is None else next((p for name, p in sheets if name == sheet), None)
+        if sheet_path is None:
+            raise ValueError(f'Worksheet not found: {sheet}')
+        shared: List[str] = []
+        if shared_path:
+            with archive.open(shared_path) as handle:
+                shared.extend(_rich_text(si) for si in _scan_elements(handle, 'si'))
+        rows = _iter_xlsx_rows(archive, sheet_path, shared)
+        headers = cast(List[str], next(rows))
+    except Exception:
+        archive.close()
+        raise
+
+    def iterate() -> Iterator[DataRow]:
+        try:
+            for row in rows:
+                yield cast(DataRow, row)
+        finally:
+            archive.close()
+
+    return list(headers), iterate()
+
+
+def file_extension(path: str) -> str:
+    return os.path.splitext(path)[1].lstrip('.').lower()
+
+
+def list_sheets(path: str) -> List[Tuple[Optional[str], int]]:
+    """
+    파일의 시트 목록 [(시트 이름, 예상 크기)]을 통합 문서 순서로 반환합니다. CSV는 이름 없는 시트 하나입니다.
+    예상 크기는 CSV 파일 크기 또는 압축을 푼 시트 XML 크기(바이트)로, 일괄 정제의 작업 순서를 정할 때 씁니다.
+    """
+    ext = file_extension(path)
+    if ext == 'csv':
+        return [(None, os.path.getsize(path))]
+    if ext != 'xlsx':
+        raise ValueError('Unsupported file type')
+    with zipfile.ZipFile(path) as archive:
+        sheets, _ = _locate_parts(archive)
+        sizes = {info.filename: info.file_size for info in archive.infolist()}
+    return [(name, sizes.get(sheet_path, 0)) for name, sheet_path in sheets]
+
+
+def open_table(path: str, sheet: Optional[str] = None) -> Tuple[List[str], Iterator[DataRow]]:
+    """확장자에 따라 CSV/XLSX 스트리밍 파서를 선택합니다. sheet는 XLSX 시트 이름입니다 (없으면 첫 번째 시트)."""
+    ext = file_extension(path)
+    if ext == 'csv':
+        return open_csv(path)
+    if ext == 'xlsx':
+        return open_xlsx(path, sheet)
+    raise ValueError('Unsupported file type')
@@ -0,0 +1,198 @@
+"""
+스트리밍 정제 파이프라인
+
+읽기(parsers) -> 정제(processors) -> 쓰기(exporters)를 제너레이터로 연결합니다.
+어느 시점에도 메모리에는 청크 하나만 존재하므로, 1천 행 파일이든 수십 GB 내보내기든
+메모리 사용량은 chunk_size에만 비례합니다.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from .analyzers import DiffCounts, IssueScanner, detect_pattern_issues, finalize_diff_stats
+from .capacity import auto_plan
+from .columnar import process_columns
+from .exporters import open_writer
+from .memo import MemoStats
+from .models import ColumnLimits, ColumnSpecificOptions, DataIssue, DataRow, ProcessingOptions, ProcessingStats
+from .parallel import clean_chunks_parallel
+from .parsers import DEFAULT_CHUNK_SIZE, iter_chunks, open_table
+from .plan import CleaningPlan, PromptLike, get_plan
+from .profiler import CleaningProfiler
+from .table_cache import TableCache
+
+# row: 행마다 전체 단계 실행 / columnar: 청크를 컬럼 배열로 펼쳐 컬럼 단위로 실행 (결과 동일)
+MODES = ('row', 'columnar')
+
+
+@dataclass
+class CleanResult:
+    """파일 정제 결과 요약"""
+    input_path: str
+    output_path: str
+    sheet: Optional[str] = None   # XLSX 시트 이름 (CSV 또는 첫 번째 시트 기본값이면 None)
+    headers: List[str] = field(default_factory=list)
+    total_rows: int = 0
+    chunks: int = 0
+    chunk_size: int = 0
+    elapsed: float = 0.0
+    # 고유값 메모 적중 통계 (workers=1일 때만 수집, 병렬 실행은 워커 프로세스에 남음)
+    memo_stats: List[MemoStats] = field(default_factory=list)
+    # analyze=True일 때만 채움 (원본/정제 결과 이슈와 품질 통계)
+    original_issues: List[DataIssue] = field(default_factory=list)
+    issues: List[DataIssue] = field(default_factory=list)
+    stats: Optional[ProcessingStats] = None
+    # profile=True일 때만 채움 (단계/규칙별 실행 통계, profiler.py의 JSON 프로파일)
+    profile: Optional[Dict[str, Any]] = None
+
+
+def clean_chunks(
+    chunks: Iterable[List[DataRow]],
+    prompt: Union[str, CleaningPlan],
+    options: Optional[ProcessingOptions] = None,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+    mode: str = 'row',
+    workers: int = 1,
+    profiler: Optional[CleaningProfiler] = None,
+) -> Iterator[List[DataRow]]:
+    """
+    청크 스트림을 정제하여 정제된 청크를 순서대로 내보냅니다.
+    정제 계획은 첫 청크의 헤더로 한 번만 컴파일(캐시)되며, 이미 컴파일한 CleaningPlan을 넘길 수도 있습니다.
+    mode='columnar'는 청크를 컬럼 단위로 정제합니다 (columnar.py).
+    workers가 1이 아니면 청크를 워커 프로세스에서 병렬 정제하되 입력 순서대로 내보냅니다 (0: CPU 코어 수, parallel.py).
+    profiler를 주면 규칙별 실행 통계를 기록합니다 (profiler.py).
+    Order: Lock > Column Option > NLP > Checkbox
+    """
+    if mode not in MODES:
+        raise ValueError(f'Unknown mode: {mode}')
+    plan = prompt if isinstance(prompt, CleaningPlan) else None
+    chunks = iter(chunks)
+    if plan is None:
+        # 첫 청크의 헤더로 계획을 컴파일한 뒤 그 청크부터 다시 처리
+        for chunk in chunks:
+            if chunk:
+                headers = [k for k in chunk[0] if k is not None]
+                plan = get_plan(prompt, headers, options or ProcessingOptions(), locked_columns, column_options)
+                chunks = itertools.chain([chunk], chunks)
+                break
+        else:
+            return
+
+    if workers != 1:
+        yield from clean_chunks_parallel(chunks, plan, workers, mode, profiler)
+        return
+
+    if profiler:
+        plan = profiler.instrument(plan)
+
+    for chunk in chunks:
+        if mode == 'columnar':
+            yield process_columns(plan, chunk)
+        else:
+            yield [plan.process_row(row) for row in chunk]
+
+
+def clean_file(
+    input_path: str,
+    output_path: str,
+    prompt: PromptLike = '',
+    options: Optional[ProcessingOptions] = None,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = 'row',
+    workers: int = 1,
+    column_limits: Optional[ColumnLimits] = None,
+    analyze: bool = False,
+    on_chunk: Optional[Callable[[CleanResult], None]] = None,
+    cache: Optional[TableCache] = None,
+    sheet: Optional[str] = None,
+    profile: bool = False,
+) -> CleanResult:
+    """
+    CSV/XLSX 파일을 청크 단위로 읽어 정제한 뒤, 결과를 도착 순서대로 output_path에 기록합니다.
+    입출력 형식은 각 경로의 확장자로 정하며(csv, xlsx), XLSX도 행 단위로 읽고 쓰기 전용으로 기록합니다.
+    chunk_size가 0 이하이면 측정한 처리량/메모리로 청크 크기를 정합니다 (capacity.py).
+    analyze=True이면 원본/정제 결과를 청크마다 검사해 이슈와 품질 통계를 함께 반환합니다 (analyzers.py).
+    on_chunk는 청크를 기록할 때마다 진행 중인 결과로 호출되며, 예외를 던지면 정제를 중단합니다.
+    cache를 주면 같은 내용의 파일을 다시 열 때 파싱을 건너뜁니다 (table_cache.py).
+    sheet는 읽을 XLSX 시트 이름이며, 없으면 첫 번째 시트를 읽습니다.
+    output_path가 input_path와 같은 파일이면 ValueError입니다.
+    profile=True이면 단계/규칙별 실행 통계를 result.profile에 담습니다 (profiler.py). 끄면 측정 비용이 없습니다.
+    """
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        # 읽는 도중 결과 파일을 쓰면 원본이 잘려 나가므로 거부
+        raise ValueError(f'Output path must differ from input path: {output_path}')
+    started = time.perf_counter()
+    options = options or ProcessingOptions()
+    profiler = CleaningProfiler() if profile else None
+
+    def stage(name: str) -> ContextManager[None]:
+        return profiler.stage(name) if profiler else nullcontext()
+
+    if chunk_size <= 0:
+        chunk_size = auto_plan(workers, mode).chunk_size
+    with stage('parse'):
+        headers, rows = cache.open(input_path, chunk_size, sheet) if cache else open_table(input_path, sheet)
+    result = CleanResult(input_path=input_path, output_path=output_path, sheet=sheet, headers=headers, chunk_size=chunk_size)
+
+    with stage('compile'):
+        plan = get_plan(prompt, headers, options, locked_columns, column_options)
+    chunks: Iterable[List[DataRow]] = iter_chunks(rows, chunk_size)
+    if profiler:
+        chunks = profiler.timed_iter('parse', chunks)
+
+    # 분석할 때는 정제 결과와 짝지을 원본 청크를 보관 (병렬 실행에서도 대기 중인 청크 수만큼만 쌓임)
+    originals: Deque[List[DataRow]] = deque()
+    if analyze:
+        original_scan = IssueScanner(headers, column_limits, options)
+        processed_scan = IssueScanner(headers, column_limits, options)
+        counts = DiffCounts()
+
+        def keep(source: Iterable[List[DataRow]]) -> Iterator[List[DataRow]]:
+            for chunk in source:
+                originals.append(chunk)
+                yield chunk
+        chunks = keep(chunks)
+
+    cleaned = clean_chunks(chunks, plan, mode=mode, workers=workers, profiler=profiler)
+    if profiler:
+        cleaned = profiler.timed_iter('clean', cleaned)
+
+    with open_writer(output_path, headers) as writer:
+        for chunk in cleaned:
+            with stage('export'):
+                writer.write_rows(chunk)
+            if analyze:
+                original = originals.popleft()
+                with stage('detect'):
+                    original_scan.scan(original)
+                    processed_scan.scan(chunk)
+                with stage('diff'):
+                    counts.add(original, chunk, headers)
+            result.total_rows += len(chunk)
+            result.chunks += 1
+            if on_chunk:
+                on_chunk(result)
+
+    if analyze:
+        result.original_issues = original_scan.issues()
+        result.issues = processed_scan.issues()
+        result.stats = finalize_diff_stats(counts, len(result.original_issues), len(result.issues))
+        # 적용하지 않은 프롬프트 패턴은 품질 통계와 별개로 알림 (useDataFlow의 patternIssues와 동일)
+        result.issues.extend(detect_pattern_issues(plan.nlp.rejected_patterns))
+    result.elapsed = time.perf_counter() - started
+    if workers == 1:
+        result.memo_stats = plan.memo_stats()
+    if profiler:
+        profiler.rows = result.total_rows
+        profiler.shards = result.chunks
+        result.profile = profiler.to_dict()
+    return result
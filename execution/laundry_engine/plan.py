@@ -0,0 +1,219 @@
+"""
+정제 계획(CleaningPlan) 컴파일 및 캐시
+
+프롬프트 + 헤더 + 옵션 조합을 한 번만 분석해, 컬럼마다 적용할 변환 목록을 미리 확정한
+불변 객체로 만듭니다. 셀 단위 비용은 확정된 함수 목록을 순서대로 실행하는 것뿐이며,
+같은 프리셋으로 여러 파일을 배치 처리하면 LRU 캐시에서 계획을 재사용해 프롬프트 분석을 건너뜁니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .memo import MemoStats, ValueMemo
+from .models import ColumnSpecificOptions, DataRow, ProcessingOptions
+from .nlp import PromptAnalysis, analyze_prompt
+from .transforms import Transform, build_column_transforms, find_null_filling
+from .utils import js_str
+
+DEFAULT_PLAN_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """컬럼 하나의 확정된 정제 단계"""
+    key: str
+    locked: bool = False
+    transforms: Tuple[Transform, ...] = ()
+    # 원본 값이 없는(None) 셀은 결측치 채우기 단계 값에서 이어서 처리 (processDataLocal의 rawVal 검사)
+    missing_fill: Optional[str] = None
+    missing_start: int = 0
+    _fns: Tuple[Callable[[str], str], ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_fns', tuple(t.fn for t in self.transforms))
+
+    @property
+    def step_names(self) -> Tuple[str, ...]:
+        return tuple(t.name for t in self.transforms)
+
+    def apply(self, raw: object) -> str:
+        """한 셀 값을 정제합니다. 잠금 컬럼은 호출측에서 건너뜁니다."""
+        fns = self._fns
+        if raw is None and self.missing_fill is not None:
+            val = self.missing_fill
+            fns = fns[self.missing_start:]
+        else:
+            val = js_str(raw)
+        for fn in fns:
+            val = fn(val)
+        return val
+
+
+def compile_column(
+    key: str,
+    nlp: PromptAnalysis,
+    options: ProcessingOptions,
+    locked: bool = False,
+    col_option: Optional[str] = None,
+) -> ColumnPlan:
+    """컬럼 하나의 정제 단계를 컴파일합니다."""
+    if locked:
+        return ColumnPlan(key, locked=True)
+    transforms = tuple(build_column_transforms(key, nlp, options, col_option))
+    null_fill = find_null_filling(key, nlp)
+    if null_fill is None:
+        return ColumnPlan(key, transforms=transforms)
+    start = next(i for i, t in enumerate(transforms) if t.name == 'null_fill') + 1
+    return ColumnPlan(key, transforms=transforms, missing_fill=null_fill.fill_value, missing_start=start)
+
+
+@dataclass(frozen=True)
+class CleaningPlan:
+    """
+    프롬프트/헤더/옵션을 컴파일한 불변 정제 계획
+    헤더에 없던 컬럼이 들어오면 같은 규칙으로 즉석 컴파일합니다 (캐시된 계획은 변경하지 않음).
+    """
+    nlp: PromptAnalysis
+    options: ProcessingOptions
+    columns: Mapping[str, ColumnPlan]
+    locked_columns: frozenset = frozenset()
+    column_options: Mapping[str, Optional[str]] = field(default_factory=dict)
+    key: str = ''
+
+    def column(self, key: str) -> ColumnPlan:
+        plan = self.columns.get(key)
+        if plan is None:
+            plan = compile_column(key, self.nlp, self.options, key in self.locked_columns, self.column_options.get(key))
+        return plan
+
+    def process_row(self, row: DataRow) -> DataRow:
+        """한 행을 정제한 새 행을 반환합니다. [Rule 1] 잠금 컬럼은 원본 값을 그대로 유지합니다."""
+        new_row = dict(row)
+        columns = self.columns
+        for key, raw in row.items():
+            if key is None:
+                continue
+            plan = columns.get(key) or self.column(key)
+            if not plan.locked:
+                new_row[key] = plan.apply(raw)
+        return new_row
+
+    def memo_stats(self) -> List[MemoStats]:
+        """고유값 메모 적중 통계 (컬럼/단계별). 캐시된 계획을 재사용하면 이전 실행 결과도 누적됩니다."""
+        return [t.fn.stats() for col in self.columns.values() for t in col.transforms if isinstance(t.fn, ValueMemo)]
+
+
+PromptLike = Union[str, PromptAnalysis]
+
+
+def plan_key(
+    prompt: PromptLike,
+    headers: Sequence[str],
+    options: ProcessingOptions,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+) -> str:
+    """프롬프트/헤더/옵션 조합의 해시 (캐시 키)"""
+    payload = json.dumps(
+        [
+            prompt if isinstance(prompt, str) else repr(prompt),
+            list(headers),
+            sorted(k for k, v in vars(options).items() if v),
+            sorted(locked_columns),
+            sorted((column_options or {}).items(), key=lambda kv: kv[0]),
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def compile_plan(
+    prompt: PromptLike,
+    headers: Sequence[str],
+    options: ProcessingOptions,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+) -> CleaningPlan:
+    """프롬프트를 한 번 분석하고 헤더별 정제 단계를 확정합니다."""
+    nlp = analyze_prompt(prompt) if isinstance(prompt, str) else prompt
+    locked = frozenset(locked_columns)
+    col_options = dict(column_options or {})
+    columns: Dict[str, ColumnPlan] = {}
+    for key in headers:
+        if key is None or key in columns:
+            continue
+        columns[key] = compile_column(key, nlp, options, key in locked, col_options.get(key))
+    return CleaningPlan(
+        nlp=nlp,
+        options=options,
+        columns=columns,
+        locked_columns=locked,
+        column_options=col_options,
+        key=plan_key(prompt, headers, options, locked, col_options),
+    )
+
+
+class PlanCache:
+    """정제 계획 LRU 캐시 (키: 프롬프트/헤더/옵션 해시)"""
+
+    def __init__(self, maxsize: int = DEFAULT_PLAN_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: 'OrderedDict[str, CleaningPlan]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(
+        self,
+        prompt: PromptLike,
+        headers: Sequence[str],
+        options: ProcessingOptions,
+        locked_columns: Iterable[str] = (),
+        column_options: Optional[ColumnSpecificOptions] = None,
+    ) -> CleaningPlan:
+        locked = frozenset(locked_columns)
+        key = plan_key(prompt, headers, options, locked, column_options)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+        plan = compile_plan(prompt, headers, options, locked, column_options)
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# 프로세스 전역 기본 캐시
+plan_cache = PlanCache()
+
+
+def get_plan(
+    prompt: PromptLike,
+    headers: Sequence[str],
+    options: ProcessingOptions,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+) -> CleaningPlan:
+    """기본 캐시에서 정제 계획을 가져오거나 새로 컴파일합니다."""
+    return plan_cache.get(prompt, headers, options, locked_columns, column_options)
@@ -0,0 +1,50 @@
+"""
+데이터 정제 핵심 로직
+
+`src/lib/core/processors.ts`의 `processDataLocal`을 파이썬으로 옮긴 것입니다.
+프롬프트/헤더/옵션을 정제 계획(plan.py)으로 한 번 컴파일한 뒤, 셀마다 확정된 변환 목록만 실행합니다.
+규칙 적용 순서와 결과는 브라우저 엔진과 동일하게 유지합니다.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Union
+
+from .models import ColumnSpecificOptions, DataRow, ProcessingOptions
+from .nlp import PromptAnalysis
+from .plan import CleaningPlan, compile_column, get_plan
+
+
+def process_value(
+    key: str,
+    raw: object,
+    nlp: PromptAnalysis,
+    options: ProcessingOptions,
+    col_option: Optional[str] = None,
+) -> str:
+    """
+    한 셀에 전체 정제 규칙을 적용합니다 (단건 호출용).
+    대량 처리는 컬럼별로 한 번만 컴파일하는 CleaningPlan을 사용하세요.
+    """
+    return compile_column(key, nlp, options, col_option=col_option).apply(raw)
+
+
+def process_row(row: DataRow, plan: CleaningPlan) -> DataRow:
+    """한 행을 정제한 새 행을 반환합니다. [Rule 1] 잠금 컬럼은 원본 값을 그대로 유지합니다."""
+    return plan.process_row(row)
+
+
+def process_data_local(
+    data: List[DataRow],
+    prompt: Union[str, PromptAnalysis],
+    options: ProcessingOptions,
+    locked_columns: Iterable[str] = (),
+    column_options: Optional[ColumnSpecificOptions] = None,
+) -> List[DataRow]:
+    """
+    데이터를 정제하는 핵심 함수 (processDataLocal 포팅)
+    첫 행의 헤더로 정제 계획을 컴파일(캐시)하며, prompt에 미리 분석한 PromptAnalysis를 넘길 수도 있습니다.
+    """
+    if not data:
+        return []
+    plan = get_plan(prompt, [k for k in data[0] if k is not None], options, locked_columns, column_options)
+    return [plan.process_row(row) for row in data]
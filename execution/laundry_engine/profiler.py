@@ -0,0 +1,178 @@
+"""
+정제 프로파일러 (Opt-in)
+
+`src/lib/core/profiler.ts`와 같은 구성입니다. 정제가 느릴 때 어느 규칙이 원인인지 보기 위해
+규칙(컬럼/단계)별 실행 횟수, 변경한 셀 수, 누적 시간과 단계(parse/compile/clean/detect/diff/export)별 시간을 모읍니다.
+프로파일링을 켜면 정제 계획의 셀 함수/커널을 측정용으로 감싼 사본(instrument)으로 실행하고,
+끄면 기존 계획을 그대로 실행하므로 비용이 없습니다. 규칙 시간에는 측정 자체의 비용이 포함되므로 규칙 간 상대 비교용으로 봅니다.
+
+단계 시간은 중첩을 빼고 기록합니다 (정제 중 다음 청크를 읽는 시간은 parse로만 셈).
+병렬 실행(parallel.py)에서 단계 시간은 부모 프로세스의 경과 시간이고, 규칙 통계는 워커 합계입니다.
+컬럼 모드의 커널 단계는 청크마다 한 번 실행되므로 calls가 청크 수입니다.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from . import kernels
+from .kernels import Kernel
+from .plan import CleaningPlan, ColumnPlan
+from .transforms import Transform
+
+STAGES = ('parse', 'compile', 'clean', 'detect', 'diff', 'export')
+
+T = TypeVar('T')
+
+
+@dataclass
+class RuleProfile:
+    """규칙 하나의 누적 실행 통계"""
+    column: str
+    step: str
+    calls: int = 0
+    cells: int = 0       # 규칙을 거친 셀 수
+    changed: int = 0     # 규칙이 값을 바꾼 셀 수
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """웹 앱과 같은 키 (시간은 밀리초)"""
+        return {
+            'column': self.column,
+            'step': self.step,
+            'calls': self.calls,
+            'cells': self.cells,
+            'changed': self.changed,
+            'ms': round(self.seconds * 1000, 3),
+        }
+
+
+class CleaningProfiler:
+    """단계/규칙별 실행 통계 수집기 (프로세스 하나에서만 사용)"""
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.rules: Dict[Tuple[str, str], RuleProfile] = {}
+        self.rows = 0
+        self.shards = 0
+        # 진행 중인 단계마다 안쪽 단계에 쓴 시간 (바깥 단계 시간에서 뺌)
+        self._nested: List[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self._nested.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stages[name] += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def timed_iter(self, name: str, source: Iterable[T]) -> Iterator[T]:
+        """항목을 꺼내는 데 걸린 시간을 단계 시간에 더하며 그대로 내보냅니다."""
+        it = iter(source)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def rule(self, column: str, step: str) -> RuleProfile:
+        key = (column, step)
+        rule = self.rules.get(key)
+        if rule is None:
+            rule = self.rules[key] = RuleProfile(column, step)
+        return rule
+
+    def instrument(self, plan: CleaningPlan) -> CleaningPlan:
+        """모든 컬럼의 단계를 측정용으로 감싼 계획 사본 (캐시된 원래 계획과 고유값 메모는 그대로 공유)"""
+        return replace(plan, columns={key: self.instrument_column(col) for key, col in plan.columns.items()})
+
+    def instrument_column(self, plan: ColumnPlan) -> ColumnPlan:
+        if plan.locked or not plan.transforms:
+            return plan
+        transforms = []
+        for t in plan.transforms:
+            rule = self.rule(plan.key, t.name)
+            kernel = _profiled_kernel(rule, t.kernel) if t.kernel is not None else None
+            transforms.append(Transform(t.name, _profiled_fn(rule, t.fn), kernel))
+        return ColumnPlan(plan.key, transforms=tuple(transforms), missing_fill=plan.missing_fill, missing_start=plan.missing_start)
+
+    def add(self, profile: Dict[str, Any], stages: bool = True) -> None:
+        """다른 프로파일(to_dict 결과)을 더합니다. stages=False이면 규칙 통계와 행/청크 수만 더합니다."""
+        if stages:
+            for name, ms in profile['stages'].items():
+                self.stages[name] = self.stages.get(name, 0.0) + ms / 1000
+        for r in profile['rules']:
+            rule = self.rule(r['column'], r['step'])
+            rule.calls += r['calls']
+            rule.cells += r['cells']
+            rule.changed += r['changed']
+            rule.seconds += r['ms'] / 1000
+        self.rows += profile['rows']
+        self.shards += profile['shards']
+
+    def drain(self) -> Dict[str, Any]:
+        """지금까지의 프로파일을 반환하고 비웁니다 (워커가 청크마다 결과와 함께 돌려보낼 때)."""
+        profile = self.to_dict()
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        for rule in self.rules.values():
+            rule.calls = rule.cells = rule.changed = 0
+            rule.seconds = 0.0
+        self.rows = self.shards = 0
+        return profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 프로파일 (웹 앱 디버그 패널의 JSON 저장과 같은 구성, 규칙은 누적 시간 순)"""
+        return {
+            'stages': {name: round(self.stages.get(name, 0.0) * 1000, 3) for name in STAGES},
+            'rules': [r.to_dict() for r in sorted(self.rules.values(), key=lambda r: r.seconds, reverse=True) if r.calls],
+            'rows': self.rows,
+            'shards': self.shards,
+        }
+
+
+def _profiled_fn(rule: RuleProfile, fn: Callable[[str], str]) -> Callable[[str], str]:
+    perf_counter = time.perf_counter
+
+    def profiled(val: str) -> str:
+        started = perf_counter()
+        result = fn(val)
+        rule.seconds += perf_counter() - started
+        rule.calls += 1
+        rule.cells += 1
+        if result != val:
+            rule.changed += 1
+        return result
+    return profiled
+
+
+def _profiled_kernel(rule: RuleProfile, kernel: Kernel) -> Kernel:
+    def profiled(col: kernels.Column) -> kernels.Column:
+        before = kernels.to_list(col)
+        started = time.perf_counter()
+        result = kernel(col)
+        rule.seconds += time.perf_counter() - started
+        after = kernels.to_list(result)
+        rule.calls += 1
+        rule.cells += len(after)
+        rule.changed += sum(1 for a, b in zip(before, after) if a != b)
+        return result
+    return profiled
+
+
+def merge_profiles(profiles: Iterable[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """시트/파일별 프로파일을 합칩니다 (같은 컬럼/단계의 규칙은 더함). 프로파일이 하나도 없으면 None."""
+    merged: Optional[CleaningProfiler] = None
+    for profile in profiles:
+        if profile is None:
+            continue
+        merged = merged or CleaningProfiler()
+        merged.add(profile)
+    return merged.to_dict() if merged else None
@@ -0,0 +1,631 @@
+"""
+사용자 정규식 안전 실행 (Safe Regex)
+
+`src/lib/core/safeRegex.ts`와 같은 규칙입니다. 프롬프트에서 만든 패턴은 사용자가 쓴 문자열이 그대로 정규식이 되므로
+`(a+)+` 같은 패턴은 백트래킹이 지수적으로 늘어 배치 작업 하나가 멈출 수 있습니다.
+구문을 분석해 백트래킹 양이 제한되는 패턴만 `re`로 실행하고, 나머지는 선형 시간 NFA(Pike VM)로 실행합니다.
+NFA로 옮길 수 없는데(역참조/전후방 탐색) 안전하다고 볼 수도 없는 패턴은 적용하지 않고 이슈로 보고합니다.
+컴파일 결과는 소스/플래그별로 전역 캐시에 둡니다.
+"""
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Pattern, Tuple
+
+from .utils import compile_js_regex, js_sub
+
+# re로 실행할 수 있는 유한 반복 조합 수 상한 (반복 구간 길이의 곱)
+MAX_NATIVE_FACTOR = 16
+# 무한 반복이 하나 있는 패턴을 re로 실행하는 셀 길이 상한 (넘으면 NFA)
+NATIVE_MAX_LENGTH = 1000
+# NFA 명령 수 상한 ({n,m} 반복은 펼쳐서 컴파일)
+MAX_PROGRAM = 4000
+# 컴파일 결과 캐시 크기
+MAX_CACHED_PATTERNS = 256
+
+INF = float('inf')
+DIGIT_RANGES = (48, 57)
+WORD_RANGES = (48, 57, 65, 90, 95, 95, 97, 122)
+SPACE_RANGES = (9, 13, 32, 32, 160, 160, 5760, 5760, 8192, 8202, 8232, 8233, 8239, 8239, 8287, 8287, 12288, 12288, 65279, 65279)
+LINE_TERMINATORS = (10, 10, 13, 13, 8232, 8233)
+_QUANTIFIER = re.compile(r'\{([0-9]+)(,([0-9]*))?\}')
+_LOOK = re.compile(r'\?<?[=!]')
+_OCTAL = re.compile(r'[0-7]{0,2}')
+_HEX = {2: re.compile(r'[0-9a-fA-F]{2}'), 4: re.compile(r'[0-9a-fA-F]{4}')}
+_JS_TEMPLATE_TOKEN = re.compile(r"\$(\$|&|`|'|[0-9]{1,2})")
+
+
+class UnsupportedPattern(Exception):
+    """NFA로 옮길 수 없는 문법 (역참조, 전후방 탐색, 너무 큰 반복)"""
+
+
+# --- 구문 트리 (튜플: 종류, 값...) ---
+# ('char', c) / ('set', ranges, negate) / ('seq', items) / ('alt', items) / ('group', index, body)
+# ('repeat', body, min, max, lazy) / ('assert', kind) / ('backref',) / ('look', body)
+
+
+class _Parser:
+    """JS 정규식 소스를 구문 트리로 바꿉니다. (u 플래그 없는 기본 문법)"""
+
+    def __init__(self, src: str) -> None:
+        self.src = src
+        self.pos = 0
+        self.groups = 0
+
+    def peek(self) -> str:
+        return self.src[self.pos] if self.pos < len(self.src) else ''
+
+    def parse(self) -> tuple:
+        node = self.alternation()
+        if self.pos < len(self.src):
+            raise UnsupportedPattern(f'unexpected {self.src[self.pos]!r}')
+        return node
+
+    def alternation(self) -> tuple:
+        items = [self.sequence()]
+        while self.peek() == '|':
+            self.pos += 1
+            items.append(self.sequence())
+        return items[0] if len(items) == 1 else ('alt', items)
+
+    def sequence(self) -> tuple:
+        items = []
+        while self.pos < len(self.src) and self.peek() not in '|)':
+            atom = self.atom()
+            repeat = self.quantifier()
+            if repeat:
+                if atom[0] == 'assert':
+                    raise UnsupportedPattern('quantified assertion')
+                atom = ('repeat', atom) + repeat
+            items.append(atom)
+        return items[0] if len(items) == 1 else ('seq', items)
+
+    def quantifier(self) -> Optional[tuple]:
+        ch = self.peek()
+        if ch == '*':
+            lo, hi = 0, INF
+        elif ch == '+':
+            lo, hi = 1, INF
+        elif ch == '?':
+            lo, hi = 0, 1
+        elif ch == '{':
+            # {n}, {n,}, {n,m} 이 아니면 글자 '{' (Annex B)
+            m = _QUANTIFIER.match(self.src, self.pos)
+            if not m:
+                return None
+            lo = int(m.group(1))
+            hi = lo if m.group(2) is None else (INF if m.group(3) == '' else int(m.group(3)))
+            self.pos = m.end() - 1
+        else:
+            return None
+        self.pos += 1
+        lazy = self.peek() == '?'
+        if lazy:
+            self.pos += 1
+        return (lo, hi, lazy)
+
+    def atom(self) -> tuple:
+        ch = self.src[self.pos]
+        self.pos += 1
+        if ch == '.':
+            return ('set', LINE_TERMINATORS, True)
+        if ch == '^':
+            return ('assert', 'bol')
+        if ch == '$':
+            return ('assert', 'eol')
+        if ch == '[':
+            return self.char_class()
+        if ch == '\\':
+            return self.escape(False)
+        if ch == '(':
+            index = 0
+            look = False
+            if self.src.startswith('?:', self.pos):
+                self.pos += 2
+            elif _LOOK.match(self.src, self.pos):
+                look = True
+                self.pos += 3 if self.src[self.pos + 1] == '<' else 2
+            else:
+                if self.src.startswith('?<', self.pos):
+                    self.pos = self.src.index('>', self.pos) + 1
+                self.groups += 1
+                index = self.groups
+            body = self.alternation()
+            if self.peek() != ')':
+                raise UnsupportedPattern('unclosed group')
+            self.pos += 1
+            return ('look', body) if look else ('group', index, body)
+        return ('char', ord(ch))
+
+    def escape(self, in_class: bool) -> tuple:
+        ch = self.src[self.pos]
+        self.pos += 1
+        sets = {'d': (DIGIT_RANGES, False), 'D': (DIGIT_RANGES, True), 'w': (WORD_RANGES, False),
+                'W': (WORD_RANGES, True), 's': (SPACE_RANGES, False), 'S': (SPACE_RANGES, True)}
+        if ch in sets:
+            return ('set',) + sets[ch]
+        if ch == 'b':
+            return ('char', 8) if in_class else ('assert', 'word')
+        if ch == 'B':
+            return ('char', 66) if in_class else ('assert', 'not_word')
+        controls = {'t': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13}
+        if ch in controls:
+            return ('char', controls[ch])
+        if ch == 'k':
+            if not in_class and self.peek() == '<':
+                raise UnsupportedPattern('backreference')
+            return ('char', 107)
+        if ch == 'c':
+            nxt = self.peek()
+            if nxt and nxt.isascii() and nxt.isalpha():
+                self.pos += 1
+                return ('char', ord(nxt) % 32)
+            return ('char', 92)
+        if ch in 'xu':
+            size = 2 if ch == 'x' else 4
+            m = _HEX[size].match(self.src, self.pos)
+            if m and m.end() - self.pos == size:
+                self.pos += size
+                return ('char', int(m.group(0), 16))
+            return ('char', ord(ch))
+        if '1' <= ch <= '9' and not in_class:
+            return ('backref',)
+        if '0' <= ch <= '7':
+            # \0 및 8진수 이스케이프 (Annex B)
+            m = _OCTAL.match(self.src, self.pos)
+            self.pos = m.end()
+            return ('char', int(ch + m.group(0), 8) & 0xff)
+        return ('char', ord(ch))
+
+    def char_class(self) -> tuple:
+        negate = self.peek() == '^'
+        if negate:
+            self.pos += 1
+        ranges: List[int] = []
+        while self.pos < len(self.src) and self.peek() != ']':
+            start = self.class_atom()
+            if start[0] == 'set':
+                ranges.extend(_set_ranges(start))
+                continue
+            lo = start[1]
+            if self.peek() == '-' and self.pos + 1 < len(self.src) and self.src[self.pos + 1] != ']':
+                self.pos += 1
+                end = self.class_atom()
+                if end[0] == 'set':
+                    # [a-\d] 같은 경우 '-'는 글자
+                    ranges.extend((lo, lo, 45, 45))
+                    ranges.extend(_set_ranges(end))
+                    continue
+                ranges.extend((lo, end[1]))
+            else:
+                ranges.extend((lo, lo))
+        if self.peek() != ']':
+            raise UnsupportedPattern('unclosed class')
+        self.pos += 1
+        return ('set', tuple(ranges), negate)
+
+    def class_atom(self) -> tuple:
+        ch = self.src[self.pos]
+        self.pos += 1
+        return self.escape(True) if ch == '\\' else ('char', ord(ch))
+
+
+def _set_ranges(node: tuple) -> Tuple[int, ...]:
+    """부정 집합을 0~0xffff 범위의 양의 구간으로 바꿉니다. (문자 집합 안의 \\D, \\W, \\S)"""
+    _, ranges, negate = node
+    if not negate:
+        return ranges
+    out: List[int] = []
+    nxt = 0
+    for lo, hi in sorted(zip(ranges[::2], ranges[1::2])):
+        if lo > nxt:
+            out.extend((nxt, lo - 1))
+        nxt = max(nxt, hi + 1)
+    if nxt <= 0xffff:
+        out.extend((nxt, 0xffff))
+    return tuple(out)
+
+
+# --- 백트래킹 비용 분석 ---
+
+def _is_simple(node: tuple) -> bool:
+    """반복 본문이 고정 길이 글자열인지 (반복/선택/역참조/전후방 탐색이 없음)"""
+    kind = node[0]
+    if kind in ('char', 'set', 'assert'):
+        return True
+    if kind == 'seq':
+        return all(_is_simple(item) for item in node[1])
+    if kind == 'group':
+        return _is_simple(node[2])
+    return False
+
+
+def _backtrack_cost(node: tuple) -> Tuple[int, float, bool]:
+    """(무한 반복 수, 유한 반복/선택지 조합 수, 중첩 반복 여부)"""
+    kind = node[0]
+    if kind in ('seq', 'alt'):
+        unbounded, factor, nested = 0, 1 if kind == 'seq' else 0, False
+        for item in node[1]:
+            u, f, n = _backtrack_cost(item)
+            unbounded += u
+            factor = factor * f if kind == 'seq' else factor + f
+            nested = nested or n
+        return unbounded, factor, nested
+    if kind == 'group':
+        return _backtrack_cost(node[2])
+    if kind == 'look':
+        return _backtrack_cost(node[1])
+    if kind == 'repeat':
+        _, body, lo, hi, _lazy = node
+        if not _is_simple(body):
+            return 1, INF, True
+        return (1, 1, False) if hi == INF else (0, hi - lo + 1, False)
+    if kind == 'backref':
+        return 0, 1, True
+    return 0, 1, False
+
+
+def _nullable(node: tuple) -> bool:
+    """빈 문자열과 일치할 수 있는지"""
+    kind = node[0]
+    if kind in ('char', 'set'):
+        return False
+    if kind == 'seq':
+        return all(_nullable(item) for item in node[1])
+    if kind == 'alt':
+        return any(_nullable(item) for item in node[1])
+    if kind == 'group':
+        return _nullable(node[2])
+    if kind == 'repeat':
+        return node[2] == 0 or _nullable(node[1])
+    return True
+
+
+def _empty_iteration_capture(node: tuple) -> bool:
+    """
+    빈 문자열과 일치할 수 있는 반복 본문에 캡처 그룹이 있는지 (`(a|)+`, `(a?){0,2}`)
+    JS는 최소 횟수를 넘는 빈 반복을 실패로 보고 이전 반복의 캡처를 남기지만 re는 빈 캡처로 덮어쓰므로 NFA로 실행합니다.
+    """
+    kind = node[0]
+    if kind in ('seq', 'alt'):
+        return any(_empty_iteration_capture(item) for item in node[1])
+    if kind == 'group':
+        return _empty_iteration_capture(node[2])
+    if kind == 'look':
+        return _empty_iteration_capture(node[1])
+    if kind == 'repeat':
+        body = node[1]
+        return (_nullable(body) and _group_span(body) is not None) or _empty_iteration_capture(body)
+    return False
+
+
+# --- 선형 시간 NFA (Pike VM) ---
+
+OP_CHAR, OP_SET, OP_SPLIT, OP_JMP, OP_SAVE, OP_ASSERT, OP_MATCH, OP_CLEAR, OP_PROGRESS = range(9)
+ASSERT_KINDS = {'bol': 0, 'eol': 1, 'word': 2, 'not_word': 3}
+
+
+@dataclass
+class _Program:
+    op: List[int] = field(default_factory=list)
+    x: List[int] = field(default_factory=list)   # 글자 코드 / 집합 번호 / 분기·이동 대상 / 저장 칸 / 검사 종류 / 지울 첫 칸 / 시작 위치 칸
+    y: List[int] = field(default_factory=list)   # 분기 두 번째 대상 / 지울 마지막 칸 다음
+    sets: List[Tuple[Tuple[int, ...], bool]] = field(default_factory=list)
+    slots: int = 2   # 캡처 저장 칸 (그룹 수 + 1) x 2 뒤에 반복 시작 위치 칸
+
+    def emit(self, op: int, x: int = 0, y: int = 0) -> int:
+        if len(self.op) >= MAX_PROGRAM:
+            raise UnsupportedPattern('program too large')
+        self.op.append(op)
+        self.x.append(x)
+        self.y.append(y)
+        return len(self.op) - 1
+
+
+def _group_span(node: tuple) -> Optional[Tuple[int, int]]:
+    """노드 안의 캡처 그룹 번호 범위 (없으면 None)"""
+    indexes: List[int] = []
+
+    def visit(n: tuple) -> None:
+        kind = n[0]
+        if kind == 'group':
+            if n[1] > 0:
+                indexes.append(n[1])
+            visit(n[2])
+        elif kind in ('seq', 'alt'):
+            for item in n[1]:
+                visit(item)
+        elif kind in ('repeat', 'look'):
+            visit(n[1])
+    visit(node)
+    return (min(indexes), max(indexes)) if indexes else None
+
+
+def _compile_program(root: tuple, groups: int) -> _Program:
+    prog = _Program(slots=(groups + 1) * 2)
+
+    def gen(node: tuple) -> None:
+        kind = node[0]
+        if kind == 'char':
+            prog.emit(OP_CHAR, node[1])
+        elif kind == 'set':
+            prog.sets.append((node[1], node[2]))
+            prog.emit(OP_SET, len(prog.sets) - 1)
+        elif kind == 'assert':
+            prog.emit(OP_ASSERT, ASSERT_KINDS[node[1]])
+        elif kind == 'seq':
+            for item in node[1]:
+                gen(item)
+        elif kind == 'alt':
+            jumps = []
+            items = node[1]
+            for i, item in enumerate(items):
+                if i < len(items) - 1:
+                    split = prog.emit(OP_SPLIT)
+                    prog.x[split] = split + 1
+                    gen(item)
+                    jumps.append(prog.emit(OP_JMP))
+                    prog.y[split] = len(prog.op)
+                else:
+                    gen(item)
+            for j in jumps:
+                prog.x[j] = len(prog.op)
+        elif kind == 'group':
+            if node[1] > 0:
+                prog.emit(OP_SAVE, node[1] * 2)
+            gen(node[2])
+            if node[1] > 0:
+                prog.emit(OP_SAVE, node[1] * 2 + 1)
+        elif kind == 'repeat':
+            _, body, lo, hi, lazy = node
+            # 반복할 때마다 본문 안의 캡처를 비움 (JS는 마지막 반복의 캡처만 남김)
+            span = _group_span(body)
+
+            def emit_body() -> None:
+                if span:
+                    prog.emit(OP_CLEAR, span[0] * 2, span[1] * 2 + 2)
+                gen(body)
+
+            def branch(split: int, target: int, exit_: int) -> None:
+                prog.x[split], prog.y[split] = (exit_, target) if lazy else (target, exit_)
+
+            for _ in range(lo):
+                emit_body()
+            if hi == INF:
+                # 빈 반복은 같은 위치에서 분기로 돌아오므로 VM의 중복 제거로 끝남
+                split = prog.emit(OP_SPLIT)
+                emit_body()
+                prog.emit(OP_JMP, split)
+                branch(split, split + 1, len(prog.op))
+            else:
+                # 최소 횟수를 넘는 반복이 빈 문자열과 일치하면 실패 (JS 규칙, 펼친 반복은 시작 위치를 저장해 확인)
+                start_slot = prog.slots
+                prog.slots += 1
+                splits = []
+                for _ in range(int(hi) - lo):
+                    splits.append(prog.emit(OP_SPLIT))
+                    prog.emit(OP_SAVE, start_slot)
+                    emit_body()
+                    prog.emit(OP_PROGRESS, start_slot)
+                for s in splits:
+                    branch(s, s + 1, len(prog.op))
+        else:
+            raise UnsupportedPattern(kind)
+
+    prog.emit(OP_SAVE, 0)
+    gen(root)
+    prog.emit(OP_SAVE, 1)
+    prog.emit(OP_MATCH)
+    return prog
+
+
+def _canonical(c: int) -> int:
+    """대소문자 무시 비교용 정규화 (u 플래그 없는 JS 규칙: 한 글자 대문자로 바뀔 때만)"""
+    upper = chr(c).upper()
+    if len(upper) != 1:
+        return c
+    u = ord(upper)
+    return c if c >= 128 and u < 128 else u
+
+
+def _in_ranges(ranges: Tuple[int, ...], c: int) -> bool:
+    for i in range(0, len(ranges), 2):
+        if ranges[i] <= c <= ranges[i + 1]:
+            return True
+    return False
+
+
+def _is_word(text: str, i: int) -> bool:
+    return 0 <= i < len(text) and _in_ranges(WORD_RANGES, ord(text[i]))
+
+
+class _PikeVM:
+    def __init__(self, prog: _Program, ignore_case: bool) -> None:
+        self.prog = prog
+        self.ignore_case = ignore_case
+        self.mark = [0] * len(prog.op)
+        self.generation = 0
+
+    def _match_set(self, index: int, c: int) -> bool:
+        ranges, negate = self.prog.sets[index]
+        hit = _in_ranges(ranges, c)
+        if not hit and self.ignore_case:
+            ch = chr(c)
+            lower, upper = ch.lower(), ch.upper()
+            hit = (len(lower) == 1 and _in_ranges(ranges, ord(lower))) or (len(upper) == 1 and _in_ranges(ranges, ord(upper)))
+        return hit != negate
+
+    def _add(self, out: list, pc: int, caps: list, text: str, pos: int) -> None:
+        """엡실론 이동을 따라가며 글자를 소비하는 명령만 out에 추가 (재귀 대신 스택, 우선순위 순서 유지)"""
+        op, x, y, mark, gen = self.prog.op, self.prog.x, self.prog.y, self.mark, self.generation
+        stack = [(pc, caps)]
+        while stack:
+            pc, caps = stack.pop()
+            if mark[pc] == gen:
+                continue
+            mark[pc] = gen
+            o = op[pc]
+            if o == OP_JMP:
+                stack.append((x[pc], caps))
+            elif o == OP_SPLIT:
+                stack.append((y[pc], caps))
+                stack.append((x[pc], caps))
+            elif o == OP_SAVE:
+                copy = caps[:]
+                copy[x[pc]] = pos
+                stack.append((pc + 1, copy))
+            elif o == OP_CLEAR:
+                copy = caps[:]
+                copy[x[pc]:y[pc]] = [-1] * (y[pc] - x[pc])
+                stack.append((pc + 1, copy))
+            elif o == OP_PROGRESS:
+                if caps[x[pc]] != pos:
+                    stack.append((pc + 1, caps))
+            elif o == OP_ASSERT:
+                kind = x[pc]
+                if kind == 0:
+                    ok = pos == 0
+                elif kind == 1:
+                    ok = pos == len(text)
+                else:
+                    ok = (_is_word(text, pos - 1) != _is_word(text, pos)) == (kind == 2)
+                if ok:
+                    stack.append((pc + 1, caps))
+            else:
+                out.append((pc, caps))
+
+    def exec(self, text: str, start: int) -> Optional[list]:
+        """start 위치부터 가장 왼쪽 일치의 캡처 위치 목록 (JS와 같은 우선순위). 없으면 None"""
+        op, x = self.prog.op, self.prog.x
+        empty = [-1] * self.prog.slots
+        matched = None
+        clist: list = []
+        self.generation += 1
+        self._add(clist, 0, empty, text, start)
+        pos = start
+        n = len(text)
+        while True:
+            nlist: list = []
+            self.generation += 1
+            c = ord(text[pos]) if pos < n else -1
+            for pc, caps in clist:
+                o = op[pc]
+                if o == OP_MATCH:
+                    # 이 스레드보다 우선순위가 낮은 스레드는 버림
+                    matched = caps
+                    break
+                if c < 0:
+                    continue
+                if o == OP_CHAR:
+                    hit = x[pc] == c or (self.ignore_case and _canonical(x[pc]) == _canonical(c))
+                else:
+                    hit = self._match_set(x[pc], c)
+                if hit:
+                    self._add(nlist, pc + 1, caps, text, pos + 1)
+            # 아직 일치가 없으면 다음 위치에서 시작하는 스레드를 가장 낮은 우선순위로 추가 (검색)
+            if matched is None and pos < n:
+                self._add(nlist, 0, empty, text, pos + 1)
+            if pos >= n or (matched is not None and not nlist):
+                return matched
+            clist = nlist
+            pos += 1
+
+
+def _expand(template: str, text: str, caps: list, groups: int) -> str:
+    """JS 치환 문자열 규칙 ($$, $&, $`, $', $n, $nn)"""
+    if '$' not in template:
+        return template
+
+    def group(i: int) -> str:
+        return '' if caps[i * 2] < 0 else text[caps[i * 2]:caps[i * 2 + 1]]
+
+    def token(t: re.Match) -> str:
+        key = t.group(1)
+        if key == '$':
+            return '$'
+        if key == '&':
+            return group(0)
+        if key == '`':
+            return text[:caps[0]]
+        if key == "'":
+            return text[caps[1]:]
+        idx = int(key)
+        if len(key) == 2 and 1 <= idx <= groups:
+            return group(idx)
+        if 1 <= int(key[0]) <= groups:
+            return group(int(key[0])) + key[1:]
+        return t.group(0)
+    return _JS_TEMPLATE_TOKEN.sub(token, template)
+
+
+class SafePattern:
+    """안전하게 실행되도록 컴파일된 사용자 정규식 (mode: 'native' | 'linear' | 'rejected')"""
+
+    def __init__(self, source: str, flags: str, native: Pattern[str], mode: str, guard_length: bool,
+                 program: Optional[_Program], groups: int, reason: Optional[str]) -> None:
+        self.source = source
+        self.flags = flags
+        self.is_global = 'g' in flags
+        self.mode = mode
+        self.reason = reason  # 거부 사유 (mode == 'rejected')
+        self._native = native
+        self._guard_length = guard_length  # 긴 셀은 NFA로 (무한 반복이 있는 re 실행 패턴)
+        self._groups = groups
+        self._vm = _PikeVM(program, 'i' in flags) if program else None
+
+    def __repr__(self) -> str:
+        # 정제 계획 캐시 키(plan_key)가 분석 결과의 repr을 쓰므로 객체 주소 대신 소스/플래그로 표시
+        return f'SafePattern({self.source!r}, {self.flags!r})'
+
+    def sub(self, template: str, text: str) -> str:
+        """`String.prototype.replace`와 같은 치환. 거부된 패턴은 값을 그대로 돌려줍니다."""
+        if self.mode == 'rejected':
+            return text
+        if self.mode == 'native' and (not self._guard_length or not self._vm or len(text) <= NATIVE_MAX_LENGTH):
+            return js_sub(self._native, template, text, count=0 if self.is_global else 1)
+        vm = self._vm
+        parts = []
+        last = pos = 0
+        while pos <= len(text):
+            caps = vm.exec(text, pos)
+            if caps is None:
+                break
+            parts.append(text[last:caps[0]])
+            parts.append(_expand(template, text, caps, self._groups))
+            last = caps[1]
+            if not self.is_global:
+                break
+            # 빈 일치는 한 글자 건너뛰어 계속 (JS와 동일)
+            pos = caps[1] + 1 if caps[1] == caps[0] else caps[1]
+        parts.append(text[last:])
+        return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_PATTERNS)
+def compile_safe_pattern(source: str, flags: str = '') -> Optional[SafePattern]:
+    """사용자 정규식을 컴파일합니다. 문법 오류면 None (기존처럼 조용히 무시). 같은 소스/플래그는 캐시에서 재사용합니다."""
+    native = compile_js_regex(source, ignore_case='i' in flags)
+    if native is None:
+        return None
+    tree = None
+    groups = 0
+    program = None
+    reason = None
+    try:
+        parser = _Parser(source)
+        tree = parser.parse()
+        groups = parser.groups
+        program = _compile_program(tree, groups)
+    except UnsupportedPattern as e:
+        reason = str(e)
+    except (IndexError, ValueError):
+        reason = 'unsupported syntax'
+    cost = _backtrack_cost(tree) if tree is not None else None
+    bounded = cost is not None and not cost[2] and cost[0] <= 1 and cost[1] <= MAX_NATIVE_FACTOR
+    if bounded and program and _empty_iteration_capture(tree):
+        bounded = False
+    mode = 'native' if bounded else 'linear' if program else 'rejected'
+    return SafePattern(source, flags, native, mode, cost is not None and cost[0] > 0, program, groups,
+                       (reason or 'nested repetition') if mode == 'rejected' else None)
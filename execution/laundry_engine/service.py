@@ -0,0 +1,544 @@
+"""
+로컬 정제 작업 서비스 (asyncio HTTP)
+
+다른 내부 도구가 브라우저 없이 정제 작업을 맡길 수 있는 로컬 HTTP 서비스입니다. (표준 라이브러리만 사용)
+작업 입력은 `worker.ts`의 ShardRequest와 같은 값(prompt, options, lockedColumns, columnLimits, columnOptions)에
+로컬 파일 경로를 더한 JSON이며, 작업은 동시 실행 수 제한이 있는 대기열을 거쳐 프로세스 풀에서 실행됩니다.
+워커 프로세스는 작업 사이에 재사용되므로 컴파일된 정제 계획(plan_cache)과 고유값 메모도 이어서 쓰입니다.
+
+  POST   /jobs              작업 등록 → 202 {"id", "status"}
+  GET    /jobs              작업 목록
+  GET    /jobs/{id}         상태/결과 (stats, issues, originalIssues)
+  GET    /jobs/{id}/events  진행 이벤트 (SSE: PROGRESS, COMPLETE, ERROR, CANCELLED)
+  GET    /jobs/{id}/file    정제된 파일
+  DELETE /jobs/{id}         작업 취소 (대기 중이면 바로, 실행 중이면 다음 청크 경계에서 중단)
+
+실행 예:
+  cd execution
+  python -m laundry_engine.service --port 8765 --concurrency 2
+  curl -X POST localhost:8765/jobs -d '{"input": "../test_data/tax_chaos.csv", "prompt": "날짜는 yyyy.mm.dd 형식으로"}'
+  curl -N localhost:8765/jobs/<id>/events
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .capacity import auto_plan
+from .models import ProcessingOptions
+from .parsers import file_extension
+from .pipeline import MODES, CleanResult, clean_file
+from .table_cache import TableCache
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# 결과 폴더 (실행 위치와 무관하게 저장소 루트의 .tmp/jobs). 작업 결과는 이 폴더 안에만 씁니다.
+DEFAULT_OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.tmp', 'jobs'))
+# 요청 본문 최대 크기 (파일은 경로로만 받으므로 JSON 옵션만 들어옴)
+MAX_BODY_BYTES = 1024 * 1024
+FILE_BLOCK_SIZE = 64 * 1024
+# 끝난 작업(done/failed/cancelled) 보관 수와 기간 (초). 넘으면 오래된 작업부터 목록에서 지움 (결과 파일은 남김)
+DEFAULT_MAX_FINISHED_JOBS = 256
+DEFAULT_JOB_TTL = 60 * 60
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+TERMINAL_EVENTS = ('COMPLETE', 'ERROR', 'CANCELLED')
+
+# 워커 프로세스 전역 상태 (_init_job_worker에서 설정)
+_events: Any = None
+_cancelled: Any = None
+
+
+class JobCancelled(Exception):
+    """취소 요청으로 중단된 작업 (청크 경계에서 발생)"""
+
+
+class RequestError(Exception):
+    """잘못된 요청 (HTTP 상태 코드와 메시지)"""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """작업 입력 (웹 앱 JSON의 camelCase 키를 받아 정리)"""
+    input_path: str
+    output_path: str
+    prompt: str = ''
+    options: ProcessingOptions = field(default_factory=ProcessingOptions)
+    locked_columns: Tuple[str, ...] = ()
+    column_limits: Dict[str, int] = field(default_factory=dict)
+    column_options: Dict[str, Optional[str]] = field(default_factory=dict)
+    mode: str = 'row'
+    chunk_size: int = 0
+    cache: bool = True
+
+    @classmethod
+    def from_request(cls, body: Dict[str, Any], job_id: str, output_dir: str) -> 'JobSpec':
+        """
+        output은 결과 폴더(output_dir) 기준 경로로 풀며, 폴더 밖이거나 input과 같은 파일이면 거부합니다.
+        output이 없으면 작업 id를 붙인 파일명을 만듭니다.
+        """
+        input_path = body.get('input')
+        if not isinstance(input_path, str) or not os.path.isfile(input_path):
+            raise RequestError(400, f'input 파일을 찾을 수 없습니다: {input_path}')
+        if file_extension(input_path) not in CONTENT_TYPES:
+            raise RequestError(400, 'input은 CSV 또는 XLSX 파일이어야 합니다.')
+        output_name = body.get('output')
+        if output_name is None:
+            stem = os.path.splitext(os.path.basename(input_path))[0]
+            output_name = f'{job_id}_{stem}_clean.{file_extension(input_path)}'
+        elif not isinstance(output_name, str) or file_extension(output_name) not in CONTENT_TYPES:
+            raise RequestError(400, 'output은 .csv 또는 .xlsx 경로여야 합니다.')
+        output_root = os.path.realpath(output_dir)
+        output_path = os.path.realpath(os.path.join(output_root, output_name))
+        if os.path.commonpath([output_root, output_path]) != output_root:
+            raise RequestError(400, f'output은 결과 폴더 안의 경로여야 합니다: {output_root}')
+        if output_path == os.path.realpath(input_path):
+            raise RequestError(400, 'output은 input과 다른 파일이어야 합니다.')
+        mode = body.get('mode', 'row')
+        if mode not in MODES:
+            raise RequestError(400, f'mode는 {", ".join(MODES)} 중 하나여야 합니다.')
+        try:
+            return cls(
+                input_path=input_path,
+                output_path=output_path,
+                prompt=str(body.get('prompt') or ''),
+                options=ProcessingOptions.from_dict(body.get('options')),
+                locked_columns=tuple(body.get('lockedColumns') or ()),
+                column_limits={k: int(v) for k, v in (body.get('columnLimits') or {}).items()},
+                column_options=dict(body.get('columnOptions') or {}),
+                mode=mode,
+                chunk_size=int(body.get('chunkSize') or 0),
+                cache=bool(body.get('cache', True)),
+            )
+        except (TypeError, ValueError, AttributeError) as e:
+            raise RequestError(400, f'잘못된 작업 입력입니다: {e}') from e
+
+
+def _init_job_worker(events: Any, cancelled: Any) -> None:
+    global _events, _cancelled
+    _events = events
+    _cancelled = cancelled
+
+
+def _run_job(job_id: str, spec: JobSpec) -> Dict[str, Any]:
+    """워커 프로세스에서 작업 하나를 실행하고, 청크마다 진행 이벤트를 보냅니다."""
+    def on_chunk(result: CleanResult) -> None:
+        if _cancelled is not None and _cancelled.get(job_id):
+            raise JobCancelled()
+        if _events is not None:
+            _events.put((job_id, {
+                'type': 'PROGRESS',
+                'rows': result.total_rows,
+                'chunks': result.chunks,
+                'message': f'⚡ 로컬 엔진으로 정제 중... ({result.total_rows:,}행)',
+            }))
+
+    os.makedirs(os.path.dirname(os.path.abspath(spec.output_path)), exist_ok=True)
+    try:
+        result = clean_file(
+            spec.input_path, spec.output_path, spec.prompt, spec.options, spec.locked_columns, spec.column_options,
+            chunk_size=spec.chunk_size, mode=spec.mode, column_limits=spec.column_limits, analyze=True, on_chunk=on_chunk,
+            cache=TableCache() if spec.cache else None,
+        )
+    except JobCancelled:
+        # 중단된 작업의 일부만 기록된 파일은 남기지 않음
+        if os.path.exists(spec.output_path):
+            os.remove(spec.output_path)
+        return {'cancelled': True}
+    return {
+        'totalRows': result.total_rows,
+        'chunks': result.chunks,
+        'chunkSize': result.chunk_size,
+        'elapsed': result.elapsed,
+        'output': result.output_path,
+        'headers': result.headers,
+        'stats': result.stats.to_dict() if result.stats else None,
+        'issues': result.issues,
+        'originalIssues': result.original_issues,
+    }
+
+
+@dataclass
+class Job:
+    """서비스가 관리하는 작업 하나의 상태"""
+    id: str
+    spec: JobSpec
+    status: str = 'queued'          # queued / running / done / failed / cancelled
+    created_at: float = field(default_factory=time.time)
+    progress: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    finished_at: Optional[float] = None
+    task: Optional['asyncio.Task[None]'] = None
+    subscribers: List['asyncio.Queue[Dict[str, Any]]'] = field(default_factory=list)
+    final_event: Optional[Dict[str, Any]] = None
+
+    def summary(self, detail: bool = False) -> Dict[str, Any]:
+        info: Dict[str, Any] = {
+            'id': self.id,
+            'status': self.status,
+            'input': self.spec.input_path,
+            'output': self.spec.output_path,
+            'createdAt': self.created_at,
+            'progress': self.progress,
+        }
+        if self.error:
+            info['error'] = self.error
+        if self.result:
+            info['result'] = self.result if detail else {k: v for k, v in self.result.items() if k not in ('issues', 'originalIssues')}
+        return info
+
+
+class JobService:
+    """
+    작업 대기열 + 프로세스 풀
+    동시에 실행되는 작업 수는 concurrency로 제한되며, 워커 프로세스는 서비스가 끝날 때까지 유지됩니다.
+    끝난 작업은 max_finished_jobs개, job_ttl초까지만 보관하고 끝난 순서대로 지웁니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        job_ttl: float = DEFAULT_JOB_TTL,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.output_dir = os.path.abspath(output_dir)
+        self.max_finished_jobs = max_finished_jobs
+        self.job_ttl = job_ttl
+        self.jobs: Dict[str, Job] = {}
+        # 끝난 작업 id (끝난 순서)
+        self._finished: 'OrderedDict[str, float]' = OrderedDict()
+        self.chunk_size = 0
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._manager = multiprocessing.Manager()
+        self._events = self._manager.Queue()
+        self._cancelled = self._manager.dict()
+        self._pool = self._new_pool()
+        self._pump: Optional['asyncio.Task[None]'] = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.concurrency, initializer=_init_job_worker, initargs=(self._events, self._cancelled))
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        # 청크 크기는 시작할 때 한 번 정해 모든 작업에 사용 (동시 실행 작업 수만큼 메모리 몫을 나눔)
+        self.chunk_size = (await loop.run_in_executor(None, auto_plan, self.concurrency)).chunk_size
+        self._pump = asyncio.create_task(self._pump_events())
+
+    async def close(self) -> None:
+        for job in self.jobs.values():
+            if job.task and not job.task.done():
+                self.cancel(job.id)
+        self._events.put(None)
+        if self._pump:
+            await self._pump
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._manager.shutdown()
+
+    def submit(self, body: Dict[str, Any]) -> Job:
+        self._evict_finished()
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(id=job_id, spec=JobSpec.from_request(body, job_id, self.output_dir))
+        self.jobs[job_id] = job
+        job.task = asyncio.create_task(self._run(job))
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise RequestError(404, '작업을 찾을 수 없습니다.')
+        if job.status == 'queued' and job.task:
+            job.task.cancel()
+        elif job.status == 'running':
+            self._cancelled[job_id] = True
+        return job
+
+    async def _run(self, job: Job) -> None:
+        try:
+            async with self._slots:
+                job.status = 'running'
+                spec = job.spec if job.spec.chunk_size > 0 else _with_chunk_size(job.spec, self.chunk_size)
+                loop = asyncio.get_running_loop()
+                pool = self._pool
+                try:
+                    result = await loop.run_in_executor(pool, _run_job, job.id, spec)
+                except BrokenProcessPool:
+                    self._replace_pool(pool)
+                    raise RuntimeError('워커 프로세스가 비정상 종료되었습니다.')
+        except asyncio.CancelledError:
+            self._finish(job, 'cancelled', {'type': 'CANCELLED'})
+            return
+        except Exception as e:  # 작업 실패는 이벤트로 알리고 서비스는 계속 실행
+            job.error = str(e) or e.__class__.__name__
+            self._finish(job, 'failed', {'type': 'ERROR', 'error': job.error})
+            return
+        finally:
+            self._cancelled.pop(job.id, None)
+
+        if result.get('cancelled'):
+            self._finish(job, 'cancelled', {'type': 'CANCELLED'})
+            return
+        job.result = result
+        self._finish(job, 'done', {
+            'type': 'COMPLETE',
+            'totalRows': result['totalRows'],
+            'elapsed': result['elapsed'],
+            'output': result['output'],
+            'stats': result['stats'],
+            'issueCount': len(result['issues']),
+        })
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """
+        워커가 비정상 종료되면 풀을 새로 만들어 이후 작업은 계속 실행합니다.
+        같은 풀에서 동시에 실패한 작업들 중 처음 한 번만 교체하고, 깨진 풀은 대기 작업을 취소하며 정리합니다.
+        """
+        if self._pool is not broken:
+            return
+        self._pool = self._new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, job: Job, status: str, event: Dict[str, Any]) -> None:
+        job.status = status
+        job.final_event = event
+        job.finished_at = time.time()
+        self._publish(job, event)
+        self._finished[job.id] = job.finished_at
+        self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        """보관 기간이 지났거나 보관 수를 넘은 끝난 작업을 오래된 것부터 목록에서 지웁니다."""
+        expires = time.time() - self.job_ttl
+        finished = self._finished
+        while finished and (len(finished) > self.max_finished_jobs or next(iter(finished.values())) <= expires):
+            job_id, _ = finished.popitem(last=False)
+            self.jobs.pop(job_id, None)
+
+    def _publish(self, job: Job, event: Dict[str, Any]) -> None:
+        for queue in job.subscribers:
+            queue.put_nowait(event)
+
+    async def _pump_events(self) -> None:
+        """워커 프로세스가 보낸 진행 이벤트를 구독자에게 전달합니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self._events.get)
+            if item is None:
+                return
+            job_id, event = item
+            job = self.jobs.get(job_id)
+            if job is None or job.final_event is not None:
+                continue
+            job.progress = {k: v for k, v in event.items() if k != 'type'}
+            self._publish(job, event)
+
+    def subscribe(self, job: Job) -> 'asyncio.Queue[Dict[str, Any]]':
+        """진행 이벤트 구독 (마지막 진행 상태와 완료 이벤트를 먼저 넣어 늦게 붙은 구독자도 받게 함)"""
+        queue: 'asyncio.Queue[Dict[str, Any]]' = asyncio.Queue()
+        if job.progress:
+            queue.put_nowait({'type': 'PROGRESS', **job.progress})
+        if job.final_event:
+            queue.put_nowait(job.final_event)
+        else:
+            job.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, job: Job, queue: 'asyncio.Queue[Dict[str, Any]]') -> None:
+        if queue in job.subscribers:
+            job.subscribers.remove(queue)
+
+
+def _with_chunk_size(spec: JobSpec, chunk_size: int) -> JobSpec:
+    values = dict(vars(spec))
+    values['chunk_size'] = chunk_size
+    return JobSpec(**values)
+
+
+# ---------------------------------------------------------------------------
+# HTTP (HTTP/1.1, 요청마다 연결 종료)
+# ---------------------------------------------------------------------------
+
+STATUS_TEXT = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+    request_line = (await reader.readline()).decode('latin-1').strip()
+    parts = request_line.split()
+    if len(parts) < 2:
+        raise RequestError(400, '잘못된 요청입니다.')
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1')
+        if line in ('\r\n', '\n', ''):
+            break
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise RequestError(400, 'Content-Length가 올바르지 않습니다.')
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, '요청 본문이 너무 큽니다.')
+    body = await reader.readexactly(length) if length else b''
+    return parts[0].upper(), parts[1].split('?', 1)[0], headers, body
+
+
+def _head(status: int, content_type: str, length: Optional[int] = None, extra: str = '') -> bytes:
+    lines = [f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}', f'Content-Type: {content_type}', 'Connection: close']
+    if length is not None:
+        lines.append(f'Content-Length: {length}')
+    if extra:
+        lines.append(extra)
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    writer.write(_head(status, 'application/json; charset=utf-8', len(body)) + body)
+    await writer.drain()
+
+
+async def _send_events(writer: asyncio.StreamWriter, service: JobService, job: Job) -> None:
+    queue = service.subscribe(job)
+    try:
+        writer.write(_head(200, 'text/event-stream; charset=utf-8', extra='Cache-Control: no-cache'))
+        await writer.drain()
+        while True:
+            event = await queue.get()
+            data = json.dumps({'jobId': job.id, **event}, ensure_ascii=False)
+            writer.write(f'event: {event["type"]}\ndata: {data}\n\n'.encode('utf-8'))
+            await writer.drain()
+            if event['type'] in TERMINAL_EVENTS:
+                return
+    except (ConnectionResetError, BrokenPipeError):
+        pass  # 구독자가 먼저 연결을 끊음 (작업은 계속 실행)
+    finally:
+        service.unsubscribe(job, queue)
+
+
+async def _send_file(writer: asyncio.StreamWriter, path: str) -> None:
+    """파일 열기/읽기는 기본 스레드 풀에서 실행해 다른 요청과 이벤트 전달을 막지 않습니다."""
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, 'rb')
+    try:
+        size = os.fstat(f.fileno()).st_size
+        name = os.path.basename(path)
+        writer.write(_head(200, CONTENT_TYPES.get(file_extension(path), 'application/octet-stream'), size,
+                           f'Content-Disposition: attachment; filename="{name}"'))
+        while True:
+            block = await loop.run_in_executor(None, f.read, FILE_BLOCK_SIZE)
+            if not block:
+                break
+            writer.write(block)
+            await writer.drain()
+    finally:
+        f.close()
+
+
+async def _route(service: JobService, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+    parts = [p for p in path.split('/') if p]
+    if parts[:1] != ['jobs']:
+        raise RequestError(404, '경로를 찾을 수 없습니다.')
+
+    if len(parts) == 1:
+        if method == 'GET':
+            await _send_json(writer, 200, [job.summary() for job in service.jobs.values()])
+        elif method == 'POST':
+            try:
+                payload = json.loads(body.decode('utf-8') or '{}')
+            except ValueError as e:
+                raise RequestError(400, f'JSON 형식이 아닙니다: {e}') from e
+            if not isinstance(payload, dict):
+                raise RequestError(400, '작업 입력은 JSON 객체여야 합니다.')
+            job = service.submit(payload)
+            await _send_json(writer, 202, {'id': job.id, 'status': job.status})
+        else:
+            raise RequestError(405, '지원하지 않는 메서드입니다.')
+        return
+
+    job = service.jobs.get(parts[1])
+    if job is None:
+        raise RequestError(404, '작업을 찾을 수 없습니다.')
+    action = parts[2] if len(parts) > 2 else ''
+
+    if action == '' and method == 'GET':
+        await _send_json(writer, 200, job.summary(detail=True))
+    elif action == '' and method == 'DELETE':
+        await _send_json(writer, 202, service.cancel(job.id).summary())
+    elif action == 'events' and method == 'GET':
+        await _send_events(writer, service, job)
+    elif action == 'file' and method == 'GET':
+        if job.status != 'done':
+            raise RequestError(409, f'작업이 완료되지 않았습니다. (상태: {job.status})')
+        await _send_file(writer, job.spec.output_path)
+    else:
+        raise RequestError(404 if action not in ('', 'events', 'file') else 405, '지원하지 않는 요청입니다.')
+
+
+async def _handle(service: JobService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        try:
+            method, path, _, body = await _read_request(reader)
+            await _route(service, method, path, body, writer)
+        except RequestError as e:
+            await _send_json(writer, e.status, {'error': str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:  # 요청 처리 오류는 응답으로 알리고 서버는 계속 실행
+            await _send_json(writer, 500, {'error': str(e)})
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, concurrency: int = 2, output_dir: str = DEFAULT_OUTPUT_DIR) -> None:
+    """서비스를 시작하고 종료될 때까지 요청을 처리합니다."""
+    service = JobService(concurrency, output_dir)
+    await service.start()
+    server = await asyncio.start_server(lambda r, w: _handle(service, r, w), host, port)
+    print(f'🧺 정제 작업 서비스 http://{host}:{port} (동시 작업 {service.concurrency}개, 청크 {service.chunk_size:,}행)', flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog='laundry_engine.service', description='데이터세탁소 로컬 정제 작업 서비스')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='바인딩 주소 (기본: 로컬만)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--concurrency', type=int, default=2, help='동시에 실행할 작업 수 (= 워커 프로세스 수)')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='작업 결과 폴더 (output은 이 폴더 안의 경로만 허용)')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.concurrency, args.output_dir))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
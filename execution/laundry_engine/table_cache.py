@@ -0,0 +1,414 @@
+"""
+파싱 결과 캐시 (컬럼 파일 + mmap)
+
+매달 같은 파일을 다시 정제하는 경우 XLSX 압축 해제/시트 XML 파싱이 정제보다 오래 걸리므로,
+파일 내용의 SHA-256을 키로 파싱 결과를 캐시 디렉터리에 컬럼 단위로 저장해 두고 다시 열 때 파싱을 건너뜁니다.
+브라우저의 `core/tableCache.ts`(IndexedDB)와 같은 사전 인코딩 구조(`core/table.ts`)입니다.
+
+항목 하나 = `<digest>/` 디렉터리 (meta.json + 컬럼마다 `<번호>.col`)
+컬럼 파일은 mmap으로 열어 필요한 컬럼만, 읽는 구간만 메모리에 올립니다.
+
+  헤더 24바이트   MAGIC(8) | 사전 크기 uint32 | 행 수 uint32 | 문자열 바이트 수 uint64
+  kinds           사전 값 종류 (값마다 1바이트, 4바이트 단위로 채움)
+  ends            사전 값마다 문자열 안의 끝 위치 (uint32)
+  codes           행마다 사전 번호 (uint32, 0번은 키가 없는 셀)
+  text            사전 값을 이어 붙인 UTF-8 바이트
+
+전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지웁니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import time
+import uuid
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .models import CellValue, DataRow
+from .parsers import DEFAULT_CHUNK_SIZE, open_table
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'laundry_engine', 'tables')
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# 캐시할 확장자 (CSV는 파싱이 빨라 캐시에서 읽는 것과 차이가 작음)
+CACHED_EXTENSIONS = ('xlsx',)
+# 이보다 오래된 작성 중 디렉터리는 중단된 것으로 보고 지움 (초)
+STALE_STAGING_SECONDS = 24 * 60 * 60
+
+MAGIC = b'LDCOL001'
+_HEADER = struct.Struct('<8sIIQ')
+_DIGEST_BLOCK = 1024 * 1024
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+# 값 종류 (transfer.ts와 같은 번호에 정수/실수 구분 추가, 사전 0번은 항상 MISSING)
+KIND_MISSING = 0
+KIND_NULL = 1
+KIND_STRING = 2
+KIND_TRUE = 4
+KIND_FALSE = 5
+KIND_INT = 6
+KIND_FLOAT = 7
+
+# 행에 키가 없는 셀 (None 값과 구분)
+_MISSING = object()
+
+
+def file_digest(path: str) -> str:
+    """파일 내용의 SHA-256 (16진수)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_DIGEST_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _uint32(buffer: Any, offset: int, count: int) -> Any:
+    """buffer의 offset부터 uint32 count개 (리틀 엔디언 시스템은 복사 없이 뷰로 반환)"""
+    view = memoryview(buffer)[offset:offset + count * 4]
+    if not _BIG_ENDIAN:
+        return view.cast('I')
+    values = array('I', view.tobytes())
+    values.byteswap()
+    return values
+
+
+def _encode_value(value: CellValue) -> Tuple[int, str]:
+    if value is None:
+        return KIND_NULL, ''
+    if value is True:
+        return KIND_TRUE, ''
+    if value is False:
+        return KIND_FALSE, ''
+    if isinstance(value, int):
+        return KIND_INT, str(value)
+    if isinstance(value, float):
+        return KIND_FLOAT, repr(value)
+    return KIND_STRING, str(value)
+
+
+def _decode_value(kind: int, text: str) -> Optional[CellValue]:
+    if kind == KIND_STRING:
+        return text
+    if kind == KIND_INT:
+        return int(text)
+    if kind == KIND_FLOAT:
+        return float(text)
+    if kind == KIND_TRUE:
+        return True
+    if kind == KIND_FALSE:
+        return False
+    return None
+
+
+class CachedColumn:
+    """mmap으로 연 컬럼 파일 하나 (사전은 처음 읽을 때 한 번만 풀어 둠)"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.value_count, self.row_count, self._text_bytes = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f'캐시 컬럼 파일 형식이 아닙니다: {path}')
+        self._kinds_at = _HEADER.size
+        self._ends_at = self._kinds_at + (self.value_count + 3) // 4 * 4
+        self._codes_at = self._ends_at + self.value_count * 4
+        self._text_at = self._codes_at + self.row_count * 4
+        self.codes = _uint32(self._map, self._codes_at, self.row_count)
+        self._values: Optional[List[Optional[CellValue]]] = None
+
+    @property
+    def values(self) -> List[Optional[CellValue]]:
+        """사전: 번호 → 값 (0번은 키가 없는 셀)"""
+        if self._values is None:
+            kinds = self._map[self._kinds_at:self._kinds_at + self.value_count]
+            ends = _uint32(self._map, self._ends_at, self.value_count)
+            text = self._map[self._text_at:self._text_at + self._text_bytes]
+            values: List[Optional[CellValue]] = []
+            start = 0
+            for kind, end in zip(kinds, ends):
+                values.append(_decode_value(kind, text[start:end].decode('utf-8')) if kind != KIND_MISSING else None)
+                start = end
+            self._values = values
+        return self._values
+
+    def close(self) -> None:
+        if isinstance(self.codes, memoryview):
+            self.codes.release()
+        self._map.close()
+
+
+class CachedTable:
+    """캐시 항목 하나. 컬럼 파일은 처음 필요할 때 엽니다."""
+
+    def __init__(self, path: str, meta: Dict[str, Any]) -> None:
+        self.path = path
+        self.headers: List[str] = list(meta['headers'])
+        self.keys: List[str] = list(meta['keys'])
+        self.row_count: int = meta['rows']
+        self._columns: Dict[str, CachedColumn] = {}
+
+    def column(self, key: str) -> CachedColumn:
+        column = self._columns.get(key)
+        if column is None:
+            column = CachedColumn(os.path.join(self.path, f'{self.keys.index(key)}.col'))
+            self._columns[key] = column
+        return column
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[DataRow]:
+        """행 객체를 chunk_size 행씩 만들어 차례로 넘깁니다. (키 순서는 파싱할 때와 같음)"""
+        columns = [(key, self.column(key)) for key in self.keys]
+        for start in range(0, self.row_count, chunk_size):
+            end = min(start + chunk_size, self.row_count)
+            parts = [(key, column.values, column.codes[start:end].tolist()) for key, column in columns]
+            if all(0 not in codes for _, _, codes in parts):
+                # 빈 키가 없는 구간은 컬럼 값 목록을 한 번에 묶어 행을 만듦
+                value_lists = [[values[c] for c in codes] for _, values, codes in parts]
+                yield from (dict(zip(self.keys, cells)) for cells in zip(*value_lists))
+                continue
+            rows: List[DataRow] = [{} for _ in range(end - start)]
+            for key, values, codes in parts:
+                for row, code in zip(rows, codes):
+                    if code:
+                        row[key] = values[code]
+            yield from rows
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.close()
+        self._columns.clear()
+
+
+class _ColumnWriter:
+    """파싱하면서 컬럼 하나를 사전 인코딩해 임시 파일에 번호를 흘려 씀"""
+
+    def __init__(self, directory: str, index: int, rows_before: int) -> None:
+        self.path = os.path.join(directory, f'{index}.col')
+        self._codes_path = self.path + '.codes'
+        self._codes_file = open(self._codes_path, 'wb')
+        # 앞선 행은 이 키가 없으므로 0번
+        self._pending = array('I', bytes(4 * rows_before))
+        self.lookup: Dict[Any, int] = {}
+        self.kinds = bytearray([KIND_MISSING])
+        self.texts: List[str] = ['']
+        self.text_bytes = 0
+
+    def code(self, value: Any) -> int:
+        if value is _MISSING:
+            return 0
+        # 1 == 1.0 == True이므로 문자열이 아닌 값은 종류와 함께 찾음
+        key = value if type(value) is str else (type(value), value)
+        code = self.lookup.get(key)
+        if code is None:
+            kind, text = _encode_value(value)
+            code = len(self.kinds)
+            self.lookup[key] = code
+            self.kinds.append(kind)
+            self.texts.append(text)
+            self.text_bytes += len(text.encode('utf-8'))
+        return code
+
+    def push(self, values: List[Any]) -> None:
+        """컬럼 값 목록의 사전 번호를 붙입니다. (이미 본 문자열은 dict 조회 한 번)"""
+        get = self.lookup.get
+        # 문자열이 아닌 값은 (종류, 값) 키로만 저장되므로 여기서는 찾지 못하고 code()로 넘어감
+        codes = [get(v) if type(v) is str else None for v in values]
+        for i, code in enumerate(codes):
+            if code is None:
+                codes[i] = self.code(values[i])
+        self._pending.extend(codes)
+
+    def flush(self) -> None:
+        if _BIG_ENDIAN:
+            self._pending.byteswap()
+        self._pending.tofile(self._codes_file)
+        self._pending = array('I')
+
+    def finish(self, row_count: int) -> None:
+        self.flush()
+        self._codes_file.close()
+        text = ''.join(self.texts).encode('utf-8')
+        ends = array('I')
+        pos = 0
+        for part in self.texts:
+            pos += len(part.encode('utf-8'))
+            ends.append(pos)
+        if _BIG_ENDIAN:
+            ends.byteswap()
+        value_count = len(self.kinds)
+        with open(self.path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, value_count, row_count, len(text)))
+            f.write(bytes(self.kinds) + bytes((-value_count) % 4))
+            ends.tofile(f)
+            with open(self._codes_path, 'rb') as codes:
+                shutil.copyfileobj(codes, f)
+            f.write(text)
+        os.remove(self._codes_path)
+
+    def close(self) -> None:
+        if not self._codes_file.closed:
+            self._codes_file.close()
+
+
+class TableCache:
+    """
+    파일 내용 해시로 찾는 파싱 결과 캐시
+    open()은 open_table과 같이 (헤더 목록, 행 이터레이터)를 반환하며,
+    처음 읽는 파일은 파싱하면서 컬럼 파일을 만들고 끝까지 읽었을 때만 캐시에 등록합니다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 extensions: Tuple[str, ...] = CACHED_EXTENSIONS) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.extensions = extensions
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest)
+
+    def load(self, digest: str) -> Optional[CachedTable]:
+        """캐시된 테이블을 엽니다. 없거나 깨졌으면 None"""
+        path = self._entry_path(digest)
+        meta_path = os.path.join(path, 'meta.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != CACHE_VERSION:
+                return None
+            os.utime(meta_path)  # 최근 사용 시각 (삭제 순서 기준)
+        except (OSError, ValueError):
+            return None
+        return CachedTable(path, meta)
+
+    def open(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, sheet: Optional[str] = None) -> Tuple[List[str], Iterator[DataRow]]:
+        """캐시를 거쳐 파일을 엽니다. 캐시 대상 확장자가 아니면 open_table과 같습니다. 시트를 지정하면 시트별로 캐시합니다."""
+        if os.path.splitext(path)[1].lstrip('.').lower() not in self.extensions:
+            return open_table(path, sheet)
+        digest = file_digest(path)
+        if sheet is not None:
+            digest = hashlib.sha256(f'{digest}/{sheet}'.encode('utf-8')).hexdigest()
+        table = self.load(digest)
+        if table is not None:
+            self.hits += 1
+            return list(table.headers), self._iter_cached(table, chunk_size)
+        self.misses += 1
+        headers, rows = open_table(path, sheet)
+        return headers, self._iter_and_store(digest, headers, rows)
+
+    def _iter_cached(self, table: CachedTable, chunk_size: int) -> Iterator[DataRow]:
+        try:
+            yield from table.iter_rows(chunk_size)
+        finally:
+            table.close()
+
+    def _iter_and_store(self, digest: str, headers: List[str], rows: Iterator[DataRow]) -> Iterator[DataRow]:
+        staging = os.path.join(self.directory, f'.tmp-{uuid.uuid4().hex}')
+        try:
+            os.makedirs(staging)
+        except OSError:
+            yield from rows  # 캐시 디렉터리를 만들 수 없으면 캐시 없이 진행
+            return
+
+        writers: Dict[str, _ColumnWriter] = {}
+        for key in headers:
+            writers.setdefault(key, _ColumnWriter(staging, len(writers), 0))
+        count = 0
+        text_bytes = 0
+        storing = True
+        completed = False
+        try:
+            while True:
+                chunk = list(islice(rows, DEFAULT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                if storing:
+                    keys = set().union(*chunk)
+                    if not keys.issubset(writers):
+                        # 헤더에 없던 키는 처음 등장한 순서대로 컬럼 추가 (앞선 청크의 행은 0번)
+                        for row in chunk:
+                            for key in row:
+                                if key not in writers:
+                                    writers[key] = _ColumnWriter(staging, len(writers), count)
+                    for key, writer in writers.items():
+                        writer.push([row.get(key, _MISSING) for row in chunk])
+                    count += len(chunk)
+                    for writer in writers.values():
+                        writer.flush()
+                    text_bytes = sum(w.text_bytes for w in writers.values())
+                    # 사전이 캐시 상한의 절반을 넘는 파일은 저장하지 않음 (고유값 위주의 거대한 파일)
+                    if text_bytes + count * 4 * len(writers) > self.max_bytes // 2:
+                        storing = False
+                        for writer in writers.values():
+                            writer.close()
+                        writers.clear()
+                yield from chunk
+            completed = storing
+        finally:
+            if completed:
+                self._commit(digest, staging, headers, writers, count)
+            for writer in writers.values():
+                writer.close()
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _commit(self, digest: str, staging: str, headers: List[str], writers: Dict[str, _ColumnWriter], count: int) -> None:
+        try:
+            for writer in writers.values():
+                writer.finish(count)
+            size = sum(os.path.getsize(w.path) for w in writers.values())
+            meta = {'version': CACHE_VERSION, 'headers': headers, 'keys': list(writers), 'rows': count, 'bytes': size, 'created': time.time()}
+            with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            # 다른 프로세스가 먼저 등록했으면 그 항목을 그대로 사용
+            os.rename(staging, self._entry_path(digest))
+        except (OSError, ValueError):
+            return
+        self.evict()
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        """(digest, 바이트 수, 최근 사용 시각) 목록"""
+        found: List[Tuple[str, int, float]] = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return found
+        for name in names:
+            meta_path = os.path.join(self.directory, name, 'meta.json')
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    size = int(json.load(f).get('bytes', 0))
+                found.append((name, size, os.path.getmtime(meta_path)))
+            except (OSError, ValueError):
+                continue
+        return found
+
+    def evict(self) -> int:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 쓰지 않은 항목을 지우고, 지운 개수를 반환합니다."""
+        # 중단된 프로세스가 남긴 작성 중 디렉터리 정리
+        try:
+            for name in os.listdir(self.directory):
+                staging = os.path.join(self.directory, name)
+                if name.startswith('.tmp-') and time.time() - os.path.getmtime(staging) > STALE_STAGING_SECONDS:
+                    shutil.rmtree(staging, ignore_errors=True)
+        except OSError:
+            pass
+        entries = sorted(self.entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for digest, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._entry_path(digest), ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,715 @@
+"""
+컬럼별 변환(Transform) 빌더
+
+`src/lib/core/processors.ts`의 셀 단위 정제 규칙과 `applySingleColumnOption`을 파이썬으로
+옮긴 것입니다. 컬럼명/옵션/프롬프트만으로 결정되는 조건은 컴파일 시점에 한 번만 평가하고,
+값에 따라 달라지는 로직만 클로저로 남겨 컬럼별 변환 목록을 만듭니다.
+규칙 적용 순서와 결과는 브라우저 엔진과 동일하게 유지합니다.
+1. 잠금 컬럼 보호 (plan.py)
+2. 개별 컬럼 옵션 우선 (단, NLP 지정 포맷 존중)
+3. 체크박스 수행 후 자연어 최종 적용
+4. 자연어는 기본 포맷을 무시하고 요청대로 처리
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+from . import kernels
+from .kernels import Kernel
+from .memo import ValueMemo
+from .models import ProcessingOptions
+from .nlp import NullFilling, NumericCondition, PromptAnalysis
+from .utils import (
+    EMAIL_REGEX,
+    EMOJI_REGEX,
+    GARBAGE_REGEX,
+    HTML_TAG_REGEX,
+    JS_WHITESPACE,
+    js_number,
+    js_sub,
+    normalize_date,
+    normalize_datetime,
+    parse_float,
+    parse_int,
+    parse_korean_amount,
+    to_locale_string,
+)
+
+_NON_DIGIT = re.compile(r'[^0-9]')
+_MOBILE = re.compile(r'^(01[016789])([0-9]{3,4})([0-9]{4})$')
+_PHONE_SEOUL = re.compile(r'^([0-9]{2})([0-9]{3,4})([0-9]{4})$')
+_PHONE_AREA = re.compile(r'^([0-9]{3})([0-9]{3,4})([0-9]{4})$')
+_WHITESPACE_RUN = re.compile('[' + re.escape(JS_WHITESPACE) + ']+')
+_BIZ_NUM = re.compile(r'([0-9]{3})([0-9]{2})([0-9]{5})')
+_CORP_NUM = re.compile(r'([0-9]{6})([0-9]{7})')
+_RRN = re.compile(r'([0-9]{6})[-.]?([1-4])[0-9]{6}')
+_COMPANY_SUFFIX = re.compile(r'\((?:주|유|합|사|재|특|협|공|사단|재단|법인)\)|(?:주|유|합|사|재)식회사')
+_POSITION_FULL = re.compile(
+    r'\s?(?:대표이사|전무이사|상무이사|부사장|대리|과장|차장|부장|팀장|본부장|실장|사장|대표|이사|전무|상무|위원|교수|의사|간호사'
+    r'|연구원|매니저|책임|선임|수석|주임|사원)$'
+)
+_POSITION_BASIC = re.compile(r'\s?(?:대리|과장|차장|부장|팀장|본부장|실장|사장|대표|이사|전무|상무|위원|교수|의사|간호사|연구원)$')
+_DONG = re.compile(r'([가-힣0-9]+[동읍면])')
+_SIDO = re.compile(r'^([가-힣]+[시도])')
+_BUILDING = re.compile(r'([가-힣0-9A-Za-z]+(?:아파트|빌딩|타워|상가|오피스텔|빌라|하우스|팰리스|캐슬|맨션))')
+_ADDRESS_MASKS = (
+    (re.compile(r'[0-9]+-[0-9]+'), '****'),
+    (re.compile(r'[0-9]+동\s?[0-9]+호'), '****호'),
+    (re.compile(r'[0-9]+번길\s?[0-9]+'), '$1 ****'),
+)
+_UNIT_VALUE = re.compile(r'^[0-9.]+\s*(?:kg|g|t|m|cm|mm|평|m2|호|인분|개|p|set|세트)$', re.IGNORECASE)
+_CURRENCY_SIGN = re.compile('[$£€¥₩]')
+_CURRENCY_STRIP = re.compile('[$£€¥₩,\\s]')
+_NAME_NOISE = re.compile(r"[0-9!@#$%^&*()_+={}\[\]|\\;:'\",<>?/~`]")
+_NO_SPECIAL = re.compile(r'[^\w\s가-힣]', re.ASCII)
+_BRACKETS = re.compile(r'\(.*?\)|\[.*?\]|\{.*?\}')
+_HASHTAG_SPLIT = re.compile(r'[,\s]+')
+_NUMERIC_CHARS = re.compile(r'[^0-9.-]')
+_NUMERIC_ONLY = re.compile(r'^[0-9.-]+$')
+_DIGITS_ONLY = re.compile(r'^[0-9]+$')
+_DECIMAL_CHARS = re.compile(r'[^0-9.]')
+_ALNUM_CHARS = re.compile(r'[^a-zA-Z0-9]')
+_KOREAN_CHARS = re.compile(r'[^가-힣\s]')
+_ENGLISH_CHARS = re.compile(r'[^a-zA-Z\s]')
+_KOREAN_ONLY = re.compile(r'^[가-힣]+$')
+_KOREAN_UNITS = re.compile(r'[만천백]')
+_HYPHEN_DOT_SPACE = re.compile('[-.' + re.escape(JS_WHITESPACE) + ']')
+_HYPHEN_SPACE = re.compile(r'[-\s]')
+_SKU_SEPARATORS = re.compile(r'[-_\s]')
+_SPACES = re.compile(r'\s')
+_DATE_SEPARATORS = re.compile(r'[-./]')
+_ISO_DATE_PREFIX = re.compile(r'^[0-9]{4}[-./][0-9]{2}[-./][0-9]{2}')
+_YY_DATE_PREFIX = re.compile(r'^[0-9]{2}[-./][0-9]{2}[-./][0-9]{2}')
+_CARD_TAIL = re.compile(r'[0-9]{3,4}$')
+_LONG_NUMBER = re.compile(r'^[0-9-]{12,}$')
+_AGE_VALUE = re.compile(r'^[0-9]{1,2}$')
+
+_PHONE_COL = re.compile(r'연락처|전화|phone|mobile|tel')
+_DATE_COL = re.compile(r'날짜|일시|일자|date|time')
+_EMAIL_COL = re.compile(r'email|이메일')
+_ADDRESS_COL = re.compile(r'주소|지역|address')
+_ADDRESS_ONLY_COL = re.compile(r'주소|address')
+_NAME_COL = re.compile(r'이름|성함|name')
+_AGE_COL = re.compile(r'나이|연령|age')
+_SKU_COL = re.compile(r'sku|모델|코드|model')
+_AMOUNT_COL = re.compile(r'금액|가격|비용|매출|입금|출금|잔액|price|amount|cost|balance|fee')
+
+
+def is_amount_col_pattern(key: str) -> bool:
+    """헬퍼: 금액 컬럼 패턴 확인"""
+    return bool(_AMOUNT_COL.search(key))
+
+
+def is_target_column(key: str, specific_target: Optional[str], all_potential_targets: Sequence[str]) -> bool:
+    """타겟 컬럼 여부 확인 (명시된 타겟 -> 후보 목록 -> 후보가 없으면 전체)"""
+    lower_key = key.lower()
+    if specific_target and (specific_target in lower_key or lower_key in specific_target):
+        return True
+    if any(t in lower_key for t in all_potential_targets):
+        return True
+    return not specific_target and len(all_potential_targets) == 0
+
+
+def _matches_target(lower_key: str, target: Optional[str]) -> bool:
+    return not target or target in lower_key or lower_key in target
+
+
+def _is_nan(num: float) -> bool:
+    return num != num
+
+
+def _format_phone(digits: str) -> Optional[str]:
+    """지역번호(02 또는 3자리)에 맞춰 하이픈을 넣습니다. 형식이 맞지 않으면 None."""
+    regex = _PHONE_SEOUL if digits.startswith('02') else _PHONE_AREA
+    if regex.match(digits):
+        return regex.sub(r'\1-\2-\3', digits, count=1)
+    return None
+
+
+def _restore_exponential(val: str) -> str:
+    if 'E+' in val or 'e+' in val:
+        num = js_number(val)
+        if not _is_nan(num):
+            return to_locale_string(num, grouping=False)
+    return val
+
+
+def _mask_email(val: str) -> str:
+    parts = val.split('@')
+    local, domain = parts[0], parts[1]
+    # JS의 id[0]은 빈 문자열이면 undefined가 되므로 동일하게 맞춤
+    head = local[0] if local else 'undefined'
+    if len(local) <= 3:
+        return head + '***@' + domain
+    return local[:3] + '****@' + domain
+
+
+def _mask_address(val: str) -> str:
+    for regex, replacement in _ADDRESS_MASKS:
+        val = js_sub(regex, replacement, val)
+    return val
+
+
+def _mask_name(val: str) -> str:
+    if len(val) == 2:
+        return val[0] + '*'
+    if len(val) == 3:
+        return val[0] + '*' + val[2]
+    if len(val) > 3:
+        return val[0] + '**' + val[-1]
+    return val
+
+
+def _age_category(val: str) -> str:
+    age = parse_int(_NON_DIGIT.sub('', val))
+    return f'{math.floor(age / 10) * 10}대' if not _is_nan(age) else val
+
+
+def _extract_sido(val: str) -> str:
+    m = _SIDO.search(val)
+    return m.group(1) if m else val.split(' ')[0]
+
+
+def _extract_gungu(val: str) -> str:
+    parts = val.split(' ')
+    return parts[1] if len(parts) >= 2 else val
+
+
+def _clean_zip(val: str) -> Optional[str]:
+    digits = _NON_DIGIT.sub('', val)
+    if len(digits) > 5 and '-' not in val:
+        digits = digits[:5]
+    return digits.zfill(5) if 0 < len(digits) <= 6 else None
+
+
+# ---------------------------------------------------------------------------
+# 개별 컬럼 옵션 (applySingleColumnOption)
+# ---------------------------------------------------------------------------
+
+def _opt_date(val: str, nlp_sep: Optional[str]) -> str:
+    if nlp_sep is not None:
+        digits = _NON_DIGIT.sub('', val)
+        if len(digits) == 8:
+            return f'{digits[:4]}{nlp_sep}{digits[4:6]}{nlp_sep}{digits[6:8]}'
+        if _ISO_DATE_PREFIX.match(val):
+            return _DATE_SEPARATORS.sub(nlp_sep, val[:10])
+    return normalize_date(val) or val
+
+
+def _opt_mobile(val: str, nlp_sep: Optional[str]) -> str:
+    digits = _NON_DIGIT.sub('', val)
+    if 10 <= len(digits) <= 11 and digits.startswith('01'):
+        return _MOBILE.sub(r'\1-\2-\3', digits, count=1)
+    return val
+
+
+def _opt_phone(val: str, nlp_sep: Optional[str]) -> str:
+    digits = _NON_DIGIT.sub('', val)
+    if digits.startswith('0') and 9 <= len(digits) <= 11:
+        return _format_phone(digits) or val
+    return val
+
+
+def _opt_rrn(val: str, nlp_sep: Optional[str]) -> str:
+    if _RRN.search(val):
+        return _RRN.sub(r'\1-\2******', val, count=1)
+    return val
+
+
+def _opt_amount(val: str, nlp_sep: Optional[str]) -> str:
+    num = parse_float(_NUMERIC_CHARS.sub('', val))
+    return val if _is_nan(num) else to_locale_string(num)
+
+
+def _opt_amount_krn(val: str, nlp_sep: Optional[str]) -> str:
+    amount = parse_korean_amount(val)
+    return to_locale_string(amount) if amount > 0 else val
+
+
+def _opt_biz_num(val: str, nlp_sep: Optional[str]) -> str:
+    digits = _NON_DIGIT.sub('', val)
+    return _BIZ_NUM.sub(r'\1-\2-\3', digits, count=1) if len(digits) == 10 else val
+
+
+def _opt_corp_num(val: str, nlp_sep: Optional[str]) -> str:
+    digits = _NON_DIGIT.sub('', val)
+    return _CORP_NUM.sub(r'\1-\2', digits, count=1) if len(digits) == 13 else val
+
+
+def _opt_sns_id(val: str, nlp_sep: Optional[str]) -> str:
+    sns_id = val.split('?')[0]
+    if '/' in sns_id:
+        parts = sns_id.split('/')
+        sns_id = parts[-1] or parts[-2]
+    return sns_id.replace('@', '', 1)
+
+
+def _opt_tracking_num(val: str, nlp_sep: Optional[str]) -> str:
+    # 엑셀 지수 표기(1.23E+11)가 포함된 경우 먼저 숫자로 복원
+    val = _restore_exponential(val)
+    digits = _NON_DIGIT.sub('', val)
+    return digits if len(digits) > 5 else val
+
+
+def _opt_account_mask(val: str, nlp_sep: Optional[str]) -> str:
+    if len(_HYPHEN_SPACE.sub('', val)) >= 10:
+        return val[:len(val) - 4] + '****'
+    return val
+
+
+def _opt_card_mask(val: str, nlp_sep: Optional[str]) -> str:
+    # 이미 중간이 마스킹(*)되어 있고 뒷자리가 숫자로 살아있다면 추가 마스킹 건너뛰기
+    if '*' in val and _CARD_TAIL.search(val):
+        return val
+    if 10 <= len(_HYPHEN_SPACE.sub('', val)) <= 19:
+        return val[:len(val) - 4] + '****'
+    return val
+
+
+def _opt_phone_mid_mask(val: str, nlp_sep: Optional[str]) -> str:
+    if '-' in val:
+        parts = val.split('-')
+        if len(parts) == 3:
+            return f'{parts[0]}-****-{parts[2]}'
+    return val
+
+
+def _opt_date_truncate(val: str, nlp_sep: Optional[str]) -> str:
+    digits = _NON_DIGIT.sub('', val)
+    if len(digits) >= 6:
+        return f'{digits[:4]}{nlp_sep or "."}{digits[4:6]}'
+    return val
+
+
+def _opt_extract(regex: Pattern[str]) -> Callable[[str, Optional[str]], str]:
+    def extract(val: str, nlp_sep: Optional[str]) -> str:
+        m = regex.search(val)
+        return m.group(1) if m else val
+    return extract
+
+
+_extract_dong = _opt_extract(_DONG)
+_extract_building = _opt_extract(_BUILDING)
+
+ColumnOptionFn = Callable[[str, Optional[str]], str]
+
+# 옵션 이름 -> 처리 함수 (값은 앞뒤 공백이 제거된 상태로 전달됨)
+COLUMN_OPTIONS: Dict[str, ColumnOptionFn] = {
+    'date': _opt_date,
+    'datetime': lambda val, _sep: normalize_datetime(val) or val,
+    'mobile': _opt_mobile,
+    'phone': _opt_phone,
+    'rrn': _opt_rrn,
+    'amount': _opt_amount,
+    'amountKrn': _opt_amount_krn,
+    'bizNum': _opt_biz_num,
+    'corpNum': _opt_corp_num,
+    'zip': lambda val, _sep: _clean_zip(val) or val,
+    'url': lambda val, _sep: 'https://' + val if not val.startswith('http') and '.' in val else val,
+    'area': lambda val, _sep: _DECIMAL_CHARS.sub('', val),
+    'snsId': _opt_sns_id,
+    'hashtag': lambda val, _sep: ' '.join('#' + t.replace('#', '') for t in _HASHTAG_SPLIT.split(val) if t),
+    'trackingNum': _opt_tracking_num,
+    'orderId': lambda val, _sep: _ALNUM_CHARS.sub('', val),
+    'companyClean': lambda val, _sep: _COMPANY_SUFFIX.sub('', val).strip(),
+    'positionRemove': lambda val, _sep: _POSITION_BASIC.sub('', val, count=1).strip(),
+    'dongExtract': _extract_dong,
+    'accountMask': _opt_account_mask,
+    'cardMask': _opt_card_mask,
+    'nameMask': lambda val, _sep: _mask_name(val),
+    'emailMask': lambda val, _sep: _mask_email(val) if '@' in val else val,
+    'addressMask': lambda val, _sep: _mask_address(val),
+    'phoneMidMask': _opt_phone_mid_mask,
+    'ageCategory': lambda val, _sep: _age_category(val),
+    'dateTruncate': _opt_date_truncate,
+    'exponentialRestore': lambda val, _sep: _restore_exponential(val),
+    'buildingExtract': _extract_building,
+    'skuNormalize': lambda val, _sep: _SKU_SEPARATORS.sub('', val.upper()),
+    'unitUnify': lambda val, _sep: _DECIMAL_CHARS.sub('', val),
+    'currencyStandardize': lambda val, _sep: _CURRENCY_STRIP.sub('', val),
+    'trim': lambda val, _sep: _WHITESPACE_RUN.sub(' ', val).strip(' '),
+    'garbage': lambda val, _sep: '' if GARBAGE_REGEX.search(val) else val,
+    'nameClean': lambda val, _sep: _NAME_NOISE.sub('', val).strip(),
+    'emailClean': lambda val, _sep: val if EMAIL_REGEX.match(val) else '',
+    'htmlRemove': lambda val, _sep: HTML_TAG_REGEX.sub('', val),
+    'emojiRemove': lambda val, _sep: EMOJI_REGEX.sub('', val),
+    'upperCase': lambda val, _sep: val.upper(),
+    'lowerCase': lambda val, _sep: val.lower(),
+}
+
+
+def apply_single_column_option(val: str, option: str, nlp_sep: Optional[str]) -> str:
+    """단일 값에 대해 컬럼 옵션을 적용하는 함수 (applySingleColumnOption 포팅)"""
+    if not val:
+        return val
+    val = val.strip()
+    fn = COLUMN_OPTIONS.get(option)
+    return fn(val, nlp_sep) if fn else val
+
+
+# ---------------------------------------------------------------------------
+# 컬럼별 변환 목록 컴파일 ([통합 정제 루프]의 본문)
+# ---------------------------------------------------------------------------
+
+class Transform(NamedTuple):
+    """
+    컬럼 하나에 적용할 정제 단계 (이름은 통계/디버깅용)
+    kernel은 컬럼 모드에서 컬럼 전체에 한 번에 적용하는 동일 동작의 벡터 구현입니다 (없으면 fn을 셀마다 실행).
+    """
+    name: str
+    fn: Callable[[str], str]
+    kernel: Optional[Kernel] = None
+
+
+def find_null_filling(key: str, nlp: PromptAnalysis) -> Optional[NullFilling]:
+    """컬럼에 해당하는 결측치 채우기 규칙 (원본 키 기준 부분 일치)"""
+    return next((c for c in nlp.null_fillings if c.column in key or key in c.column), None)
+
+
+def _phone_allowance(options: ProcessingOptions, is_phone_col: bool) -> Tuple[bool, bool]:
+    return bool(options.format_mobile or is_phone_col), bool(options.format_general_phone)
+
+
+def _phone_step(options: ProcessingOptions, nlp: PromptAnalysis, is_phone_col: bool) -> Callable[[str], str]:
+    if nlp.wants_hyphen_removal:
+        return lambda val: _HYPHEN_DOT_SPACE.sub('', val)
+    allow_mobile, allow_general = _phone_allowance(options, is_phone_col)
+
+    def phone(val: str) -> str:
+        only_digits = _NON_DIGIT.sub('', val)
+        if only_digits.startswith('82'):
+            only_digits = '0' + only_digits[2:]
+        if only_digits.startswith('01') and allow_mobile:
+            if 10 <= len(only_digits) <= 11:
+                return _MOBILE.sub(r'\1-\2-\3', only_digits, count=1)
+        elif only_digits.startswith('0') and allow_general:
+            return _format_phone(only_digits) or val
+        return val
+    return phone
+
+
+def _amount_step(nlp: PromptAnalysis) -> Callable[[str], str]:
+    if nlp.wants_comma_removal:
+        return lambda val: val.replace(',', '')
+
+    def amount(val: str) -> str:
+        if _KOREAN_UNITS.search(val):
+            parsed = parse_korean_amount(val)
+            return to_locale_string(parsed) if parsed > 0 else val
+        clean_val = val.replace(',', '')
+        if _NUMERIC_ONLY.match(clean_val):
+            num = parse_float(clean_val)
+            if not _is_nan(num):
+                return to_locale_string(num)
+        return val
+    return amount
+
+
+def _numeric_condition_step(cond: NumericCondition) -> Callable[[str], str]:
+    op, target, replacement = cond.operator, cond.value, cond.target_value
+
+    def numeric_condition(val: str) -> str:
+        clean_num = _NUMERIC_CHARS.sub('', val)
+        current = parse_float(clean_num)
+        if _is_nan(current) or clean_num == '':
+            return val
+        if ((op == 'ge' and current >= target) or (op == 'le' and current <= target)
+                or (op == 'gt' and current > target) or (op == 'lt' and current < target)
+                or (op == 'eq' and current == target)):
+            return replacement
+        return val
+    return numeric_condition
+
+
+def _null_fill_step(fill_value: str) -> Callable[[str], str]:
+    def null_fill(val: str) -> str:
+        if val == '' or val.lower().strip() in ('null', 'undefined'):
+            return fill_value
+        return val
+    return null_fill
+
+
+def _masking_step(options: ProcessingOptions, nlp: PromptAnalysis, lower_key: str) -> Callable[[str], str]:
+    is_account_col = '계좌' in lower_key or 'account' in lower_key
+    is_card_col = '카드' in lower_key or 'card' in lower_key
+    is_account = options.mask_account or (is_account_col and (options.auto_detect or nlp.wants_masking))
+    is_card = options.mask_card or (is_card_col and (options.auto_detect or nlp.wants_masking))
+    always = is_account or is_card
+    mask_middle = nlp.wants_mask_middle
+
+    def mask(val: str) -> str:
+        if always or _LONG_NUMBER.match(_SPACES.sub('', val)):
+            # 너무 짧거나 형식이 아닌 데이터는 마스킹하지 않음 (이슈로 보고됨)
+            if len(_HYPHEN_SPACE.sub('', val)) >= 10:
+                if mask_middle:
+                    return val[:4] + '****' + val[8:] if len(val) > 8 else val
+                return val[:len(val) - 4] + '****'
+        return val
+    return mask
+
+
+def _nlp_date_step(sep: str, empty_on_error: bool) -> Callable[[str], str]:
+    def nlp_date(val: str) -> str:
+        standard_date = normalize_date(val)
+        # normalizeDate가 실패했다면, YY/MM/DD 패턴에 '20'을 붙여서 재시도
+        if not standard_date and _YY_DATE_PREFIX.match(val):
+            standard_date = normalize_date('20' + val)
+        if standard_date:
+            return standard_date.replace('-', sep)
+        digits = _NON_DIGIT.sub('', val)
+        if len(digits) == 8:
+            return f'{digits[:4]}{sep}{digits[4:6]}{sep}{digits[6:8]}'
+        # 오류 시 빈칸 처리 (날짜/일시 컬럼인 경우에만 한정)
+        return '' if empty_on_error else val
+    return nlp_date
+
+
+def _column_option_step(option: str, nlp_sep: Optional[str]) -> Callable[[str], str]:
+    fn = COLUMN_OPTIONS.get(option)
+    if fn is None:
+        return lambda val: val.strip() if val else val
+    return lambda val: fn(val.strip(), nlp_sep) if val else val
+
+
+def build_column_transforms(
+    key: str,
+    nlp: PromptAnalysis,
+    options: ProcessingOptions,
+    col_option: Optional[str] = None,
+) -> List[Transform]:
+    """
+    한 컬럼에 적용할 정제 단계를 원래 규칙 순서대로 컴파일합니다.
+    컬럼명/옵션/프롬프트로 결정되는 조건은 여기서 한 번만 평가하므로,
+    목록에 포함된 단계만 셀마다 실행하면 processDataLocal과 같은 결과가 나옵니다.
+    잠금 컬럼 처리와 원본 값이 없는(None) 셀의 결측치 채우기는 호출측(plan.py) 책임입니다.
+    """
+    steps: List[Transform] = []
+
+    def add(name: str, fn: Callable[[str], str], kernel: Optional[Kernel] = None) -> None:
+        steps.append(Transform(name, fn, kernel))
+
+    def add_memo(name: str, fn: Callable[[str], str], factorize: bool = False) -> None:
+        # 비용이 큰 정규화 단계는 고유값마다 한 번만 계산 (memo.py)
+        memo = ValueMemo(key, name, fn)
+        add(name, memo, kernels.factorized(memo) if factorize else None)
+
+    lower_key = key.lower()
+    targets = nlp.all_potential_targets
+    auto = options.auto_detect
+
+    # [Rule 0] 컬럼 전체 일괄 치환
+    if lower_key in nlp.mappings:
+        mapped = nlp.mappings[lower_key]
+        add('column_mapping', lambda _val: mapped)
+
+    # 0.5단계: 조건부 로직 적용 (Numeric Condition)
+    num_cond = next((c for c in nlp.numeric_conditions if c.column in lower_key or lower_key in c.column), None)
+    if num_cond:
+        add('numeric_condition', _numeric_condition_step(num_cond),
+            kernels.numeric_condition_kernel(num_cond.operator, num_cond.value, num_cond.target_value))
+
+    # 0.6단계: 결측치 채우기 (Null Filling)
+    null_fill = find_null_filling(key, nlp)
+    if null_fill:
+        add('null_fill', _null_fill_step(null_fill.fill_value))
+
+    # -----------------------------------------------------------------
+    # 1단계: 전역 체크박스 옵션 (Checkbox Options) [Rule 3]
+    # -----------------------------------------------------------------
+    is_phone_col = auto and bool(_PHONE_COL.search(lower_key))
+    if options.format_mobile or options.format_general_phone or is_phone_col:
+        if nlp.wants_hyphen_removal:
+            phone_kernel = kernels.hyphen_removal_kernel()
+        else:
+            phone_kernel = kernels.phone_kernel(*_phone_allowance(options, is_phone_col))
+        add('phone', _phone_step(options, nlp, is_phone_col), phone_kernel)
+
+    if options.remove_whitespace or nlp.wants_whitespace:
+        add('whitespace', lambda val: _WHITESPACE_RUN.sub(' ', val).strip(' '), kernels.whitespace_kernel())
+
+    is_date_col = auto and bool(_DATE_COL.search(lower_key))
+    # nlp 지정 포맷이 없는 경우에만 기본 포맷 적용 (Rule 5)
+    if (options.format_date or options.format_date_time or is_date_col) and nlp.date_separator is None:
+        normalize = normalize_datetime if options.format_date_time else normalize_date
+
+        def date(val: str) -> str:
+            return normalize(val) or val
+        add_memo('date', date, factorize=True)
+
+    if options.format_number or options.clean_amount or (auto and is_amount_col_pattern(lower_key)):
+        if nlp.wants_comma_removal:
+            add('amount', _amount_step(nlp), kernels.comma_removal_kernel())
+        else:
+            add_memo('amount', _amount_step(nlp), factorize=True)
+
+    if auto and _EMAIL_COL.search(lower_key):
+        if options.clean_email:
+            add('email', lambda val: '' if val and not EMAIL_REGEX.match(val) else val)
+        else:
+            add('email', lambda val: '' if '@' in val and not EMAIL_REGEX.match(val) else val)
+
+    if options.format_zip or (auto and ('zip' in lower_key or '우편' in lower_key)):
+        add('zip', lambda val: _clean_zip(val) or val)
+
+    if options.format_biz_num or (auto and '사업자' in lower_key):
+        add('biz_num', lambda val: _opt_biz_num(val, None))
+
+    if options.format_corp_num or (auto and '법인' in lower_key):
+        add('corp_num', lambda val: _opt_corp_num(val, None))
+
+    if options.format_url or (auto and 'url' in lower_key):
+        add('url', lambda val: 'https://' + val if val and not val.startswith('http') and '.' in val else val)
+
+    if not nlp.wants_unmask and (options.mask_personal_data or (auto and '주민번호' in lower_key)):
+        add('rrn_mask', lambda val: _opt_rrn(val, None))
+
+    if options.clean_garbage or nlp.wants_garbage:
+        add('garbage', lambda val: '' if GARBAGE_REGEX.search(val) else val)
+
+    # Global Checkbox Options: HTML, Emoji, Case
+    if options.remove_html:
+        add('html', lambda val: HTML_TAG_REGEX.sub('', val))
+    if options.remove_emoji:
+        add('emoji', lambda val: EMOJI_REGEX.sub('', val))
+    if options.to_upper_case:
+        add('upper_case', str.upper)
+    if options.to_lower_case:
+        add('lower_case', str.lower)
+
+    # -----------------------------------------------------------------
+    # 2단계: 자연어 처리 (NLP Smart) [Rule 4]
+    # -----------------------------------------------------------------
+    if nlp.wants_no_special:
+        add('nlp_no_special', lambda val: _NO_SPECIAL.sub('', val))
+    if nlp.wants_no_brackets and is_target_column(key, nlp.target_no_brackets, targets):
+        add_memo('nlp_no_brackets', lambda val: _BRACKETS.sub('', val).strip())
+    if nlp.wants_only_digits:
+        add('nlp_only_digits', lambda val: _NON_DIGIT.sub('', val))
+    elif nlp.wants_only_korean:
+        add('nlp_only_korean', lambda val: _KOREAN_CHARS.sub('', val))
+    elif nlp.wants_only_english:
+        add('nlp_only_english', lambda val: _ENGLISH_CHARS.sub('', val))
+
+    if nlp.wants_no_html and is_target_column(key, nlp.target_no_html, targets):
+        add('nlp_no_html', lambda val: HTML_TAG_REGEX.sub('', val))
+    if nlp.wants_no_emoji and is_target_column(key, nlp.target_no_emoji, targets):
+        add('nlp_no_emoji', lambda val: EMOJI_REGEX.sub('', val))
+
+    if nlp.padding_len > 0 and _matches_target(lower_key, nlp.padding_target):
+        width = nlp.padding_len
+        add('nlp_padding', lambda val: val.zfill(width) if _DIGITS_ONLY.match(val) else val)
+
+    if nlp.prefix_value is not None and _matches_target(lower_key, nlp.prefix_target):
+        prefix = nlp.prefix_value
+        add('nlp_prefix', lambda val: prefix + val)
+    if nlp.suffix_value is not None and _matches_target(lower_key, nlp.suffix_target):
+        suffix = nlp.suffix_value
+        add('nlp_suffix', lambda val: val + suffix)
+
+    # 대/소문자 변환은 최종 결과(접미사 이후)에 적용
+    if nlp.wants_lower and _matches_target(lower_key, nlp.lower_target):
+        add('nlp_lower', str.lower)
+    if nlp.wants_upper and _matches_target(lower_key, nlp.upper_target):
+        add('nlp_upper', str.upper)
+
+    if _ADDRESS_COL.search(lower_key):
+        if nlp.wants_sido:
+            add_memo('nlp_sido', _extract_sido)
+        elif nlp.wants_gungu:
+            add_memo('nlp_gungu', _extract_gungu)
+        elif options.extract_dong or nlp.wants_dong_extraction:
+            add_memo('dong', lambda val: _extract_dong(val, None))
+
+    # 이메일 컬럼이 아니더라도 '@'가 있으면 도메인만 남김 ('@'가 없으면 값 유지)
+    if nlp.wants_domain:
+        add('nlp_domain', lambda val: (val.split('@')[1] or val) if '@' in val else val)
+
+    # 업체명 정리 [Rule 5]
+    is_company_col = '업체' in lower_key or '회사' in lower_key or '상호' in lower_key or 'name' in lower_key
+    is_target_company = is_company_col or is_target_column(key, nlp.target_company_clean, targets)
+    if (options.clean_company_name or nlp.wants_company_clean) and is_target_company:
+        add_memo('company', lambda val: _COMPANY_SUFFIX.sub('', val).strip())
+
+    # 직함 제거
+    is_position_col = '이름' in lower_key or '성함' in lower_key or '담당' in lower_key or 'name' in lower_key
+    is_target_position = is_position_col or is_target_column(key, nlp.target_position_removal, targets)
+    if (options.remove_position or nlp.wants_position_removal) and is_target_position:
+        add_memo('position', lambda val: _POSITION_FULL.sub('', val, count=1).strip())
+
+    # 계좌/카드 마스킹
+    if options.mask_account or options.mask_card or nlp.wants_masking:
+        add('account_card_mask', _masking_step(options, nlp, lower_key))
+
+    # 성함 마스킹
+    if options.mask_name or nlp.wants_name_mask:
+        if _NAME_COL.search(lower_key):
+            add('name_mask', _mask_name)
+        else:
+            add('name_mask', lambda val: _mask_name(val) if 2 <= len(val) <= 4 and _KOREAN_ONLY.match(val) else val)
+
+    # 이메일 마스킹
+    if options.mask_email or nlp.wants_email_mask:
+        add('email_mask', lambda val: _mask_email(val) if '@' in val else val)
+
+    # 상세 주소 마스킹 (번지수, 동호수 패턴 대략적 마스킹)
+    if (options.mask_address or nlp.wants_address_mask) and _ADDRESS_ONLY_COL.search(lower_key):
+        add('address_mask', _mask_address)
+
+    # 연락처 중간자리 마스킹
+    if options.mask_phone_mid:
+        add('phone_mid_mask', lambda val: _opt_phone_mid_mask(val, None))
+
+    # 나이 범주화
+    if options.category_age or nlp.wants_age_category:
+        if _AGE_COL.search(lower_key):
+            add('age_category', _age_category)
+        else:
+            add('age_category', lambda val: _age_category(val) if _AGE_VALUE.match(val) else val)
+
+    # 날짜 절삭 (연/월)
+    if options.truncate_date or nlp.wants_truncate_date:
+        truncate_sep = nlp.nlp_date_separator or '.'
+        add('truncate_date', lambda val: _opt_date_truncate(val, truncate_sep))
+
+    # 엑셀 지수 표기 복원
+    if options.restore_exponential or nlp.wants_exponential:
+        add('exponential', _restore_exponential)
+
+    # 주소 내 건물명 추출
+    if (options.extract_building or nlp.wants_building) and _ADDRESS_ONLY_COL.search(lower_key):
+        add('building', lambda val: _extract_building(val, None))
+
+    # SKU/모델명 표준화
+    if (options.normalize_sku or nlp.wants_sku) and _SKU_COL.search(lower_key):
+        add('sku', lambda val: _SKU_SEPARATORS.sub('', val.upper()))
+
+    # 단위 수치화
+    if options.unify_unit or nlp.wants_unit:
+        add('unit', lambda val: _DECIMAL_CHARS.sub('', val) if _UNIT_VALUE.match(val) else val)
+
+    # 통화 표준화
+    if options.standardize_currency or nlp.wants_currency:
+        add('currency', lambda val: _CURRENCY_STRIP.sub('', val) if _CURRENCY_SIGN.search(val) else val)
+
+    # A->B 치환 및 패턴 매핑 적용
+    if nlp.mappings:
+        mappings = nlp.mappings
+        add('value_mapping', lambda val: mappings.get(val.lower(), val))
+    for pm in nlp.pattern_mappings:
+        add('pattern_mapping', lambda val, pm=pm: pm.pattern.sub(pm.replacement, val))
+
+    # 자연어 날짜 포맷 강제 적용 (Rule 5) - 날짜 관련 컬럼일 때만 수행
+    sep = nlp.date_separator
+    if sep is not None and _DATE_COL.search(lower_key):
+        add_memo('nlp_date', _nlp_date_step(sep, nlp.wants_empty_on_error))
+
+    # -----------------------------------------------------------------
+    # 3단계: 개별 컬럼 지정 옵션 (Column Option) [Rule 2]
+    # 가장 마지막에 수행되어 전역/자연어 결과를 최종 확고히 함.
+    # -----------------------------------------------------------------
+    if col_option:
+        add_memo(f'column_option:{col_option}', _column_option_step(col_option, sep))
+
+    return steps
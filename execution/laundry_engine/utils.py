@@ -0,0 +1,300 @@
+"""
+정제 엔진 공용 유틸리티
+
+`src/lib/core/utils.ts`의 파이썬 포팅과, 브라우저 엔진과 동일한 결과를 내기 위한
+JavaScript 호환 헬퍼(String(), parseFloat, Number, toLocaleString 등)를 모아둡니다.
+"""
+from __future__ import annotations
+
+import math
+import re
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Optional, Pattern
+
+# ---------------------------------------------------------------------------
+# JavaScript 호환 헬퍼
+# ---------------------------------------------------------------------------
+
+_JS_FLOAT_PREFIX = re.compile(r'^[+-]?(?:Infinity|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)')
+_JS_NUMBER_FULL = re.compile(r'^[+-]?(?:Infinity|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)$')
+_JS_INT_PREFIX = re.compile(r'^[+-]?[0-9]+')
+# JS 공백 문자 집합 (WhiteSpace + LineTerminator: `\s`, trim(), parseFloat 기준)
+JS_WHITESPACE = (' \t\n\r\v\f\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+                 '\u2028\u2029\u202f\u205f\u3000\ufeff')
+
+
+def js_str(value: object) -> str:
+    """`String(value || "")`와 동일하게 셀 값을 문자열로 변환합니다."""
+    if value is None or value is False or value == '':
+        return ''
+    if value is True:
+        return 'true'
+    if isinstance(value, (int, float)):
+        if value == 0 or value != value:
+            return ''
+        if isinstance(value, float):
+            if math.isinf(value):
+                return 'Infinity' if value > 0 else '-Infinity'
+            if value.is_integer() and abs(value) < 1e21:
+                return str(int(value))
+        return repr(value)
+    return str(value)
+
+
+def parse_float(text: str) -> float:
+    """JavaScript `parseFloat`: 앞부분의 숫자만 해석하고 실패 시 NaN을 반환합니다."""
+    m = _JS_FLOAT_PREFIX.match(text.lstrip(JS_WHITESPACE))
+    if not m:
+        return math.nan
+    return float(m.group(0).replace('Infinity', 'inf'))
+
+
+def parse_int(text: str) -> float:
+    """JavaScript `parseInt(text)` (10진수). 실패 시 NaN을 반환합니다."""
+    m = _JS_INT_PREFIX.match(text.lstrip(JS_WHITESPACE))
+    return float(int(m.group(0))) if m else math.nan
+
+
+def js_number(text: str) -> float:
+    """JavaScript `Number(text)`: 문자열 전체가 숫자여야 하며 빈 문자열은 0입니다."""
+    s = text.strip(JS_WHITESPACE)
+    if s == '':
+        return 0.0
+    if not _JS_NUMBER_FULL.match(s):
+        return math.nan
+    return float(s.replace('Infinity', 'inf'))
+
+
+def js_round(num: float) -> float:
+    """JavaScript `Math.round` (0.5는 +무한대 방향으로 반올림)."""
+    if math.isnan(num) or math.isinf(num):
+        return num
+    return float(math.floor(num + 0.5))
+
+
+def to_locale_string(num: float, grouping: bool = True) -> str:
+    """
+    `num.toLocaleString('en-US')` 포팅 (소수점 최대 3자리, 천단위 콤마)
+    grouping=False는 `toLocaleString('fullwide', { useGrouping: false })`에 해당합니다.
+    """
+    if math.isnan(num):
+        return 'NaN'
+    if math.isinf(num):
+        return '∞' if num > 0 else '-∞'
+    try:
+        dec = Decimal(repr(float(num))).quantize(Decimal('0.001'), rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        return repr(num)
+    text = format(dec, ',f' if grouping else 'f')
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+_JS_TEMPLATE_TOKEN = re.compile(r"\$(\$|&|`|'|[0-9]{1,2})")
+
+
+class _EmptyMatchRetry(Exception):
+    """re.sub이 빈 일치 바로 뒤 같은 위치에서 다시 일치를 찾음 (JS와 다른 경우)"""
+
+
+def js_sub(regex: Pattern[str], template: str, text: str, count: int = 0) -> str:
+    """
+    `String.prototype.replace(regex, template)`와 동일한 치환
+    `$1`, `$&`, `$$` 등 JS 치환 토큰을 해석하며, 존재하지 않는 그룹 참조는 그대로 둡니다.
+    count=0은 'g' 플래그(전체 치환), 1은 첫 매칭만 치환합니다.
+
+    빈 일치 다음에는 JS의 lastIndex 규칙대로 한 글자 뒤에서 다시 찾습니다. (safe_regex.py의 NFA 치환과 동일)
+    re.sub은 빈 일치와 같은 위치에서 비지 않은 일치를 한 번 더 찾으므로(`a*?`, `a??` 등) 그런 일치가 나오면 직접 찾기로 바꿉니다.
+    """
+    if '$' not in template:
+        def expand(m: re.Match) -> str:
+            return template
+    else:
+        def expand(m: re.Match) -> str:
+            def token(t: re.Match) -> str:
+                key = t.group(1)
+                if key == '$':
+                    return '$'
+                if key == '&':
+                    return m.group(0)
+                if key == '`':
+                    return m.string[:m.start()]
+                if key == "'":
+                    return m.string[m.end():]
+                idx = int(key)
+                if 0 < idx <= (regex.groups or 0):
+                    return m.group(idx) or ''
+                if len(key) == 2 and 0 < int(key[0]) <= (regex.groups or 0):
+                    return (m.group(int(key[0])) or '') + key[1]
+                return t.group(0)
+            return _JS_TEMPLATE_TOKEN.sub(token, template)
+
+    if count == 1:
+        return regex.sub(expand, text, count=1)
+
+    empty_at = -1  # 직전 빈 일치 위치
+
+    def checked(m: re.Match) -> str:
+        nonlocal empty_at
+        if m.start() == empty_at:
+            raise _EmptyMatchRetry
+        empty_at = m.start() if m.start() == m.end() else -1
+        return expand(m)
+
+    try:
+        return regex.sub(checked, text)
+    except _EmptyMatchRetry:
+        pass
+    parts = []
+    last = pos = 0
+    while pos <= len(text):
+        m = regex.search(text, pos)
+        if m is None:
+            break
+        parts.append(text[last:m.start()])
+        parts.append(expand(m))
+        last = m.end()
+        pos = m.end() + 1 if m.start() == m.end() else m.end()
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+def compile_js_regex(source: str, ignore_case: bool = False) -> Optional[Pattern[str]]:
+    """사용자 프롬프트에서 만든 정규식을 컴파일합니다. 실패하면 None (JS의 try/catch 무시와 동일)."""
+    try:
+        return re.compile(source, re.IGNORECASE if ignore_case else 0)
+    except (re.error, OverflowError, RecursionError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# utils.ts 포팅
+# ---------------------------------------------------------------------------
+
+_AMOUNT_STRIP = re.compile(r'[원\s,]')
+_AMOUNT_UNITS = {'만': 10000, '천': 1000, '백': 100}
+
+
+def parse_korean_amount(text: str) -> float:
+    """
+    한글 금액 문자열을 숫자로 변환하는 함수
+    예: "1,500만 3천원" -> 15003000
+    """
+    total = 0.0
+    current = ''
+    for char in _AMOUNT_STRIP.sub('', text):
+        if char in '0123456789.':
+            current += char
+        elif char in _AMOUNT_UNITS:
+            num = 1.0 if current == '' else parse_float(current)
+            total += num * _AMOUNT_UNITS[char]
+            current = ''
+    if current != '':
+        total += parse_float(current)
+    return js_round(total)
+
+
+_DATE_KR = re.compile(r'((?:19|20)[0-9]{2})[-.년/\s]{1,3}([0-9]{1,2})[-.월/\s]{1,3}([0-9]{1,2})[일\s)]?')
+_DATE_YMD = re.compile(r'((?:19|20)[0-9]{2})[-./]([0-9]{1,2})[-./]([0-9]{1,2})')
+_DATE_MDY = re.compile(r'([0-9]{1,2})[/\-.]([0-9]{1,2})[/\-.]((?:19|20)[0-9]{2})')
+_DATE_EIGHT = re.compile(r'((?:19|20)[0-9]{2})([0-9]{2})([0-9]{2})')
+_DATE_SIX = re.compile(r'^([0-9]{2})([0-9]{2})([0-9]{2})')
+_DATE_YY = re.compile(r'^([0-9]{2})[/\-.]([0-9]{1,2})[/\-.]([0-9]{1,2})')
+
+
+def normalize_date(val: str) -> Optional[str]:
+    """다양한 날짜 형식 문자열을 표준 포맷(yyyy-MM-dd)으로 변환합니다. 실패 시 None."""
+    val = val.strip(JS_WHITESPACE)
+    if not val:
+        return None
+
+    m = _DATE_KR.search(val)
+    if m:
+        return f'{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}'
+
+    m = _DATE_YMD.search(val)
+    if m:
+        return f'{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}'
+
+    m = _DATE_MDY.search(val)
+    if m:
+        p1, p2, y = int(m.group(1)), int(m.group(2)), m.group(3)
+        if p1 > 12:
+            month, day = p2, p1
+        else:
+            month, day = p1, p2
+        if month > 12 or day > 31:
+            return None
+        return f'{y}-{month:02d}-{day:02d}'
+
+    m = _DATE_EIGHT.search(val)
+    if m:
+        return f'{m.group(1)}-{m.group(2)}-{m.group(3)}'
+
+    m = _DATE_SIX.search(val)
+    if m:
+        y = int(m.group(1))
+        full_year = (1900 if y > 50 else 2000) + y
+        return f'{full_year}-{m.group(2)}-{m.group(3)}'
+
+    m = _DATE_YY.search(val)
+    if m:
+        y, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        full_year = (1900 if y > 50 else 2000) + y
+        if month <= 12 and day <= 31:
+            return f'{full_year}-{month:02d}-{day:02d}'
+
+    return None
+
+
+_TIME_MARKER = re.compile(r'(오전|오후|am|pm|[0-9]{1,2}:[0-9]{1,2}(?::[0-9]{1,2})?)', re.IGNORECASE)
+_TIME = re.compile(r'([0-9]{1,2}):([0-9]{1,2})(?::([0-9]{1,2}))?')
+_AFTERNOON = re.compile(r'오후|pm', re.IGNORECASE)
+_MORNING = re.compile(r'오전|am', re.IGNORECASE)
+
+
+def normalize_datetime(val: str) -> Optional[str]:
+    """일시 형식 문자열을 표준 포맷(yyyy-MM-dd HH:mm:ss)으로 변환합니다. 실패 시 None."""
+    val = val.strip(JS_WHITESPACE)
+    if not val:
+        return None
+    if not _TIME_MARKER.search(val):
+        return None
+
+    date_part = normalize_date(val)
+    if not date_part:
+        return None
+
+    m = _TIME.search(val)
+    if not m:
+        return None
+
+    hh = int(m.group(1))
+    mm = m.group(2).zfill(2)
+    ss = (m.group(3) or '0').zfill(2)
+
+    if _AFTERNOON.search(val) and hh < 12:
+        hh += 12
+    elif _MORNING.search(val) and hh == 12:
+        hh = 0
+
+    return f'{date_part} {hh:02d}:{mm}:{ss}'
+
+
+# 가비지(깨진 문자, 무의미한 데이터) 탐지를 위한 정규식
+GARBAGE_REGEX = re.compile(
+    r'Ã|ï¿½|&nbsp;|unknown|N/A|NaN|undefined|null|[ëìí][\u0080-\u00BF]|ðŸ'
+    r'|[\u1F60-\u1F64][\u0080-\u00BF]|^None$|^X$|^---$|^[!@#$%^&*(),.?":{}|<>+=-]+$',
+    re.IGNORECASE,
+)
+
+# JS 이모지 정규식(서로게이트 쌍 기준)을 코드포인트 범위로 옮긴 것
+EMOJI_REGEX = re.compile(
+    r'([\u2700-\u27BF]|[\uE000-\uF8FF]|[\U0001F000-\U0001F3FF]|[\U0001F400-\U0001F7FF]'
+    r'|[\u2011-\u26FF]|[\U0001F910-\U0001F9FF])'
+)
+
+HTML_TAG_REGEX = re.compile(r'<[^>]*>?', re.MULTILINE)
+
+EMAIL_REGEX = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
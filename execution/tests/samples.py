@@ -0,0 +1,70 @@
+"""
+테스트 공용 샘플 프롬프트
+
+심화 테스트 시나리오(directives/advanced_test_plan.md A-1~A-8), 점검 스크립트(full_system_check.ts,
+advanced_nlp_test.ts)와 벤치마크에서 쓰는 프롬프트에 규칙 종류별 대표 문장을 더한 목록입니다.
+"""
+
+SAMPLE_PROMPTS = [
+    '',
+    # 심화 테스트 시나리오 A-1~A-8
+    '주소에서 구/군만 남겨줘',
+    '대괄호 [포함] 텍스트 제거하고 지워줘',
+    '연락처 컬럼 앞에 [VIP] 붙여줘',
+    '대문자로 바꾸고 뒤에 _FIXED 붙여',
+    "1000이 넘는 값은 'VIP'로 바꿔",
+    '이메일에서 도메인만 남겨줘',
+    '날짜를 yyyymmdd 붙여서 포맷으로',
+    '회사 이름에서 주식회사랑 (주) 싹다 지워',
+    # 점검 스크립트
+    '가입일은 yyyy.mm.dd 형식으로',
+    "price가 10000 이상이면 'VIP'로 바꿔",
+    "price  가  10000  이상이면 'VIP'로 바꿔",
+    "price가10000 이상이면 'VIP'로 바꿔",
+    "가격이 10000 이상이면 'VIP'로 바꿔",
+    "메모에서 '확인필요' 지워줘",
+    'email은 대문자로 변경',
+    'id를 5자리 0으로 채워줘',
+    'test@naver.com은 sample@test.com으로 변경',
+    '전부 대문자로 바꿔',
+    # 파이썬 엔진 테스트
+    '가입일자를 yyyy.mm.dd 형식으로 변경',
+    '고객명 앞뒤 공백 제거',
+    "상태가 'Inactive'이면 '휴면'으로 바꿔줘",
+    '날짜는 yyyy-mm-dd 형식으로',
+    '가입일자가 비어있으면 2024-01-01로 채워줘',
+    # 규칙 종류별
+    '전화번호 하이픈 빼고 콤마도 지워',
+    '카드 번호 중간 마스킹 해줘',
+    '마스킹 해제해서 보이게',
+    '주소에서 시/도 따로 추출하고 동/읍/면 분리',
+    '숫자만 남겨',
+    '한글만 남겨줘',
+    '영문만 남기고 특수문자 제거',
+    'memo 괄호 내용삭제',
+    '직함 제거하고 이름만',
+    'msg에서 html 태그와 이모지 지워',
+    '소문자로 바꿔',
+    "grade가 비어있으면 'Unknown'으로 채워",
+    "grade 가 없으면 'N/A' 로 바꿔",
+    "점수가 80 이하이면 '재시험'으로 설정",
+    "나이가 20 미만이면 '미성년'으로 바꿔",
+    "금액이 500 초과이면 '고액'으로 치환",
+    "등급이 A와 같으면 'Gold'로 수정",
+    '오류 값은 빈칸으로',
+    "'N/A' -> ''",
+    "'서울' => '서울특별시'",
+    "'[비공개]' 패턴 지워",
+    '\\d{3}-\\d{4} 패턴 제거',
+    '연령대 범주로 나눠',
+    '날짜 연월 절삭',
+    '지수 표기 E+ 복원',
+    '건물명 빼고 상세주소 뒷부분 마스킹',
+    'SKU 모델명 정리',
+    '단위 제거해서 수치화',
+    '통화 부호 제거',
+    '가비지 쓰레기 값 정리',
+    '이메일 별표 가림',
+    'ALL 전체 모든 데이터 English Only',
+    '  앞뒤\t공백\n줄바꿈  섞인   프롬프트  ',
+]
@@ -0,0 +1,163 @@
+"""
+일괄 정제(batch.py) 점검: 결과 파일 이름 중복 처리, 시트 크기에 따른 작업 분배, 품질 통계 가중 합산
+"""
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from xml.sax.saxutils import escape
+
+from laundry_engine import ProcessingStats, clean_batch, open_table
+from laundry_engine.batch import REPORT_NAME, BatchTask, collect_tasks, merge_stats, schedule_tasks
+
+HEADERS = ['고객명', '연락처', '가입일자']
+
+
+def make_rows(count):
+    return [{'고객명': f' 고객{i} ', '연락처': f'010{i:08d}', '가입일자': f'2024.{i % 12 + 1}.{i % 28 + 1}'} for i in range(count)]
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=HEADERS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_xlsx(path, sheets):
+    """시트 여러 개를 가진 최소 XLSX (인라인 문자열 셀)"""
+    ns = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" ' \
+         'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    rel_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet'
+    with zipfile.ZipFile(path, 'w') as archive:
+        entries, rels = [], []
+        for i, (name, rows) in enumerate(sheets.items(), 1):
+            entries.append(f'<sheet name="{escape(name)}" sheetId="{i}" r:id="rId{i}"/>')
+            rels.append(f'<Relationship Id="rId{i}" Type="{rel_type}" Target="worksheets/sheet{i}.xml"/>')
+            xml_rows = []
+            for r, values in enumerate([HEADERS] + [[row[h] for h in HEADERS] for row in rows], 1):
+                cells = ''.join(f'<c r="{chr(65 + c)}{r}" t="inlineStr"><is><t>{escape(v)}</t></is></c>' for c, v in enumerate(values))
+                xml_rows.append(f'<row r="{r}">{cells}</row>')
+            archive.writestr(f'xl/worksheets/sheet{i}.xml', f'<worksheet {ns}><sheetData>{"".join(xml_rows)}</sheetData></worksheet>')
+        archive.writestr('xl/workbook.xml', f'<workbook {ns}><sheets>{"".join(entries)}</sheets></workbook>')
+        archive.writestr('xl/_rels/workbook.xml.rels', (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{"".join(rels)}</Relationships>'
+        ))
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.inputs = os.path.join(self.dir, 'inputs')
+        self.output = os.path.join(self.dir, 'out')
+        os.makedirs(self.inputs)
+
+    def path(self, name):
+        return os.path.join(self.inputs, name)
+
+    def test_output_names_are_unique(self):
+        write_xlsx(self.path('Sales.xlsx'), {'Q1 / 2024': make_rows(3), 'Sheet:2': make_rows(2), '***': make_rows(1)})
+        write_csv(self.path('Sales__Q1_2024.csv'), make_rows(2))  # 시트 결과 이름과 같은 파일
+        write_csv(self.path('sales.csv'), make_rows(2))
+        write_csv(self.path('.hidden.csv'), make_rows(1))
+        write_csv(self.path('~$lock.csv'), make_rows(1))
+        with open(self.path('notes.txt'), 'w', encoding='utf-8') as f:
+            f.write('무시')
+        with open(self.path('broken.xlsx'), 'wb') as f:
+            f.write(b'not a zip')
+        other = os.path.join(self.dir, 'other')
+        os.makedirs(other)
+        write_csv(os.path.join(other, 'SALES.csv'), make_rows(1))  # 대소문자만 다른 이름
+
+        tasks = collect_tasks([self.inputs, os.path.join(other, 'SALES.csv')], self.output)
+        self.assertEqual([(os.path.basename(t.input_path), t.sheet, os.path.basename(t.output_path)) for t in tasks], [
+            ('Sales.xlsx', 'Q1 / 2024', 'Sales__Q1_2024.xlsx'),
+            ('Sales.xlsx', 'Sheet:2', 'Sales__Sheet_2.xlsx'),
+            ('Sales.xlsx', '***', 'Sales__sheet.xlsx'),
+            ('Sales__Q1_2024.csv', None, 'Sales__Q1_2024_2.csv'),
+            ('broken.xlsx', None, 'broken.xlsx'),
+            ('sales.csv', None, 'sales.csv'),
+            ('SALES.csv', None, 'SALES_2.csv'),
+        ])
+        self.assertTrue(all(os.path.dirname(t.output_path) == self.output for t in tasks))
+        self.assertEqual(tasks[4].size, 0)
+        self.assertGreater(tasks[0].size, tasks[2].size)
+
+        # 형식을 바꾸면 확장자만 바뀜
+        names = [os.path.basename(t.output_path) for t in collect_tasks([self.inputs], self.output, 'csv')]
+        self.assertEqual(names[:3], ['Sales__Q1_2024.csv', 'Sales__Sheet_2.csv', 'Sales__sheet.csv'])
+        with self.assertRaises(ValueError):
+            collect_tasks([self.inputs], self.output, 'json')
+
+    def test_schedule_splits_by_worker_share(self):
+        tasks = [BatchTask(f'{size}.csv', None, f'out/{size}.csv', size) for size in (10, 100, 5, 75, 10)]
+        large, small = schedule_tasks(tasks, 1)
+        self.assertEqual((large, [t.size for t in small]), ([], [100, 75, 10, 10, 5]))
+        # 워커 2개: 몫 100 → 몫보다 큰 시트 없음 (같으면 시트 단위)
+        large, small = schedule_tasks(tasks, 2)
+        self.assertEqual(([t.size for t in large], [t.size for t in small]), ([], [100, 75, 10, 10, 5]))
+        # 워커 3개: 몫 66.7 → 100, 75는 청크 단위로 나눠 정제
+        large, small = schedule_tasks(tasks, 3)
+        self.assertEqual(([t.size for t in large], [t.size for t in small]), ([100, 75], [10, 10, 5]))
+
+    def test_schedule_uses_file_sizes(self):
+        write_csv(self.path('big.csv'), make_rows(400))
+        write_csv(self.path('small1.csv'), make_rows(10))
+        write_xlsx(self.path('book.xlsx'), {'A': make_rows(20), 'B': make_rows(5)})
+        large, small = schedule_tasks(collect_tasks([self.inputs], self.output), 2)
+        self.assertEqual([os.path.basename(t.output_path) for t in large], ['big.csv'])
+        # 크기는 CSV 파일 크기 / 압축을 푼 시트 XML 크기이며, 나머지는 큰 것부터
+        self.assertEqual(sorted(os.path.basename(t.output_path) for t in small), ['book__A.xlsx', 'book__B.xlsx', 'small1.csv'])
+        self.assertEqual([t.size for t in small], sorted((t.size for t in small), reverse=True))
+        self.assertEqual(small[0].output_path, os.path.join(self.output, 'book__A.xlsx'))
+
+    def test_merge_stats_weights_by_rows(self):
+        self.assertIsNone(merge_stats([]))
+        merged = merge_stats([
+            ProcessingStats(total_rows=30, changed_cells=12, resolved_issues=3, quality_score=90, completeness=100, validity=80),
+            ProcessingStats(total_rows=10, changed_cells=5, resolved_issues=1, quality_score=50, completeness=60, validity=41),
+            ProcessingStats(total_rows=0, changed_cells=0, resolved_issues=0, quality_score=0, completeness=0, validity=0),
+        ])
+        self.assertEqual(merged, ProcessingStats(total_rows=40, changed_cells=17, resolved_issues=4,
+                                                 quality_score=80, completeness=90, validity=70))
+        empty = merge_stats([ProcessingStats(), ProcessingStats()])
+        self.assertEqual((empty.total_rows, empty.quality_score), (0, 0))
+
+    def test_clean_batch_report(self):
+        write_csv(self.path('big.csv'), make_rows(300))
+        write_csv(self.path('small.csv'), make_rows(12))
+        write_xlsx(self.path('book.xlsx'), {'A': make_rows(20), 'B': make_rows(7)})
+        with open(self.path('broken.xlsx'), 'wb') as f:
+            f.write(b'not a zip')
+        seen = []
+        batch = clean_batch([self.inputs], self.output, '날짜는 yyyy-mm-dd 형식으로', chunk_size=50, workers=2,
+                            on_result=lambda r: seen.append(r.output_path))
+
+        tasks = collect_tasks([self.inputs], self.output)
+        self.assertEqual([r.output_path for r in batch.results], [t.output_path for t in tasks if not t.input_path.endswith('broken.xlsx')])
+        self.assertEqual(sorted(seen), sorted(r.output_path for r in batch.results))
+        self.assertEqual([os.path.basename(t.input_path) for t, _ in batch.failures], ['broken.xlsx'])
+        self.assertEqual(batch.total_rows, 300 + 12 + 20 + 7)
+        for r in batch.results:
+            with self.subTest(output=r.output_path):
+                headers, rows = open_table(r.output_path)
+                rows = list(rows)
+                self.assertEqual(headers, HEADERS)
+                self.assertEqual(len(rows), r.total_rows)
+                self.assertRegex(rows[0]['가입일자'], r'^\d{4}-\d{2}-\d{2}$')
+
+        with open(os.path.join(self.output, REPORT_NAME), encoding='utf-8') as f:
+            report = json.load(f)
+        summary = report['summary']
+        self.assertEqual((summary['files'], summary['sheets'], summary['failed'], summary['totalRows']), (4, 4, 1, 339))
+        self.assertEqual(summary['stats'], merge_stats([r.stats for r in batch.results]).to_dict())
+        self.assertEqual([s['rows'] for s in report['sheets']], [r.total_rows for r in batch.results])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+처리 용량 계획(capacity.py) 점검: 고정 측정값으로 청크 크기 계산, 저장된 측정값의 유효 기간/버전 처리
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from dataclasses import asdict, replace
+from unittest import mock
+
+from laundry_engine import capacity
+from laundry_engine.capacity import (
+    CALIBRATION_TTL,
+    CALIBRATION_VERSION,
+    CHUNK_SECONDS,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    Calibration,
+    get_calibration,
+    plan_capacity,
+)
+from laundry_engine.parallel import PENDING_PER_WORKER
+
+MB = 1024 * 1024
+
+
+class PlanCapacityTest(unittest.TestCase):
+    def test_chunk_bounded_by_time(self):
+        # 메모리가 충분하면 CHUNK_SECONDS 분량 (1000행 단위 내림)
+        plan = plan_capacity(Calibration(rows_per_second=50_500, bytes_per_row=100), workers=1, memory_budget_mb=1024)
+        self.assertEqual(plan.chunk_size, int(50_500 * CHUNK_SECONDS) // 1000 * 1000)
+        self.assertEqual((plan.workers, plan.rows_per_second, plan.bytes_per_row, plan.memory_budget_mb), (1, 50_500, 100, 1024))
+
+    def test_chunk_bounded_by_memory(self):
+        calibration = Calibration(rows_per_second=10_000_000, bytes_per_row=1024)
+        plan = plan_capacity(calibration, workers=1, memory_budget_mb=10)
+        self.assertEqual(plan.chunk_size, 10 * MB // 1024 // 1000 * 1000)
+
+    def test_memory_split_across_in_flight_chunks(self):
+        # 병렬 실행은 워커마다 PENDING_PER_WORKER개 청크가 동시에 메모리에 올라감
+        calibration = Calibration(rows_per_second=10_000_000, bytes_per_row=512)
+        serial = plan_capacity(calibration, workers=1, memory_budget_mb=200)
+        parallel = plan_capacity(calibration, workers=4, memory_budget_mb=200)
+        in_flight = 4 * PENDING_PER_WORKER
+        self.assertEqual(parallel.workers, 4)
+        self.assertEqual(parallel.chunk_size, int(200 * MB / (512 * in_flight)) // 1000 * 1000)
+        self.assertLess(parallel.chunk_size, serial.chunk_size)
+
+    def test_clamps(self):
+        cases = [
+            (Calibration(rows_per_second=100, bytes_per_row=100), 1024, MIN_CHUNK_SIZE),
+            (Calibration(rows_per_second=10_000, bytes_per_row=10 * MB), 1, MIN_CHUNK_SIZE),
+            (Calibration(rows_per_second=10_000_000, bytes_per_row=1), 100_000, MAX_CHUNK_SIZE),
+        ]
+        for calibration, budget, expected in cases:
+            with self.subTest(calibration=calibration, budget=budget):
+                self.assertEqual(plan_capacity(calibration, memory_budget_mb=budget).chunk_size, expected)
+
+    def test_default_budget_uses_available_memory(self):
+        calibration = Calibration(rows_per_second=10_000_000, bytes_per_row=1024)
+        with mock.patch.object(capacity, 'available_memory_mb', return_value=400):
+            plan = plan_capacity(calibration)
+        self.assertEqual(plan.memory_budget_mb, int(400 * capacity.MEMORY_RATIO))
+
+
+class GetCalibrationTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'nested', 'calibration.json')
+        # 프로세스 안 재사용 값은 테스트마다 비움
+        saved = dict(capacity._calibrations)
+        capacity._calibrations.clear()
+        self.addCleanup(capacity._calibrations.update, saved)
+        self.addCleanup(capacity._calibrations.clear)
+        self.measured = Calibration(rows_per_second=1234, bytes_per_row=56, measured_at=time.time())
+        patcher = mock.patch.object(capacity, 'measure_throughput', side_effect=lambda mode: replace(self.measured, mode=mode))
+        self.measure = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save(self, saved):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+
+    def read(self):
+        with open(self.path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_measures_and_saves(self):
+        # 없는 폴더도 만들어 저장하고, 같은 프로세스에서는 다시 측정하지 않음
+        calibration = get_calibration('row', cache_path=self.path)
+        self.assertEqual(calibration, self.measured)
+        self.assertEqual(self.read(), {'row': asdict(self.measured)})
+        self.assertIs(get_calibration('row', cache_path=self.path), calibration)
+        self.assertEqual(self.measure.call_count, 1)
+
+    def test_reuses_fresh_entry(self):
+        saved = Calibration(rows_per_second=999, bytes_per_row=77, measured_at=time.time() - CALIBRATION_TTL + 60)
+        self.save({'row': asdict(saved)})
+        self.assertEqual(get_calibration('row', cache_path=self.path), saved)
+        self.measure.assert_not_called()
+
+    def test_remeasures_stale_or_mismatched_entry(self):
+        fresh = time.time()
+        entries = {
+            '유효 기간 지남': asdict(Calibration(999, 77, measured_at=fresh - CALIBRATION_TTL - 1)),
+            '버전 다름': asdict(Calibration(999, 77, measured_at=fresh, version=CALIBRATION_VERSION + 1)),
+            '필드 다름': {'rows_per_second': 999, 'unknown': 1},
+            '형식 오류': 'broken',
+        }
+        for name, entry in entries.items():
+            with self.subTest(name):
+                capacity._calibrations.clear()
+                self.measure.reset_mock()
+                self.save({'row': entry, 'columnar': {'keep': True}})
+                self.assertEqual(get_calibration('row', cache_path=self.path), self.measured)
+                self.measure.assert_called_once_with('row')
+                # 다른 mode의 저장값은 유지하고 이 mode만 갱신
+                self.assertEqual(self.read(), {'row': asdict(self.measured), 'columnar': {'keep': True}})
+
+    def test_refresh_ignores_saved_entry(self):
+        self.save({'row': asdict(Calibration(999, 77, measured_at=time.time()))})
+        self.assertEqual(get_calibration('row', refresh=True, cache_path=self.path), self.measured)
+        self.measure.assert_called_once_with('row')
+
+    def test_without_cache_path_writes_nothing(self):
+        get_calibration('row', cache_path=None)
+        self.assertFalse(os.path.exists(self.path))
+        with mock.patch.object(capacity, 'get_calibration', wraps=get_calibration) as spy:
+            capacity.auto_plan(memory_budget_mb=100)
+        spy.assert_called_once_with('row', False, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+컬럼 모드(columnar.py / kernels.py) 점검: 행 모드와 결과가 같아야 합니다.
+
+pyarrow가 설치되어 있으면 Arrow 커널을, 없으면 고유값 커널을 점검합니다 (requirements-arrow.txt).
+"""
+import os
+import random
+import unittest
+
+from laundry_engine import (
+    ProcessingOptions,
+    PromptAnalysis,
+    analyze_prompt,
+    build_column_transforms,
+    kernels,
+    open_table,
+    process_data_columnar,
+    process_data_local,
+)
+from laundry_engine.nlp import NumericCondition
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+ALL_CHECKBOXES = ProcessingOptions(
+    remove_whitespace=True, format_mobile=True, format_general_phone=True, format_date=True,
+    format_number=True, clean_email=True, format_zip=True, clean_amount=True, clean_name=True,
+    remove_html=True, restore_exponential=True, mask_card=True,
+)
+
+# (파일, 프롬프트, 옵션, 잠금 컬럼, 컬럼 옵션)
+CASES = [
+    ('chaos_test_data.csv', '', ALL_CHECKBOXES, (), {}),
+    ('large_complex_data.csv', '', ALL_CHECKBOXES, ('이메일',), {'가입일자': 'date'}),
+    ('comprehensive_test_data.csv', '', ALL_CHECKBOXES, (), {'휴대폰': 'mobile'}),
+    ('chaos_test_data.csv', '가입일자를 yyyy.mm.dd 형식으로 변경', ProcessingOptions(), (), {}),
+    ('chaos_test_data.csv', '고객명 앞뒤 공백 제거', ProcessingOptions(format_mobile=True), (), {}),
+    ('large_complex_data.csv', "상태가 'Inactive'이면 '휴면'으로 바꿔줘", ProcessingOptions(remove_whitespace=True), (), {}),
+    ('tax_chaos.csv', '날짜는 yyyy-mm-dd 형식으로', ProcessingOptions(clean_amount=True, format_number=True), (), {}),
+    ('real_estate_chaos.csv', '', ProcessingOptions(clean_area_unit=True, clean_amount=True), (), {}),
+    ('marketing_chaos.csv', '', ProcessingOptions(), (), {'AccountID': 'snsId', 'Hashtags': 'hashtag'}),
+]
+
+# 커널별 (컬럼, 프롬프트 또는 조건, 옵션, 커널 단계 이름)
+# 프롬프트로 만들 수 없는 음수/소수 기준값은 NumericCondition을 직접 넘김
+KERNEL_CASES = [
+    ('연락처', '', ProcessingOptions(format_mobile=True), 'phone'),
+    ('연락처', '', ProcessingOptions(format_general_phone=True), 'phone'),
+    ('연락처', '', ProcessingOptions(format_mobile=True, format_general_phone=True), 'phone'),
+    ('전화번호', '', ProcessingOptions(auto_detect=True), 'phone'),
+    ('연락처', '전화번호 하이픈 빼고 콤마도 지워', ProcessingOptions(format_mobile=True), 'phone'),
+    ('메모', '', ProcessingOptions(remove_whitespace=True), 'whitespace'),
+    ('금액', '전화번호 하이픈 빼고 콤마도 지워', ProcessingOptions(clean_amount=True), 'amount'),
+    ('price', "price가 10000 이상이면 'VIP'로 바꿔", ProcessingOptions(), 'numeric_condition'),
+    ('price', "price가 0 이하이면 '없음'으로 바꿔", ProcessingOptions(), 'numeric_condition'),
+    ('price', "price가 100 초과이면 '고액'으로 바꿔", ProcessingOptions(), 'numeric_condition'),
+    ('price', "price가 100 미만이면 '소액'으로 바꿔", ProcessingOptions(), 'numeric_condition'),
+    ('price', "price가 100 같으면 '백'으로 바꿔", ProcessingOptions(), 'numeric_condition'),
+    ('price', NumericCondition('price', -5.0, 'gt', '양수'), ProcessingOptions(), 'numeric_condition'),
+    ('price', NumericCondition('price', 1.5, 'lt', '소액'), ProcessingOptions(), 'numeric_condition'),
+    ('price', NumericCondition('price', -0.5, 'eq', '음수'), ProcessingOptions(), 'numeric_condition'),
+]
+
+# 정규식 엔진(RE2/re) 차이가 드러나기 쉬운 값: 국가번호, 자리수 경계, JS 공백 문자, 소수점/부호 위치, 전각/아라비아 외 숫자
+KERNEL_VALUES = [
+    '', ' ', '01012345678', '010-1234-5678', '010 1234 5678', '+82 10-1234-5678', '82-10-1234-5678', '8201012345678',
+    '0101234567', '010123456789', '0212345678', '02-123-4567', '031 123 4567', '0311234567', '03112345678', '1588-1234',
+    '０１０-１２３４-５６７８', '٠١٠١٢٣٤٥٦٧٨', '010.1234.5678', '(02) 123-4567', 'tel:010-1234-5678 ext 1',
+    '1,000', '1,000,000원', '-1,5', '10000', '10000.0', '9999.99', '0010000', '-5', '-5.5', '--5', '5-', '1-2',
+    '12.5.3', '.5', '-.5', '1.', '-', '.', '..5', '1e5', 'Infinity', 'NaN', '100', '100.00', '1.5', '1.49', '0', '-0',
+    '  앞뒤  공백  ', '\t탭\n줄바꿈\r', '\u3000전각\u3000공백', '\u00a0nbsp\u00a0', '\ufeffbom', '\u2028줄\u2029단락',
+    '\u200b폭없는공백', '\x1c구분', '가,나,,다', 'VIP', '🙂 010-1234-5678 🙂', 'a\u0085b',
+]
+
+
+def kernel_values(seed=5, count=300):
+    """고정 값 + 전화번호/숫자 조각을 이어 붙인 값"""
+    rnd = random.Random(seed)
+    pieces = ['0', '1', '2', '82', '010', '02', '031', '-', '.', ',', ' ', '\u3000', '\t', '+', '가', 'a', '1234', '5678']
+    generated = [''.join(rnd.choice(pieces) for _ in range(rnd.randint(1, 8))) for _ in range(count)]
+    return KERNEL_VALUES + generated
+
+
+def load(name):
+    _, rows = open_table(os.path.join(TEST_DATA, name))
+    return list(rows)
+
+
+class ColumnarParityTest(unittest.TestCase):
+    def test_matches_row_mode(self):
+        for name, prompt, options, locked, column_options in CASES:
+            with self.subTest(file=name, prompt=prompt, arrow=kernels.ARROW_AVAILABLE):
+                data = load(name)
+                expected = process_data_local(data, prompt, options, locked, column_options)
+                self.assertEqual(process_data_columnar(data, prompt, options, locked, column_options), expected)
+
+    def test_missing_values_and_ragged_rows(self):
+        data = [
+            {'연락처': '01012345678', '가입일자': None},
+            {'연락처': None, '가입일자': '2024.1.5'},
+            {'연락처': ' 010 1234 5678 ', '가입일자': ''},
+        ]
+        prompt = '가입일자가 비어있으면 2024-01-01로 채워줘'
+        options = ProcessingOptions(format_mobile=True, format_date=True, remove_whitespace=True)
+        self.assertEqual(process_data_columnar(data, prompt, options), process_data_local(data, prompt, options))
+        # 행마다 키 구성이 다르면 행 모드로 처리
+        ragged = data + [{'연락처': '01099998888'}]
+        self.assertEqual(process_data_columnar(ragged, prompt, options), process_data_local(ragged, prompt, options))
+
+
+@unittest.skipUnless(kernels.ARROW_AVAILABLE, 'pyarrow 미설치 (pip install -r requirements-arrow.txt)')
+class ArrowKernelTest(unittest.TestCase):
+    """Arrow 커널을 같은 단계의 셀 함수와 셀 단위로 비교"""
+
+    def test_kernels_match_cell_functions(self):
+        values = kernel_values()
+        covered = set()
+        for i, (key, prompt, options, step) in enumerate(KERNEL_CASES):
+            with self.subTest(case=i, column=key, prompt=prompt):
+                nlp = analyze_prompt(prompt) if isinstance(prompt, str) else PromptAnalysis(numeric_conditions=[prompt])
+                transforms = {t.name: t for t in build_column_transforms(key, nlp, options)}
+                self.assertIn(step, transforms)
+                t = transforms[step]
+                self.assertIsNotNone(t.kernel)
+                result = kernels.to_list(t.kernel(kernels.to_column(values)))
+                for value, got in zip(values, result):
+                    self.assertEqual(got, t.fn(value), repr(value))
+                self.assertEqual(len(result), len(values))
+                covered.add(t.kernel.__qualname__.split('.')[0])
+        self.assertEqual(covered, {
+            'phone_kernel', 'hyphen_removal_kernel', 'whitespace_kernel', 'comma_removal_kernel', 'numeric_condition_kernel',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+스트리밍 작성기(exporters.py) 점검: 여러 청크로 나눠 쓴 CSV/XLSX가 한 번에 쓴 결과와 같게 읽혀야 합니다.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from laundry_engine import clean_file, iter_chunks, open_table
+from laundry_engine.exporters import CsvChunkWriter, XlsxChunkWriter, open_writer
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+HEADERS = ['이름', '메모', '금액', '여부']
+ROWS = [
+    {'이름': '홍길동', '메모': '쉼표, "따옴표"\n줄바꿈', '금액': 1000, '여부': True},
+    {'이름': '  앞뒤 공백  ', '메모': '<태그> & 기호', '금액': 2.5, '여부': False},
+    {'이름': '제어\x01문자', '메모': '_x0041_ 그대로', '금액': None, '여부': None},
+    {'이름': '', '메모': '🙂 이모지', '금액': -3, '여부': '아니오'},
+    {'이름': 'extra', '메모': '없는 컬럼은 무시', '금액': 0, '여부': '', '기타': 'x'},
+] * 5
+
+
+class ChunkWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def write(self, name, chunk_size):
+        path = os.path.join(self.dir, name)
+        with open_writer(path, HEADERS) as writer:
+            for chunk in iter_chunks(iter(ROWS), chunk_size):
+                writer.write_rows(chunk)
+        self.assertEqual(writer.rows_written, len(ROWS))
+        return path
+
+    def test_multi_chunk_matches_single_pass(self):
+        for ext, writer_type in (('csv', CsvChunkWriter), ('xlsx', XlsxChunkWriter)):
+            with self.subTest(ext=ext):
+                with open_writer(os.path.join(self.dir, f'type.{ext}'), HEADERS) as writer:
+                    self.assertIsInstance(writer, writer_type)
+                single = self.write(f'single.{ext}', len(ROWS))
+                chunked = self.write(f'chunked.{ext}', 3)
+                expected_headers, expected = open_table(single)
+                expected = list(expected)
+                headers, rows = open_table(chunked)
+                self.assertEqual(expected_headers, HEADERS)
+                self.assertEqual(headers, HEADERS)
+                self.assertEqual(list(rows), expected)
+                self.assertEqual(len(expected), len(ROWS))
+                # 문자열은 그대로 읽혀야 함 (제어 문자/_xHHHH_ 표기 포함)
+                self.assertEqual([r['메모'] for r in expected], [r['메모'] for r in ROWS])
+                self.assertEqual([r['이름'] for r in expected[:3]], [r['이름'] for r in ROWS[:3]])
+        with open(os.path.join(self.dir, 'single.csv'), 'rb') as a, open(os.path.join(self.dir, 'chunked.csv'), 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_clean_file_chunk_size_does_not_change_output(self):
+        source = os.path.join(TEST_DATA, 'chaos_test_data.xlsx')
+        for ext in ('csv', 'xlsx'):
+            with self.subTest(ext=ext):
+                outputs = []
+                for chunk_size in (7, 100_000):
+                    path = os.path.join(self.dir, f'clean_{chunk_size}.{ext}')
+                    clean_file(source, path, '가입일자를 yyyy.mm.dd 형식으로 변경', chunk_size=chunk_size)
+                    headers, rows = open_table(path)
+                    outputs.append((headers, list(rows)))
+                self.assertEqual(outputs[0], outputs[1])
+                self.assertGreater(len(outputs[0][1]), 7)
+
+    def test_rejects_unknown_extension(self):
+        with self.assertRaises(ValueError):
+            open_writer(os.path.join(self.dir, 'out.json'), HEADERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
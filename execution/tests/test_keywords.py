@@ -0,0 +1,56 @@
+"""
+프롬프트 키워드 매처(keywords.py) 점검: 단일 패스 결과가 키워드마다 `in` / `re.split`으로 찾던 방식과 같아야 합니다.
+"""
+import random
+import re
+import unittest
+
+from laundry_engine import PROMPT_KEYWORDS, PROMPT_MATCHER, KeywordMatcher
+
+from .samples import SAMPLE_PROMPTS
+
+
+def naive_scan(table, text):
+    """이전 방식: 그룹마다 키워드를 하나씩 포함 검사하고, 토큰은 re.split(r'\\s+')"""
+    groups = {g for g, keywords in table.items() if any(k in text for k in keywords)}
+    tokens = re.split(r'\s+', text)
+    token_groups = [{g for g, keywords in table.items() if any(k in token for k in keywords)} for token in tokens]
+    return groups, tokens, token_groups
+
+
+class KeywordMatcherTest(unittest.TestCase):
+    def assert_same_as_naive(self, matcher, table, text):
+        scan = matcher.scan(text)
+        groups, tokens, token_groups = naive_scan(table, text)
+        self.assertEqual(scan.groups, groups)
+        self.assertEqual(scan.tokens, tokens)
+        for i, expected in enumerate(token_groups):
+            self.assertEqual({g for g in table if scan.token_has(i, g)}, expected, tokens[i])
+
+    def test_sample_prompts(self):
+        for prompt in SAMPLE_PROMPTS:
+            for text in (prompt, prompt.lower()):
+                with self.subTest(prompt=text):
+                    self.assert_same_as_naive(PROMPT_MATCHER, PROMPT_KEYWORDS, text)
+
+    def test_generated_prompts(self):
+        # 키워드 조각과 공백을 이어 붙여 겹치는 일치/토큰 경계의 일치를 만듦
+        rnd = random.Random(3)
+        pieces = [k for keywords in PROMPT_KEYWORDS.values() for k in keywords]
+        pieces += [k[:-1] for k in pieces if len(k) > 1] + ['a', '가', '0']
+        for _ in range(2000):
+            text = ''.join(rnd.choice(pieces) + rnd.choice(['', '', ' ', '  ', '\t', '　']) for _ in range(rnd.randint(0, 6)))
+            with self.subTest(prompt=text):
+                self.assert_same_as_naive(PROMPT_MATCHER, PROMPT_KEYWORDS, text)
+
+    def test_overlapping_keywords(self):
+        # 접두/접미가 겹치는 키워드 (실패 링크와 출력 병합)
+        table = {'he': ('he',), 'she': ('she',), 'hers': ('hers',), 'his': ('his',), 'e': ('e',)}
+        matcher = KeywordMatcher(table)
+        for text in ('ushers', 'she hers', 'h e r s', ' his ', '', '   '):
+            with self.subTest(text=text):
+                self.assert_same_as_naive(matcher, table, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+고유값 메모(memo.py) 점검: 문자 수 상한 삭제, 적중률이 낮을 때 자동 우회, 통계 합계
+"""
+import math
+import os
+import unittest
+
+from laundry_engine import ProcessingOptions, ValueMemo, open_table, process_data_local
+from laundry_engine.memo import BYPASS_CHECK_AFTER, BYPASS_MIN_HIT_RATE
+from laundry_engine.plan import compile_plan
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+
+class CountingFn:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, val):
+        self.calls += 1
+        return val.upper() + '!'
+
+
+def stored_chars(memo):
+    return sum(len(k) + len(v) for k, v in memo._cache.items())
+
+
+class ValueMemoTest(unittest.TestCase):
+    def test_hits_and_misses(self):
+        fn = CountingFn()
+        memo = ValueMemo('col', 'step', fn)
+        values = ['a', 'b', 'a', 'c', 'b', 'a']
+        self.assertEqual([memo(v) for v in values], [fn(v) for v in values])
+        stats = memo.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size, stats.evictions), (3, 3, 3, 0))
+        self.assertEqual(fn.calls - len(values), stats.misses)  # 원래 함수는 새 값에만 호출
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+        self.assertEqual(stored_chars(memo), memo._chars)
+
+    def test_char_cap_evicts_oldest_first(self):
+        # 항목 하나 = 키 2자 + 결과 3자, 상한 20자 → 다섯 번째에서 절반(10자) 이하가 될 때까지 앞에서부터 삭제
+        memo = ValueMemo('col', 'step', CountingFn(), max_chars=20)
+        keys = ['k0', 'k1', 'k2', 'k3', 'k4']
+        for k in keys:
+            memo(k)
+        stats = memo.stats()
+        self.assertEqual((stats.evictions, stats.size), (3, 2))
+        self.assertEqual(list(memo._cache), keys[3:])
+        self.assertEqual(stored_chars(memo), memo._chars)
+        self.assertLessEqual(memo._chars, memo.max_chars // 2)
+
+        memo('k4')  # 남은 항목은 적중
+        memo('k0')  # 삭제된 항목은 다시 계산
+        stats = memo.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 6))
+        self.assertEqual(stats.size, stats.misses - stats.evictions)
+        self.assertFalse(stats.bypassed)
+
+    def test_bypass_on_low_hit_rate(self):
+        fn = CountingFn()
+        memo = ValueMemo('col', 'step', fn)
+        for i in range(BYPASS_CHECK_AFTER):
+            memo(str(i))
+        stats = memo.stats()
+        self.assertTrue(stats.bypassed)
+        self.assertEqual((stats.hits, stats.misses, stats.size), (0, BYPASS_CHECK_AFTER, 0))
+        self.assertEqual(memo._chars, 0)
+
+        # 우회 후에는 원래 함수만 실행하고 통계는 그대로
+        calls = fn.calls
+        self.assertEqual(memo('0'), '0!')
+        self.assertEqual(fn.calls, calls + 1)
+        self.assertEqual(memo.stats(), stats)
+
+    def test_no_bypass_above_threshold(self):
+        memo = ValueMemo('col', 'step', CountingFn())
+        # 적중률 = 적중 / (적중 + 미적중) 이 하한 이상이 되는 최소 적중 수
+        hits = math.ceil(BYPASS_CHECK_AFTER * BYPASS_MIN_HIT_RATE / (1 - BYPASS_MIN_HIT_RATE))
+        for i in range(hits):
+            memo(str(i))
+            memo(str(i))
+        for i in range(hits, BYPASS_CHECK_AFTER):
+            memo(str(i))
+        stats = memo.stats()
+        self.assertEqual((stats.hits, stats.misses), (hits, BYPASS_CHECK_AFTER))
+        self.assertGreaterEqual(stats.hit_rate, BYPASS_MIN_HIT_RATE)
+        self.assertFalse(stats.bypassed)
+        self.assertEqual(stats.size, BYPASS_CHECK_AFTER)
+
+    def test_plan_stats_add_up(self):
+        # 메모를 쓰는 단계(날짜/금액/주소/업체명)의 조회 수는 처리한 셀 수를 넘지 않고, 남은 항목 = 미적중 - 삭제
+        headers, rows = open_table(os.path.join(TEST_DATA, 'large_complex_data.csv'))
+        rows = list(rows)
+        options = ProcessingOptions(format_date=True, clean_amount=True, auto_detect=True)
+        prompt = '주소에서 구/군만 남겨주고 회사 이름에서 주식회사 지워'
+        plan = compile_plan(prompt, headers, options)
+        self.assertEqual([plan.process_row(r) for r in rows], process_data_local(rows, prompt, options))
+        stats = plan.memo_stats()
+        self.assertTrue(stats)
+        for s in stats:
+            with self.subTest(column=s.column, step=s.step):
+                self.assertLessEqual(s.hits + s.misses, len(rows))
+                self.assertEqual(s.size, s.misses - s.evictions)
+                self.assertFalse(s.bypassed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+멀티코어 샤드 정제(parallel.py) 점검: 워커 수와 무관하게 결과와 순서가 같아야 합니다.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from laundry_engine import ProcessingOptions, clean_chunks, clean_file, iter_chunks, open_table
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+PROMPT = '가입일자를 yyyy.mm.dd 형식으로 변경'
+OPTIONS = ProcessingOptions(remove_whitespace=True, format_mobile=True, clean_amount=True, format_zip=True)
+
+
+class ParallelParityTest(unittest.TestCase):
+    def test_chunks_match_serial(self):
+        _, rows = open_table(os.path.join(TEST_DATA, 'large_complex_data.csv'))
+        chunks = list(iter_chunks(rows, 16))
+        for mode in ('row', 'columnar'):
+            with self.subTest(mode=mode):
+                serial = list(clean_chunks(chunks, PROMPT, OPTIONS, mode=mode))
+                parallel = list(clean_chunks(chunks, PROMPT, OPTIONS, mode=mode, workers=3))
+                self.assertEqual(parallel, serial)
+                self.assertEqual([len(c) for c in parallel], [len(c) for c in chunks])
+
+    def test_file_output_matches_serial(self):
+        out = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, out)
+        source = os.path.join(TEST_DATA, 'chaos_test_data.csv')
+        results, contents = {}, {}
+        for workers in (1, 2):
+            path = os.path.join(out, f'w{workers}.csv')
+            results[workers] = clean_file(source, path, PROMPT, OPTIONS, chunk_size=25, workers=workers, analyze=True)
+            with open(path, 'rb') as f:
+                contents[workers] = f.read()
+        serial, parallel = results[1], results[2]
+        self.assertEqual(contents[2], contents[1])
+        self.assertEqual(parallel.total_rows, serial.total_rows)
+        self.assertEqual(parallel.issues, serial.issues)
+        self.assertEqual(parallel.stats, serial.stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+스트리밍 파이프라인(pipeline.py)과 옵션 모델(models.py) 점검
+
+실행:  cd execution && python -m unittest discover -s tests -t .
+"""
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from laundry_engine import ProcessingOptions, clean_file
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+
+class CleanFileTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.input = os.path.join(self.dir, 'tax.csv')
+        shutil.copy(os.path.join(TEST_DATA, 'tax_chaos.csv'), self.input)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_streams_every_row(self):
+        output = os.path.join(self.dir, 'out.csv')
+        result = clean_file(self.input, output, '날짜는 yyyy.mm.dd 형식으로', chunk_size=7)
+        with open(self.input, encoding='utf-8-sig', newline='') as f:
+            expected = sum(1 for _ in csv.DictReader(f))
+        with open(output, encoding='utf-8-sig', newline='') as f:
+            written = list(csv.DictReader(f))
+        self.assertEqual(result.total_rows, expected)
+        self.assertEqual(len(written), expected)
+        self.assertEqual(list(written[0]), result.headers)
+
+    def test_rejects_output_equal_to_input(self):
+        with open(self.input, 'rb') as f:
+            original = f.read()
+        for output in (self.input, os.path.join(self.dir, '.', 'tax.csv')):
+            with self.assertRaises(ValueError):
+                clean_file(self.input, output, chunk_size=7)
+        with open(self.input, 'rb') as f:
+            self.assertEqual(f.read(), original)
+
+
+class ProcessingOptionsTest(unittest.TestCase):
+    def test_accepts_camel_and_snake_case(self):
+        options = ProcessingOptions.from_dict({'formatMobile': 1, 'remove_whitespace': True, 'normalizeSKU': True})
+        self.assertTrue(options.format_mobile)
+        self.assertTrue(options.remove_whitespace)
+        self.assertTrue(options.normalize_sku)
+
+    def test_rejects_unknown_keys(self):
+        with self.assertRaises(ValueError) as ctx:
+            ProcessingOptions.from_dict({'formatMobile': True, 'formatPhone': True, 'trimWhitespace': True})
+        self.assertIn('formatPhone', str(ctx.exception))
+        self.assertIn('trimWhitespace', str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+정제 계획 캐시(plan.py) 점검: 적중/미적중, LRU 삭제, 캐시 키 안정성
+"""
+import unittest
+
+from laundry_engine import PlanCache, ProcessingOptions, analyze_prompt
+from laundry_engine.plan import plan_key
+
+from .samples import SAMPLE_PROMPTS
+
+HEADERS = ['고객명', '연락처', '가입일자', 'price', 'grade', 'memo']
+PROMPT = '가입일자를 yyyy.mm.dd 형식으로 변경'
+
+
+class PlanCacheTest(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = PlanCache()
+        options = ProcessingOptions(format_mobile=True)
+        plan = cache.get(PROMPT, HEADERS, options)
+        self.assertIs(cache.get(PROMPT, HEADERS, ProcessingOptions(format_mobile=True)), plan)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # 입력이 하나라도 다르면 새로 컴파일
+        variants = [
+            ('프롬프트', ('가입일자를 yyyy-mm-dd 형식으로 변경', HEADERS, options, (), None)),
+            ('헤더', (PROMPT, HEADERS[:-1], options, (), None)),
+            ('헤더 순서', (PROMPT, HEADERS[::-1], options, (), None)),
+            ('옵션', (PROMPT, HEADERS, ProcessingOptions(format_mobile=True, format_date=True), (), None)),
+            ('잠금 컬럼', (PROMPT, HEADERS, options, ('연락처',), None)),
+            ('컬럼 옵션', (PROMPT, HEADERS, options, (), {'price': 'amount'})),
+        ]
+        for name, args in variants:
+            with self.subTest(name):
+                misses = cache.misses
+                self.assertIsNot(cache.get(*args), plan)
+                self.assertEqual(cache.misses, misses + 1)
+        self.assertEqual(len(cache), len(variants) + 1)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_lru_eviction(self):
+        cache = PlanCache(maxsize=2)
+        options = ProcessingOptions()
+        a = cache.get('a 지워', HEADERS, options)
+        cache.get('b 지워', HEADERS, options)
+        self.assertIs(cache.get('a 지워', HEADERS, options), a)  # a를 최근 사용으로
+        cache.get('c 지워', HEADERS, options)                    # 가장 오래된 b 삭제
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get('a 지워', HEADERS, options), a)
+        misses = cache.misses
+        cache.get('b 지워', HEADERS, options)
+        self.assertEqual(cache.misses, misses + 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_key_ignores_set_order(self):
+        options = ProcessingOptions(clean_amount=True)
+        self.assertEqual(
+            plan_key(PROMPT, HEADERS, options, ('grade', 'memo'), {'price': 'amount', 'grade': None}),
+            plan_key(PROMPT, HEADERS, options, ('memo', 'grade'), {'grade': None, 'price': 'amount'}),
+        )
+
+    def test_key_is_stable_for_analyzed_prompts(self):
+        # 미리 분석한 프롬프트는 repr로 키를 만들므로 객체 주소 등 실행마다 달라지는 값이 들어가면 안 됨
+        options = ProcessingOptions()
+        keys = {}
+        for prompt in SAMPLE_PROMPTS:
+            with self.subTest(prompt=prompt):
+                first, second = analyze_prompt(prompt), analyze_prompt(prompt)
+                self.assertNotIn(' at 0x', repr(first))
+                key = plan_key(first, HEADERS, options)
+                self.assertEqual(plan_key(second, HEADERS, options), key)
+                keys.setdefault(key, repr(first))
+        # 분석 결과가 다른 프롬프트는 키도 다름
+        self.assertEqual(len(keys), len({repr(analyze_prompt(p)) for p in SAMPLE_PROMPTS}))
+
+    def test_analyzed_prompt_is_cached(self):
+        cache = PlanCache()
+        options = ProcessingOptions()
+        plan = cache.get(analyze_prompt(PROMPT), HEADERS, options)
+        self.assertIs(cache.get(analyze_prompt(PROMPT), HEADERS, options), plan)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+정제 프로파일러(profiler.py) 점검: 프로파일 JSON 구성과 건수, 시트별 프로파일 합산, 끄면 프로파일이 없어야 함
+"""
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from laundry_engine import ProcessingOptions, clean_batch, clean_file, open_table
+from laundry_engine.__main__ import main
+from laundry_engine.profiler import STAGES, merge_profiles
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+PROMPT = '가입일자를 yyyy.mm.dd 형식으로 변경'
+OPTIONS = ProcessingOptions(remove_whitespace=True, format_mobile=True, clean_amount=True)
+
+
+def rule_counts(profile):
+    return {(r['column'], r['step']): (r['calls'], r['cells'], r['changed']) for r in profile['rules']}
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.source = os.path.join(TEST_DATA, 'chaos_test_data.csv')
+
+    def clean(self, name, **kwargs):
+        return clean_file(self.source, os.path.join(self.dir, name), PROMPT, OPTIONS, chunk_size=25, **kwargs)
+
+    def read(self, name):
+        with open(os.path.join(self.dir, name), 'rb') as f:
+            return f.read()
+
+    def assert_profile_shape(self, profile, rows, shards):
+        self.assertEqual(set(profile), {'stages', 'rules', 'rows', 'shards'})
+        self.assertEqual(tuple(profile['stages']), STAGES)
+        self.assertTrue(all(ms >= 0 for ms in profile['stages'].values()))
+        self.assertEqual((profile['rows'], profile['shards']), (rows, shards))
+        self.assertTrue(profile['rules'])
+        for r in profile['rules']:
+            self.assertEqual(set(r), {'column', 'step', 'calls', 'cells', 'changed', 'ms'})
+            self.assertLessEqual(r['changed'], r['cells'])
+            self.assertLessEqual(r['cells'], rows)
+        # 규칙은 누적 시간 순
+        self.assertEqual([r['ms'] for r in profile['rules']], sorted((r['ms'] for r in profile['rules']), reverse=True))
+
+    def test_row_mode_profile(self):
+        plain = self.clean('plain.csv')
+        result = self.clean('profiled.csv', profile=True, analyze=True)
+        self.assertIsNone(plain.profile)
+        self.assertEqual(self.read('profiled.csv'), self.read('plain.csv'))
+        self.assert_profile_shape(result.profile, result.total_rows, result.chunks)
+        self.assertGreater(result.chunks, 1)
+        for r in result.profile['rules']:
+            self.assertEqual(r['calls'], r['cells'])  # 행 모드는 셀마다 한 번
+        steps = {r['step'] for r in result.profile['rules']}
+        self.assertTrue({'phone', 'whitespace', 'amount'} <= steps, steps)
+        self.assertGreater(result.profile['stages']['clean'], 0)
+        self.assertGreater(result.profile['stages']['detect'], 0)
+        self.assertEqual(json.loads(json.dumps(result.profile)), result.profile)
+
+    def test_columnar_and_parallel_counts(self):
+        serial = self.clean('serial.csv', profile=True)
+        parallel = self.clean('parallel.csv', profile=True, workers=2)
+        # 병렬 실행의 규칙 통계는 워커 합계이므로 건수가 같아야 함
+        self.assertEqual(rule_counts(parallel.profile), rule_counts(serial.profile))
+        self.assertEqual(self.read('parallel.csv'), self.read('serial.csv'))
+
+        columnar = self.clean('columnar.csv', profile=True, mode='columnar')
+        self.assert_profile_shape(columnar.profile, columnar.total_rows, columnar.chunks)
+        # 커널 단계는 청크마다 한 번, 셀 함수 단계는 셀마다 한 번
+        expected = {key: cells for key, (_, cells, _) in rule_counts(serial.profile).items()}
+        for r in columnar.profile['rules']:
+            with self.subTest(column=r['column'], step=r['step']):
+                self.assertIn(r['calls'], (columnar.chunks, r['cells']))
+                self.assertEqual(r['cells'], expected.get((r['column'], r['step']), r['cells']))
+
+    def test_batch_merges_sheet_profiles(self):
+        inputs = os.path.join(self.dir, 'inputs')
+        os.makedirs(inputs)
+        for name in ('chaos_test_data.csv', 'large_complex_data.csv', 'chaos_test_data.xlsx'):
+            shutil.copy(os.path.join(TEST_DATA, name), inputs)
+        batch = clean_batch([inputs], os.path.join(self.dir, 'out'), PROMPT, OPTIONS, chunk_size=25, workers=1, profile=True)
+        self.assertFalse(batch.failures)
+        profiles = [r.profile for r in batch.results]
+        merged = batch.profile()
+        self.assertEqual(merged, merge_profiles(profiles))
+        self.assertEqual(merged['rows'], batch.total_rows)
+        self.assertEqual(merged['shards'], sum(r.chunks for r in batch.results))
+
+        expected = {}
+        for profile in profiles:
+            for key, counts in rule_counts(profile).items():
+                expected[key] = tuple(a + b for a, b in zip(expected.get(key, (0, 0, 0)), counts))
+        self.assertEqual(rule_counts(merged), expected)
+        for stage in STAGES:
+            self.assertAlmostEqual(merged['stages'][stage], sum(p['stages'][stage] for p in profiles), places=2)
+
+        with open(batch.report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['summary']['profile'], merged)
+        self.assertEqual([s['profile'] for s in report['sheets']], profiles)
+
+    def test_disabled_leaves_no_profile(self):
+        self.assertIsNone(merge_profiles([None, None]))
+        batch = clean_batch([self.source], os.path.join(self.dir, 'out'), PROMPT, OPTIONS, chunk_size=25, workers=1)
+        self.assertEqual([r.profile for r in batch.results], [None])
+        self.assertIsNone(batch.profile())
+        report = batch.to_report()
+        self.assertNotIn('profile', report['summary'])
+        self.assertNotIn('profile', report['sheets'][0])
+
+    def test_cli_writes_profile(self):
+        path = os.path.join(self.dir, 'profile.json')
+        output = os.path.join(self.dir, 'cli.csv')
+        args = [self.source, output, '--prompt', PROMPT, '--chunk-size', '25', '--no-cache']
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(args + ['--profile', path]), 0)
+        with open(path, encoding='utf-8') as f:
+            profile = json.load(f)
+        self.assertEqual(profile['rows'], len(list(open_table(output)[1])))
+        self.assertEqual(tuple(profile['stages']), STAGES)
+        self.assertIn(path, out.getvalue())
+
+        os.remove(path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(args), 0)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
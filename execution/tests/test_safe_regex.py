@@ -0,0 +1,89 @@
+"""
+사용자 정규식 안전 실행(safe_regex.py) 점검: re 실행과 NFA 실행이 JS `String.prototype.replace`와 같은 결과를 내야 합니다.
+"""
+import copy
+import random
+import re
+import unittest
+
+from laundry_engine.safe_regex import NATIVE_MAX_LENGTH, compile_safe_pattern
+from laundry_engine.utils import js_sub
+
+# (패턴, 플래그, 치환 문자열, 입력, Node.js 결과) — 빈 일치/게으른 반복/빈 반복 캡처
+JS_CASES = [
+    ('a*?', 'g', '-', 'aab', '-a-a-b-'),
+    ('a??', 'g', '[$&]', 'aa', '[]a[]a[]'),
+    ('.*?', 'g', '$`|', 'ab1', '|aa|bab|1ab1|'),
+    ('x*', 'g', '-', 'abxd', '-a-b--d-'),
+    ('(a|)??', 'g', '<$&>', 'a', '<>a<>'),
+    (r'\s*?', 'g', '-', 'a a1', '-a- -a-1-'),
+    (r'\bb?a??', 'g', '[$&]', 'aab a', '[]aab[] []a[]'),
+    ('(a|)+', '', '[$1]', 'a 1', '[a] 1'),
+    ('(a|){0,2}', 'g', '[$1]', 'aaaa11a', '[a][a][]1[]1[a][]'),
+    (r'\d*(a|){0,2}a+?', '', '[$1]', 'aa1', '[a]1'),
+    ('[ab](a|)*', '', '[$1]', '1aa1', '1[a]1'),
+    ('(b?a?)+', 'g', '[$1]', 'baab1', '[b][]1[]'),
+    ('a*', '', '-', 'baaac', '-baaac'),
+    ('$', 'g', '-', 'ab', 'ab-'),
+]
+
+ATOMS = ['a', 'b', 'A', '.', '[ab]', '[^a]', r'\d', r'\s', r'\b', '^', '$', '(a|)', '(a|b)', '(b?a?)', '(?:ab|a)', '(a)', '']
+QUANTIFIERS = ['', '', '*', '+', '?', '*?', '+?', '??', '{0,2}', '{1,2}?']
+
+
+def vm_sub(pattern, template, text):
+    """같은 패턴을 NFA로만 실행 (캐시된 객체는 바꾸지 않음)"""
+    linear = copy.copy(pattern)
+    linear.mode = 'linear'
+    return linear.sub(template, text)
+
+
+def fuzz_corpus(seed, count):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        atoms = [rnd.choice(ATOMS) for _ in range(rnd.randint(1, 3))]
+        # 빈 원자 뒤 반복은 앞 반복과 붙어 JS 문법 오류인 소유 반복(`a?+`)이 되므로 붙이지 않음
+        source = ''.join(a + (rnd.choice(QUANTIFIERS) if a and rnd.random() < 0.6 else '') for a in atoms)
+        text = ''.join(rnd.choice('aab 1') for _ in range(rnd.randint(0, 8)))
+        yield source, rnd.choice(['g', '', 'gi', 'i']), rnd.choice(['-', '<$&>', '[$1]', '$`|']), text
+
+
+class SafePatternTest(unittest.TestCase):
+    def test_matches_javascript(self):
+        for source, flags, template, text, expected in JS_CASES:
+            with self.subTest(source=source, flags=flags, text=text):
+                pattern = compile_safe_pattern(source, flags)
+                self.assertEqual(pattern.sub(template, text), expected)
+                self.assertEqual(vm_sub(pattern, template, text), expected)
+
+    def test_js_sub_advances_past_empty_match(self):
+        # re.sub은 빈 일치 뒤 같은 위치의 'a'를 다시 일치시키지만 JS는 다음 글자부터 찾음
+        self.assertEqual(js_sub(re.compile('a*?'), '-', 'aab'), '-a-a-b-')
+        self.assertEqual(js_sub(re.compile('a??'), '[$&]', 'aa'), '[]a[]a[]')
+        self.assertEqual(js_sub(re.compile('a*?'), '-', 'aab', count=1), '-aab')
+        self.assertEqual(js_sub(re.compile('-'), '$$', '0-1-2'), '0$1$2')
+
+    def test_native_matches_linear_on_fuzz_corpus(self):
+        checked = 0
+        for source, flags, template, text in fuzz_corpus(seed=7, count=3000):
+            try:
+                re.compile(source)
+            except re.error:
+                continue
+            pattern = compile_safe_pattern(source, flags)
+            if pattern is None or pattern._vm is None:
+                continue
+            checked += 1
+            with self.subTest(source=source, flags=flags, template=template, text=text):
+                self.assertEqual(pattern.sub(template, text), vm_sub(pattern, template, text))
+        self.assertGreater(checked, 2000)
+
+    def test_long_cells_keep_native_result(self):
+        # NATIVE_MAX_LENGTH를 넘는 셀은 NFA로 실행되므로 짧은 셀과 같은 규칙이어야 함
+        pattern = compile_safe_pattern('a*?', 'g')
+        text = 'ab' * (NATIVE_MAX_LENGTH // 2 + 1)
+        self.assertEqual(pattern.sub('-', text), js_sub(pattern._native, '-', text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+"""
+로컬 작업 서비스(service.py) 점검: 결과 경로 제한, SSE 구독 해제, 요청 본문 길이, 파일 전송, 깨진 풀 교체, 끝난 작업 정리
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from laundry_engine import service as service_module
+from laundry_engine.service import (
+    FILE_BLOCK_SIZE,
+    MAX_BODY_BYTES,
+    Job,
+    JobService,
+    JobSpec,
+    RequestError,
+    _read_request,
+    _send_events,
+    _send_file,
+)
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+
+class JobSpecOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.root = os.path.join(self.dir, 'jobs')
+        self.input = os.path.join(TEST_DATA, 'tax_chaos.csv')
+
+    def spec(self, **body):
+        return JobSpec.from_request({'input': self.input, **body}, 'job1', self.root)
+
+    def test_allocates_name_per_job(self):
+        spec = self.spec()
+        self.assertEqual(spec.output_path, os.path.join(os.path.realpath(self.root), 'job1_tax_chaos_clean.csv'))
+
+    def test_resolves_output_under_root(self):
+        root = os.path.realpath(self.root)
+        self.assertEqual(self.spec(output='a/out.csv').output_path, os.path.join(root, 'a', 'out.csv'))
+        self.assertEqual(self.spec(output=os.path.join(self.root, 'b.xlsx')).output_path, os.path.join(root, 'b.xlsx'))
+
+    def test_rejects_output_outside_root(self):
+        for output in ('../escape.csv', os.path.join(self.dir, 'escape.csv'), os.path.abspath(self.input)):
+            with self.subTest(output=output), self.assertRaises(RequestError) as ctx:
+                self.spec(output=output)
+            self.assertEqual(ctx.exception.status, 400)
+
+    def test_rejects_output_equal_to_input(self):
+        os.makedirs(self.root)
+        self.input = os.path.join(self.root, 'in.csv')
+        shutil.copy(os.path.join(TEST_DATA, 'tax_chaos.csv'), self.input)
+        with self.assertRaises(RequestError):
+            self.spec(output='in.csv')
+        with self.assertRaises(RequestError):
+            self.spec(output=os.path.join(self.root, '.', 'in.csv'))
+
+
+class _ClosedWriter:
+    """구독 도중 클라이언트가 연결을 끊은 스트림"""
+
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        raise ConnectionResetError('peer closed')
+
+
+class _Subscriptions:
+    def __init__(self):
+        self.queues = []
+
+    def subscribe(self, job):
+        queue = asyncio.Queue()
+        queue.put_nowait({'type': 'PROGRESS', 'rows': 1})
+        self.queues.append(queue)
+        return queue
+
+    def unsubscribe(self, job, queue):
+        self.queues.remove(queue)
+
+
+class SendEventsTest(unittest.TestCase):
+    def test_unsubscribes_when_client_disconnects(self):
+        service = _Subscriptions()
+        job = Job(id='job1', spec=JobSpec(input_path='in.csv', output_path='out.csv'))
+        asyncio.run(_send_events(_ClosedWriter(), service, job))
+        self.assertEqual(service.queues, [])
+
+
+async def _read(raw):
+    reader = asyncio.StreamReader()
+    reader.feed_data(raw)
+    reader.feed_eof()
+    return await _read_request(reader)
+
+
+class ReadRequestTest(unittest.TestCase):
+    def test_reads_body(self):
+        method, path, headers, body = asyncio.run(_read(b'POST /jobs?x=1 HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}'))
+        self.assertEqual((method, path, headers['content-length'], body), ('POST', '/jobs', '2', b'{}'))
+        self.assertEqual(asyncio.run(_read(b'GET /jobs HTTP/1.1\r\n\r\n'))[3], b'')
+
+    def test_rejects_bad_content_length(self):
+        cases = [('abc', 400), ('-1', 400), ('1.5', 400), (str(MAX_BODY_BYTES + 1), 413)]
+        for value, status in cases:
+            with self.subTest(value=value), self.assertRaises(RequestError) as ctx:
+                asyncio.run(_read(f'POST /jobs HTTP/1.1\r\nContent-Length: {value}\r\n\r\n'.encode('latin-1') + b'{}'))
+            self.assertEqual(ctx.exception.status, status)
+
+
+class _BufferWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+class SendFileTest(unittest.TestCase):
+    def test_reads_off_event_loop(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'out.csv')
+        content = os.urandom(FILE_BLOCK_SIZE * 3 + 5)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        threads = []
+
+        def tracked_open(*args):
+            threads.append(threading.get_ident())
+            return open(*args)
+
+        writer = _BufferWriter()
+        with mock.patch.object(service_module, 'open', tracked_open, create=True):
+            asyncio.run(_send_file(writer, path))
+        head, _, body = bytes(writer.data).partition(b'\r\n\r\n')
+        self.assertIn(f'Content-Length: {len(content)}'.encode(), head)
+        self.assertIn(b'filename="out.csv"', head)
+        self.assertEqual(body, content)
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+
+class _BrokenPool:
+    """제출한 작업이 모두 BrokenProcessPool로 끝나는 풀"""
+
+    def __init__(self):
+        self.futures = []
+        self.shutdowns = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def break_all(self):
+        for future in self.futures:
+            future.set_exception(BrokenProcessPool('worker died'))
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns.append((wait, cancel_futures))
+
+
+class JobServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.input = os.path.join(TEST_DATA, 'tax_chaos.csv')
+
+    def make_service(self, **kwargs):
+        service = JobService(concurrency=2, output_dir=self.dir, **kwargs)
+        self.addCleanup(service._manager.shutdown)
+        self.addCleanup(service._pool.shutdown)
+        return service
+
+    def test_broken_pool_is_replaced_once(self):
+        service = self.make_service()
+        broken = _BrokenPool()
+        replacement = _BrokenPool()
+        service._pool = broken  # 실제 풀은 make_service에서 정리
+
+        async def run():
+            with mock.patch.object(service, '_new_pool', return_value=replacement) as new_pool:
+                jobs = [service.submit({'input': self.input}) for _ in range(2)]
+                while len(broken.futures) < 2:
+                    await asyncio.sleep(0)
+                broken.break_all()
+                await asyncio.gather(*(job.task for job in jobs))
+            return jobs, new_pool.call_count
+
+        jobs, created = asyncio.run(run())
+        self.assertEqual(created, 1)
+        self.assertIs(service._pool, replacement)
+        self.assertEqual(broken.shutdowns, [(False, True)])
+        self.assertEqual([job.status for job in jobs], ['failed', 'failed'])
+        self.assertTrue(all('비정상 종료' in job.error for job in jobs))
+
+    def add_job(self, service, job_id):
+        job = Job(id=job_id, spec=JobSpec(input_path=self.input, output_path=os.path.join(self.dir, f'{job_id}.csv')))
+        service.jobs[job_id] = job
+        return job
+
+    def test_evicts_oldest_finished_jobs(self):
+        service = self.make_service(max_finished_jobs=2)
+        running = self.add_job(service, 'running')
+        running.status = 'running'
+        for job_id in ('a', 'b', 'c'):
+            service._finish(self.add_job(service, job_id), 'done', {'type': 'COMPLETE'})
+        self.assertEqual(list(service.jobs), ['running', 'b', 'c'])
+        self.add_job(service, 'queued')
+        service._finish(service.jobs['queued'], 'cancelled', {'type': 'CANCELLED'})
+        self.assertEqual(list(service.jobs), ['running', 'c', 'queued'])
+
+    def test_evicts_expired_finished_jobs(self):
+        service = self.make_service(job_ttl=60)
+        clock = mock.Mock(return_value=1000.0)
+        with mock.patch.object(service_module.time, 'time', clock):
+            service._finish(self.add_job(service, 'old'), 'done', {'type': 'COMPLETE'})
+            clock.return_value = 1030.0
+            service._finish(self.add_job(service, 'new'), 'done', {'type': 'COMPLETE'})
+            self.assertEqual(set(service.jobs), {'old', 'new'})
+            clock.return_value = 1061.0
+            service._evict_finished()
+            self.assertEqual(set(service.jobs), {'new'})
+            clock.return_value = 1091.0
+            service._evict_finished()
+        self.assertEqual(service.jobs, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+파싱 결과 캐시(table_cache.py) 점검: 캐시에서 다시 연 행이 원본 파싱 결과와 같아야 합니다.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from laundry_engine import TableCache, open_table
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'test_data')
+
+
+class TableCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_round_trip_matches_parser(self):
+        cache = TableCache(self.dir)
+        for name in ('large_complex_data.xlsx', 'chaos_test_data.xlsx'):
+            with self.subTest(file=name):
+                path = os.path.join(TEST_DATA, name)
+                expected_headers, rows = open_table(path)
+                expected = list(rows)
+                for _ in range(2):
+                    headers, rows = cache.open(path, chunk_size=7)
+                    self.assertEqual(headers, expected_headers)
+                    self.assertEqual(list(rows), expected)
+        self.assertEqual((cache.misses, cache.hits), (2, 2))
+
+    def test_mixed_value_kinds(self):
+        # CSV는 기본 캐시 대상이 아니므로 확장자를 지정해 문자열 외 값(행마다 다른 키)을 점검
+        path = os.path.join(self.dir, 'mixed.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('이름,금액\n홍길동,1000\n,\n김철수,1e3\n')
+        cache = TableCache(os.path.join(self.dir, 'cache'), extensions=('csv',))
+        rows = [{'이름': '가', '금액': 1}, {'이름': None, '금액': 2.5, '비고': True}, {'금액': False}, {'이름': ''}]
+        digest = 'mixed'
+        list(cache._iter_and_store(digest, ['이름', '금액'], iter(rows)))
+        table = cache.load(digest)
+        self.addCleanup(table.close)
+        self.assertEqual(list(table.iter_rows(2)), rows)
+        for _ in range(2):  # 처음은 파싱하며 저장, 두 번째는 캐시에서 읽음
+            self.assertEqual(list(cache.open(path)[1]), list(open_table(path)[1]))
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+    def test_partial_read_is_not_stored(self):
+        cache = TableCache(self.dir)
+        path = os.path.join(TEST_DATA, 'chaos_test_data.xlsx')
+        _, rows = cache.open(path, chunk_size=7)
+        next(rows)
+        rows.close()
+        self.assertEqual(cache.entries(), [])
+
+    def test_evicts_over_limit(self):
+        cache = TableCache(self.dir)
+        for name in ('large_complex_data.xlsx', 'chaos_test_data.xlsx'):
+            list(cache.open(os.path.join(TEST_DATA, name))[1])
+        sizes = sorted(size for _, size, _ in cache.entries())
+        cache.max_bytes = sizes[-1]
+        self.assertEqual(cache.evict(), 1)
+        self.assertEqual(len(cache.entries()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
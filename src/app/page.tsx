@@ -4,7 +4,8 @@ import { useState, useCallback, useEffect, useRef } from 'react';
 import { DataIssue, DataRow, ColumnOptionType, CleaningPreset } from '@/types';
 import { useDataFlow } from '@/hooks/useDataFlow';
 import { useCleaningOptions, INITIAL_OPTIONS } from '@/hooks/useCleaningOptions';
-import { downloadData } from '@/lib/core/exporters';
+import { useBatchCleaning } from '@/hooks/useBatchCleaning';
+import { downloadData, downloadProfile } from '@/lib/core/exporters';
 
 // Components
 import { Header } from '@/components/dashboard/Header';
@@ -15,6 +16,8 @@ import { AnalysisReport } from '@/components/dashboard/AnalysisReport';
 import { ResultSummary } from '@/components/dashboard/ResultSummary';
 import { DataPreviewTable } from '@/components/dashboard/DataPreviewTable';
 import { DownloadSection } from '@/components/dashboard/DownloadSection';
+import { BatchSection } from '@/components/dashboard/BatchSection';
+import { ProfilePanel } from '@/components/dashboard/ProfilePanel';
 import { DonateModal, GuideModal, HelpModal, TermsModal, FixModal, FormatGuideModal, ConfirmModal, AlertModal } from '@/components/dashboard/Modals';
 import { LoadingOverlay } from '@/components/processing/LoadingOverlay';
 import { AdBanner } from '@/components/dashboard/AdBanner';
@@ -28,10 +31,12 @@ export default function DataCleanDashboard() {
     file,
     data,
     processedData,
+    changes,
     headers,
     isProcessing,
     progress,
     progressMessage,
+    readyRows,
     // ... rest of hooks
     error,
     issues,
@@ -42,9 +47,13 @@ export default function DataCleanDashboard() {
     setColumnLimits,
     handleFileSelect,
     startProcessing,
+    cancelProcessing,
     updateCell,
+    updateCells,
     updateHeader,
     toggleLock,
+    duplicateKeys,
+    toggleDuplicateKey,
     updateColumnLimit,
     setError,
     resetData,
@@ -52,7 +61,11 @@ export default function DataCleanDashboard() {
     columnOptions,
     updateColumnOption,
     initialStats,
-    applyProcessedToOriginal
+    applyProcessedToOriginal,
+    profiling,
+    toggleProfiling,
+    profile,
+    recordProfileStage
   } = useDataFlow();
 
   const handleApplyProcessed = () => {
@@ -72,6 +85,7 @@ export default function DataCleanDashboard() {
   };
 
   const { options, setOptions, prompt, setPrompt } = useCleaningOptions();
+  const batch = useBatchCleaning(); // 여러 파일/시트 일괄 정제
 
   // 2. UI State (Modals & Filters)
   const [showAllIssues, setShowAllIssues] = useState(false);
@@ -103,7 +117,7 @@ export default function DataCleanDashboard() {
     // isProcessing이 true였다가 false로 바뀌는 순간(정제 완료)을 정확히 감지
     const justFinished = prevIsProcessingRef.current === true && isProcessing === false;
 
-    if (justFinished && processedData.length > 0) {
+    if (justFinished && processedData.rowCount > 0) {
       // 1. 미리보기 섹션으로 스크롤 이동
       const scrollTimer = setTimeout(() => {
         previewRef.current?.scrollIntoView({ behavior: 'smooth', block: 'start' });
@@ -116,7 +130,7 @@ export default function DataCleanDashboard() {
 
     // 현재 상태를 ref에 저장하여 다음 렌더링 시 비교
     prevIsProcessingRef.current = isProcessing;
-  }, [isProcessing, processedData.length]);
+  }, [isProcessing, processedData.rowCount]);
 
   // Modals State
   const [donateModalOpen, setDonateModalOpen] = useState(false);
@@ -141,8 +155,15 @@ export default function DataCleanDashboard() {
   });
 
   // 3. Handlers
+  // 첫 번째 파일은 화면에서 정제하고, 선택한 파일 전체는 일괄 정제 대상으로 시트 목록을 모음
+  const selectFiles = (files: FileList | null | undefined) => {
+    if (!files?.[0]) return;
+    handleFileSelect(files[0]);
+    batch.selectFiles(Array.from(files));
+  };
+
   const onFileSelect = (e: React.ChangeEvent<HTMLInputElement>) => {
-    if (e.target.files?.[0]) handleFileSelect(e.target.files[0]);
+    selectFiles(e.target.files);
   };
 
   const handleDragOver = (e: React.DragEvent) => {
@@ -153,7 +174,7 @@ export default function DataCleanDashboard() {
   const handleDrop = (e: React.DragEvent) => {
     e.preventDefault();
     e.stopPropagation();
-    if (e.dataTransfer.files?.[0]) handleFileSelect(e.dataTransfer.files[0]);
+    selectFiles(e.dataTransfer.files);
   };
 
   const handleProcess = () => {
@@ -176,10 +197,30 @@ export default function DataCleanDashboard() {
     startProcessing(prompt, options);
   };
 
-  const handleDownload = () => {
+  const handleDownload = async () => {
     if (!file) return;
     const fileName = `cleaned_${file.name.replace(/\.[^/.]+$/, "")}.xlsx`;
-    downloadData(processedData, fileName, data, options.highlightChanges);
+    try {
+      const started = performance.now();
+      await downloadData(processedData, fileName, changes, options.highlightChanges);
+      if (profiling) recordProfileStage('export', performance.now() - started);
+    } catch (err) {
+      setAlertConfig({
+        open: true,
+        title: "다운로드 실패",
+        description: `파일을 저장하지 못했습니다.\n${String(err)}`,
+        type: 'info'
+      });
+    }
+  };
+
+  const handleProfileDownload = () => {
+    if (!file || !profile) return;
+    downloadProfile(profile, `profile_${file.name.replace(/\.[^/.]+$/, "")}.json`);
+  };
+
+  const handleBatchStart = () => {
+    batch.start({ prompt, options, lockedColumns, columnLimits, columnOptions });
   };
 
   // Issue Suggestion Application (Single Issue) - Targeted to Column
@@ -298,10 +339,8 @@ export default function DataCleanDashboard() {
 
     const { column, affectedRows } = targetFixIssue;
 
-    // Update affected cells locally
-    affectedRows.forEach(rowIdx => {
-      updateCell(rowIdx, column, replacementValue);
-    });
+    // Update affected cells locally (한 번에 반영해 컬럼 복사를 한 번만 수행)
+    updateCells(affectedRows, column, replacementValue);
 
     // Close modal and clear fix state
     setFixModalOpen(false);
@@ -376,6 +415,7 @@ export default function DataCleanDashboard() {
                 onDragLeave={() => { }}
                 onDrop={handleDrop}
                 onFileSelect={onFileSelect}
+                extraFileCount={Math.max(0, new Set(batch.sources.map(s => s.file)).size + batch.failures.length - 1)}
               />
             </section>
 
@@ -390,6 +430,7 @@ export default function DataCleanDashboard() {
                 progress={progress}
                 progressMessage={progressMessage}
                 onProcess={handleProcess}
+                onCancel={cancelProcessing}
                 fileLoaded={!!file}
                 detectedDateColumns={detectedDateColumns}
                 columnOptions={columnOptions}
@@ -435,9 +476,12 @@ export default function DataCleanDashboard() {
                 <DataPreviewTable
                   processedData={processedData}
                   originalData={data}
+                  changes={changes}
                   headers={headers}
                   lockedColumns={lockedColumns}
                   toggleLock={toggleLock}
+                  duplicateKeys={duplicateKeys}
+                  toggleDuplicateKey={toggleDuplicateKey}
                   columnLimits={columnLimits}
                   onLimitChange={updateColumnLimit}
                   onHeaderRename={updateHeader}
@@ -467,7 +511,30 @@ export default function DataCleanDashboard() {
                 <div id="section-download" className="animation-fade-in">
                   <DownloadSection
                     handleDownload={handleDownload}
-                    rowCount={processedData.length}
+                    rowCount={processedData.rowCount}
+                  />
+                </div>
+
+                <div id="section-batch" className="animation-fade-in">
+                  <BatchSection
+                    sources={batch.sources}
+                    failures={batch.failures}
+                    isRunning={batch.isRunning}
+                    progress={batch.progress}
+                    progressMessage={batch.progressMessage}
+                    report={batch.report}
+                    error={batch.error}
+                    onStart={handleBatchStart}
+                    onCancel={batch.cancel}
+                  />
+                </div>
+
+                <div id="section-profile" className="animation-fade-in">
+                  <ProfilePanel
+                    enabled={profiling}
+                    onToggle={toggleProfiling}
+                    profile={profile}
+                    onDownload={handleProfileDownload}
                   />
                 </div>
               </div>
@@ -523,11 +590,12 @@ export default function DataCleanDashboard() {
         onApply={handleApplyFix}
       />
 
-      {/* Full Screen Loading Overlay */}
+      {/* Full Screen Loading Overlay (정제된 앞 구간이 미리보기에 표시되기 시작하면 가리지 않음) */}
       <LoadingOverlay
-        isVisible={delayedShowLoading}
+        isVisible={delayedShowLoading && readyRows === 0}
         progress={progress}
         message={progressMessage}
+        onCancel={cancelProcessing}
       />
 
       {/* Alert & Confirm Modals */}
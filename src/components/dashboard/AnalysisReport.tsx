@@ -60,12 +60,15 @@ export function AnalysisReport({
                                 onClick={() => {
                                     if (issue.fixType === 'maxLength') {
                                         onOpenFixModal(issue);
+                                    } else if (issue.fixType === 'duplicate') {
+                                        // 중복 행은 원본 행 순서를 유지해야 하므로 자동 삭제 대신 그룹별로 모아 보여줌
+                                        setFilterIssue(filterIssue === issue ? null : issue);
                                     } else {
                                         onApplySuggestion(issue);
                                     }
                                 }}
                             >
-                                {issue.fixType === 'maxLength' ? '수정하기' : (issue.promptSuggestion ? '정제 제안' : '옵션 적용')}
+                                {issue.fixType === 'maxLength' ? '수정하기' : issue.fixType === 'duplicate' ? '중복 보기' : (issue.promptSuggestion ? '정제 제안' : '옵션 적용')}
                             </Button>
 
                             {issue.affectedRows && issue.affectedRows.length > 0 && (
@@ -0,0 +1,117 @@
+import { Layers, Download, X } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent } from '@/components/ui/card';
+import { SheetSource } from '@/lib/core/parsers';
+import { BatchReport, BatchSheetReport } from '@/lib/batch';
+
+interface BatchSectionProps {
+    sources: SheetSource[];
+    failures: BatchSheetReport[];
+    isRunning: boolean;
+    progress: number;
+    progressMessage: string;
+    report: BatchReport | null;
+    error: string | null;
+    onStart: () => void;
+    onCancel: () => void;
+}
+
+/**
+ * 여러 파일/시트 일괄 정제 섹션 컴포넌트
+ * 선택한 파일들의 모든 시트를 현재 프롬프트/옵션으로 정제해 zip으로 내려받고, 시트별 요약 보고서를 표시합니다.
+ * 시트가 하나뿐이면 표시하지 않습니다.
+ *
+ * @param sources 일괄 정제할 시트 목록
+ * @param failures 시트 목록을 읽지 못한 파일
+ * @param report 마지막 일괄 정제 보고서
+ */
+export function BatchSection({ sources, failures, isRunning, progress, progressMessage, report, error, onStart, onCancel }: BatchSectionProps) {
+    if (sources.length + failures.length <= 1) return null;
+
+    const fileCount = new Set([...sources.map(s => s.file.name), ...failures.map(f => f.fileName)]).size;
+
+    return (
+        <Card className="border-blue-200 bg-blue-50/40 shadow-sm animate-in fade-in slide-in-from-bottom-5">
+            <CardContent className="p-6 flex flex-col gap-3">
+                <div className="flex items-center justify-between">
+                    <div className="font-medium text-blue-700 flex items-center gap-2">
+                        <Layers size={16} />
+                        일괄 정제
+                    </div>
+                    <div className="text-xs text-blue-600 bg-blue-100 px-2 py-1 rounded-full border border-blue-200">
+                        파일 {fileCount}개 · 시트 {sources.length}개
+                    </div>
+                </div>
+                <p className="text-xs text-slate-500">
+                    현재 프롬프트와 옵션으로 모든 시트를 정제해 시트별 CSV와 요약 보고서(report.csv, issues.csv)를 ZIP 하나로 저장합니다.
+                </p>
+
+                {isRunning ? (
+                    <div className="flex flex-col gap-2">
+                        <div className="h-2 w-full bg-blue-100 rounded-full overflow-hidden">
+                            <div className="h-full bg-blue-500 transition-all duration-300" style={{ width: `${progress}%` }} />
+                        </div>
+                        <div className="flex items-center justify-between text-xs text-slate-600">
+                            <span>{progressMessage}</span>
+                            <Button onClick={onCancel} variant="ghost" size="sm" className="h-7 text-slate-500 hover:text-red-600">
+                                <X size={14} className="mr-1" />
+                                취소
+                            </Button>
+                        </div>
+                    </div>
+                ) : (
+                    <Button
+                        onClick={onStart}
+                        variant="outline"
+                        disabled={sources.length === 0}
+                        className="w-full border-blue-300 hover:bg-blue-100 hover:text-blue-800 text-blue-700 transition-colors h-10"
+                    >
+                        <Download size={16} className="mr-2" />
+                        전체 시트 정제 후 ZIP 다운로드
+                    </Button>
+                )}
+
+                {error && <div className="p-3 bg-red-50 text-red-600 text-sm rounded-lg">{error}</div>}
+
+                {report && (
+                    <div className="overflow-x-auto">
+                        <table className="w-full text-xs text-left">
+                            <thead className="text-slate-500 border-b border-blue-100">
+                                <tr>
+                                    <th className="py-1.5 pr-2 font-medium">파일 / 시트</th>
+                                    <th className="py-1.5 px-2 font-medium text-right">행 수</th>
+                                    <th className="py-1.5 px-2 font-medium text-right">변경 셀</th>
+                                    <th className="py-1.5 px-2 font-medium text-right">품질 점수</th>
+                                    <th className="py-1.5 pl-2 font-medium text-right">이슈</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {report.sheets.map((s, i) => (
+                                    <tr key={i} className="border-b border-blue-50 text-slate-700">
+                                        <td className="py-1.5 pr-2">
+                                            {s.fileName}{s.sheetName ? ` / ${s.sheetName}` : ''}
+                                            {s.error && <span className="ml-2 text-red-600">실패: {s.error}</span>}
+                                        </td>
+                                        <td className="py-1.5 px-2 text-right">{s.error ? '-' : s.rowCount.toLocaleString()}</td>
+                                        <td className="py-1.5 px-2 text-right">{s.stats ? s.stats.changedCells.toLocaleString() : '-'}</td>
+                                        <td className="py-1.5 px-2 text-right">{s.stats ? s.stats.qualityScore : '-'}</td>
+                                        <td className="py-1.5 pl-2 text-right">{s.error ? '-' : s.issues.length}</td>
+                                    </tr>
+                                ))}
+                            </tbody>
+                            <tfoot>
+                                <tr className="font-medium text-blue-800">
+                                    <td className="py-1.5 pr-2">합계 ({(report.elapsedMs / 1000).toFixed(1)}초{report.failed > 0 ? `, 실패 ${report.failed}개` : ''})</td>
+                                    <td className="py-1.5 px-2 text-right">{report.totalRows.toLocaleString()}</td>
+                                    <td className="py-1.5 px-2 text-right">{report.stats ? report.stats.changedCells.toLocaleString() : '-'}</td>
+                                    <td className="py-1.5 px-2 text-right">{report.stats ? report.stats.qualityScore : '-'}</td>
+                                    <td className="py-1.5 pl-2 text-right">{report.sheets.reduce((n, s) => n + s.issues.length, 0)}</td>
+                                </tr>
+                            </tfoot>
+                        </table>
+                    </div>
+                )}
+            </CardContent>
+        </Card>
+    );
+}
@@ -23,6 +23,7 @@ interface CleaningOptionsProps {
     progress: number;
     progressMessage: string;
     onProcess: () => void;
+    onCancel?: () => void;
     fileLoaded: boolean;
     detectedDateColumns?: number;
     columnOptions?: ColumnSpecificOptions;
@@ -42,6 +43,7 @@ export function CleaningOptions({
     progress,
     progressMessage,
     onProcess,
+    onCancel,
     fileLoaded,
     detectedDateColumns = 0,
     columnOptions = {},
@@ -287,7 +289,7 @@ export function CleaningOptions({
             />
             <CardFooter className="pt-2 flex flex-col gap-2">
                 {isProcessing ? (
-                    <ProcessingStatus progress={progress} message={progressMessage} />
+                    <ProcessingStatus progress={progress} message={progressMessage} onCancel={onCancel} />
                 ) : (
                     <div className="flex flex-col sm:flex-row gap-2 w-full">
                         <Button
@@ -1,6 +1,6 @@
 import { useState, useMemo, useRef, useEffect } from 'react';
 import {
-    Lock, Unlock, Table as TableIcon, Settings, Calendar, Clock, RefreshCw,
+    Lock, Unlock, Copy, Table as TableIcon, Settings, Calendar, Clock, RefreshCw,
     Smartphone, Phone as PhoneIcon, Mail, Link as LinkIcon, UserCheck,
     Banknote, Landmark, Hash, Globe, CreditCard, ShoppingCart, Ruler,
     Instagram, Tag, Sparkles, CheckCircle2, MapPin, Code, Smile, Type
@@ -9,16 +9,22 @@ import { Button } from '@/components/ui/button';
 import { Card } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { cn } from '@/lib/utils';
-import { DataRow, DataIssue, ColumnSpecificOptions, ColumnOptionType } from '@/types';
+import { DataIssue, DataRow, ColumnSpecificOptions, ColumnOptionType } from '@/types';
 import { getHeaderRecommendations, recommendColumnFormat } from '@/lib/core/analyzers';
+import { ChangeSet, getChange, getColumnIndex } from '@/lib/core/changes';
+import { DataTable, getTableColumnIndex, getTableRow, getTableValue } from '@/lib/core/table';
+import { getTableSample } from '@/lib/core/sampling';
 
 
 interface DataPreviewTableProps {
-    processedData: DataRow[];
-    originalData: DataRow[];
+    processedData: DataTable;
+    originalData: DataTable;
+    changes: ChangeSet | null;
     headers: string[];
     lockedColumns: string[];
     toggleLock: (header: string) => void;
+    duplicateKeys: string[];
+    toggleDuplicateKey: (header: string) => void;
     columnLimits: Record<string, number>;
     onLimitChange: (header: string, limit: number) => void;
     onHeaderRename: (oldName: string, newName: string) => void;
@@ -34,11 +40,14 @@ interface DataPreviewTableProps {
  * 데이터 미리보기 및 수정 테이블 컴포넌트
  * 페이지네이션, 셀 직접 수정, 헤더 수정, 삭제 잠금, 컬럼 길이 설정 등의 기능을 제공합니다.
  * 
- * @param processedData 정제된 데이터 배열
- * @param originalData 원본 데이터 배열 (변경 사항 비교용)
+ * @param processedData 정제된 데이터 테이블
+ * @param originalData 원본 데이터 테이블 (변경 전 값 표시용)
+ * @param changes 셀 변경 기록 (변경 여부 표시용, 없으면 변경 없음)
  * @param headers 현재 헤더 목록
  * @param lockedColumns 잠금 처리된 컬럼 목록
  * @param toggleLock 잠금 토글 핸들러
+ * @param duplicateKeys 중복 검사 기준 컬럼 목록
+ * @param toggleDuplicateKey 중복 검사 기준 토글 핸들러
  * @param columnLimits 컬럼별 길이 제한 설정값
  * @param onLimitChange 길이 제한 변경 핸들러
  * @param onHeaderRename 헤더 이름 변경 핸들러
@@ -50,9 +59,12 @@ interface DataPreviewTableProps {
 export function DataPreviewTable({
     processedData,
     originalData,
+    changes,
     headers,
     lockedColumns,
     toggleLock,
+    duplicateKeys,
+    toggleDuplicateKey,
     columnLimits,
     onLimitChange,
     onHeaderRename,
@@ -72,6 +84,19 @@ export function DataPreviewTable({
 
     const tableContainerRef = useRef<HTMLDivElement>(null);
 
+    // 변경 기록의 헤더 → 컬럼 위치
+    const changeColumns = useMemo(() => (changes ? getColumnIndex(changes) : null), [changes]);
+    // 테이블의 헤더 → 컬럼 위치 (셀 값은 보이는 행만 테이블에서 조회)
+    const processedColumns = useMemo(() => getTableColumnIndex(processedData), [processedData]);
+    const originalColumns = useMemo(() => getTableColumnIndex(originalData), [originalData]);
+    // 헤더/포맷 추천용 표본 (원본의 값 모양별 층화 표본 행을 현재 정제본에서 읽음, 상위 행만 보지 않음)
+    const sampleRows = useMemo(() => {
+        const { rows } = getTableSample(originalData);
+        const picked: DataRow[] = [];
+        for (const row of rows) if (row < processedData.rowCount) picked.push(getTableRow(processedData, row));
+        return picked;
+    }, [originalData, processedData]);
+
     // Keyboard Navigation Handler
     const handleKeyDown = (e: React.KeyboardEvent) => {
         if (!selectedCell || editingCell) return; // 편집 중이거나 선택된 게 없으면 무시
@@ -139,14 +164,14 @@ export function DataPreviewTable({
     const MIN_ROWS = 10;
 
     // totalCount 선언 추가
-    const totalCount = filterIssue?.affectedRows ? filterIssue.affectedRows.length : processedData.length;
+    const totalCount = filterIssue?.affectedRows ? filterIssue.affectedRows.length : processedData.rowCount;
 
     const currentDataIndices = useMemo(() => {
         if (filterIssue?.affectedRows) {
             return filterIssue.affectedRows;
         }
-        return Array.from({ length: processedData.length }, (_, i) => i);
-    }, [filterIssue, processedData.length]);
+        return Array.from({ length: processedData.rowCount }, (_, i) => i);
+    }, [filterIssue, processedData.rowCount]);
 
     // 빈 행 개수 계산
     const emptyRows = Math.max(0, MIN_ROWS - currentDataIndices.length);
@@ -158,7 +183,7 @@ export function DataPreviewTable({
 
     return (
         <Card className="border-slate-200 shadow-sm flex flex-col bg-white overflow-visible">
-            {processedData.length > 0 ? (
+            {processedData.rowCount > 0 ? (
                 <>
                     <div
                         ref={tableContainerRef}
@@ -175,6 +200,7 @@ export function DataPreviewTable({
                                     </TableHead>
                                     {headers.map((header, idx) => {
                                         const isLocked = lockedColumns.includes(header);
+                                        const isDuplicateKey = duplicateKeys.includes(header);
                                         const isLastCols = idx >= headers.length - 2 && headers.length > 2;
                                         return (
                                             <TableHead key={header} className="font-semibold text-slate-700 py-3 relative group overflow-visible min-w-[150px]">
@@ -201,7 +227,7 @@ export function DataPreviewTable({
                                                                 )}>
                                                                     <div className="text-[10px] text-slate-400 mb-1.5 font-bold px-1 uppercase tracking-tight">추천 컬럼명</div>
                                                                     <div className="flex flex-wrap gap-1">
-                                                                        {getHeaderRecommendations(processedData, header).map(rec => (
+                                                                        {getHeaderRecommendations(sampleRows, header).map(rec => (
                                                                             <button
                                                                                 key={rec}
                                                                                 className="px-2 py-1 bg-blue-50 text-blue-600 rounded text-[11px] hover:bg-blue-600 hover:text-white transition-colors border border-blue-100"
@@ -241,6 +267,17 @@ export function DataPreviewTable({
                                                                 {isLocked ? <Lock size={14} /> : <Unlock size={14} />}
                                                             </button>
 
+                                                            <button
+                                                                onClick={() => toggleDuplicateKey(header)}
+                                                                className={cn(
+                                                                    "p-1 rounded-md transition-colors shrink-0",
+                                                                    isDuplicateKey ? "bg-amber-50 text-amber-600" : "text-slate-300 hover:text-slate-600 hover:bg-slate-100"
+                                                                )}
+                                                                title={isDuplicateKey ? "중복 검사 기준에서 빼기" : "중복 검사 기준에 넣기"}
+                                                            >
+                                                                <Copy size={14} />
+                                                            </button>
+
                                                             {/* Column Settings Menu */}
                                                             <div className="relative">
                                                                 <button
@@ -265,7 +302,7 @@ export function DataPreviewTable({
                                                                         <div className="text-[10px] text-slate-400 px-3 py-2 font-bold uppercase tracking-wider border-b border-slate-50 mb-1">컬럼 정제 포맷 설정</div>
                                                                         <div className="flex-1 overflow-y-auto custom-scrollbar pr-0.5">
                                                                             {(() => {
-                                                                                const recommended = recommendColumnFormat(processedData, header);
+                                                                                const recommended = recommendColumnFormat(sampleRows, header);
                                                                                 const categories = [
                                                                                     {
                                                                                         label: '기본 및 날짜',
@@ -431,9 +468,7 @@ export function DataPreviewTable({
                             </TableHeader>
                             <TableBody>
                                 {currentDataIndices.map((originalIdx) => {
-                                    const row = processedData[originalIdx];
-                                    const originalRow = originalData[originalIdx];
-                                    if (!row) return null;
+                                    if (originalIdx >= processedData.rowCount) return null;
 
                                     return (
                                         <TableRow key={originalIdx} className="hover:bg-blue-50/30 transition-colors group/row">
@@ -443,9 +478,9 @@ export function DataPreviewTable({
                                             </TableCell>
                                             {headers.map((header) => {
                                                 const isLocked = lockedColumns.includes(header);
-                                                const processedVal = row[header]?.toString() || '';
-                                                const originalVal = originalRow ? (originalRow[header]?.toString() || '') : '';
-                                                const isModified = originalVal !== processedVal;
+                                                const processedVal = getTableValue(processedData, originalIdx, processedColumns.get(header) ?? -1)?.toString() || '';
+                                                const originalVal = getTableValue(originalData, originalIdx, originalColumns.get(header) ?? -1)?.toString() || '';
+                                                const isModified = !!changes && getChange(changes, originalIdx, changeColumns?.get(header) ?? -1) !== 'none';
 
                                                 return (
                                                     <TableCell
@@ -3,6 +3,7 @@ import { Loader2 } from 'lucide-react';
 interface ProcessingStatusProps {
     progress: number;
     message: string;
+    onCancel?: () => void;
 }
 
 /**
@@ -11,8 +12,9 @@ interface ProcessingStatusProps {
  * 
  * @param progress 현재 진행률 (0-100)
  * @param message 현재 진행 중인 작업에 대한 설명 메시지
+ * @param onCancel (선택) 백그라운드 정제 취소 핸들러 (있으면 취소 버튼 표시)
  */
-export function ProcessingStatus({ progress, message }: ProcessingStatusProps) {
+export function ProcessingStatus({ progress, message, onCancel }: ProcessingStatusProps) {
     return (
         <div className="w-full space-y-3 p-4 bg-blue-50/50 rounded-lg animate-in fade-in zoom-in duration-300">
             <div className="flex justify-between text-sm text-blue-700 font-medium mb-1">
@@ -20,7 +22,14 @@ export function ProcessingStatus({ progress, message }: ProcessingStatusProps) {
                     <Loader2 size={14} className="animate-spin" />
                     <span>{message || '처리 준비 중...'}</span>
                 </div>
-                <span className="font-bold">{Math.round(progress)}%</span>
+                <div className="flex items-center gap-3">
+                    <span className="font-bold">{Math.round(progress)}%</span>
+                    {onCancel && (
+                        <button type="button" onClick={onCancel} className="text-xs text-slate-500 hover:text-red-600 underline">
+                            취소
+                        </button>
+                    )}
+                </div>
             </div>
             <div className="h-2 bg-blue-200 rounded-full overflow-hidden w-full">
                 <div
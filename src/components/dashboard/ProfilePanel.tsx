@@ -0,0 +1,119 @@
+import { useState } from 'react';
+import { Activity, Download } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Switch } from '@/components/ui/switch';
+import { Card, CardContent } from '@/components/ui/card';
+import { CleaningProfile, PROFILE_STAGES, ProfileStage } from '@/lib/core/profiler';
+
+interface ProfilePanelProps {
+    enabled: boolean;
+    onToggle: (enabled: boolean) => void;
+    profile: CleaningProfile | null;
+    onDownload: () => void;
+}
+
+const STAGE_LABELS: Record<ProfileStage, string> = {
+    parse: '파싱',
+    compile: '계획 컴파일',
+    clean: '정제',
+    detect: '이슈 검사',
+    diff: '변경 비교',
+    export: '내보내기',
+};
+
+// 처음에 보여줄 규칙 수 (누적 시간 순)
+const TOP_RULES = 15;
+
+const formatMs = (ms: number) => (ms >= 1000 ? `${(ms / 1000).toFixed(2)}초` : `${ms.toFixed(1)}ms`);
+
+/**
+ * 정제 프로파일 디버그 패널 컴포넌트
+ * 프로파일링을 켜면 다음 정제부터 단계별 시간과 규칙(컬럼/단계)별 실행 횟수, 변경 셀 수, 누적 시간을 표시합니다.
+ * 워커 시간은 샤드 합계이므로 여러 워커로 정제하면 실제 경과 시간보다 클 수 있습니다.
+ *
+ * @param enabled 프로파일링 사용 여부
+ * @param profile 마지막 전체 정제의 프로파일 (없으면 안내 문구)
+ * @param onDownload 프로파일 JSON 저장 핸들러
+ */
+export function ProfilePanel({ enabled, onToggle, profile, onDownload }: ProfilePanelProps) {
+    const [showAll, setShowAll] = useState(false);
+    const maxStage = profile ? Math.max(1, ...PROFILE_STAGES.map(s => profile.stages[s])) : 1;
+    const rules = profile ? (showAll ? profile.rules : profile.rules.slice(0, TOP_RULES)) : [];
+
+    return (
+        <Card className="border-slate-200 shadow-sm">
+            <CardContent className="p-6 flex flex-col gap-4">
+                <div className="flex items-center justify-between">
+                    <div className="font-medium text-slate-700 flex items-center gap-2">
+                        <Activity size={16} />
+                        정제 프로파일 (디버그)
+                    </div>
+                    <div className="flex items-center gap-2 text-xs text-slate-500">
+                        {enabled ? '측정 중' : '꺼짐'}
+                        <Switch checked={enabled} onCheckedChange={onToggle} />
+                    </div>
+                </div>
+
+                {enabled && !profile && (
+                    <p className="text-xs text-slate-500">다음 정제부터 규칙별 실행 횟수와 시간을 측정합니다. (측정하는 동안에는 정제가 조금 느려집니다)</p>
+                )}
+
+                {enabled && profile && (
+                    <>
+                        <div className="flex flex-col gap-1.5">
+                            {PROFILE_STAGES.map(stage => (
+                                <div key={stage} className="flex items-center gap-2 text-xs">
+                                    <span className="w-20 text-slate-500 shrink-0">{STAGE_LABELS[stage]}</span>
+                                    <div className="flex-1 h-2 bg-slate-100 rounded-full overflow-hidden">
+                                        <div className="h-full bg-slate-500" style={{ width: `${(profile.stages[stage] / maxStage) * 100}%` }} />
+                                    </div>
+                                    <span className="w-16 text-right text-slate-700 tabular-nums">{formatMs(profile.stages[stage])}</span>
+                                </div>
+                            ))}
+                            <div className="text-[11px] text-slate-400">{profile.rows.toLocaleString()}행 · 샤드 {profile.shards}개</div>
+                        </div>
+
+                        <div className="overflow-x-auto">
+                            <table className="w-full text-xs text-left">
+                                <thead className="text-slate-500 border-b border-slate-100">
+                                    <tr>
+                                        <th className="py-1.5 pr-2 font-medium">컬럼</th>
+                                        <th className="py-1.5 px-2 font-medium">규칙</th>
+                                        <th className="py-1.5 px-2 font-medium text-right">실행</th>
+                                        <th className="py-1.5 px-2 font-medium text-right">셀</th>
+                                        <th className="py-1.5 px-2 font-medium text-right">변경</th>
+                                        <th className="py-1.5 pl-2 font-medium text-right">시간</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    {rules.map(r => (
+                                        <tr key={`${r.column}\u0000${r.step}`} className="border-b border-slate-50 text-slate-700">
+                                            <td className="py-1.5 pr-2">{r.column}</td>
+                                            <td className="py-1.5 px-2 font-mono">{r.step}</td>
+                                            <td className="py-1.5 px-2 text-right tabular-nums">{r.calls.toLocaleString()}</td>
+                                            <td className="py-1.5 px-2 text-right tabular-nums">{r.cells.toLocaleString()}</td>
+                                            <td className="py-1.5 px-2 text-right tabular-nums">{r.changed.toLocaleString()}</td>
+                                            <td className="py-1.5 pl-2 text-right tabular-nums">{formatMs(r.ms)}</td>
+                                        </tr>
+                                    ))}
+                                </tbody>
+                            </table>
+                        </div>
+
+                        <div className="flex items-center justify-between">
+                            {profile.rules.length > TOP_RULES ? (
+                                <Button variant="ghost" size="sm" onClick={() => setShowAll(v => !v)} className="text-slate-500">
+                                    {showAll ? '상위 규칙만 보기' : `전체 규칙 보기 (${profile.rules.length}개)`}
+                                </Button>
+                            ) : <span />}
+                            <Button variant="outline" size="sm" onClick={onDownload}>
+                                <Download size={14} className="mr-1" />
+                                JSON 저장
+                            </Button>
+                        </div>
+                    </>
+                )}
+            </CardContent>
+        </Card>
+    );
+}
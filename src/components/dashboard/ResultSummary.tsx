@@ -3,14 +3,14 @@ import { Button } from '@/components/ui/button';
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/card';
 import { cn } from '@/lib/utils';
 import { DataIssue, ProcessingStats } from '@/types';
-import { detectDataIssues } from '@/lib/core/analyzers';
-import { DataRow } from '@/types';
+import { detectTableIssues } from '@/lib/core/analyzers';
+import { DataTable } from '@/lib/core/table';
 
 interface ResultSummaryProps {
     stats: ProcessingStats;
     initialStats: ProcessingStats | null; // [NEW]
     issues: DataIssue[];
-    processedData: DataRow[];
+    processedData: DataTable;
     setIssues: (issues: DataIssue[]) => void;
 }
 
@@ -20,7 +20,7 @@ interface ResultSummaryProps {
  */
 export function ResultSummary({ stats, initialStats, issues, processedData, setIssues }: ResultSummaryProps) {
     const handleRefresh = () => {
-        setIssues(detectDataIssues(processedData));
+        setIssues(detectTableIssues(processedData));
     };
 
     // 건강도 점수에 따른 테마 색상 결정
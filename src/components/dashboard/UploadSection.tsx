@@ -2,7 +2,7 @@ import { useRef, useEffect, useState } from 'react';
 import { Upload, FileSpreadsheet, AlertCircle, Info, Cpu } from 'lucide-react';
 import { Card, CardHeader, CardTitle, CardDescription, CardContent } from '@/components/ui/card';
 import { cn } from '@/lib/utils';
-import { estimatePerformance } from '@/lib/core/performance';
+import { estimatePerformance, calibratePerformance } from '@/lib/core/performance';
 
 interface UploadSectionProps {
     file: File | null;
@@ -12,6 +12,7 @@ interface UploadSectionProps {
     onDragLeave: () => void;
     onDrop: (e: React.DragEvent) => void;
     onFileSelect: (e: React.ChangeEvent<HTMLInputElement>) => void;
+    extraFileCount?: number;   // 함께 선택한 나머지 파일 수 (일괄 정제 대상)
 }
 
 export function UploadSection({
@@ -21,15 +22,20 @@ export function UploadSection({
     onDragOver,
     onDragLeave,
     onDrop,
-    onFileSelect
+    onFileSelect,
+    extraFileCount = 0
 }: UploadSectionProps) {
     const fileInputRef = useRef<HTMLInputElement>(null);
-    const [perf, setPerf] = useState<{ tier: string, recommendedRows: number, memoryGB?: number } | null>(null);
+    const [perf, setPerf] = useState<{ tier: string, recommendedRows: number, memoryGB?: number, rowsPerSecond?: number } | null>(null);
 
     useEffect(() => {
-        // 컴포넌트 마운트 시 시스템 성능 체크
-        const result = estimatePerformance();
-        setPerf(result);
+        // 컴포넌트 마운트 시 저장된 측정값(없으면 가정값)으로 먼저 표시하고, 처리량을 측정한 뒤 갱신
+        let active = true;
+        setPerf(estimatePerformance());
+        calibratePerformance().then(result => {
+            if (active) setPerf(result);
+        });
+        return () => { active = false; };
     }, []);
 
     const triggerFileInput = () => {
@@ -49,8 +55,8 @@ export function UploadSection({
                     {perf && (
                         <div
                             className="hidden sm:flex items-center gap-1.5 px-2.5 py-1.5 bg-slate-50 border border-slate-200 rounded-full animate-in fade-in duration-700 cursor-help"
-                            title={perf.memoryGB && perf.memoryGB >= 8
-                                ? "💡 실제 8GB 이상의 램을 보유하고 있다면, 표시된 권장량보다 훨씬 더 많은 데이터도 충분히 처리 가능합니다."
+                            title={perf.rowsPerSecond
+                                ? `이 PC에서 측정한 정제 속도(코어당 초당 약 ${perf.rowsPerSecond.toLocaleString()}행)와 메모리 한도로 계산한 권장 데이터 규모입니다.`
                                 : "현재 브라우저 환경에서 쾌적하게 처리할 수 있는 권장 데이터 규모입니다."}
                         >
                             <span className={cn(
@@ -97,6 +103,7 @@ export function UploadSection({
                         ref={fileInputRef}
                         className="hidden"
                         accept=".csv, .xlsx, .xls"
+                        multiple
                         onChange={onFileSelect}
                     />
                     {file ? (
@@ -104,6 +111,9 @@ export function UploadSection({
                             <FileSpreadsheet size={32} />
                             <div className="font-medium text-sm">{file.name}</div>
                             <div className="text-xs text-slate-500">{(file.size / 1024).toFixed(1)} KB</div>
+                            {extraFileCount > 0 && (
+                                <div className="text-xs text-blue-600">외 {extraFileCount}개 파일 (일괄 정제)</div>
+                            )}
                         </div>
                     ) : (
                         <div className="flex flex-col items-center gap-2 text-slate-400">
@@ -111,7 +121,7 @@ export function UploadSection({
                             <div className="font-medium text-sm text-slate-600">
                                 파일을 드래그하거나 <span className="text-blue-600">클릭</span>하세요
                             </div>
-                            <div className="text-xs">CSV, Excel 지원</div>
+                            <div className="text-xs">CSV, Excel 지원 (여러 파일 선택 시 일괄 정제)</div>
                         </div>
                     )}
                 </div>
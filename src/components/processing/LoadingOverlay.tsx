@@ -6,6 +6,7 @@ interface LoadingOverlayProps {
     isVisible: boolean;
     progress: number;
     message: string;
+    onCancel?: () => void;
 }
 
 const TIPS = [
@@ -18,7 +19,7 @@ const TIPS = [
     "Tip: 로컬 정제 엔진이 수만 행의 데이터를 초고속으로 처리합니다."
 ];
 
-export function LoadingOverlay({ isVisible, progress, message }: LoadingOverlayProps) {
+export function LoadingOverlay({ isVisible, progress, message, onCancel }: LoadingOverlayProps) {
     const [currentTipIndex, setCurrentTipIndex] = useState(0);
 
     // 팁 자동 롤링 (3초마다 변경)
@@ -63,6 +64,13 @@ export function LoadingOverlay({ isVisible, progress, message }: LoadingOverlayP
                     </div>
                 </div>
 
+                {/* 정제 취소 (워커를 종료하고 정제 전 화면으로 복구) */}
+                {onCancel && (
+                    <button type="button" onClick={onCancel} className="text-gray-400 text-sm hover:text-white underline">
+                        정제 취소
+                    </button>
+                )}
+
                 {/* 닫기 버튼 (개발 단계 편의용, 실제 서비스 시에는 제거하거나 보이지 않게 처리 가능) */}
                 {/* <button className="text-gray-500 text-xs hover:text-white underline mt-4">백그라운드로 숨기기</button> */}
             </div>
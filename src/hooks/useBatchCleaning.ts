@@ -0,0 +1,92 @@
+import { useState, useRef, useEffect, useCallback } from 'react';
+import { SheetSource } from '@/lib/core/parsers';
+import { openDownloadSink } from '@/lib/core/exporters';
+import { CleaningWorkerPool, PoolCancelledError } from '@/lib/workerPool';
+import { BATCH_ZIP_MIME, BatchReport, BatchSettings, BatchSheetReport, collectBatchSheets, runBatchCleaning } from '@/lib/batch';
+
+/**
+ * 여러 파일/시트 일괄 정제 훅
+ * 선택한 파일들의 시트 목록을 모아 두고, 현재 프롬프트/옵션으로 전체 시트를 정제해 zip으로 내려받습니다. (lib/batch.ts)
+ * 화면의 단일 파일 정제(useDataFlow)와 겹치지 않도록 별도의 워커 풀을 사용합니다.
+ */
+export function useBatchCleaning() {
+    const [sources, setSources] = useState<SheetSource[]>([]);
+    const [failures, setFailures] = useState<BatchSheetReport[]>([]); // 시트 목록을 읽지 못한 파일
+    const [isRunning, setIsRunning] = useState(false);
+    const [progress, setProgress] = useState(0);
+    const [progressMessage, setProgressMessage] = useState("");
+    const [report, setReport] = useState<BatchReport | null>(null);
+    const [error, setError] = useState<string | null>(null);
+    const poolRef = useRef<CleaningWorkerPool | null>(null);
+    const abortRef = useRef<AbortController | null>(null);
+    const selectIdRef = useRef(0); // 최신 파일 선택 번호 (이전 선택의 시트 목록 무시용)
+
+    useEffect(() => {
+        poolRef.current = new CleaningWorkerPool(() => new Worker(new URL('../lib/worker.ts', import.meta.url)));
+
+        return () => {
+            abortRef.current?.abort();
+            poolRef.current?.terminate();
+        };
+    }, []);
+
+    // 파일 선택 시 시트 목록 수집 (시트 내용은 정제를 시작할 때 읽음)
+    const selectFiles = useCallback(async (files: File[]) => {
+        const selectId = ++selectIdRef.current;
+        setReport(null);
+        setError(null);
+        const collected = await collectBatchSheets(files);
+        if (selectId !== selectIdRef.current) return;
+        setSources(collected.sources);
+        setFailures(collected.failures);
+    }, []);
+
+    const start = useCallback(async (settings: BatchSettings) => {
+        const pool = poolRef.current;
+        if (!pool || sources.length === 0 || isRunning) return;
+
+        // 저장 창은 사용자 동작 직후에 열어야 하므로 정제 전에 엶 (행 수를 모르므로 시트 크기로 판단)
+        const baseName = sources[0].file.name.replace(/\.[^/.]+$/, '');
+        const estimatedCells = sources.reduce((sum, s) => sum + s.size, 0);
+        const sink = await openDownloadSink(`${baseName}_외_일괄정제.zip`, BATCH_ZIP_MIME, estimatedCells);
+        if (!sink) return;
+
+        const controller = new AbortController();
+        abortRef.current = controller;
+        setIsRunning(true);
+        setError(null);
+        setReport(null);
+        setProgress(0);
+        try {
+            const result = await runBatchCleaning(pool, sources, failures, settings, sink, (value, message) => {
+                setProgress(value);
+                setProgressMessage(message);
+            }, controller.signal);
+            setReport(result);
+        } catch (err: any) {
+            await sink.abort();
+            if (!(err instanceof PoolCancelledError)) setError(err.message || String(err));
+        } finally {
+            abortRef.current = null;
+            setIsRunning(false);
+        }
+    }, [sources, failures, isRunning]);
+
+    const cancel = useCallback(() => {
+        abortRef.current?.abort();
+        poolRef.current?.cancel();
+    }, []);
+
+    return {
+        sources,
+        failures,
+        isRunning,
+        progress,
+        progressMessage,
+        report,
+        error,
+        selectFiles,
+        start,
+        cancel,
+    };
+}
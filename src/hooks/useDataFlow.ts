@@ -1,18 +1,30 @@
-import { useState, useRef, useEffect, useCallback } from 'react';
-import { DataRow, DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits, ColumnSpecificOptions, ColumnOptionType } from '@/types';
-import { parseFile } from '@/lib/core/parsers';
-import { detectDataIssues, detectDateCandidateColumns, analyzeDataQuality } from '@/lib/core/analyzers';
-import { WorkerMessage, WorkerResponse } from '@/lib/worker';
+import { useState, useRef, useEffect, useCallback, useMemo } from 'react';
+import { DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits, ColumnSpecificOptions, ColumnOptionType } from '@/types';
+import { parseFileTableCached } from '@/lib/core/parsers';
+import { baselineIssueCache, detectDateCandidateColumns, analyzeDataQuality, detectPatternIssues } from '@/lib/core/analyzers';
+import { ChangeSet, createChangeSet, classifyChange, setCellChanges, renameChangeColumn } from '@/lib/core/changes';
+import { DataTable, EMPTY_TABLE, getTableRows, getTableValue, setTableCells, renameTableColumn } from '@/lib/core/table';
+import { getCleaningPlan } from '@/lib/core/plan';
+import { CleaningSnapshot, createCleaningSnapshot, planIncremental, applyIncremental } from '@/lib/core/incremental';
+import { getTableSample, previewCleaning } from '@/lib/core/sampling';
+import { suggestDuplicateKeys } from '@/lib/core/dedup';
+import { CleaningWorkerPool, PoolCancelledError } from '@/lib/workerPool';
+import { CleaningProfile, ProfileStage, isProfilingEnabled, setProfilingEnabled, withStageTime } from '@/lib/core/profiler';
+
+// 정제 결과가 바뀐 뒤 중복 검사를 시작하기까지 기다리는 시간 (셀을 연속으로 수정하면 마지막 수정 뒤 한 번만 검사)
+const DUPLICATE_CHECK_DELAY_MS = 300;
 
 /**
  * 데이터 흐름 및 상태 관리를 위한 핵심 커스텀 훅
- * 파일 로드, 데이터 저장, Web Worker 통신, 통계 및 이슈 관리를 담당합니다.
+ * 파일 로드, 데이터 저장, Web Worker 풀 통신, 통계 및 이슈 관리를 담당합니다.
+ * 원본/정제본은 사전 인코딩 테이블(table.ts)로 보관하며, 정제본은 원본과 번호 배열을 공유합니다.
  */
 export function useDataFlow() {
     // 1. Core Data State
     const [file, setFile] = useState<File | null>(null);
-    const [data, setData] = useState<DataRow[]>([]); // 원본 (파싱 직후 상태)
-    const [processedData, setProcessedData] = useState<DataRow[]>([]); // 정제된 데이터 (화면 표시용)
+    const [data, setData] = useState<DataTable>(EMPTY_TABLE); // 원본 (파싱 직후 상태)
+    const [processedData, setProcessedData] = useState<DataTable>(EMPTY_TABLE); // 정제된 데이터 (화면 표시용)
+    const [changes, setChanges] = useState<ChangeSet | null>(null); // 원본 대비 변경된 셀 기록 (없으면 변경 없음)
     const [headers, setHeaders] = useState<string[]>([]);
     const [initialStats, setInitialStats] = useState<ProcessingStats | null>(null); // [NEW] 정제 전 비교용
 
@@ -20,54 +32,54 @@ export function useDataFlow() {
     const [isProcessing, setIsProcessing] = useState(false);
     const [progress, setProgress] = useState(0);
     const [progressMessage, setProgressMessage] = useState("");
+    const [readyRows, setReadyRows] = useState(0); // 정제 중 화면에 먼저 표시한 앞 구간 행 수 (0이면 아직 없음)
     const [error, setError] = useState<string | null>(null);
-    const workerRef = useRef<Worker | null>(null);
+    const [profiling, setProfiling] = useState(false); // 규칙/단계별 프로파일 수집 (디버그 패널, core/profiler.ts)
+    const [profile, setProfile] = useState<CleaningProfile | null>(null); // 마지막 전체 정제의 프로파일
+    const parseMsRef = useRef(0); // 현재 파일의 파싱 시간 (프로파일의 parse 단계)
+    const poolRef = useRef<CleaningWorkerPool | null>(null);
+    const snapshotRef = useRef<CleaningSnapshot | null>(null); // 직전 정제 결과 (증분 재정제 기준점)
+    const runIdRef = useRef(0); // 최신 정제 요청 번호 (이전 요청의 결과 무시용)
+    const restoreRef = useRef<{ processedData: DataTable; changes: ChangeSet | null } | null>(null); // 정제 시작 직전 화면 (취소/실패 시 복구)
 
     // 3. Analysis State
     const [issues, setIssues] = useState<DataIssue[]>([]);
+    const [patternIssues, setPatternIssues] = useState<DataIssue[]>([]); // 적용하지 않은 프롬프트 패턴 (마지막 정제 요청 기준)
+    const [duplicateIssue, setDuplicateIssue] = useState<DataIssue | null>(null); // 중복/유사 중복 행 (정제 결과 기준, 워커에서 검사)
     const [stats, setStats] = useState<ProcessingStats>({ totalRows: 0, changedCells: 0, resolvedIssues: 0, qualityScore: 0, completeness: 0, validity: 0 });
 
     // 4. Configuration State
     const [lockedColumns, setLockedColumns] = useState<string[]>([]);
+    const [duplicateKeys, setDuplicateKeys] = useState<string[] | null>(null); // 중복 검사 기준 컬럼 (null이면 헤더 이름으로 자동 선택)
     const [columnLimits, setColumnLimits] = useState<ColumnLimits>({});
     const [columnOptions, setColumnOptions] = useState<ColumnSpecificOptions>({});
     const [detectedDateColumns, setDetectedDateColumns] = useState<number>(0);
 
-    // Worker 초기화
+    // Worker 풀 초기화 (대용량 데이터는 샤드로 나눠 코어 수만큼 병렬 정제)
     useEffect(() => {
-        workerRef.current = new Worker(new URL('../lib/worker.ts', import.meta.url));
-
-        workerRef.current.onmessage = (e: MessageEvent<WorkerResponse>) => {
-            const { type } = e.data;
-
-            if (type === 'PROGRESS') {
-                // @ts-ignore
-                const { progress, message } = e.data;
-                setProgress(progress);
-                setProgressMessage(message);
-            }
-            else if (type === 'COMPLETE') {
-                // @ts-ignore
-                const { processedData: resultData, issues: resultIssues, stats: resultStats } = e.data;
-                setProcessedData(resultData);
-                setIssues(resultIssues);
-                setStats(resultStats);
-                setIsProcessing(false);
-                setProgress(100);
-                setProgressMessage("완료되었습니다.");
-            }
-            else if (type === 'ERROR') {
-                // @ts-ignore
-                setError(e.data.error);
-                setIsProcessing(false);
-            }
-        };
+        poolRef.current = new CleaningWorkerPool(() => new Worker(new URL('../lib/worker.ts', import.meta.url)));
 
         return () => {
-            workerRef.current?.terminate();
+            poolRef.current?.terminate();
         };
     }, []);
 
+    // 프로파일링 설정은 브라우저에만 저장되므로 마운트 후 읽음
+    useEffect(() => {
+        setProfiling(isProfilingEnabled());
+    }, []);
+
+    const toggleProfiling = useCallback((enabled: boolean) => {
+        setProfilingEnabled(enabled);
+        setProfiling(enabled);
+        if (!enabled) setProfile(null);
+    }, []);
+
+    // 메인 스레드 단계(내보내기 등) 시간을 마지막 프로파일에 더함
+    const recordProfileStage = useCallback((stage: ProfileStage, ms: number) => {
+        setProfile(prev => prev && withStageTime(prev, stage, ms));
+    }, []);
+
     // 파일 선택 및 파싱 핸들러
     const handleFileSelect = useCallback(async (selectedFile: File) => {
         setFile(selectedFile);
@@ -77,26 +89,38 @@ export function useDataFlow() {
         setProgressMessage("파일 읽는 중...");
 
         try {
-            const parsedData = await parseFile(selectedFile);
-            if (parsedData.length === 0) throw new Error("데이터가 비어있습니다.");
+            // 청크 단위로 읽어 바로 테이블로 쌓으며 읽은 행 수를 표시 (원본 파일 전체 문자열/행 객체 배열을 만들지 않음)
+            // 같은 내용의 파일을 전에 읽었다면 파싱 결과 캐시에서 불러옴
+            const parseStarted = performance.now();
+            const { table: parsedData } = await parseFileTableCached(selectedFile, rows => {
+                setProgressMessage(`파일 읽는 중... (${rows.toLocaleString()}행)`);
+            });
+            parseMsRef.current = performance.now() - parseStarted;
+            if (parsedData.rowCount === 0) throw new Error("데이터가 비어있습니다.");
 
-            const initialHeaders = Object.keys(parsedData[0]);
+            const initialHeaders = parsedData.headers;
             setData(parsedData);
             setHeaders(initialHeaders);
             setProcessedData(parsedData); // 초기엔 원본 = 정제본
+            setChanges(null);
+            snapshotRef.current = null;
+            restoreRef.current = null;
 
             // 초기 이슈 감지
-            const initialIssues = detectDataIssues(parsedData);
+            const initialIssues = baselineIssueCache.getOrDetect(parsedData);
             setIssues(initialIssues);
 
             const qualityStats = analyzeDataQuality(parsedData, initialIssues);
             setStats(qualityStats);
             setInitialStats(qualityStats); // 초기 상태 고정
 
-            // 날짜 컬럼 자동 감지
-            const dateColCount = detectDateCandidateColumns(parsedData, initialHeaders);
+            // 날짜 컬럼 자동 감지 (값 모양별 층화 표본 기준, 표본은 포맷 추천/미리보기에서 재사용)
+            const dateColCount = detectDateCandidateColumns(getTableRows(getTableSample(parsedData).table), initialHeaders);
             setDetectedDateColumns(dateColCount);
             setColumnOptions({}); // Reset column options
+            setDuplicateKeys(null);
+            setPatternIssues([]);
+            setProfile(null);
 
         } catch (err) {
             setError(String(err));
@@ -107,6 +131,16 @@ export function useDataFlow() {
         }
     }, []);
 
+    // 먼저 표시한 미리보기/앞 구간 결과를 버리고 정제 시작 직전 화면으로 되돌림
+    const restoreBeforeRun = () => {
+        const restore = restoreRef.current;
+        if (!restore) return;
+        restoreRef.current = null;
+        setProcessedData(restore.processedData);
+        setChanges(restore.changes);
+        setReadyRows(0);
+    };
+
     // 정제 프로세스 시작 (Worker 호출)
     const startProcessing = useCallback((
         prompt: string,
@@ -115,37 +149,132 @@ export function useDataFlow() {
         customLimits?: ColumnLimits,
         customColOptions?: ColumnSpecificOptions
     ) => {
-        if (!workerRef.current || data.length === 0) return;
+        if (!poolRef.current || data.rowCount === 0) return;
 
         setIsProcessing(true);
         setProgress(0);
+        setReadyRows(0);
         setError(null);
+        const runId = ++runIdRef.current;
+        // 이전 실행이 끝나기 전에 다시 시작하면 처음 실행 직전 화면을 유지
+        if (!restoreRef.current) restoreRef.current = { processedData, changes };
+
+        const limits = customLimits || columnLimits;
+        const locked = customLocked || lockedColumns;
+        const colOptions = customColOptions || columnOptions;
+        const plan = getCleaningPlan(prompt, data.headers, options, locked, colOptions);
+        setPatternIssues(detectPatternIssues(plan.nlp.rejectedPatterns));
+
+        // 직전 실행과 계획을 컬럼 단위로 비교해, 바뀐 컬럼만 다시 정제 (나머지 컬럼의 값/이슈 재사용)
+        // 프로파일링 중에는 모든 규칙이 측정되도록 항상 전체 정제
+        const snapshot = snapshotRef.current;
+        const target = profiling ? null : planIncremental(snapshot, data, plan, limits, options);
+        if (target && snapshot) {
+            poolRef.current.cancel();
+            setProgressMessage(`⚡ 변경된 컬럼만 다시 정제 중... (${target.cleanColumns.length}개)`);
+            // 진행 상태가 한 번 렌더링된 뒤 실행 (완료 시 미리보기 이동 등 기존 흐름 유지)
+            setTimeout(() => {
+                if (runIdRef.current !== runId || snapshotRef.current !== snapshot) return;
+                try {
+                    const result = applyIncremental(snapshot, plan, target, limits, options);
+                    snapshotRef.current = result.snapshot;
+                    baselineIssueCache.set(data, limits, options, result.snapshot.baselineIssues);
+                    setProcessedData(result.processedData);
+                    setChanges(result.changes);
+                    setIssues(result.issues);
+                    setStats(result.stats);
+                    setProgress(100);
+                    setProgressMessage("완료되었습니다.");
+                } catch (err: any) {
+                    snapshotRef.current = null;
+                    setError(err.message || String(err));
+                }
+                restoreRef.current = null;
+                setIsProcessing(false);
+            }, 0);
+            return;
+        }
+
+        // 표본에 먼저 정제 계획을 실행해 상위 행 미리보기를 바로 표시 (전체 정제는 워커 풀에서 이어서 실행)
+        try {
+            const preview = previewCleaning(data, getTableSample(data), prompt, options, locked, colOptions);
+            setProcessedData(preview.processedData);
+            setChanges(preview.changes);
+            setReadyRows(preview.readyRows);
+            setProgressMessage(`미리보기 완료, 전체 ${data.rowCount.toLocaleString()}행 정제 중...`);
+        } catch {
+            // 미리보기 실패는 무시하고 전체 정제 결과를 기다림
+        }
+
+        // 원본 이슈는 같은 데이터/검사 조건이면 재사용 (워커는 정제 결과만 검사)
+        const baselineIssues = baselineIssueCache.get(data, limits, options);
 
-        const message: WorkerMessage = {
-            type: 'PROCESS',
+        poolRef.current.run({
             data: data,
             prompt,
             options,
-            lockedColumns: customLocked || lockedColumns,
-            columnLimits: customLimits || columnLimits,
-            columnOptions: customColOptions || columnOptions
-        };
+            lockedColumns: locked,
+            columnLimits: limits,
+            columnOptions: colOptions,
+            baselineIssues,
+            profile: profiling
+        }, (progress, message) => {
+            setProgress(progress);
+            setProgressMessage(message);
+        }, partial => {
+            // 앞에서부터 끝난 구간을 먼저 표시 (나머지 행은 완료 시 전체 결과로 교체)
+            if (runIdRef.current !== runId) return;
+            setProcessedData(partial.processedData);
+            setChanges(partial.changes);
+            setReadyRows(partial.readyRows);
+        }).then(result => {
+            if (!baselineIssues) baselineIssueCache.set(data, limits, options, result.originalIssues);
+            restoreRef.current = null;
+            snapshotRef.current = createCleaningSnapshot(data, plan, limits, options, result);
+            setProcessedData(result.processedData);
+            setChanges(result.changes);
+            setIssues(result.issues);
+            setStats(result.stats);
+            setProfile(result.profile ? withStageTime(result.profile, 'parse', parseMsRef.current) : null);
+            setIsProcessing(false);
+            setReadyRows(0);
+            setProgress(100);
+            setProgressMessage("완료되었습니다.");
+        }).catch((err: Error) => {
+            // 새 정제 요청/사용자 취소로 중단된 작업은 무시
+            if (err instanceof PoolCancelledError) return;
+            restoreBeforeRun();
+            setError(err.message || String(err));
+            setIsProcessing(false);
+        });
+    }, [data, processedData, changes, lockedColumns, columnLimits, columnOptions, profiling]);
+
+    // 백그라운드 전체 정제 취소 (진행 중인 샤드는 워커를 종료해 중단)
+    const cancelProcessing = useCallback(() => {
+        runIdRef.current++;
+        poolRef.current?.cancel();
+        restoreBeforeRun();
+        setIsProcessing(false);
+        setProgress(0);
+        setProgressMessage("정제를 취소했습니다.");
+    }, []);
 
-        workerRef.current.postMessage(message);
-    }, [data, lockedColumns, columnLimits, columnOptions]);
+    // 데이터 직접 수정 핸들러 (한 컬럼의 여러 셀을 같은 값으로, 해당 컬럼의 번호 배열만 한 번 복사)
+    const updateCells = useCallback((rowIdxs: number[], col: string, newVal: string) => {
+        setProcessedData(prev => setTableCells(prev, rowIdxs, prev.headers.indexOf(col), newVal));
+        // 변경 기록도 해당 셀만 갱신 (원본과 같은 값으로 되돌리면 변경 표시 해제)
+        setChanges(prev => {
+            const base = prev || createChangeSet(headers, data.rowCount);
+            const dataCol = data.headers.indexOf(col);
+            return setCellChanges(base, rowIdxs, base.columns.indexOf(col), row => classifyChange(getTableValue(data, row, dataCol), newVal));
+        });
+        // TODO: 수정 후 이슈 재검사 또는 통계 업데이트 로직이 필요할 수 있음 (선택적)
+    }, [data, headers]);
 
     // 데이터 직접 수정 핸들러 (Cell Edit)
     const updateCell = useCallback((rowIdx: number, col: string, newVal: string) => {
-        setProcessedData(prev => {
-            const newData = [...prev];
-            if (newData[rowIdx]) {
-                newData[rowIdx] = { ...newData[rowIdx], [col]: newVal };
-            }
-            return newData;
-        });
-        // TODO: 수정 후 이슈 재검사 또는 통계 업데이트 로직이 필요할 수 있음 (선택적)
-        // TODO: 수정 후 이슈 재검사 또는 통계 업데이트 로직이 필요할 수 있음 (선택적)
-    }, []);
+        updateCells([rowIdx], col, newVal);
+    }, [updateCells]);
 
     // 컬럼별 옵션 설정 (날짜/일시 지정)
     const updateColumnOption = useCallback((header: string, type: ColumnOptionType) => {
@@ -162,20 +291,14 @@ export function useDataFlow() {
         // 1. 헤더 목록 업데이트
         setHeaders(prev => prev.map(h => h === oldName ? newName : h));
 
-        // 2. 데이터 내 키 변경
-        const renameKey = (rows: DataRow[]) => rows.map(row => {
-            const newRow: DataRow = {};
-            Object.keys(row).forEach(key => {
-                newRow[key === oldName ? newName : key] = row[key];
-            });
-            return newRow;
-        });
-
-        setData(prev => renameKey(prev));
-        setProcessedData(prev => renameKey(prev));
+        // 2. 테이블 헤더 변경 (컬럼 데이터는 그대로 공유)
+        setData(prev => renameTableColumn(prev, oldName, newName));
+        setProcessedData(prev => renameTableColumn(prev, oldName, newName));
+        setChanges(prev => prev && renameChangeColumn(prev, oldName, newName));
 
         // 3. 관련 상태 업데이트 (Lock, Limits)
         setLockedColumns(prev => prev.map(c => c === oldName ? newName : c));
+        setDuplicateKeys(prev => prev && prev.map(c => c === oldName ? newName : c));
         setColumnLimits(prev => {
             const newLimits = { ...prev };
             if (newLimits[oldName]) {
@@ -193,6 +316,44 @@ export function useDataFlow() {
         );
     }, []);
 
+    // 중복 검사 기준 컬럼 토글 (처음 토글하면 자동 선택된 컬럼에서 시작)
+    const toggleDuplicateKey = useCallback((col: string) => {
+        setDuplicateKeys(prev => {
+            const current = prev ?? suggestDuplicateKeys(headers);
+            return current.includes(col) ? current.filter(c => c !== col) : [...current, col];
+        });
+    }, [headers]);
+
+    // 중복/유사 중복 행 검사 (정제 결과 기준, 워커 풀의 검사 워커에서 실행)
+    // 정제 중에는 결과가 계속 바뀌므로 끝난 뒤 한 번만 검사하고, 셀 수정은 잠시 기다렸다가 마지막 수정 기준으로 다시 검사
+    const effectiveDuplicateKeys = useMemo(() => duplicateKeys ?? suggestDuplicateKeys(headers), [duplicateKeys, headers]);
+    useEffect(() => {
+        const pool = poolRef.current;
+        if (!pool || isProcessing || processedData.rowCount === 0 || effectiveDuplicateKeys.length === 0) {
+            pool?.cancelDuplicates();
+            setDuplicateIssue(null);
+            return;
+        }
+        let active = true;
+        // 수정 중에는 직전 검사 결과를 그대로 표시 (행 수는 바뀌지 않음)
+        const timer = setTimeout(() => {
+            pool.detectDuplicates(processedData, effectiveDuplicateKeys).then(issue => {
+                if (active) setDuplicateIssue(issue);
+            }).catch((err: Error) => {
+                // 다음 검사로 취소된 경우는 무시, 검사 실패는 중복 이슈 없이 표시
+                if (active && !(err instanceof PoolCancelledError)) setDuplicateIssue(null);
+            });
+        }, DUPLICATE_CHECK_DELAY_MS);
+        return () => {
+            active = false;
+            clearTimeout(timer);
+        };
+    }, [processedData, effectiveDuplicateKeys, isProcessing]);
+    const allIssues = useMemo(() => {
+        const extra = duplicateIssue ? [...patternIssues, duplicateIssue] : patternIssues;
+        return extra.length > 0 ? [...issues, ...extra] : issues;
+    }, [issues, patternIssues, duplicateIssue]);
+
     // 컬럼 길이 제한 설정
     const updateColumnLimit = useCallback((col: string, limit: number) => {
         setColumnLimits(prev => ({ ...prev, [col]: limit }));
@@ -207,20 +368,23 @@ export function useDataFlow() {
 
     // [NEW] 현재 정제된 데이터를 원본으로 확정 (Apply)
     const applyProcessedToOriginal = useCallback((onSuccess?: () => void) => {
-        if (processedData.length === 0) return;
+        if (processedData.rowCount === 0) return;
         setData(processedData);
+        setChanges(null); // 정제본이 새 원본이 되므로 변경 기록 초기화
+        snapshotRef.current = null;
         setColumnOptions({}); // 정제된 상태가 원본이 되므로 기존 옵션 초기화
         setInitialStats(stats); // 통계 기준점 업데이트
-        setIssues(detectDataIssues(processedData)); // 이슈 재검사
+        setIssues(baselineIssueCache.getOrDetect(processedData)); // 이슈 재검사 (확정된 원본 기준으로 캐시)
         if (onSuccess) onSuccess();
     }, [processedData, stats]);
 
     // 데이터 초기화 (Reset)
     const resetData = useCallback(() => {
-        if (data.length === 0) return;
+        if (data.rowCount === 0) return;
 
         setProcessedData(data);
-        const initialIssues = detectDataIssues(data);
+        setChanges(null);
+        const initialIssues = baselineIssueCache.getOrDetect(data);
         setIssues(initialIssues);
         const qualityStats = analyzeDataQuality(data, initialIssues);
         setStats(qualityStats);
@@ -233,22 +397,28 @@ export function useDataFlow() {
         file,
         data,              // Original
         processedData,     // Current View
+        changes,           // 원본 대비 변경 셀 기록 (하이라이트/미리보기용)
         headers,
         isProcessing,
         progress,
         progressMessage,
+        readyRows,         // 정제 중 먼저 표시된 행 수
         error,
-        issues,
+        issues: allIssues, // 값 검사 이슈 + 적용하지 않은 패턴 + 중복 행 이슈
         stats,
         lockedColumns,
+        duplicateKeys: effectiveDuplicateKeys,
         columnLimits,
         setIssues,         // 외부에서 이슈 업데이트 필요 시
         setColumnLimits,
         handleFileSelect,
         startProcessing,
+        cancelProcessing,
         updateCell,
+        updateCells,
         updateHeader,
         toggleLock,
+        toggleDuplicateKey,
         updateColumnLimit,
         updateColumnOption,
         columnOptions,
@@ -256,6 +426,10 @@ export function useDataFlow() {
         initialStats,      // [NEW]
         setError,
         resetData,
-        applyProcessedToOriginal // Export
+        applyProcessedToOriginal, // Export
+        profiling,         // 프로파일링 사용 여부 (디버그 패널)
+        toggleProfiling,
+        profile,           // 마지막 전체 정제의 규칙/단계별 프로파일
+        recordProfileStage
     };
 }
@@ -0,0 +1,240 @@
+import Papa from 'papaparse';
+import { DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits, ColumnSpecificOptions } from '@/types';
+import { CleaningWorkerPool, PoolCancelledError, PoolJob } from './workerPool';
+import { SheetSource, listFileSheets, parseSheetTable } from './core/parsers';
+import { DownloadSink, writeCsv } from './core/exporters';
+import { ZipStreamWriter } from './core/xlsxStream';
+import { analyzePrompt } from './core/nlp';
+import { detectPatternIssues } from './core/analyzers';
+import { getCapacityPlan } from './core/performance';
+
+/**
+ * 여러 파일/시트 일괄 정제
+ * 선택한 파일들의 모든 시트를 같은 프롬프트/옵션으로 워커 풀에서 정제하고(runBatch),
+ * 시트별 정제 결과 CSV와 요약 보고서(report.csv, issues.csv)를 zip 하나로 내려받습니다. 파이썬 엔진의 batch.py와 같은 방식입니다.
+ * 시트는 큰 것부터 읽어 권장 행 수(performance.ts) 단위로 묶어 정제하고, 묶음이 끝날 때마다 결과를 zip에 기록한 뒤 버리므로
+ * 메모리에는 한 묶음의 원본/정제 테이블만 남습니다. 읽거나 정제하지 못한 시트는 건너뛰고 보고서에 실패로 남깁니다.
+ */
+
+export const BATCH_ZIP_MIME = 'application/zip';
+
+export interface BatchSettings {
+    prompt: string;
+    options: ProcessingOptions;
+    lockedColumns: string[];
+    columnLimits: ColumnLimits;
+    columnOptions: ColumnSpecificOptions;
+}
+
+/**
+ * 시트 하나의 일괄 정제 결과 (error가 있으면 실패한 시트)
+ */
+export interface BatchSheetReport {
+    fileName: string;
+    sheetName: string | null;
+    outputName: string;         // zip 안의 결과 파일 이름
+    rowCount: number;
+    stats: ProcessingStats | null;
+    issues: DataIssue[];
+    error?: string;
+}
+
+export interface BatchReport {
+    sheets: BatchSheetReport[];   // 시트 목록을 읽지 못한 파일, 이어서 입력 순서 (파일 > 시트)
+    stats: ProcessingStats | null;
+    totalRows: number;
+    failed: number;
+    elapsedMs: number;
+}
+
+export type BatchProgressHandler = (progress: number, message: string) => void;
+
+/**
+ * 선택한 파일들의 시트 목록을 모읍니다. 시트 목록을 읽지 못한 파일은 failures로 돌려줍니다.
+ */
+export async function collectBatchSheets(files: File[]): Promise<{ sources: SheetSource[]; failures: BatchSheetReport[] }> {
+    const sources: SheetSource[] = [];
+    const failures: BatchSheetReport[] = [];
+    for (const file of files) {
+        try {
+            sources.push(...await listFileSheets(file));
+        } catch (err: any) {
+            failures.push({ fileName: file.name, sheetName: null, outputName: '', rowCount: 0, stats: null, issues: [], error: err.message || String(err) });
+        }
+    }
+    return { sources, failures };
+}
+
+/**
+ * 시트별 품질 통계를 합칩니다. 건수는 더하고, 점수/비율은 행 수로 가중 평균합니다. (batch.py merge_stats와 동일)
+ */
+export function mergeBatchStats(stats: ProcessingStats[]): ProcessingStats | null {
+    if (stats.length === 0) return null;
+    const rows = stats.reduce((sum, s) => sum + s.totalRows, 0);
+    const weighted = (key: 'qualityScore' | 'completeness' | 'validity') =>
+        rows === 0 ? 0 : Math.round(stats.reduce((sum, s) => sum + s[key] * s.totalRows, 0) / rows);
+    return {
+        totalRows: rows,
+        changedCells: stats.reduce((sum, s) => sum + s.changedCells, 0),
+        resolvedIssues: stats.reduce((sum, s) => sum + s.resolvedIssues, 0),
+        qualityScore: weighted('qualityScore'),
+        completeness: weighted('completeness'),
+        validity: weighted('validity'),
+    };
+}
+
+/**
+ * zip 안의 결과 파일 이름 (`<파일 이름>.csv` 또는 `<파일 이름>__<시트 이름>.csv`, 겹치면 뒤에 번호)
+ */
+function assignOutputNames(sources: SheetSource[]): string[] {
+    const used = new Set<string>();
+    return sources.map(({ file, sheetName }) => {
+        const stem = file.name.replace(/\.[^/.]+$/, '');
+        const base = sheetName === null ? stem : `${stem}__${sheetName.replace(/[\\/:*?"<>|\s]+/g, '_').replace(/^_+|_+$/g, '') || 'sheet'}`;
+        let name = base;
+        for (let n = 2; used.has(name.toLowerCase()); n++) name = `${base}_${n}`;
+        used.add(name.toLowerCase());
+        return `${name}.csv`;
+    });
+}
+
+function countIssues(issues: DataIssue[], type: DataIssue['type']): number {
+    return issues.reduce((n, issue) => n + (issue.type === type ? 1 : 0), 0);
+}
+
+/**
+ * 시트별 요약 표 (report.csv, 마지막 행은 합계)
+ */
+function reportCsv(report: BatchReport): string {
+    const row = (s: Pick<BatchSheetReport, 'fileName' | 'sheetName' | 'outputName' | 'rowCount' | 'stats' | 'issues' | 'error'>) => ({
+        '파일': s.fileName,
+        '시트': s.sheetName ?? '',
+        '결과 파일': s.outputName,
+        '행 수': s.rowCount,
+        '변경 셀': s.stats?.changedCells ?? '',
+        '품질 점수': s.stats?.qualityScore ?? '',
+        '완결성(%)': s.stats?.completeness ?? '',
+        '유효성(%)': s.stats?.validity ?? '',
+        '오류': countIssues(s.issues, 'error'),
+        '경고': countIssues(s.issues, 'warning'),
+        '정보': countIssues(s.issues, 'info'),
+        '실패 사유': s.error ?? '',
+    });
+    const rows = report.sheets.map(row);
+    rows.push(row({
+        fileName: '합계', sheetName: null, outputName: '', rowCount: report.totalRows, stats: report.stats,
+        issues: report.sheets.flatMap(s => s.issues), error: report.failed > 0 ? `실패 ${report.failed}개` : undefined,
+    }));
+    return '﻿' + Papa.unparse(rows);
+}
+
+/**
+ * 시트별 이슈 목록 (issues.csv, 예시 행 번호는 1부터)
+ */
+function issuesCsv(report: BatchReport): string {
+    const rows = report.sheets.flatMap(s => s.issues.map(issue => ({
+        '파일': s.fileName,
+        '시트': s.sheetName ?? '',
+        '컬럼': issue.column,
+        '유형': issue.type,
+        '내용': issue.message,
+        '해당 행 수': issue.affectedRows?.length ?? 0,
+        '예시 행 번호': (issue.affectedRows ?? []).slice(0, 20).map(r => r + 1).join(' '),
+    })));
+    return '﻿' + Papa.unparse(rows.length > 0 ? rows : [{ '파일': '', '시트': '', '컬럼': '', '유형': '', '내용': '', '해당 행 수': '', '예시 행 번호': '' }]);
+}
+
+/**
+ * 시트들을 일괄 정제해 결과를 sink에 zip으로 기록합니다. sink는 끝나면 닫고, 실패/취소 시에는 호출측이 abort합니다.
+ * @param failures collectBatchSheets에서 시트 목록을 읽지 못한 파일 (보고서에 함께 남김)
+ * @param signal (선택) 중단 신호 (시트를 읽는 사이에 확인하며, 정제 중 취소는 pool.cancel()로 함)
+ */
+export async function runBatchCleaning(
+    pool: CleaningWorkerPool,
+    sources: SheetSource[],
+    failures: BatchSheetReport[],
+    settings: BatchSettings,
+    sink: DownloadSink,
+    onProgress?: BatchProgressHandler,
+    signal?: AbortSignal
+): Promise<BatchReport> {
+    const started = performance.now();
+    const zip = new ZipStreamWriter({ write: chunk => sink.write(chunk) });
+    const outputNames = assignOutputNames(sources);
+    const reports: (BatchSheetReport | null)[] = sources.map(() => null);
+    const patternIssues = detectPatternIssues(analyzePrompt(settings.prompt).rejectedPatterns);
+    const budget = getCapacityPlan().recommendedRows;
+    const totalSheets = sources.length;
+    let finishedSheets = 0;
+
+    const fail = (i: number, err: any) => {
+        const { file, sheetName } = sources[i];
+        reports[i] = { fileName: file.name, sheetName, outputName: '', rowCount: 0, stats: null, issues: [], error: err?.message || String(err) };
+        finishedSheets++;
+    };
+
+    // 큰 시트부터 읽어 권장 행 수만큼 묶음으로 정제 (묶음 안에서는 runBatch가 다시 큰 시트부터 샤드를 나눠 줌)
+    const order = sources.map((_, i) => i).sort((a, b) => sources[b].size - sources[a].size);
+    let cursor = 0;
+    while (cursor < order.length) {
+        const wave: { index: number; job: PoolJob }[] = [];
+        let waveRows = 0;
+        while (cursor < order.length && (wave.length === 0 || waveRows < budget)) {
+            if (signal?.aborted) throw new PoolCancelledError();
+            const index = order[cursor++];
+            const source = sources[index];
+            onProgress?.(Math.round((finishedSheets / totalSheets) * 100), `📂 ${source.file.name}${source.sheetName ? ` [${source.sheetName}]` : ''} 읽는 중...`);
+            try {
+                const data = await parseSheetTable(source);
+                waveRows += data.rowCount;
+                wave.push({ index, job: { data, ...settings } });
+            } catch (err) {
+                fail(index, err);
+            }
+        }
+        if (wave.length === 0) continue;
+
+        // 끝난 시트부터 zip에 기록 (zip 항목은 순서대로 써야 하므로 기록 작업을 이어 붙임)
+        let writing = Promise.resolve();
+        const waveStart = finishedSheets;
+        await pool.runBatch(wave.map(w => w.job), (j, result) => {
+            const { index } = wave[j];
+            const { file, sheetName } = sources[index];
+            reports[index] = {
+                fileName: file.name,
+                sheetName,
+                outputName: outputNames[index],
+                rowCount: result.processedData.rowCount,
+                stats: result.stats,
+                issues: patternIssues.length > 0 ? [...result.issues, ...patternIssues] : result.issues,
+            };
+            finishedSheets++;
+            writing = writing.then(async () => {
+                await zip.begin(outputNames[index]);
+                await writeCsv({ write: chunk => zip.write(chunk as string) }, result.processedData);
+                await zip.end();
+            });
+        }, progress => {
+            // 묶음 진행률(0~100)을 전체 시트 기준으로 환산
+            const waveShare = wave.length / totalSheets;
+            onProgress?.(Math.round(((waveStart / totalSheets) + waveShare * (progress / 100)) * 100), `⚡ ${totalSheets}개 시트 일괄 정제 중... (${finishedSheets} / ${totalSheets})`);
+        });
+        await writing;
+    }
+
+    const sheets = [...failures, ...reports.filter((r): r is BatchSheetReport => r !== null)];
+    const succeeded = sheets.filter(s => !s.error);
+    const report: BatchReport = {
+        sheets,
+        stats: mergeBatchStats(succeeded.map(s => s.stats as ProcessingStats)),
+        totalRows: succeeded.reduce((sum, s) => sum + s.rowCount, 0),
+        failed: sheets.length - succeeded.length,
+        elapsedMs: performance.now() - started,
+    };
+    await zip.add('report.csv', reportCsv(report));
+    await zip.add('issues.csv', issuesCsv(report));
+    await zip.close();
+    await sink.close();
+    onProgress?.(100, '완료되었습니다.');
+    return report;
+}
@@ -1,15 +1,16 @@
 import { DataRow, DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits, ColumnOptionType } from '@/types';
 import { GARBAGE_REGEX } from './utils';
+import { ChangeSet } from './changes';
+import { DataTable, getTableColumnIndex, countCodes, countEmptyCells } from './table';
 
 /**
  * 컬럼 데이터 패턴을 분석하여 적절한 헤더 이름을 추천하는 함수
- * @param data 데이터 배열
+ * @param data 표본 행 배열 (sampling.ts의 값 모양별 층화 표본, 상위 행만 쓰지 않음)
  * @param column 분석할 컬럼명
  * @returns 추천 헤더 이름 배열 (최대 5개)
  */
 export function getHeaderRecommendations(data: DataRow[], column: string): string[] {
-    // 상위 20개 행만 샘플링하여 분석
-    const values = data.slice(0, 20).map(r => String(r[column] || ''));
+    const values = data.map(r => String(r[column] || ''));
     const combined = values.join(' ');
 
     const recs: string[] = [];
@@ -65,334 +66,655 @@ export function calculateColumnLengths(data: DataRow[]): ColumnLimits {
 }
 
 /**
- * 데이터 내의 잠재적 이슈를 감지하는 함수
- * 정규식과 패턴 매칭을 사용하여 다양한 데이터 품질 문제를 식별합니다.
- * 
- * @param data 검사할 데이터 배열
+ * 컬럼 하나의 이슈 검사 중간 결과
+ * 행 인덱스는 검사한 데이터(샤드) 기준이며, mergeIssueScans에서 샤드 시작 위치만큼 보정됩니다.
+ * 컬럼 전체 비율로 판단하는 검사(이메일/주소/URL/사업자번호 등)는 개수만 모아 두고 finalizeIssueScan에서 판정합니다.
+ */
+export interface ColumnIssueScan {
+    relevant: number[];          // 값이 있는 행 (trim 기준)
+    totalLength: number;         // 주소 평균 길이 계산용
+    lengthExceeded: number[];
+    whitespace: number[];
+    whitespaceSample: string | null;
+    phoneLetters: number[];
+    phoneNonDigits: number[];
+    phoneHasDash: boolean;
+    phoneHasNoDash: boolean;
+    dateLike: number[];
+    dateRelative: number[];
+    dateMixed: number[];
+    dateHasDot: boolean;
+    dateHasDash: boolean;
+    dateHasSlash: boolean;
+    dateHasTime: boolean;
+    emailLike: number;
+    emailInvalid: number[];
+    zipText: number[];
+    zipBadFormat: number[];
+    garbage: number[];
+    amountNonNumeric: number[];
+    nameNoise: number[];
+    addressValid: number;
+    addressMissing: number[];    // 주소 지시어('시 ', '구 ' 등)가 없는 행
+    bizNum: number;
+    bizNumInvalid: number[];
+    rrnUnmasked: number[];
+    urlLike: number;
+    urlNoProtocol: number[];
+    cardInvalid: number[];
+}
+
+/**
+ * 이슈 검사 중간 결과 (샤드 단위로 만들고 병합한 뒤 한 번에 이슈로 확정)
+ */
+export interface IssueScan {
+    headers: string[];
+    rowCount: number;
+    // 사업자번호 검사는 전체 데이터의 첫 행 값으로 판단하므로 첫 샤드의 첫 행 값을 보관
+    firstValues: Record<string, string>;
+    columns: Record<string, ColumnIssueScan>;
+}
+
+const ADDRESS_INDICATORS = ['시 ', '군 ', '구 ', '동 ', '로 ', '길 '];
+
+// 이슈 검사용 정규식 (모듈 로드 시 한 번만 컴파일)
+const NON_DIGIT = /\D/g;
+const PHONE_LETTERS = /[A-Za-z가-힣]/;
+const PHONE_NON_DIGIT = /[^\d-]/;
+const DATE_YEAR_FIRST = /^((19|20)\d{2}[-.\/년\s]|(19|20)\d{6}$)/;
+const DATE_YEAR_LAST = /^(\d{1,2})[\/\-.](\d{1,2})[\/\-.]((?:19|20)\d{2})$/;
+const DATE_SHORT = /^(\d{2})[\/\-.](\d{1,2})[\/\-.](\d{1,2})$/;
+const DATE_KOREAN_UNIT = /년|월|일/;
+const DATE_RELATIVE = /오늘|어제|그저께/;
+const MIXED_TEXT = /[가-힣a-zA-Z]/;
+const YEAR = /((?:19|20)\d{2})/;
+const DATE_TIME = /[:오전오후ampm]/i;
+const EMAIL_REGEX = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+const ZIP_TEXT = /[^\d\s-]/;
+const AMOUNT_COL = /금액|가격|비용|price|amount/i;
+const NAME_NOISE = /[0-9!@#$%^&*()_+={}\[\]|\\;:'",<>?/~`]/;
+const BIZ_NUM_FORMAT = /^\d{3}-\d{2}-\d{5}$/;
+const RRN_DIGITS = /[0-9]{6}[1-4][0-9]{6}/;
+const CARD_COL = /카드|card/i;
+const CARD_SEPARATORS = /[-\s]/g;
+const NON_NUMERIC = /[^0-9]/;
+const COMMAS = /,/g;
+
+/**
+ * 셀 값의 숫자 개수와 앞 두 자리 숫자 (`val.replace(/\D/g, '')` 문자열을 만들지 않고 계산)
+ */
+function countDigits(val: string): { count: number; lead: string } {
+    let count = 0;
+    let lead = '';
+    for (let i = 0; i < val.length; i++) {
+        const c = val.charCodeAt(i);
+        if (c >= 48 && c <= 57) {
+            if (count < 2) lead += val[i];
+            count++;
+        }
+    }
+    return { count, lead };
+}
+
+function emptyColumnScan(): ColumnIssueScan {
+    return {
+        relevant: [], totalLength: 0, lengthExceeded: [], whitespace: [], whitespaceSample: null,
+        phoneLetters: [], phoneNonDigits: [], phoneHasDash: false, phoneHasNoDash: false,
+        dateLike: [], dateRelative: [], dateMixed: [], dateHasDot: false, dateHasDash: false, dateHasSlash: false, dateHasTime: false,
+        emailLike: 0, emailInvalid: [], zipText: [], zipBadFormat: [], garbage: [], amountNonNumeric: [], nameNoise: [],
+        addressValid: 0, addressMissing: [], bizNum: 0, bizNumInvalid: [], rrnUnmasked: [], urlLike: 0, urlNoProtocol: [], cardInvalid: [],
+    };
+}
+
+type IndexField = { [K in keyof ColumnIssueScan]: ColumnIssueScan[K] extends number[] ? K : never }[keyof ColumnIssueScan];
+type CountField = { [K in keyof ColumnIssueScan]: ColumnIssueScan[K] extends number ? K : never }[keyof ColumnIssueScan];
+type FlagField = { [K in keyof ColumnIssueScan]: ColumnIssueScan[K] extends boolean ? K : never }[keyof ColumnIssueScan];
+
+const INDEX_FIELDS: IndexField[] = [
+    'relevant', 'lengthExceeded', 'whitespace', 'phoneLetters', 'phoneNonDigits', 'dateLike', 'dateRelative', 'dateMixed',
+    'emailInvalid', 'zipText', 'zipBadFormat', 'garbage', 'amountNonNumeric', 'nameNoise', 'addressMissing',
+    'bizNumInvalid', 'rrnUnmasked', 'urlNoProtocol', 'cardInvalid',
+];
+const COUNT_FIELDS: CountField[] = ['totalLength', 'emailLike', 'addressValid', 'bizNum', 'urlLike'];
+const FLAG_FIELDS: FlagField[] = ['phoneHasDash', 'phoneHasNoDash', 'dateHasDot', 'dateHasDash', 'dateHasSlash', 'dateHasTime'];
+
+/**
+ * 컬럼명/검사 조건으로 결정되는 검사 대상 여부 (컬럼마다 한 번만 판단)
+ */
+interface ColumnRules {
+    limit: number;
+    ignoreCommas: boolean;
+    isPhoneCol: boolean;
+    isEmailCol: boolean;
+    isZipCol: boolean;
+    isAmountCol: boolean;
+    isNameCol: boolean;
+    isAddressCol: boolean;
+    isUrlCol: boolean;
+    isCardCol: boolean;
+}
+
+function getColumnRules(key: string, maxLengthConstraints: ColumnLimits, options?: Partial<ProcessingOptions>): ColumnRules {
+    const lowerKey = key.toLowerCase();
+    return {
+        limit: maxLengthConstraints[key] > 0 ? maxLengthConstraints[key] : 0,
+        ignoreCommas: !!options?.formatNumber,
+        isPhoneCol: key.includes('연락처') || key.includes('전화번호') || lowerKey.includes('phone'),
+        isEmailCol: lowerKey.includes('email') || key.includes('이메일'),
+        isZipCol: key.includes('우편번호') || lowerKey.includes('zip') || lowerKey.includes('postal'),
+        isAmountCol: AMOUNT_COL.test(key),
+        isNameCol: ['이름', '고객명', '성함', '성명'].some(k => key.includes(k)),
+        isAddressCol: lowerKey.includes('주소') || lowerKey.includes('address'),
+        isUrlCol: (lowerKey.includes('url') || lowerKey.includes('web') || key.includes('사이트') || key.includes('주소') /* web content implied */)
+            && !key.includes('이메일') && !key.includes('email'), // Simple heuristic to avoid email
+        isCardCol: CARD_COL.test(key),
+    };
+}
+
+// 셀 값 하나의 검사 결과 비트: INDEX_FIELDS 순서의 행 목록 비트 뒤에 개수/플래그 비트
+const bit = (field: IndexField) => 1 << INDEX_FIELDS.indexOf(field);
+const INDEX_MASK = (1 << INDEX_FIELDS.length) - 1;
+const WHITESPACE_BIT = bit('whitespace');
+const EMAIL_LIKE_BIT = 1 << INDEX_FIELDS.length;
+const ADDRESS_VALID_BIT = 1 << (INDEX_FIELDS.length + 1);
+const BIZ_NUM_BIT = 1 << (INDEX_FIELDS.length + 2);
+const URL_LIKE_BIT = 1 << (INDEX_FIELDS.length + 3);
+const PHONE_DASH_BIT = 1 << (INDEX_FIELDS.length + 4);
+const PHONE_NO_DASH_BIT = 1 << (INDEX_FIELDS.length + 5);
+const DATE_DOT_BIT = 1 << (INDEX_FIELDS.length + 6);
+const DATE_DASH_BIT = 1 << (INDEX_FIELDS.length + 7);
+const DATE_SLASH_BIT = 1 << (INDEX_FIELDS.length + 8);
+const DATE_TIME_BIT = 1 << (INDEX_FIELDS.length + 9);
+
+/**
+ * 셀 값 하나를 모든 검사 규칙으로 판정해 결과 비트를 반환합니다. (빈 값이면 0)
+ * 결과는 값과 컬럼 규칙으로만 정해지므로 사전 인코딩 테이블에서는 고유값마다 한 번만 호출합니다.
+ */
+function scanValue(rules: ColumnRules, val: string): number {
+    const trimmed = val.trim();
+    if (trimmed === '') return 0;
+    let mask = bit('relevant');
+
+    const { count: digitCount, lead: leadDigits } = countDigits(val);
+    const hasDash = val.includes('-');
+
+    // 0. 최대 길이 검사 (Max Length Check)
+    if (rules.limit && (rules.ignoreCommas ? val.replace(COMMAS, '') : val).length > rules.limit) mask |= bit('lengthExceeded');
+
+    // 1. 공백 검사 (Whitespace)
+    if (trimmed !== val) mask |= WHITESPACE_BIT;
+
+    // 2. 전화번호 검사 (Phone)
+    if (rules.isPhoneCol) {
+        if (PHONE_LETTERS.test(val)) mask |= bit('phoneLetters');
+        if (PHONE_NON_DIGIT.test(val) || leadDigits === '82') mask |= bit('phoneNonDigits');
+        if (hasDash) mask |= PHONE_DASH_BIT;
+        else if (digitCount >= 9) mask |= PHONE_NO_DASH_BIT;
+    }
+
+    // 3. 날짜/일시 검사 (Date)
+    if (!rules.isEmailCol) {
+        const isRelative = DATE_RELATIVE.test(val);
+        if (isRelative || DATE_YEAR_FIRST.test(val) || DATE_YEAR_LAST.test(val) || DATE_SHORT.test(val) || DATE_KOREAN_UNIT.test(val)) {
+            mask |= bit('dateLike');
+            if (isRelative) mask |= bit('dateRelative');
+            if (MIXED_TEXT.test(val) && YEAR.test(val)) mask |= bit('dateMixed');
+            if (val.includes('.')) mask |= DATE_DOT_BIT;
+            if (hasDash) mask |= DATE_DASH_BIT;
+            if (val.includes('/')) mask |= DATE_SLASH_BIT;
+            if (DATE_TIME.test(val)) mask |= DATE_TIME_BIT;
+        }
+    }
+
+    // 4. 이메일 검사 (Email)
+    const hasAt = val.includes('@');
+    if (hasAt) {
+        mask |= EMAIL_LIKE_BIT;
+        if (!EMAIL_REGEX.test(val)) mask |= bit('emailInvalid');
+    }
+
+    // 5. Zip Code
+    if (rules.isZipCol) {
+        // 숫자와 하이픈을 제외한 문자가 포함된 행 (완전한 텍스트 오기입 등)
+        if (ZIP_TEXT.test(val)) mask |= bit('zipText');
+        // 숫자로만 구성되었으나 5자리가 아니거나 공백이 있는 경우 (Auto Fix 가능)
+        if (digitCount !== 5 || trimmed !== val) mask |= bit('zipBadFormat');
+    }
+
+    // 6. 가비지 데이터 검사 (Garbage)
+    if (GARBAGE_REGEX.test(val)) mask |= bit('garbage');
+
+    // 7. 데이터 타입 불일치 (Amount)
+    if (rules.isAmountCol && (digitCount === 0 || (MIXED_TEXT.test(val) && !val.includes('원') && !val.includes(',')))) {
+        mask |= bit('amountNonNumeric');
+    }
+
+    // 8. 이름 내 노이즈 (Name Noise)
+    if (rules.isNameCol && NAME_NOISE.test(val)) mask |= bit('nameNoise');
+
+    // 9. Address (평균 길이는 호출측에서 집계)
+    if (rules.isAddressCol) {
+        if (ADDRESS_INDICATORS.some(ind => val.includes(ind))) mask |= ADDRESS_VALID_BIT;
+        else mask |= bit('addressMissing');
+    }
+
+    // 10. 사업자등록번호 (Business Number) - 판정은 전체 첫 행 기준으로 finalize에서 수행
+    if (digitCount === 10) {
+        mask |= BIZ_NUM_BIT;
+        if (!BIZ_NUM_FORMAT.test(val)) mask |= bit('bizNumInvalid');
+    }
+
+    // 11. 개인정보 (Personal Data) - 13자리 숫자 (6-7 format), 마스킹 되지 않은 데이터
+    if (digitCount === 13 && !val.includes('*') && RRN_DIGITS.test(val.replace(NON_DIGIT, ''))) mask |= bit('rrnUnmasked');
+
+    // 12. URL / Web
+    if (rules.isUrlCol && !hasAt && val.includes('.')) {
+        mask |= URL_LIKE_BIT;
+        if (!val.startsWith('http')) mask |= bit('urlNoProtocol');
+    }
+
+    // 13. 카드번호 (Card Number)
+    if (rules.isCardCol) {
+        const clean = val.replace(CARD_SEPARATORS, '');
+        // [Fix] 10자리 미만이나 19자리 초과(송장번호 등 제외) 또는 숫자가 아닌 경우
+        if (clean.length < 10 || clean.length > 19 || NON_NUMERIC.test(clean)) mask |= bit('cardInvalid');
+    }
+
+    return mask;
+}
+
+/**
+ * 판정 결과 비트에 해당하는 행 목록에 행 번호를 추가합니다.
+ */
+function recordRow(col: ColumnIssueScan, mask: number, row: number) {
+    for (let bits = mask & INDEX_MASK; bits !== 0; bits &= bits - 1) {
+        col[INDEX_FIELDS[31 - Math.clz32(bits & -bits)]].push(row);
+    }
+}
+
+/**
+ * 판정 결과 비트의 개수/플래그를 집계합니다. (같은 값이 times번 등장)
+ */
+function recordValue(col: ColumnIssueScan, rules: ColumnRules, mask: number, val: string, times: number) {
+    if (rules.isAddressCol) col.totalLength += val.length * times;
+    if (mask & EMAIL_LIKE_BIT) col.emailLike += times;
+    if (mask & ADDRESS_VALID_BIT) col.addressValid += times;
+    if (mask & BIZ_NUM_BIT) col.bizNum += times;
+    if (mask & URL_LIKE_BIT) col.urlLike += times;
+    if (mask & PHONE_DASH_BIT) col.phoneHasDash = true;
+    if (mask & PHONE_NO_DASH_BIT) col.phoneHasNoDash = true;
+    if (mask & DATE_DOT_BIT) col.dateHasDot = true;
+    if (mask & DATE_DASH_BIT) col.dateHasDash = true;
+    if (mask & DATE_SLASH_BIT) col.dateHasSlash = true;
+    if (mask & DATE_TIME_BIT) col.dateHasTime = true;
+}
+
+/**
+ * 데이터(또는 샤드)를 검사하여 컬럼별 이슈 후보를 수집합니다.
+ * 컬럼명으로 결정되는 검사 대상 여부는 컬럼마다 한 번만 판단하고, 셀마다 한 번의 순회로 모든 검사를 수행합니다.
+ * @param data 검사할 데이터 배열 (샤드)
+ * @param headers 전체 데이터의 헤더 (샤드마다 같아야 함, 기본값은 첫 행의 키)
  * @param maxLengthConstraints 컬럼별 길이 제약 조건
- * @param options 현재 선택된 정제 옵션 (옵션에 따라 검사 기준이 달라질 수 있음)
- * @returns 발견된 DataIssue 배열
+ * @param options 현재 선택된 정제 옵션
  */
-export function detectDataIssues(data: DataRow[], maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] {
-    const issues: DataIssue[] = [];
-    if (data.length === 0) return issues;
-    const headers = Object.keys(data[0]);
+export function scanIssues(data: DataRow[], headers: string[] = Object.keys(data[0] || {}), maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): IssueScan {
+    const scan: IssueScan = { headers, rowCount: data.length, firstValues: {}, columns: {} };
+
+    for (const key of headers) {
+        if (key === 'id') continue;
+        scan.firstValues[key] = String(data[0]?.[key] || '');
+
+        const rules = getColumnRules(key, maxLengthConstraints, options);
+        const col = emptyColumnScan();
+        scan.columns[key] = col;
+
+        for (let i = 0; i < data.length; i++) {
+            const val = String(data[i][key] || '');
+            const mask = scanValue(rules, val);
+            if (mask === 0) continue;
+            if (mask & WHITESPACE_BIT && col.whitespaceSample === null) col.whitespaceSample = val;
+            recordRow(col, mask, i);
+            recordValue(col, rules, mask, val, 1);
+        }
+    }
+
+    return scan;
+}
+
+/**
+ * scanIssues와 같은 검사를 사전 인코딩 테이블(table.ts)에 수행합니다.
+ * 검사는 컬럼의 고유값마다 한 번만 하고, 행 순회는 번호 배열로 판정 결과를 행 목록에 펼치기만 합니다.
+ * @param headers 검사할 헤더 (테이블에 없는 헤더는 모든 셀이 비어 있는 것으로 봄)
+ */
+export function scanTableIssues(table: DataTable, headers: string[] = table.headers, maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): IssueScan {
+    const scan: IssueScan = { headers, rowCount: table.rowCount, firstValues: {}, columns: {} };
+    const columnIndex = getTableColumnIndex(table);
 
     for (const key of headers) {
         if (key === 'id') continue;
+        const col = emptyColumnScan();
+        scan.columns[key] = col;
+        const column = table.columns[columnIndex.get(key) ?? -1];
+        scan.firstValues[key] = String((column && table.rowCount > 0 ? column.values[column.codes[0]] : '') || '');
+        if (!column) continue;
+
+        const rules = getColumnRules(key, maxLengthConstraints, options);
+        const counts = countCodes(column, table.rowCount);
+        const masks = new Uint32Array(column.values.length);
+        column.values.forEach((value, code) => {
+            if (counts[code] === 0) return;
+            const val = String(value || '');
+            masks[code] = scanValue(rules, val);
+            if (masks[code] !== 0) recordValue(col, rules, masks[code], val, counts[code]);
+        });
+
+        const { codes, values } = column;
+        for (let i = 0; i < table.rowCount; i++) {
+            const mask = masks[codes[i]];
+            if (mask === 0) continue;
+            if (mask & WHITESPACE_BIT && col.whitespaceSample === null) col.whitespaceSample = String(values[codes[i]] || '');
+            recordRow(col, mask, i);
+        }
+    }
+
+    return scan;
+}
+
+/**
+ * 샤드별 검사 결과를 원래 행 순서대로 병합합니다.
+ * @param scans 샤드 순서대로 정렬된 검사 결과 (워커에서 받은 행 목록이 Uint32Array인 결과도 그대로 병합)
+ * @param offsets 각 샤드의 시작 행 인덱스 (전체 데이터 기준)
+ */
+export function mergeIssueScans(scans: (IssueScan | PackedIssueScan)[], offsets: number[]): IssueScan {
+    const merged: IssueScan = {
+        headers: scans[0]?.headers || [],
+        rowCount: 0,
+        firstValues: scans[0]?.firstValues || {},
+        columns: {},
+    };
+
+    scans.forEach((scan, s) => {
+        const offset = offsets[s];
+        merged.rowCount += scan.rowCount;
+        for (const key in scan.columns) {
+            const part = scan.columns[key];
+            const target = merged.columns[key];
+            if (!target) {
+                merged.columns[key] = shiftColumnScan(part, offset);
+                continue;
+            }
+            for (const field of INDEX_FIELDS) {
+                const rows = target[field];
+                for (const i of part[field]) rows.push(i + offset);
+            }
+            for (const field of COUNT_FIELDS) target[field] += part[field];
+            for (const field of FLAG_FIELDS) target[field] = target[field] || part[field];
+            if (target.whitespaceSample === null) target.whitespaceSample = part.whitespaceSample;
+        }
+    });
+
+    return merged;
+}
+
+function shiftColumnScan(part: ColumnIssueScan | PackedColumnIssueScan, offset: number): ColumnIssueScan {
+    const shifted = { ...part } as ColumnIssueScan;
+    for (const field of INDEX_FIELDS) {
+        shifted[field] = offset === 0 ? Array.from(part[field]) : Array.from(part[field], i => i + offset);
+    }
+    return shifted;
+}
+
+/**
+ * 워커 전송용 검사 결과 (행 목록을 Uint32Array로 바꿔 버퍼째 넘김)
+ */
+export type PackedColumnIssueScan = Omit<ColumnIssueScan, IndexField> & Record<IndexField, Uint32Array>;
+
+export interface PackedIssueScan extends Omit<IssueScan, 'columns'> {
+    columns: Record<string, PackedColumnIssueScan>;
+}
+
+/**
+ * 검사 결과의 행 목록을 형식화 배열로 바꿉니다. (structured clone 대신 Transferable로 전송, 받는 쪽은 풀지 않고 병합)
+ * @returns 변환 결과와 postMessage의 transfer 인자로 넘길 버퍼 목록
+ */
+export function packIssueScan(scan: IssueScan | PackedIssueScan): { packed: PackedIssueScan; transfer: ArrayBuffer[] } {
+    const transfer: ArrayBuffer[] = [];
+    const columns: Record<string, PackedColumnIssueScan> = {};
+    for (const key in scan.columns) {
+        const column = { ...scan.columns[key] } as unknown as PackedColumnIssueScan;
+        for (const field of INDEX_FIELDS) {
+            const rows = Uint32Array.from(scan.columns[key][field]);
+            column[field] = rows;
+            transfer.push(rows.buffer);
+        }
+        columns[key] = column;
+    }
+    return { packed: { ...scan, columns }, transfer };
+}
 
-        const relevantRows = data.map((row, i) => ({ val: String(row[key] || ''), idx: i }))
-            .filter(item => item.val.trim() !== '');
+/**
+ * 검사 결과를 최종 이슈 목록으로 확정합니다. (컬럼 전체 비율 기반 판정 포함)
+ */
+export function finalizeIssueScan(scan: IssueScan, maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] {
+    const issues: DataIssue[] = [];
+    if (scan.rowCount === 0) return issues;
 
-        if (relevantRows.length === 0) continue;
+    for (const key of scan.headers) {
+        const col = scan.columns[key];
+        if (!col || col.relevant.length === 0) continue;
+        const lowerKey = key.toLowerCase();
 
         // 0. 최대 길이 검사 (Max Length Check)
-        if (maxLengthConstraints[key] && maxLengthConstraints[key] > 0) {
+        if (col.lengthExceeded.length > 0) {
             const limit = maxLengthConstraints[key];
-            const lengthExceededRows = relevantRows.filter(r => {
-                let valToMeasure = r.val;
-                if (options?.formatNumber) {
-                    valToMeasure = valToMeasure.replace(/,/g, '');
-                }
-                return valToMeasure.length > limit;
+            issues.push({
+                column: key,
+                type: 'error',
+                message: `'${key}' 컬럼의 데이터가 설정된 최대 길이(${limit}자)를 초과했습니다.${options?.formatNumber ? ' (천단위 콤마 실시간 보정 적용됨)' : ''}`,
+                fixType: 'maxLength',
+                affectedRows: col.lengthExceeded
             });
-
-            if (lengthExceededRows.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'error',
-                    message: `'${key}' 컬럼의 데이터가 설정된 최대 길이(${limit}자)를 초과했습니다.${options?.formatNumber ? ' (천단위 콤마 실시간 보정 적용됨)' : ''}`,
-                    fixType: 'maxLength',
-                    affectedRows: lengthExceededRows.map(r => r.idx)
-                });
-            }
         }
 
         // 1. 공백 검사 (Whitespace)
-        const whitespaceRows = relevantRows.filter(r => r.val.trim() !== r.val);
-        if (whitespaceRows.length > 0) {
-            const sample = whitespaceRows[0].val;
+        if (col.whitespace.length > 0) {
             issues.push({
                 column: key,
                 type: 'warning',
-                message: `'${key}' 컬럼에 불필요한 공백이 포함된 데이터가 있습니다. (예: "${sample}")`,
+                message: `'${key}' 컬럼에 불필요한 공백이 포함된 데이터가 있습니다. (예: "${col.whitespaceSample}")`,
                 suggestion: { removeWhitespace: true },
-                affectedRows: whitespaceRows.map(r => r.idx)
+                affectedRows: col.whitespace
             });
         }
 
         // 2. 전화번호 검사 (Phone)
-        const isPhoneCol = key.includes('연락처') || key.includes('전화번호') || key.toLowerCase().includes('phone');
-        if (isPhoneCol) {
-            const rowsWithLetters = relevantRows.filter(r => /[A-Za-z가-힣]/.test(r.val));
-            const rowsWithNonDigitsOrBadIntl = relevantRows.filter(r => /[^\d-]/.test(r.val) || r.val.replace(/\D/g, '').startsWith('82'));
-
-            if (rowsWithLetters.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼에 비정상적인 문자(가짜 번호 가능성)가 포함되어 있습니다.`,
-                    suggestion: { formatMobile: true, formatGeneralPhone: true },
-                    affectedRows: rowsWithLetters.map(r => r.idx)
-                });
-            } else if (rowsWithNonDigitsOrBadIntl.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼에 텍스트가 섞여 있거나 국가번호(82)가 포함되어 있습니다.`,
-                    suggestion: { formatMobile: true, formatGeneralPhone: true },
-                    affectedRows: rowsWithNonDigitsOrBadIntl.map(r => r.idx)
-                });
-            } else {
-                const hasDash = relevantRows.some(r => r.val.includes('-'));
-                const hasNoDash = relevantRows.some(r => !r.val.includes('-') && r.val.replace(/\D/g, '').length >= 9);
-                if (hasDash && hasNoDash) {
-                    issues.push({
-                        column: key,
-                        type: 'warning',
-                        message: `'${key}' 컬럼에 전화번호 형식이 일관되지 않습니다.`,
-                        suggestion: { formatMobile: true, formatGeneralPhone: true },
-                        affectedRows: relevantRows.map(r => r.idx)
-                    });
-                }
-            }
+        if (col.phoneLetters.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 비정상적인 문자(가짜 번호 가능성)가 포함되어 있습니다.`,
+                suggestion: { formatMobile: true, formatGeneralPhone: true },
+                affectedRows: col.phoneLetters
+            });
+        } else if (col.phoneNonDigits.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 텍스트가 섞여 있거나 국가번호(82)가 포함되어 있습니다.`,
+                suggestion: { formatMobile: true, formatGeneralPhone: true },
+                affectedRows: col.phoneNonDigits
+            });
+        } else if (col.phoneHasDash && col.phoneHasNoDash) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 전화번호 형식이 일관되지 않습니다.`,
+                suggestion: { formatMobile: true, formatGeneralPhone: true },
+                affectedRows: col.relevant
+            });
         }
 
         // 3. 날짜/일시 검사 (Date)
-        const isEmailCol = key.toLowerCase().includes('email') || key.includes('이메일');
-        const dateLikeRows = isEmailCol ? [] : relevantRows.filter(r =>
-            /^((19|20)\d{2}[-.\/년\s]|(19|20)\d{6}$)/.test(r.val) ||
-            /^(\d{1,2})[\/\-.](\d{1,2})[\/\-.]((?:19|20)\d{2})$/.test(r.val) ||
-            /^(\d{2})[\/\-.](\d{1,2})[\/\-.](\d{1,2})$/.test(r.val) ||
-            /년|월|일/.test(r.val) ||
-            /오늘|어제|그저께/.test(r.val)
-        );
-        if (dateLikeRows.length > 0) {
-            const relativeDateRows = dateLikeRows.filter(r => /오늘|어제|그저께/.test(r.val));
-            const mixedDateRows = dateLikeRows.filter(r => /[가-힣a-zA-Z]/.test(r.val) && /((?:19|20)\d{2})/.test(r.val));
-            const hasDot = dateLikeRows.some(r => r.val.includes('.'));
-            const hasDash = dateLikeRows.some(r => r.val.includes('-'));
-            const hasSlash = dateLikeRows.some(r => r.val.includes('/'));
-            const isInconsistent = [hasDot, hasDash, hasSlash].filter(Boolean).length > 1;
-
-            const hasTime = dateLikeRows.some(r => /[:오전오후ampm]/i.test(r.val));
-            const sugg = hasTime ? { formatDateTime: true } : { formatDate: true };
-            const msgSuffix = hasTime ? '일시 형식으로 표준화할 수 있습니다.' : '날짜 형식으로 통일할 수 있습니다.';
-
-            if (relativeDateRows.length > 0) {
+        if (col.dateLike.length > 0) {
+            const isInconsistent = [col.dateHasDot, col.dateHasDash, col.dateHasSlash].filter(Boolean).length > 1;
+            const sugg = col.dateHasTime ? { formatDateTime: true } : { formatDate: true };
+            const msgSuffix = col.dateHasTime ? '일시 형식으로 표준화할 수 있습니다.' : '날짜 형식으로 통일할 수 있습니다.';
+
+            if (col.dateRelative.length > 0) {
                 issues.push({
                     column: key,
                     type: 'info',
                     message: `'${key}' 컬럼에 '어제', '오늘' 등 상대적 날짜가 있습니다. ${msgSuffix}`,
                     suggestion: sugg,
-                    affectedRows: relativeDateRows.map(r => r.idx)
+                    affectedRows: col.dateRelative
                 });
-            } else if (mixedDateRows.length > 0 || isInconsistent) {
+            } else if (col.dateMixed.length > 0 || isInconsistent) {
                 issues.push({
                     column: key,
                     type: 'warning',
                     message: `'${key}' 컬럼에 일관되지 않은 날짜/일시 형식이 있습니다.`,
                     suggestion: sugg,
-                    affectedRows: mixedDateRows.length > 0 ? mixedDateRows.map(r => r.idx) : dateLikeRows.map(r => r.idx)
+                    affectedRows: col.dateMixed.length > 0 ? col.dateMixed : col.dateLike
                 });
             }
         }
 
         // 4. 이메일 검사 (Email)
-        const isEmailNaming = /email|이메일/.test(key.toLowerCase());
-        const emailLikeRows = relevantRows.filter(r => r.val.includes('@'));
-
-        if (emailLikeRows.length > 0) {
-            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-            const invalidEmailRows = emailLikeRows.filter(r => !emailRegex.test(r.val));
-
-            // 컬럼 이름이 이메일이거나, 데이터의 50% 이상이 이미 유효한 이메일 포맷인 경우에만 이메일 컬럼으로 확신
-            const validEmailCount = emailLikeRows.length - invalidEmailRows.length;
-            const isLikelyEmailCol = isEmailNaming || (validEmailCount > emailLikeRows.length * 0.5);
+        // 컬럼 이름이 이메일이거나, 데이터의 50% 이상이 이미 유효한 이메일 포맷인 경우에만 이메일 컬럼으로 확신
+        if (col.emailLike > 0) {
+            const isEmailNaming = /email|이메일/.test(lowerKey);
+            const validEmailCount = col.emailLike - col.emailInvalid.length;
+            const isLikelyEmailCol = isEmailNaming || (validEmailCount > col.emailLike * 0.5);
 
-            if (isLikelyEmailCol && invalidEmailRows.length > 0) {
+            if (isLikelyEmailCol && col.emailInvalid.length > 0) {
                 issues.push({
                     column: key,
                     type: 'warning',
                     message: `'${key}' 컬럼에 유효하지 않은 이메일 형식이 있습니다.`,
                     suggestion: { cleanEmail: true },
-                    affectedRows: invalidEmailRows.map(r => r.idx)
+                    affectedRows: col.emailInvalid
                 });
             }
         }
 
         // 5. Zip Code
-        const isZipCol = key.includes('우편번호') || key.toLowerCase().includes('zip') || key.toLowerCase().includes('postal');
-        if (isZipCol) {
-            // 숫자와 하이픈을 제외한 문자가 포함된 행 찾기 (완전한 텍스트 오기입 등)
-            const textZipRows = relevantRows.filter(r => /[^\d\s-]/.test(r.val));
-
-            if (textZipRows.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼에 숫자가 아닌 문자열 데이터가 섞여 있습니다. 자동 정제가 불가능하니 직접 수정해 주세요.`,
-                    affectedRows: textZipRows.map(r => r.idx)
-                });
-            } else {
-                // 숫자로만 구성되었으나 5자리가 아니거나 공백이 있는 경우 (Auto Fix 가능)
-                const badFormatRows = relevantRows.filter(r => r.val.replace(/\D/g, '').length !== 5 || r.val.trim() !== r.val);
-                if (badFormatRows.length > 0) {
-                    issues.push({
-                        column: key,
-                        type: 'warning',
-                        message: `'${key}' 컬럼의 우편번호 형식이 표준(5자리)과 다릅니다.`,
-                        suggestion: { formatZip: true },
-                        affectedRows: badFormatRows.map(r => r.idx)
-                    });
-                }
-            }
+        if (col.zipText.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 숫자가 아닌 문자열 데이터가 섞여 있습니다. 자동 정제가 불가능하니 직접 수정해 주세요.`,
+                affectedRows: col.zipText
+            });
+        } else if (col.zipBadFormat.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼의 우편번호 형식이 표준(5자리)과 다릅니다.`,
+                suggestion: { formatZip: true },
+                affectedRows: col.zipBadFormat
+            });
         }
 
         // 6. 가비지 데이터 검사 (Garbage)
-        const garbageRows = relevantRows.filter(r => GARBAGE_REGEX.test(r.val));
-        if (garbageRows.length > 0) {
+        if (col.garbage.length > 0) {
             issues.push({
                 column: key,
                 type: 'warning',
                 message: `'${key}' 컬럼에 깨진 문자열이나 무의미한 데이터가 있습니다.`,
                 suggestion: { cleanGarbage: true },
-                affectedRows: garbageRows.map(r => r.idx)
+                affectedRows: col.garbage
             });
         }
 
         // 7. 데이터 타입 불일치 (Amount)
-        if (/금액|가격|비용|price|amount/i.test(key)) {
-            const nonNumericRows = relevantRows.filter(r => {
-                const cleaned = r.val.replace(/[^0-9]/g, '');
-                return cleaned === '' || (/[가-힣a-zA-Z]/.test(r.val) && !r.val.includes('원') && !r.val.includes(','));
+        if (col.amountNonNumeric.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 텍스트가 섞여 있어 합계 계산이 불가능할 수 있습니다.`,
+                suggestion: { cleanAmount: true },
+                affectedRows: col.amountNonNumeric
             });
-            if (nonNumericRows.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼에 텍스트가 섞여 있어 합계 계산이 불가능할 수 있습니다.`,
-                    suggestion: { cleanAmount: true },
-                    affectedRows: nonNumericRows.map(r => r.idx)
-                });
-            }
         }
 
         // 8. 이름 내 노이즈 (Name Noise)
-        const isNameCol = ['이름', '고객명', '성함', '성명'].some(k => key.includes(k));
-        if (isNameCol) {
-            const noiseRows = relevantRows.filter(r => /[0-9!@#$%^&*()_+={}\[\]|\\;:'",<>?/~`]/.test(r.val));
-            if (noiseRows.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼의 이름에 숫자나 특수문자가 섞여 있습니다.`,
-                    suggestion: { cleanName: true },
-                    affectedRows: noiseRows.map(r => r.idx)
-                });
-            }
+        if (col.nameNoise.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼의 이름에 숫자나 특수문자가 섞여 있습니다.`,
+                suggestion: { cleanName: true },
+                affectedRows: col.nameNoise
+            });
         }
 
         // 9. Address
-        if (key.toLowerCase().includes('주소') || key.toLowerCase().includes('address')) {
-            const addressIndicators = ['시 ', '군 ', '구 ', '동 ', '로 ', '길 '];
+        if (lowerKey.includes('주소') || lowerKey.includes('address')) {
             // 데이터 길이 분석 (너무 짧으면 정제 불가 판단)
-            const totalLen = relevantRows.reduce((acc, curr) => acc + curr.val.length, 0);
-            const avgLen = relevantRows.length > 0 ? totalLen / relevantRows.length : 0;
+            const avgLen = col.totalLength / col.relevant.length;
 
             if (avgLen > 0 && avgLen < 6) {
                 issues.push({
                     column: key,
                     type: 'warning',
                     message: `'${key}' 컬럼의 데이터 길이가 너무 짧아 자동 정제가 어렵습니다. (평균 ${Math.round(avgLen)}자) 원본 데이터를 확인 후 직접 수정해 주세요.`,
-                    affectedRows: relevantRows.map(r => r.idx)
+                    affectedRows: col.relevant
+                });
+            } else if (col.addressValid < col.relevant.length * 0.5) {
+                issues.push({
+                    column: key,
+                    type: 'warning',
+                    message: `'${key}' 컬럼의 주소 형식이 불완전해 보입니다. AI 정제를 제안합니다.`,
+                    promptSuggestion: `'${key}' 컬럼의 주소를 도로명 주소 형식으로 정제하고 시/도, 시/군/구로 분리해줘`,
+                    affectedRows: col.addressMissing
                 });
-            } else {
-                const validAddressCount = relevantRows.filter(r => addressIndicators.some(ind => r.val.includes(ind))).length;
-
-                if (validAddressCount < relevantRows.length * 0.5) {
-                    issues.push({
-                        column: key,
-                        type: 'warning',
-                        message: `'${key}' 컬럼의 주소 형식이 불완전해 보입니다. AI 정제를 제안합니다.`,
-                        promptSuggestion: `'${key}' 컬럼의 주소를 도로명 주소 형식으로 정제하고 시/도, 시/군/구로 분리해줘`,
-                        affectedRows: relevantRows.map(r => r.idx).filter(idx => !addressIndicators.some(ind => String(data[idx][key] || '').includes(ind)))
-                    });
-                }
             }
         }
 
-
         // 10. 사업자등록번호 (Business Number)
-        if (/\d{3}-\d{2}-\d{5}|\d{10}/.test(String(data[0]?.[key] || ''))) {
+        if (/\d{3}-\d{2}-\d{5}|\d{10}/.test(scan.firstValues[key] || '')) {
             // Heuristic: Check few rows
-            const bizNumRows = relevantRows.filter(r => r.val.replace(/[^0-9]/g, '').length === 10);
-            if (bizNumRows.length > relevantRows.length * 0.5) {
-                const invalidBizNum = bizNumRows.filter(r => !/^\d{3}-\d{2}-\d{5}$/.test(r.val));
-                if (invalidBizNum.length > 0) {
-                    issues.push({
-                        column: key,
-                        type: 'warning',
-                        message: `'${key}' 컬럼에 사업자등록번호 형식이 아닌 데이터가 있습니다.`,
-                        suggestion: { formatBizNum: true },
-                        affectedRows: invalidBizNum.map(r => r.idx)
-                    });
-                }
-            }
-        }
-
-        // 11. 개인정보 (Personal Data) - 주민번호, 외국인번호 마스킹 권장
-        // 13자리 숫자 (6-7 format)
-        const rrnRows = relevantRows.filter(r => {
-            const v = r.val.replace(/[^0-9]/g, '');
-            return v.length === 13 && /[0-9]{6}[1-4][0-9]{6}/.test(v);
-        });
-
-        if (rrnRows.length > 0) {
-            // 마스킹 되지 않은 데이터 확인 (하이픈 뒤가 *이 아닌 경우)
-            const unmasked = rrnRows.filter(r => !r.val.includes('*'));
-            if (unmasked.length > 0) {
+            if (col.bizNum > col.relevant.length * 0.5 && col.bizNumInvalid.length > 0) {
                 issues.push({
                     column: key,
-                    type: 'error', // High severity for privacy
-                    message: `'${key}' 컬럼에 마스킹되지 않은 주민등록번호가 감지되었습니다. 개인정보 보호를 위해 마스킹을 권장합니다.`,
-                    suggestion: { maskPersonalData: true },
-                    affectedRows: unmasked.map(r => r.idx)
+                    type: 'warning',
+                    message: `'${key}' 컬럼에 사업자등록번호 형식이 아닌 데이터가 있습니다.`,
+                    suggestion: { formatBizNum: true },
+                    affectedRows: col.bizNumInvalid
                 });
             }
         }
 
-        // 12. URL / Web
-        if (key.toLowerCase().includes('url') || key.toLowerCase().includes('web') || key.includes('사이트') || key.includes('주소') /* web content implied */) {
-            const urlRows = relevantRows.filter(r => r.val.includes('.') && !r.val.includes('@') && !key.includes('이메일') && !key.includes('email')); // Simple heuristic to avoid email
-            const noProtocolRows = urlRows.filter(r => !r.val.startsWith('http'));
+        // 11. 개인정보 (Personal Data) - 주민번호, 외국인번호 마스킹 권장
+        if (col.rrnUnmasked.length > 0) {
+            issues.push({
+                column: key,
+                type: 'error', // High severity for privacy
+                message: `'${key}' 컬럼에 마스킹되지 않은 주민등록번호가 감지되었습니다. 개인정보 보호를 위해 마스킹을 권장합니다.`,
+                suggestion: { maskPersonalData: true },
+                affectedRows: col.rrnUnmasked
+            });
+        }
 
-            if (noProtocolRows.length > 0 && noProtocolRows.length > urlRows.length * 0.5) {
-                issues.push({
-                    column: key,
-                    type: 'info',
-                    message: `'${key}' 컬럼의 웹 사이트 주소에 프로토콜(http/https)이 누락되어 있습니다.`,
-                    suggestion: { formatUrl: true },
-                    affectedRows: noProtocolRows.map(r => r.idx)
-                });
-            }
+        // 12. URL / Web
+        if (col.urlNoProtocol.length > 0 && col.urlNoProtocol.length > col.urlLike * 0.5) {
+            issues.push({
+                column: key,
+                type: 'info',
+                message: `'${key}' 컬럼의 웹 사이트 주소에 프로토콜(http/https)이 누락되어 있습니다.`,
+                suggestion: { formatUrl: true },
+                affectedRows: col.urlNoProtocol
+            });
         }
 
         // 13. 카드번호 (Card Number)
-        if (/카드|card/i.test(key)) {
-            const invalidCards = relevantRows.filter(r => {
-                const clean = r.val.replace(/[-\s]/g, '');
-                // [Fix] 10자리 미만이나 19자리 초과(송장번호 등 제외) 또는 숫자가 아닌 경우
-                return clean.length < 10 || clean.length > 19 || /[^0-9]/.test(clean);
+        if (col.cardInvalid.length > 0) {
+            issues.push({
+                column: key,
+                type: 'warning',
+                message: `'${key}' 컬럼에 유효하지 않은 카드번호(길이 부적합 등)가 있습니다.`,
+                affectedRows: col.cardInvalid
             });
-            if (invalidCards.length > 0) {
-                issues.push({
-                    column: key,
-                    type: 'warning',
-                    message: `'${key}' 컬럼에 유효하지 않은 카드번호(길이 부적합 등)가 있습니다.`,
-                    affectedRows: invalidCards.map(r => r.idx)
-                });
-            }
         }
     }
 
@@ -400,43 +722,152 @@ export function detectDataIssues(data: DataRow[], maxLengthConstraints: ColumnLi
 }
 
 /**
- * 정제 전후의 데이터 변화량을 통계로 계산하는 함수
- * @param original 원본 데이터
- * @param processed 정제된 데이터
- * @param initialIssuesCount 정제 전 발견된 이슈 수
- * @param finalIssuesCount 정제 후 남은 이슈 수
- * @returns ProcessingStats 객체
+ * 데이터 내의 잠재적 이슈를 감지하는 함수
+ * 정규식과 패턴 매칭을 사용하여 다양한 데이터 품질 문제를 식별합니다.
+ *
+ * @param data 검사할 데이터 배열
+ * @param maxLengthConstraints 컬럼별 길이 제약 조건
+ * @param options 현재 선택된 정제 옵션 (옵션에 따라 검사 기준이 달라질 수 있음)
+ * @returns 발견된 DataIssue 배열
  */
-export function calculateDiffStats(original: DataRow[], processed: DataRow[], initialIssuesCount: number, finalIssuesCount: number): ProcessingStats {
-    const stats: ProcessingStats = {
-        totalRows: 0,
-        changedCells: 0,
-        resolvedIssues: Math.max(0, initialIssuesCount - finalIssuesCount),
-        qualityScore: 0,
-        completeness: 0,
-        validity: 0
-    };
+export function detectDataIssues(data: DataRow[], maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] {
+    if (data.length === 0) return [];
+    return finalizeIssueScan(scanIssues(data, Object.keys(data[0]), maxLengthConstraints, options), maxLengthConstraints, options);
+}
 
-    if (processed.length === 0) return stats;
+/**
+ * detectDataIssues와 같은 이슈 감지를 사전 인코딩 테이블(table.ts)에 수행합니다.
+ */
+export function detectTableIssues(table: DataTable, maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] {
+    if (table.rowCount === 0) return [];
+    return finalizeIssueScan(scanTableIssues(table, table.headers, maxLengthConstraints, options), maxLengthConstraints, options);
+}
 
-    stats.totalRows = processed.length;
-    const headers = Object.keys(processed[0]);
-    const totalCells = stats.totalRows * headers.length;
+/**
+ * 실행 시간을 보장할 수 없어 적용하지 않은 프롬프트 패턴(역참조/전후방 탐색이 있는 중첩 반복 등, safeRegex.ts)을 이슈로 만듭니다.
+ * @param rejectedPatterns analyzePrompt 결과의 rejectedPatterns
+ */
+export function detectPatternIssues(rejectedPatterns: string[]): DataIssue[] {
+    return rejectedPatterns.map(source => ({
+        column: '정제 요청',
+        type: 'warning' as const,
+        message: `"${source}" 패턴은 데이터에 따라 처리 시간이 급격히 늘 수 있어 적용하지 않았습니다. 역참조(\\1)나 전후방 탐색((?=...)) 없이 다시 입력해 주세요.`,
+    }));
+}
+
+/**
+ * 원본 데이터 이슈 캐시
+ * 원본 데이터는 프롬프트/옵션을 바꿔 다시 정제해도 그대로이므로, 같은 데이터와 검사 조건
+ * (컬럼 길이 제한, 천단위 콤마 보정 여부)의 이슈는 한 번만 계산하고 재사용합니다.
+ * 원본 테이블 자체를 키로 쓰므로(WeakMap) 파일을 바꾸거나 원본을 갱신하면 자동으로 새로 계산됩니다.
+ */
+export class BaselineIssueCache {
+    private entries = new WeakMap<DataTable, Map<string, DataIssue[]>>();
+    hits = 0;
+    misses = 0;
+
+    /**
+     * 이슈 검사 결과에 영향을 주는 조건만으로 만든 키
+     */
+    static key(maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): string {
+        const limits = Object.keys(maxLengthConstraints).filter(k => maxLengthConstraints[k] > 0).sort().map(k => [k, maxLengthConstraints[k]]);
+        return JSON.stringify([limits, !!options?.formatNumber]);
+    }
+
+    get(data: DataTable, maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] | undefined {
+        const issues = this.entries.get(data)?.get(BaselineIssueCache.key(maxLengthConstraints, options));
+        if (issues) this.hits++;
+        else this.misses++;
+        return issues;
+    }
+
+    set(data: DataTable, maxLengthConstraints: ColumnLimits = {}, options: Partial<ProcessingOptions> | undefined, issues: DataIssue[]) {
+        let byKey = this.entries.get(data);
+        if (!byKey) {
+            byKey = new Map();
+            this.entries.set(data, byKey);
+        }
+        byKey.set(BaselineIssueCache.key(maxLengthConstraints, options), issues);
+    }
+
+    /**
+     * 캐시된 이슈를 반환하거나, 없으면 검사 후 저장합니다.
+     */
+    getOrDetect(data: DataTable, maxLengthConstraints: ColumnLimits = {}, options?: Partial<ProcessingOptions>): DataIssue[] {
+        const cached = this.get(data, maxLengthConstraints, options);
+        if (cached) return cached;
+        const issues = detectTableIssues(data, maxLengthConstraints, options);
+        this.set(data, maxLengthConstraints, options, issues);
+        return issues;
+    }
+}
+
+// 탭 단위 기본 캐시 (원본 데이터 이슈)
+export const baselineIssueCache = new BaselineIssueCache();
+
+/**
+ * 셀 단위 변화량 집계 (샤드별로 계산한 뒤 합산 가능)
+ */
+export interface DiffCounts {
+    rows: number;
+    cells: number;
+    emptyCells: number;
+    changedCells: number;
+}
+
+/**
+ * 정제 전후 데이터(또는 같은 범위의 샤드)의 빈 셀/변경 셀 수를 셉니다.
+ * @param headers 전체 데이터의 헤더 (기본값은 정제 데이터 첫 행의 키)
+ */
+export function countDiff(original: DataRow[], processed: DataRow[], headers: string[] = Object.keys(processed[0] || {})): DiffCounts {
+    const counts: DiffCounts = { rows: processed.length, cells: processed.length * headers.length, emptyCells: 0, changedCells: 0 };
 
-    let emptyCells = 0;
     processed.forEach((row, i) => {
         const origRow = original[i];
         headers.forEach(h => {
             const val = String(row[h] || '').trim();
-            if (!val) emptyCells++;
+            if (!val) counts.emptyCells++;
             if (origRow && String(row[h]) !== String(origRow[h])) {
-                stats.changedCells++;
+                counts.changedCells++;
             }
         });
     });
 
+    return counts;
+}
+
+/**
+ * 정제 중 기록된 셀 변경 기록(changes.ts)으로 변화량을 집계합니다. (원본과 다시 비교하지 않음)
+ */
+export function diffCountsFromChanges(changes: ChangeSet): DiffCounts {
+    return {
+        rows: changes.rows,
+        cells: changes.rows * changes.columns.length,
+        emptyCells: changes.emptyCells,
+        changedCells: changes.changedCount,
+    };
+}
+
+/**
+ * 변화량 집계와 이슈 수로 품질 통계를 계산합니다.
+ */
+export function finalizeDiffStats(counts: DiffCounts, initialIssuesCount: number, finalIssuesCount: number): ProcessingStats {
+    const stats: ProcessingStats = {
+        totalRows: 0,
+        changedCells: 0,
+        resolvedIssues: Math.max(0, initialIssuesCount - finalIssuesCount),
+        qualityScore: 0,
+        completeness: 0,
+        validity: 0
+    };
+
+    if (counts.rows === 0) return stats;
+
+    stats.totalRows = counts.rows;
+    stats.changedCells = counts.changedCells;
+
     // 지표 계산
-    stats.completeness = Math.round(((totalCells - emptyCells) / totalCells) * 100);
+    stats.completeness = Math.round(((counts.cells - counts.emptyCells) / counts.cells) * 100);
     const issuePenalty = (finalIssuesCount / stats.totalRows) * 100; // 단순화된 패널티
     stats.validity = Math.max(0, Math.min(100, 100 - Math.round(issuePenalty)));
 
@@ -446,24 +877,39 @@ export function calculateDiffStats(original: DataRow[], processed: DataRow[], in
     return stats;
 }
 
+/**
+ * 정제 전후의 데이터 변화량을 통계로 계산하는 함수
+ * @param original 원본 데이터
+ * @param processed 정제된 데이터
+ * @param initialIssuesCount 정제 전 발견된 이슈 수
+ * @param finalIssuesCount 정제 후 남은 이슈 수
+ * @returns ProcessingStats 객체
+ */
+export function calculateDiffStats(original: DataRow[], processed: DataRow[], initialIssuesCount: number, finalIssuesCount: number): ProcessingStats {
+    return finalizeDiffStats(countDiff(original, processed), initialIssuesCount, finalIssuesCount);
+}
+
 /**
  * 초기 데이터 로드 시의 품질을 분석하는 함수
  */
-export function analyzeDataQuality(data: DataRow[], issues: DataIssue[]): ProcessingStats {
-    return calculateDiffStats(data, data, issues.length, issues.length);
+export function analyzeDataQuality(data: DataTable, issues: DataIssue[]): ProcessingStats {
+    // 정제 전이므로 변경 셀은 없음 (원본끼리 비교하지 않고 빈 셀만 사전 번호별로 집계)
+    const cells = data.rowCount * data.headers.length;
+    const counts: DiffCounts = { rows: data.rowCount, cells, emptyCells: countEmptyCells(data), changedCells: 0 };
+    return finalizeDiffStats(counts, issues.length, issues.length);
 }
 
 /**
  * 컬럼 데이터 패턴을 분석하여 적절한 정제 포맷(ColumnOptionType)을 추천하는 함수
- * @param data 데이터 배열
+ * @param data 표본 행 배열 (sampling.ts)
  * @param column 분석할 컬럼명
  * @returns 추천하는 ColumnOptionType
  */
 export function recommendColumnFormat(data: DataRow[], column: string): ColumnOptionType {
     if (data.length === 0) return null;
 
-    // 상위 50개 행 샘플링
-    const values = data.slice(0, 50).map(r => String(r[column] || '').trim()).filter(Boolean);
+    // 표본 행 전체 (값 모양별 층화 표본이므로 뒤쪽에만 있는 형식도 포함)
+    const values = data.map(r => String(r[column] || '').trim()).filter(Boolean);
     if (values.length === 0) return null;
 
     const combined = values.join(' ');
@@ -551,19 +997,17 @@ function valPatternMatch(values: string[], regex: RegExp): boolean {
 
 /**
  * 데이터에서 날짜 또는 일시 형식이 포함된 컬럼의 개수를 감지합니다.
- * 상위 50행을 분석하여 판단합니다.
+ * 표본 행(sampling.ts)을 분석하여 판단합니다.
  */
 export function detectDateCandidateColumns(data: DataRow[], headers: string[]): number {
     if (!data || data.length === 0) return 0;
 
-    const sampleSize = Math.min(data.length, 50);
-    const sample = data.slice(0, sampleSize);
+    const sample = data;
     let dateColCount = 0;
 
     for (const header of headers) {
         let matchCount = 0;
 
-        // Check first 50 rows
         for (const row of sample) {
             const val = String(row[header] || '').trim();
             if (!val) continue;
@@ -0,0 +1,177 @@
+import { DataRow } from '@/types';
+import { GARBAGE_REGEX } from './utils';
+
+/**
+ * 셀 변경 기록 (Change Set)
+ * 정제 엔진이 셀 값을 바꿀 때마다 (행, 컬럼) 위치와 사유를 비트셋에 기록합니다.
+ * 변경 통계, 엑셀 하이라이트, 미리보기 변경 표시는 원본/정제본 전체를 다시 비교하지 않고 이 기록만 읽으므로
+ * 비용이 변경된 셀 수에 비례합니다.
+ * 워커 간 전달(structured clone)이 가능하도록 클래스가 아닌 일반 객체 + Uint32Array로 구성합니다.
+ */
+
+// none: 변경 없음, modified: 수정됨(노란색), cleared: 가비지 값이 제거됨(붉은색)
+export type ChangeReason = 'none' | 'modified' | 'cleared';
+
+export interface ChangeSet {
+    columns: string[];      // 비트 위치 계산 기준 헤더 (row * columns.length + col)
+    rows: number;
+    changed: Uint32Array;   // 변경된 셀
+    cleared: Uint32Array;   // 변경된 셀 중 가비지가 제거된 셀
+    changedCount: number;
+    emptyCells: number;     // 정제 결과의 빈 셀 수 (통계용, 정제하면서 함께 집계)
+    untracked: string[];    // 헤더 밖의 키 (첫 행에 없던 컬럼, 기록 대상 아님)
+}
+
+/**
+ * 빈 변경 기록을 만듭니다. 빈 셀 수는 전체 셀 수에서 시작해 값이 있는 셀마다 줄여 나갑니다.
+ */
+export function createChangeSet(columns: string[], rows: number): ChangeSet {
+    const words = Math.ceil((rows * columns.length) / 32);
+    return {
+        columns: [...columns],
+        rows,
+        changed: new Uint32Array(words),
+        cleared: new Uint32Array(words),
+        changedCount: 0,
+        emptyCells: rows * columns.length,
+        untracked: [],
+    };
+}
+
+/**
+ * 헤더 이름 → 비트 위치 조회용 인덱스
+ */
+export function getColumnIndex(changes: ChangeSet): Map<string, number> {
+    return new Map(changes.columns.map((c, i) => [c, i]));
+}
+
+/**
+ * 원본 값과 정제 값으로 변경 사유를 판정합니다.
+ * 비교 기준은 변경 통계와 같이 String(원본)이며, 가비지 검사는 실제로 바뀐 셀에서만 수행합니다.
+ */
+export function classifyChange(raw: DataRow[string] | undefined, val: string): ChangeReason {
+    if (val === raw || val === String(raw)) return 'none';
+    const removed = val === '' || val === '0';
+    return removed && GARBAGE_REGEX.test(String(raw || '')) ? 'cleared' : 'modified';
+}
+
+/**
+ * 셀 하나의 변경을 기록합니다.
+ */
+export function markChange(changes: ChangeSet, row: number, col: number, reason: ChangeReason) {
+    if (reason === 'none') return;
+    const idx = row * changes.columns.length + col;
+    const word = idx >>> 5;
+    const bit = 1 << (idx & 31);
+    if (!(changes.changed[word] & bit)) changes.changedCount++;
+    changes.changed[word] |= bit;
+    if (reason === 'cleared') changes.cleared[word] |= bit;
+    else changes.cleared[word] &= ~bit;
+}
+
+/**
+ * 셀 하나의 변경 사유를 조회합니다. (범위 밖이면 none)
+ */
+export function getChange(changes: ChangeSet, row: number, col: number): ChangeReason {
+    if (col < 0 || col >= changes.columns.length || row < 0 || row >= changes.rows) return 'none';
+    const idx = row * changes.columns.length + col;
+    const word = idx >>> 5;
+    const bit = 1 << (idx & 31);
+    if (!(changes.changed[word] & bit)) return 'none';
+    return changes.cleared[word] & bit ? 'cleared' : 'modified';
+}
+
+/**
+ * 변경된 셀만 순서대로 순회합니다. (0인 워드는 건너뛰므로 변경 셀 수에 비례)
+ */
+export function forEachChange(changes: ChangeSet, callback: (row: number, col: number, reason: ChangeReason) => void) {
+    const cols = changes.columns.length;
+    const { changed, cleared } = changes;
+    for (let w = 0; w < changed.length; w++) {
+        let bits = changed[w];
+        while (bits !== 0) {
+            const low = bits & -bits;
+            const idx = w * 32 + (31 - Math.clz32(low));
+            bits ^= low;
+            callback(Math.floor(idx / cols), idx % cols, cleared[w] & low ? 'cleared' : 'modified');
+        }
+    }
+}
+
+/**
+ * 연속된 샤드의 변경 기록을 행 순서대로 이어 붙입니다. (모든 샤드는 같은 헤더 기준)
+ */
+export function mergeChangeSets(parts: ChangeSet[], columns: string[] = parts[0]?.columns || []): ChangeSet {
+    const merged = createChangeSet(columns, parts.reduce((sum, p) => sum + p.rows, 0));
+    merged.emptyCells = 0;
+    let offset = 0;
+    for (const part of parts) {
+        forEachChange(part, (row, col, reason) => markChange(merged, offset + row, col, reason));
+        merged.emptyCells += part.emptyCells;
+        for (const key of part.untracked) if (!merged.untracked.includes(key)) merged.untracked.push(key);
+        offset += part.rows;
+    }
+    return merged;
+}
+
+/**
+ * 앞 구간 행만 남긴 변경 기록 (비트셋은 앞 구간 워드만 복사하고 마지막 워드에 걸친 뒤 구간 비트는 지움)
+ * @param emptyCells 같은 구간의 빈 셀 수 (비트셋으로는 알 수 없으므로 호출측에서 계산)
+ */
+export function truncateChangeSet(changes: ChangeSet, rows: number, emptyCells: number): ChangeSet {
+    const bits = rows * changes.columns.length;
+    const words = Math.ceil(bits / 32);
+    const changed = changes.changed.slice(0, words);
+    const cleared = changes.cleared.slice(0, words);
+    if (bits & 31) {
+        const mask = (1 << (bits & 31)) - 1;
+        changed[words - 1] &= mask;
+        cleared[words - 1] &= mask;
+    }
+    let changedCount = 0;
+    for (let w = 0; w < words; w++) {
+        let v = changed[w];
+        while (v !== 0) {
+            v &= v - 1;
+            changedCount++;
+        }
+    }
+    return { ...changes, rows, changed, cleared, changedCount, emptyCells };
+}
+
+/**
+ * 셀 직접 수정을 반영한 새 변경 기록을 반환합니다. (React 상태로 쓰므로 비트셋을 복사)
+ */
+export function setCellChange(changes: ChangeSet, row: number, col: number, reason: ChangeReason): ChangeSet {
+    return setCellChanges(changes, [row], col, () => reason);
+}
+
+/**
+ * 한 컬럼의 여러 셀 수정을 반영한 새 변경 기록을 반환합니다. (비트셋은 실제로 바뀌는 셀이 있을 때 한 번만 복사)
+ */
+export function setCellChanges(changes: ChangeSet, rows: number[], col: number, reasonOf: (row: number) => ChangeReason): ChangeSet {
+    if (col < 0) return changes;
+    let next: ChangeSet | null = null;
+    for (const row of rows) {
+        const reason = reasonOf(row);
+        if (getChange(next || changes, row, col) === reason) continue;
+        if (!next) next = { ...changes, changed: changes.changed.slice(), cleared: changes.cleared.slice() };
+        if (reason !== 'none') {
+            markChange(next, row, col, reason);
+            continue;
+        }
+        const idx = row * changes.columns.length + col;
+        const bit = 1 << (idx & 31);
+        next.changed[idx >>> 5] &= ~bit;
+        next.cleared[idx >>> 5] &= ~bit;
+        next.changedCount--;
+    }
+    return next || changes;
+}
+
+/**
+ * 헤더 이름 변경을 반영합니다. (비트셋은 그대로 공유)
+ */
+export function renameChangeColumn(changes: ChangeSet, oldName: string, newName: string): ChangeSet {
+    return { ...changes, columns: changes.columns.map(c => (c === oldName ? newName : c)) };
+}
@@ -0,0 +1,431 @@
+import { DataIssue } from '@/types';
+import { DataTable, TableValue, getTableColumnIndex } from './table';
+import { COMPANY_SUFFIX_REGEX } from './utils';
+
+/**
+ * 중복/유사 중복 행 검사 (Duplicate Detection)
+ * 거래처/고객 목록의 중복은 대부분 `(주)`/`주식회사`, 전화번호 하이픈, 띄어쓰기 차이이므로
+ * 기준 컬럼 값을 정제 엔진과 같은 규칙으로 정규화한 뒤 비교합니다.
+ *
+ * - 정규화는 컬럼 사전(table.ts)의 고유값마다 한 번만 실행하고, 행은 정규화 번호를 조합한 키로 묶습니다. (O(n))
+ * - 유사 중복은 정규화 키의 글자 2-gram MinHash를 밴드로 나눈 LSH와 숫자 값(전화번호 등) 정확 일치 인덱스로 후보만 골라(블로킹)
+ *   컬럼별 Jaccard 유사도를 확인합니다. 모든 행 쌍을 비교하지 않으므로 100만 행도 수 초 안에 끝납니다.
+ */
+
+// MinHash 해시 수 = 밴드 수 x 밴드당 행 수 (후보 기준 유사도 약 (1/4)^(1/4) ≈ 0.71)
+const LSH_BANDS = 4;
+const LSH_ROWS = 4;
+const MINHASH_COUNT = LSH_BANDS * LSH_ROWS;
+// MinHash 해시 함수 상수 (홀수 곱셈 상수 + 덧셈 상수, 고정값이므로 결과가 실행마다 같음)
+const MINHASH_MULTIPLIERS = Uint32Array.from({ length: MINHASH_COUNT }, (_, j) => fmix32(j * 2 + 1) | 1);
+const MINHASH_OFFSETS = Uint32Array.from({ length: MINHASH_COUNT }, (_, j) => fmix32(j + 0x9e3779b9));
+// 유사 중복으로 판단하는 유사도 (기준 컬럼별 2-gram Jaccard 평균)
+export const DEFAULT_SIMILARITY = 0.8;
+// 한 버킷이 이보다 크면 모든 쌍 대신 정렬 순서상 이웃한 WINDOW개와만 비교 (반복되는 양식 문구 등)
+const MAX_BUCKET = 64;
+const WINDOW = 8;
+// 검사할 고유 키 수 상한 (넘으면 같은 값 중복만 검사)
+const MAX_NEAR_KEYS = 2000000;
+// 키 번호 조합 수가 이 이하면 Map 대신 배열로 번호를 다시 매김
+const DENSE_RENUMBER_LIMIT = 1 << 24;
+
+// 중복 검사 기준으로 자동 선택하는 컬럼 (이름/업체명/연락처/이메일/사업자번호)
+const KEY_COLUMN = /이름|성명|성함|고객|회원|업체|회사|상호|거래처|법인|name|company|연락처|전화|휴대폰|핸드폰|phone|mobile|tel|이메일|email|e-mail|사업자/i;
+const WHITESPACE = /\s+/g;
+const PHONE_SHAPE = /^\+?[\d\s().-]+$/;
+const NON_DIGIT = /\D/g;
+const DIGITS_ONLY = /^\d+$/;
+// ASCII/완성형 한글만 있는 값은 NFKC 결과가 같으므로 정규화를 건너뜀
+const NEEDS_NFKC = /[^\u0000-\u007f\uac00-\ud7a3]/;
+
+export interface DuplicateGroup {
+    rows: number[];        // 행 번호 (오름차순)
+    exact: boolean;        // 정규화 후 모든 기준 값이 같은 행만 있는 그룹
+    similarity: number;    // 그룹 안에서 확인된 가장 낮은 유사도 (같은 값만 있으면 1)
+}
+
+export interface DuplicateReport {
+    keys: string[];
+    groups: DuplicateGroup[];   // 첫 행 순서
+    duplicateRows: number;      // 그룹마다 첫 행을 뺀 행 수 (지우면 줄어드는 행 수)
+}
+
+export interface DuplicateOptions {
+    nearDuplicates?: boolean;   // 유사 중복 검사 여부 (기본 true)
+    similarity?: number;        // 유사 중복 기준 (기본 DEFAULT_SIMILARITY)
+}
+
+/**
+ * 중복 비교용 정규화: 법인 형태 표기 제거, 공백 제거, 소문자, 전화번호는 숫자만
+ */
+export function normalizeDuplicateValue(value: TableValue): string {
+    if (value === undefined || value === null) return '';
+    let text = String(value);
+    if (NEEDS_NFKC.test(text)) text = text.normalize('NFKC');
+    if (PHONE_SHAPE.test(text)) {
+        const digits = text.replace(NON_DIGIT, '');
+        if (digits.length >= 8) return digits.startsWith('82') && text.trimStart().startsWith('+') ? '0' + digits.slice(2) : digits;
+    }
+    text = text.replace(COMPANY_SUFFIX_REGEX, '').replace(WHITESPACE, '').toLowerCase();
+    return text;
+}
+
+/**
+ * 헤더 이름으로 중복 검사 기준 컬럼을 고릅니다. 해당하는 컬럼이 없으면 모든 컬럼
+ */
+export function suggestDuplicateKeys(headers: string[]): string[] {
+    const keys = headers.filter(h => KEY_COLUMN.test(h));
+    return keys.length > 0 ? keys : [...headers];
+}
+
+// 32비트 해시 섞기 (MurmurHash3 fmix32)
+function fmix32(h: number): number {
+    h ^= h >>> 16;
+    h = Math.imul(h, 0x85ebca6b);
+    h ^= h >>> 13;
+    h = Math.imul(h, 0xc2b2ae35);
+    h ^= h >>> 16;
+    return h >>> 0;
+}
+
+// 값 두 개의 Jaccard 유사도 (pool 안의 정렬된 2-gram 해시 구간 두 개를 병합하며 공통 원소 수를 셈)
+function jaccard({ pool, offsets }: ValueShingles, a: number, b: number): number {
+    let i = offsets[a], j = offsets[b], shared = 0;
+    const endA = offsets[a + 1], endB = offsets[b + 1];
+    while (i < endA && j < endB) {
+        if (pool[i] === pool[j]) {
+            shared++;
+            i++;
+            j++;
+        } else if (pool[i] < pool[j]) i++;
+        else j++;
+    }
+    return shared / (endA - offsets[a] + endB - offsets[b] - shared);
+}
+
+interface ValueShingles {
+    pool: Uint32Array;        // 값별 정렬된 2-gram 해시를 이어 붙인 배열
+    offsets: Int32Array;      // 값 번호 → pool 시작 위치 (마지막 원소 = 끝)
+    signatures: Uint32Array;  // 값 번호 x MINHASH_COUNT
+    numeric: Uint8Array;      // 숫자로만 된 값 (전화번호/사업자번호 등은 한 자리만 달라도 다른 대상이므로 유사 비교하지 않음)
+}
+
+// 정규화 값 목록의 2-gram 해시와 MinHash 서명 (값마다 배열을 만들지 않도록 평면 배열 하나에 저장)
+function buildShingles(texts: string[], seed: number): ValueShingles {
+    let total = 0;
+    for (const text of texts) total += Math.max(1, text.length - 1);
+    const pool = new Uint32Array(total);
+    const offsets = new Int32Array(texts.length + 1);
+    const signatures = new Uint32Array(texts.length * MINHASH_COUNT).fill(0xffffffff);
+    const numeric = new Uint8Array(texts.length);
+    let at = 0;
+    for (let id = 0; id < texts.length; id++) {
+        const text = texts[id];
+        const start = at;
+        offsets[id] = start;
+        if (id === 0) continue; // 빈 값
+        if (DIGITS_ONLY.test(text)) {
+            // 숫자 값은 값 전체를 해시 하나로 (자릿수 2-gram은 대부분의 번호가 공유해 후보가 지나치게 늘어남)
+            numeric[id] = 1;
+            let h = seed;
+            for (let c = 0; c < text.length; c++) h = fmix32(h ^ text.charCodeAt(c)) + c;
+            pool[at++] = fmix32(h);
+        } else if (text.length < 2) pool[at++] = fmix32(fmix32(text.charCodeAt(0) | 0x10000) ^ seed);
+        for (let c = 0; !numeric[id] && c + 1 < text.length; c++) {
+            // 삽입 정렬 + 중복 제거 (값 하나의 2-gram은 보통 수십 개 이하)
+            const h = fmix32(fmix32(Math.imul(text.charCodeAt(c), 0x9e3779b1) ^ text.charCodeAt(c + 1)) ^ seed);
+            let p = at;
+            while (p > start && pool[p - 1] > h) p--;
+            if (p > start && pool[p - 1] === h) continue;
+            for (let q = at; q > p; q--) pool[q] = pool[q - 1];
+            pool[p] = h;
+            at++;
+        }
+        const base = id * MINHASH_COUNT;
+        for (let p = start; p < at; p++) {
+            const h = pool[p];
+            for (let j = 0; j < MINHASH_COUNT; j++) {
+                // 해시 하나에 서로 다른 곱셈/덧셈 상수를 적용해 해시 함수 MINHASH_COUNT개를 만듦
+                const v = (Math.imul(h, MINHASH_MULTIPLIERS[j]) + MINHASH_OFFSETS[j]) >>> 0;
+                if (v < signatures[base + j]) signatures[base + j] = v;
+            }
+        }
+    }
+    offsets[texts.length] = at;
+    return { pool, offsets, signatures, numeric };
+}
+
+class UnionFind {
+    private parent: Int32Array;
+
+    constructor(size: number) {
+        this.parent = new Int32Array(size);
+        for (let i = 0; i < size; i++) this.parent[i] = i;
+    }
+
+    find(x: number): number {
+        while (this.parent[x] !== x) {
+            this.parent[x] = this.parent[this.parent[x]];
+            x = this.parent[x];
+        }
+        return x;
+    }
+
+    union(a: number, b: number): number {
+        const ra = this.find(a), rb = this.find(b);
+        if (ra !== rb) this.parent[Math.max(ra, rb)] = Math.min(ra, rb);
+        return Math.min(ra, rb);
+    }
+}
+
+/**
+ * 기준 컬럼으로 중복/유사 중복 행 그룹을 찾습니다.
+ * 기준 값이 모두 비어 있는 행은 제외합니다.
+ */
+export function findDuplicates(table: DataTable, keys: string[], options: DuplicateOptions = {}): DuplicateReport {
+    const columnIndex = getTableColumnIndex(table);
+    const cols = keys.map(k => columnIndex.get(k)).filter((c): c is number => c !== undefined);
+    const report: DuplicateReport = { keys: cols.map(c => table.headers[c]), groups: [], duplicateRows: 0 };
+    const n = table.rowCount;
+    if (cols.length === 0 || n < 2) return report;
+
+    // 1. 컬럼 사전 값마다 정규화 번호 (0 = 빈 값)
+    const normTexts: string[][] = [];
+    const normIds: Int32Array[] = [];
+    for (const c of cols) {
+        const values = table.columns[c].values;
+        const ids = new Int32Array(values.length);
+        const lookup = new Map<string, number>([['', 0]]);
+        const texts = [''];
+        for (let v = 0; v < values.length; v++) {
+            const norm = normalizeDuplicateValue(values[v]);
+            let id = lookup.get(norm);
+            if (id === undefined) {
+                id = texts.length;
+                lookup.set(norm, id);
+                texts.push(norm);
+            }
+            ids[v] = id;
+        }
+        normTexts.push(texts);
+        normIds.push(ids);
+    }
+
+    // 2. 행마다 정규화 번호 조합을 하나의 키 번호로 (컬럼을 하나씩 더하며 쓰인 조합에만 번호를 다시 매김)
+    const keyOf = new Int32Array(n);
+    let keyCount = 1;
+    for (let i = 0; i < cols.length; i++) {
+        const codes = table.columns[cols[i]].codes;
+        const ids = normIds[i];
+        const width = normTexts[i].length;
+        let next = 1;
+        if (keyCount * width <= DENSE_RENUMBER_LIMIT) {
+            const renumber = new Int32Array(keyCount * width).fill(-1);
+            renumber[0] = 0;
+            for (let r = 0; r < n; r++) {
+                const pair = keyOf[r] * width + ids[codes[r]];
+                let id = renumber[pair];
+                if (id < 0) id = renumber[pair] = next++;
+                keyOf[r] = id;
+            }
+        } else {
+            const renumber = new Map<number, number>([[0, 0]]);
+            for (let r = 0; r < n; r++) {
+                const pair = keyOf[r] * width + ids[codes[r]];
+                let id = renumber.get(pair);
+                if (id === undefined) {
+                    id = next++;
+                    renumber.set(pair, id);
+                }
+                keyOf[r] = id;
+            }
+        }
+        keyCount = next;
+    }
+
+    // 3. 키 번호별 행 목록 (계수 정렬, 0번 = 기준 값이 모두 빈 행)
+    const counts = new Int32Array(keyCount + 1);
+    for (let r = 0; r < n; r++) counts[keyOf[r] + 1]++;
+    for (let k = 0; k < keyCount; k++) counts[k + 1] += counts[k];
+    const rowsByKey = new Int32Array(n);
+    const fill = counts.slice(0, keyCount);
+    for (let r = 0; r < n; r++) rowsByKey[fill[keyOf[r]]++] = r;
+    const keyRows = (k: number) => rowsByKey.subarray(counts[k], counts[k + 1]);
+
+    // 4. 유사 중복: 키 번호마다 대표 행의 정규화 문자열로 MinHash → 밴드별 정렬로 같은 버킷 찾기
+    const groupOf = new UnionFind(keyCount);
+    const minSimilarity = new Float64Array(keyCount).fill(1);
+    const nearDuplicates = options.nearDuplicates !== false && keyCount - 1 <= MAX_NEAR_KEYS;
+    if (nearDuplicates && keyCount > 2) {
+        const threshold = options.similarity ?? DEFAULT_SIMILARITY;
+        // 정규화 값마다 2-gram 해시(정렬/중복 제거)와 MinHash 서명을 한 번만 계산해 컬럼별 평면 배열에 저장
+        const valueShingles = normTexts.map((texts, i) => buildShingles(texts, Math.imul(i + 1, 0x165667b1)));
+        // 키 번호의 컬럼별 정규화 번호 (대표 행 기준)
+        const keyIds = new Int32Array(keyCount * cols.length);
+        for (let k = 1; k < keyCount; k++) {
+            const r = rowsByKey[counts[k]];
+            for (let i = 0; i < cols.length; i++) keyIds[k * cols.length + i] = normIds[i][table.columns[cols[i]].codes[r]];
+        }
+        // 키 서명 = 컬럼 값 서명의 원소별 최솟값 (컬럼 2-gram 합집합의 MinHash)
+        const signatures = new Uint32Array((keyCount - 1) * MINHASH_COUNT).fill(0xffffffff);
+        for (let k = 1; k < keyCount; k++) {
+            const base = (k - 1) * MINHASH_COUNT;
+            for (let i = 0; i < cols.length; i++) {
+                const id = keyIds[k * cols.length + i];
+                if (id === 0) continue;
+                const signature = valueShingles[i].signatures;
+                for (let j = 0; j < MINHASH_COUNT; j++) {
+                    const v = signature[id * MINHASH_COUNT + j];
+                    if (v < signatures[base + j]) signatures[base + j] = v;
+                }
+            }
+        }
+
+        // 유사도 = 두 행 모두 값이 있는 기준 컬럼의 2-gram Jaccard 평균 (한쪽이 비어 있는 컬럼은 판단에서 제외, 숫자 값은 같을 때만 1)
+        const similarityOf = (a: number, b: number): number => {
+            let sum = 0, compared = 0;
+            for (let i = 0; i < cols.length; i++) {
+                const ia = keyIds[a * cols.length + i], ib = keyIds[b * cols.length + i];
+                if (ia === 0 || ib === 0) continue;
+                if (ia === ib) sum += 1;
+                else if (!valueShingles[i].numeric[ia] || !valueShingles[i].numeric[ib]) sum += jaccard(valueShingles[i], ia, ib);
+                compared++;
+            }
+            return compared === 0 ? 0 : sum / compared;
+        };
+        const compare = (a: number, b: number) => {
+            if (groupOf.find(a) === groupOf.find(b)) return;
+            const similarity = similarityOf(a, b);
+            if (similarity < threshold) return;
+            const ra = groupOf.find(a), rb = groupOf.find(b);
+            const root = groupOf.union(a, b);
+            minSimilarity[root] = Math.min(minSimilarity[ra], minSimilarity[rb], similarity);
+        };
+
+        // 숫자 값(전화번호/사업자번호 등)이 같은 키끼리는 LSH와 별개로 바로 후보 (정확 일치 블로킹 인덱스)
+        const keyTotal = keyCount - 1;
+        const blocked = new Int32Array(keyTotal);
+        for (let i = 0; i < cols.length; i++) {
+            const { numeric } = valueShingles[i];
+            const width = normTexts[i].length;
+            const starts = new Int32Array(width + 1);
+            for (let k = 1; k < keyCount; k++) {
+                const id = keyIds[k * cols.length + i];
+                if (numeric[id]) starts[id + 1]++;
+            }
+            for (let id = 0; id < width; id++) starts[id + 1] += starts[id];
+            if (starts[width] < 2) continue;
+            const at = starts.slice(0, width);
+            for (let k = 1; k < keyCount; k++) {
+                const id = keyIds[k * cols.length + i];
+                if (numeric[id]) blocked[at[id]++] = k;
+            }
+            for (let id = 1; id < width; id++) {
+                const start = starts[id], end = starts[id + 1];
+                for (let x = start; x < end; x++) {
+                    const limit = end - start > MAX_BUCKET ? Math.min(end, x + 1 + WINDOW) : end;
+                    for (let y = x + 1; y < limit; y++) compare(blocked[x], blocked[y]);
+                }
+            }
+        }
+
+        // 밴드 키(32비트) x 2^21 + 키 번호를 정렬하면 같은 버킷이 이웃하게 모임 → 정렬 후 버킷/키 번호 배열로 한 번만 풀어 둠
+        const bandHashes = Array.from({ length: LSH_BANDS }, () => new Uint32Array(keyCount));
+        const order = new Float64Array(keyTotal);
+        const sortedBucket = new Uint32Array(keyTotal);
+        const sortedKey = new Int32Array(keyTotal);
+        for (let band = 0; band < LSH_BANDS; band++) {
+            const hashes = bandHashes[band];
+            for (let k = 1; k < keyCount; k++) {
+                const base = (k - 1) * MINHASH_COUNT + band * LSH_ROWS;
+                let h = band;
+                for (let j = 0; j < LSH_ROWS; j++) h = fmix32(h ^ signatures[base + j]);
+                hashes[k] = h;
+                order[k - 1] = h * 0x200000 + k;
+            }
+            order.sort();
+            for (let i = 0; i < keyTotal; i++) {
+                const bucket = (order[i] / 0x200000) >>> 0;
+                sortedBucket[i] = bucket;
+                sortedKey[i] = order[i] - bucket * 0x200000;
+            }
+            let start = 0;
+            while (start < keyTotal) {
+                const bucket = sortedBucket[start];
+                let end = start + 1;
+                while (end < keyTotal && sortedBucket[end] === bucket) end++;
+                const size = end - start;
+                for (let i = start; i < end; i++) {
+                    const a = sortedKey[i];
+                    const limit = size > MAX_BUCKET ? Math.min(end, i + 1 + WINDOW) : end;
+                    for (let j = i + 1; j < limit; j++) {
+                        const b = sortedKey[j];
+                        // 앞 밴드에서 이미 같은 버킷이었던 쌍은 비교를 건너뜀
+                        let seen = false;
+                        for (let prev = 0; prev < band && !seen; prev++) seen = bandHashes[prev][a] === bandHashes[prev][b];
+                        if (!seen) compare(a, b);
+                    }
+                }
+                start = end;
+            }
+        }
+    }
+
+    // 5. 그룹 조립 (같은 루트의 키 번호들의 행을 합침)
+    const members = new Map<number, number[]>();
+    for (let k = 1; k < keyCount; k++) {
+        const root = groupOf.find(k);
+        const list = members.get(root);
+        if (list) list.push(k);
+        else members.set(root, [k]);
+    }
+    for (const [root, ks] of members) {
+        const total = ks.reduce((sum, k) => sum + counts[k + 1] - counts[k], 0);
+        if (total < 2) continue;
+        const rows: number[] = [];
+        for (const k of ks) for (const r of keyRows(k)) rows.push(r);
+        if (ks.length > 1) rows.sort((a, b) => a - b);
+        report.groups.push({ rows, exact: ks.length === 1, similarity: ks.length === 1 ? 1 : minSimilarity[root] });
+        report.duplicateRows += rows.length - 1;
+    }
+    report.groups.sort((a, b) => a.rows[0] - b.rows[0]);
+    return report;
+}
+
+const reportCache = new WeakMap<DataTable, Map<string, DataIssue | null>>();
+
+/**
+ * 중복 그룹을 이슈 하나로 보고합니다. (중복이 없으면 null)
+ * affectedRows는 그룹끼리 모이도록 그룹 순서대로 나열하며, 같은 테이블/기준은 다시 계산하지 않습니다.
+ */
+export function detectDuplicateIssue(table: DataTable, keys: string[] = suggestDuplicateKeys(table.headers), options: DuplicateOptions = {}): DataIssue | null {
+    const cacheKey = JSON.stringify([keys, options.nearDuplicates !== false, options.similarity ?? DEFAULT_SIMILARITY]);
+    let byKey = reportCache.get(table);
+    if (byKey?.has(cacheKey)) return byKey.get(cacheKey)!;
+
+    const report = findDuplicates(table, keys, options);
+    let issue: DataIssue | null = null;
+    if (report.groups.length > 0) {
+        const exact = report.groups.filter(g => g.exact).length;
+        const near = report.groups.length - exact;
+        const sample = report.groups.find(g => !g.exact) ?? report.groups[0];
+        const label = (row: number) => report.keys.map(k => {
+            const value = table.columns[table.headers.indexOf(k)].values[table.columns[table.headers.indexOf(k)].codes[row]];
+            return value === undefined || value === null ? '' : String(value);
+        }).join(' / ');
+        issue = {
+            column: report.keys.join(', '),
+            type: 'warning',
+            message: `같은 대상으로 보이는 행이 ${report.groups.length.toLocaleString()}그룹(같은 값 ${exact.toLocaleString()}, 비슷한 값 ${near.toLocaleString()}) 있습니다. 중복 ${report.duplicateRows.toLocaleString()}행 (예: "${label(sample.rows[0])}" ≈ "${label(sample.rows[1])}")`,
+            fixType: 'duplicate',
+            affectedRows: report.groups.flatMap(g => g.rows),
+            duplicateGroups: report.groups.map(g => g.rows),
+        };
+    }
+    if (!byKey) {
+        byKey = new Map();
+        reportCache.set(table, byKey);
+    }
+    byKey.set(cacheKey, issue);
+    return issue;
+}
@@ -1,100 +1,210 @@
 import Papa from 'papaparse';
 import * as XLSX from 'xlsx';
 import ExcelJS from 'exceljs';
-import { DataRow } from '@/types';
-import { GARBAGE_REGEX } from './utils';
+import { ChangeSet, forEachChange, getChange } from './changes';
+import { DataTable, getTableRows } from './table';
+import { CleaningProfile } from './profiler';
+import { XlsxStreamWriter, supportsXlsxStreaming, XLSX_STYLE_CLEARED, XLSX_STYLE_MODIFIED, XLSX_STYLE_NONE } from './xlsxStream';
+
+// 한 번에 직렬화하는 행 수 (출력 전체 문자열/통합 문서를 만들지 않고 이 단위로 기록)
+export const EXPORT_CHUNK_ROWS = 5000;
+// 이 셀 수 이상이면 저장 위치를 먼저 받아 디스크에 바로 기록 (File System Access API 지원 브라우저)
+export const DISK_STREAM_MIN_CELLS = 5000000;
+
+const CSV_MIME = 'text/csv;charset=utf-8;';
+const XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet';
+
+/**
+ * 내보내기 출력 (디스크 파일 스트림 또는 Blob 조각 목록)
+ */
+export interface DownloadSink {
+    write(chunk: string | Uint8Array): Promise<void>;
+    close(): Promise<void>;
+    abort(): Promise<void>;
+}
+
+interface SaveFilePickerWindow {
+    showSaveFilePicker?: (options: { suggestedName?: string }) => Promise<{
+        createWritable(): Promise<{
+            write(data: string | Uint8Array): Promise<void>;
+            close(): Promise<void>;
+            abort(): Promise<void>;
+        }>;
+    }>;
+}
+
+function triggerDownload(blob: Blob, fileName: string) {
+    const link = document.createElement("a");
+    const url = URL.createObjectURL(blob);
+    link.href = url;
+    link.download = fileName;
+    link.style.visibility = 'hidden';
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    URL.revokeObjectURL(url);
+}
+
+/**
+ * 다운로드 출력을 엽니다.
+ * 큰 결과는 저장 위치를 받아 조각을 디스크에 바로 쓰고, 그 외에는 조각마다 Blob을 만들어 모았다가 한 번에 내려받습니다.
+ * (조각 Blob은 브라우저가 메모리 밖에 보관할 수 있어 출력 전체 문자열을 만드는 것보다 최대 메모리가 작음)
+ *
+ * @returns 사용자가 저장 창을 취소하면 null
+ */
+export async function openDownloadSink(fileName: string, mimeType: string, cells: number): Promise<DownloadSink | null> {
+    const picker = typeof window !== 'undefined' ? (window as SaveFilePickerWindow).showSaveFilePicker : undefined;
+    if (picker && cells >= DISK_STREAM_MIN_CELLS) {
+        try {
+            const handle = await picker({ suggestedName: fileName });
+            const writable = await handle.createWritable();
+            return {
+                write: chunk => writable.write(chunk),
+                close: () => writable.close(),
+                abort: () => writable.abort(),
+            };
+        } catch (error) {
+            if ((error as DOMException)?.name === 'AbortError') return null;
+            // 권한/보안 정책으로 실패하면 Blob 다운로드로 진행
+        }
+    }
+
+    let parts: Blob[] = [];
+    return {
+        write: async chunk => { parts.push(new Blob([chunk as BlobPart])); },
+        close: async () => triggerDownload(new Blob(parts, { type: mimeType }), fileName),
+        abort: async () => { parts = []; },
+    };
+}
+
+/**
+ * CSV를 EXPORT_CHUNK_ROWS 행씩 직렬화해 기록합니다. (헤더와 줄바꿈 규칙은 Papa.unparse 전체 변환과 동일)
+ * 행 객체는 조각마다 테이블에서 만들고 기록 후 버립니다. (일괄 정제 zip의 시트별 항목도 이 함수로 기록, batch.ts)
+ */
+export async function writeCsv(sink: Pick<DownloadSink, 'write'>, processedData: DataTable) {
+    // UTF-8 BOM 추가하여 한글 깨짐 방지
+    await sink.write("\ufeff");
+    const columns = processedData.headers;
+    for (let start = 0; start < processedData.rowCount; start += EXPORT_CHUNK_ROWS) {
+        const csv = Papa.unparse(getTableRows(processedData, start, start + EXPORT_CHUNK_ROWS), { header: start === 0, columns });
+        await sink.write(start === 0 ? csv : `\r\n${csv}`);
+    }
+}
+
+/**
+ * 쓰기 전용 XLSX 작성기로 EXPORT_CHUNK_ROWS 행씩 기록합니다.
+ * 하이라이트 시 셀 스타일은 변경 기록 비트셋에서 바로 조회합니다.
+ */
+async function writeXlsx(sink: DownloadSink, processedData: DataTable, changes: ChangeSet | null | undefined, highlight: boolean) {
+    const headers = processedData.headers;
+    const styled = highlight && changes;
+    const writer = new XlsxStreamWriter(sink, headers, styled ? { sheetName: 'Cleaned Data', columnWidth: 20 } : {});
+
+    let styleOf: ((rowIndex: number, col: number) => number) | undefined;
+    if (styled) {
+        const columnIndex = new Map(changes.columns.map((c, i) => [c, i]));
+        const colOf = headers.map(h => columnIndex.get(h) ?? -1);
+        styleOf = (rowIndex, col) => {
+            // 가비지였던 데이터가 지워진 경우 빨간색 계열, 그 외 수정은 노란색 계열
+            const reason = getChange(changes, rowIndex, colOf[col]);
+            return reason === 'cleared' ? XLSX_STYLE_CLEARED : reason === 'modified' ? XLSX_STYLE_MODIFIED : XLSX_STYLE_NONE;
+        };
+    }
+
+    await writer.open();
+    for (let start = 0; start < processedData.rowCount; start += EXPORT_CHUNK_ROWS) {
+        await writer.writeRows(getTableRows(processedData, start, start + EXPORT_CHUNK_ROWS), styleOf);
+    }
+    await writer.close();
+}
+
+/**
+ * 압축 스트림 API가 없는 브라우저용 XLSX 내보내기 (통합 문서 전체를 메모리에서 생성)
+ */
+async function downloadXlsxInMemory(table: DataTable, fileName: string, changes: ChangeSet | null | undefined, highlight: boolean) {
+    const processedData = getTableRows(table);
+    // 하이라이트 옵션이 켜져있고 변경 기록이 있는 경우 ExcelJS 사용 (스타일링 가능)
+    if (highlight && changes) {
+        const workbook = new ExcelJS.Workbook();
+        const worksheet = workbook.addWorksheet('Cleaned Data');
+        const headers = table.headers;
+
+        // 헤더 설정
+        worksheet.columns = headers.map(h => ({ header: h, key: h, width: 20 }));
+
+        // 데이터 추가
+        processedData.forEach(row => worksheet.addRow(row));
+
+        // 변경 기록에 있는 셀만 스타일 적용 (헤더 행 다음부터)
+        const colOf = changes.columns.map(c => headers.indexOf(c));
+        forEachChange(changes, (rowIdx, col, reason) => {
+            const colIndex = colOf[col];
+            if (colIndex < 0 || rowIdx >= processedData.length) return;
+            const cell = worksheet.getRow(rowIdx + 2).getCell(colIndex + 1);
+
+            // 가비지였던 데이터가 지워진 경우 빨간색 계열, 그 외 수정은 노란색 계열
+            const isRed = reason === 'cleared';
+
+            cell.fill = {
+                type: 'pattern',
+                pattern: 'solid',
+                fgColor: { argb: isRed ? 'FFFFCDD2' : 'FFFFF9C4' } // 붉은색(제거됨) vs 노란색(수정됨)
+            };
+            cell.border = {
+                top: { style: 'thin' },
+                left: { style: 'thin' },
+                bottom: { style: 'thin' },
+                right: { style: 'thin' }
+            };
+        });
+
+        // 파일 쓰기
+        const buffer = await workbook.xlsx.writeBuffer();
+        triggerDownload(new Blob([buffer], { type: XLSX_MIME }), fileName);
+    }
+    // 단순 Excel 다운로드 (SheetJS 사용)
+    else {
+        const worksheet = XLSX.utils.json_to_sheet(processedData);
+        const workbook = XLSX.utils.book_new();
+        XLSX.utils.book_append_sheet(workbook, worksheet, "Sheet1");
+        XLSX.writeFile(workbook, fileName);
+    }
+}
 
 /**
  * 정제된 데이터를 파일로 다운로드하는 함수
  * CSV 및 Excel(xlsx) 형식을 지원하며, 옵션에 따라 변경 사항을 하이라이트할 수 있습니다.
- * 
- * @param processedData 정제된 데이터 배열
+ * 출력은 EXPORT_CHUNK_ROWS 행씩 만들어 바로 내보내므로(스트리밍) 결과 전체 문자열/통합 문서를 메모리에 만들지 않습니다.
+ *
+ * @param processedData 정제된 데이터 테이블
  * @param fileName 저장할 파일명 (확장포함)
- * @param originalData (선택) 원본 데이터, 변경 사항 비교 시 필요
+ * @param changes (선택) 정제 시 기록된 셀 변경 기록, 하이라이트 시 필요 (원본과 다시 비교하지 않음)
  * @param highlight (선택) 변경된 셀 하이라이트 여부 (Excel 전용)
  */
-export function downloadData(processedData: DataRow[], fileName: string, originalData?: DataRow[], highlight: boolean = false) {
+export async function downloadData(processedData: DataTable, fileName: string, changes?: ChangeSet | null, highlight: boolean = false): Promise<void> {
     const isCsv = fileName.toLowerCase().endsWith('.csv');
-
-    // 1. CSV 다운로드
-    if (isCsv) {
-        const csv = Papa.unparse(processedData);
-        // UTF-8 BOM 추가하여 한글 깨짐 방지
-        const blob = new Blob(["\ufeff", csv], { type: 'text/csv;charset=utf-8;' });
-        const link = document.createElement("a");
-        const url = URL.createObjectURL(blob);
-        link.href = url;
-        link.download = fileName;
-        link.style.visibility = 'hidden';
-        document.body.appendChild(link);
-        link.click();
-        link.remove();
-        URL.revokeObjectURL(url);
+    if (!isCsv && !supportsXlsxStreaming()) {
+        return downloadXlsxInMemory(processedData, fileName, changes, highlight);
     }
-    // 2. Excel 다운로드
-    else {
-        // 하이라이트 옵션이 켜져있고 원본 데이터가 있는 경우 ExcelJS 사용 (스타일링 가능)
-        if (highlight && originalData) {
-            const workbook = new ExcelJS.Workbook();
-            const worksheet = workbook.addWorksheet('Cleaned Data');
-            const headers = Object.keys(processedData[0] || {});
-
-            // 헤더 설정
-            worksheet.columns = headers.map(h => ({ header: h, key: h, width: 20 }));
-
-            // 데이터 추가 및 스타일링
-            processedData.forEach((row, index) => {
-                const worksheetRow = worksheet.addRow(row);
-                const originalRow = originalData[index];
-
-                if (originalRow) {
-                    headers.forEach((h, colIndex) => {
-                        const currentVal = String(row[h] || '');
-                        const originalVal = String(originalRow[h] || '');
-
-                        // 값이 변경된 경우 스타일 적용
-                        if (currentVal !== originalVal) {
-                            const cell = worksheetRow.getCell(colIndex + 1);
-
-                            // 가비지였던 데이터가 지워진 경우 빨간색 계열, 그 외 수정은 노란색 계열
-                            const wasGarbage = GARBAGE_REGEX.test(originalVal);
-                            const isRed = wasGarbage && (currentVal === '' || currentVal === '0');
-
-                            cell.fill = {
-                                type: 'pattern',
-                                pattern: 'solid',
-                                fgColor: { argb: isRed ? 'FFFFCDD2' : 'FFFFF9C4' } // 붉은색(제거됨) vs 노란색(수정됨)
-                            };
-                            cell.border = {
-                                top: { style: 'thin' },
-                                left: { style: 'thin' },
-                                bottom: { style: 'thin' },
-                                right: { style: 'thin' }
-                            };
-                        }
-                    });
-                }
-            });
-
-            // 파일 쓰기
-            workbook.xlsx.writeBuffer().then(buffer => {
-                const blob = new Blob([buffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
-                const link = document.createElement("a");
-                const url = URL.createObjectURL(blob);
-                link.href = url;
-                link.download = fileName;
-                document.body.appendChild(link);
-                link.click();
-                link.remove();
-                URL.revokeObjectURL(url);
-            });
-        }
-        // 단순 Excel 다운로드 (SheetJS 사용)
-        else {
-            const worksheet = XLSX.utils.json_to_sheet(processedData);
-            const workbook = XLSX.utils.book_new();
-            XLSX.utils.book_append_sheet(workbook, worksheet, "Sheet1");
-            XLSX.writeFile(workbook, fileName);
-        }
+
+    const cells = processedData.rowCount * processedData.headers.length;
+    const sink = await openDownloadSink(fileName, isCsv ? CSV_MIME : XLSX_MIME, cells);
+    if (!sink) return;
+    try {
+        // 1. CSV 다운로드
+        if (isCsv) await writeCsv(sink, processedData);
+        // 2. Excel 다운로드
+        else await writeXlsx(sink, processedData, changes, highlight);
+    } catch (error) {
+        await sink.abort();
+        throw error;
     }
+    await sink.close();
+}
+
+/**
+ * 정제 프로파일(profiler.ts)을 JSON 파일로 저장합니다. (디버그 패널, 파이썬 엔진 --profile 출력과 같은 구성)
+ */
+export function downloadProfile(profile: CleaningProfile, fileName: string) {
+    triggerDownload(new Blob([JSON.stringify(profile, null, 2)], { type: 'application/json' }), fileName);
 }
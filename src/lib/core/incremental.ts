@@ -0,0 +1,175 @@
+import { DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits } from '@/types';
+import { CleaningPlan, getColumnPlan } from './plan';
+import { scanTableIssues, finalizeIssueScan, finalizeDiffStats, diffCountsFromChanges } from './analyzers';
+import { ChangeSet, getColumnIndex } from './changes';
+import { cleanTableColumn } from './processors';
+import { DataTable } from './table';
+
+/**
+ * 증분 재정제 (Incremental Re-processing)
+ * 프롬프트나 컬럼 옵션 하나만 바꿔 다시 실행하면, 새 정제 계획과 직전 실행의 계획을 컬럼 단위(서명)로 비교해
+ * 변환이 달라진 컬럼만 다시 정제하고, 나머지 컬럼의 값/이슈/변경 기록은 그대로 재사용합니다.
+ * 이슈는 컬럼마다 독립적으로 판정되므로 길이 제한이 바뀐 컬럼도 이슈만 다시 검사합니다.
+ * 데이터는 사전 인코딩 테이블(table.ts)이므로 다시 정제하는 컬럼도 고유값만 정제합니다.
+ */
+
+// 증분 처리할 최대 셀 수 (이보다 많으면 워커 풀에서 전체를 병렬로 다시 정제하는 편이 빠름)
+export const INCREMENTAL_MAX_CELLS = 2000000;
+
+export interface CleaningSnapshot {
+    data: DataTable;                       // 정제 입력 (테이블 객체 자체로 같은 데이터인지 판단)
+    headers: string[];                     // 이슈/변경 기록 기준 헤더
+    signatures: Map<string, string>;       // 컬럼별 정제 계획 서명
+    issueKeys: Map<string, string>;        // 컬럼별 이슈 검사 조건
+    processedData: DataTable;
+    issues: DataIssue[];
+    baselineIssues: DataIssue[];           // 원본 이슈 (같은 검사 조건)
+    changes: ChangeSet;
+}
+
+export interface IncrementalPlan {
+    cleanColumns: string[];    // 다시 정제할 컬럼 (변환이 바뀜)
+    issueColumns: string[];    // 이슈를 다시 검사할 컬럼 (변환 또는 길이 제한이 바뀜)
+}
+
+export interface IncrementalResult {
+    snapshot: CleaningSnapshot;
+    processedData: DataTable;
+    issues: DataIssue[];
+    stats: ProcessingStats;
+    changes: ChangeSet;
+}
+
+/**
+ * 컬럼 하나의 이슈 검사 조건 (길이 제한과 콤마 보정 여부만 결과에 영향)
+ */
+function getIssueKey(key: string, maxLengthConstraints: ColumnLimits, options?: Partial<ProcessingOptions>): string {
+    const limit = maxLengthConstraints[key] > 0 ? maxLengthConstraints[key] : 0;
+    return limit > 0 ? `${limit}:${!!options?.formatNumber}` : '0';
+}
+
+/**
+ * 전체 정제 결과로 다음 증분 실행의 기준점을 만듭니다.
+ */
+export function createCleaningSnapshot(
+    data: DataTable,
+    plan: CleaningPlan,
+    maxLengthConstraints: ColumnLimits,
+    options: ProcessingOptions,
+    result: { processedData: DataTable; issues: DataIssue[]; originalIssues: DataIssue[]; changes: ChangeSet }
+): CleaningSnapshot {
+    const headers = result.changes.columns;
+    return {
+        data,
+        headers,
+        signatures: new Map(headers.map(h => [h, getColumnPlan(plan, h).signature])),
+        issueKeys: new Map(headers.map(h => [h, getIssueKey(h, maxLengthConstraints, options)])),
+        processedData: result.processedData,
+        issues: result.issues,
+        baselineIssues: result.originalIssues,
+        changes: result.changes,
+    };
+}
+
+/**
+ * 직전 실행과 비교해 다시 처리할 컬럼을 구합니다.
+ * 데이터나 헤더가 다르면 null (전체 재정제)
+ */
+export function planIncremental(
+    snapshot: CleaningSnapshot | null,
+    data: DataTable,
+    plan: CleaningPlan,
+    maxLengthConstraints: ColumnLimits,
+    options: ProcessingOptions
+): IncrementalPlan | null {
+    if (!snapshot || snapshot.data !== data || data.rowCount === 0 || snapshot.changes.untracked.length > 0) return null;
+    const headers = data.headers;
+    if (headers.length !== snapshot.headers.length || headers.some((h, i) => h !== snapshot.headers[i])) return null;
+
+    const cleanColumns = headers.filter(h => getColumnPlan(plan, h).signature !== snapshot.signatures.get(h));
+    const issueColumns = headers.filter(h =>
+        cleanColumns.includes(h) || getIssueKey(h, maxLengthConstraints, options) !== snapshot.issueKeys.get(h)
+    );
+    if (cleanColumns.length * data.rowCount > INCREMENTAL_MAX_CELLS) return null;
+    return { cleanColumns, issueColumns };
+}
+
+/**
+ * 컬럼 목록만 다시 이슈 검사해, 나머지 컬럼의 이슈와 원래 헤더 순서대로 합칩니다.
+ */
+function refreshColumnIssues(
+    previous: DataIssue[],
+    table: DataTable,
+    headers: string[],
+    columns: string[],
+    maxLengthConstraints: ColumnLimits,
+    options: ProcessingOptions
+): DataIssue[] {
+    if (columns.length === 0) return previous;
+    const fresh = finalizeIssueScan(scanTableIssues(table, columns, maxLengthConstraints, options), maxLengthConstraints, options);
+    const stale = new Set(columns);
+    const byColumn = new Map<string, DataIssue[]>();
+    for (const issue of [...previous.filter(i => !stale.has(i.column)), ...fresh]) {
+        const list = byColumn.get(issue.column);
+        if (list) list.push(issue);
+        else byColumn.set(issue.column, [issue]);
+    }
+    return headers.flatMap(h => byColumn.get(h) || []);
+}
+
+/**
+ * 바뀐 컬럼만 다시 정제하고 이슈/변경 기록/통계를 갱신합니다.
+ * 다시 정제한 컬럼만 새 컬럼으로 바꾼 테이블을 만들고 나머지 컬럼은 직전 결과와 공유하며,
+ * 변경 기록은 새로 만들어 React 상태 갱신이 감지되도록 합니다.
+ */
+export function applyIncremental(
+    snapshot: CleaningSnapshot,
+    plan: CleaningPlan,
+    target: IncrementalPlan,
+    maxLengthConstraints: ColumnLimits,
+    options: ProcessingOptions
+): IncrementalResult {
+    const { data, headers } = snapshot;
+    const changes: ChangeSet = { ...snapshot.changes, changed: snapshot.changes.changed.slice(), cleared: snapshot.changes.cleared.slice() };
+    const columnIndex = getColumnIndex(changes);
+    const cols = headers.length;
+    const columns = snapshot.processedData.columns.slice();
+
+    for (const key of target.cleanColumns) {
+        const col = columnIndex.get(key) as number;
+
+        // 이전 값의 빈 셀/변경 집계를 빼고 새 값으로 다시 집계
+        const previous = columns[col];
+        const wasEmpty = previous.values.map(v => !String(v || '').trim());
+        for (let i = 0; i < data.rowCount; i++) {
+            if (!wasEmpty[previous.codes[i]]) changes.emptyCells++;
+            const idx = i * cols + col;
+            const bit = 1 << (idx & 31);
+            if (changes.changed[idx >>> 5] & bit) {
+                changes.changed[idx >>> 5] &= ~bit;
+                changes.cleared[idx >>> 5] &= ~bit;
+                changes.changedCount--;
+            }
+        }
+        columns[col] = cleanTableColumn(getColumnPlan(plan, key), data.columns[col], col, data.rowCount, changes);
+    }
+
+    const nextData: DataTable = { ...snapshot.processedData, columns };
+    const issues = refreshColumnIssues(snapshot.issues, nextData, headers, target.issueColumns, maxLengthConstraints, options);
+    // 원본은 그대로이므로 길이 제한이 바뀐 컬럼만 원본 이슈를 다시 검사
+    const limitColumns = target.issueColumns.filter(h => getIssueKey(h, maxLengthConstraints, options) !== snapshot.issueKeys.get(h));
+    const baselineIssues = refreshColumnIssues(snapshot.baselineIssues, data, headers, limitColumns, maxLengthConstraints, options);
+    const stats = finalizeDiffStats(diffCountsFromChanges(changes), baselineIssues.length, issues.length);
+
+    const next: CleaningSnapshot = {
+        data,
+        headers,
+        signatures: new Map(headers.map(h => [h, getColumnPlan(plan, h).signature])),
+        issueKeys: new Map(headers.map(h => [h, getIssueKey(h, maxLengthConstraints, options)])),
+        processedData: nextData,
+        issues,
+        baselineIssues,
+        changes,
+    };
+    return { snapshot: next, processedData: nextData, issues, stats, changes };
+}
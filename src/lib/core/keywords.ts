@@ -0,0 +1,244 @@
+/**
+ * 프롬프트 키워드 사전 (Keyword Table)
+ * 자연어 분석(nlp.ts)과 타겟 모호성 검사(processors.ts)가 쓰는 키워드 목록을 한곳에 모은 표입니다.
+ * 부분 일치 그룹은 Aho-Corasick 오토마타 하나로 컴파일되어, 프롬프트를 한 번만 훑으면서
+ * 등장한 그룹과 토큰(공백 구분)별 그룹을 함께 표시합니다. 키워드 수가 늘어도 비용은 프롬프트 길이에 비례합니다.
+ * 키워드를 추가할 때는 이 표만 수정하고, 파이썬 엔진(laundry_engine/keywords.py)에도 같은 값을 반영해야 합니다.
+ */
+
+// 부분 일치 그룹 (프롬프트 안에 하나라도 포함되면 해당 그룹이 등장한 것으로 봄)
+export const PROMPT_KEYWORDS = {
+    // 동사류
+    action: ['지워', '제거', '삭제', '없애', '정리', '닦아', '통일', '표준', '바꿔', '변경', '추출', '분리', '남겨', '따로', '빼', '치환', '수정', '교체', '변환'],
+    removeVerb: ['제거', '삭제', '빼', '지워', '없애'],
+    cleanVerb: ['제거', '삭제', '빼', '지워', '없애', '지우', '정리', '정규화'],
+    specialVerb: ['제거', '삭제', '빼', '지워', '정리', '정규화'],
+    bracketVerb: ['제거', '삭제', '내용삭제', '지워', '빼', '없애', '지우', '정리', '정규화'],
+    patternRemoveVerb: ['제거', '삭제', '빼', '지워', '없애', '지우', '안보이게'],
+    unmaskVerb: ['제거', '삭제', '해제', '풀어', '보이게', '표시'],
+    extractVerb: ['추출', '분리', '남겨', '따로'],
+    sidoVerb: ['추출', '분리', '남겨', '따로', '앞에'],
+    domainVerb: ['추출', '분리', '남겨'],
+    mappingVerb: ['변경', '변환', '교체', '바꿔', '수정', '치환', '통일', '->', ':', '=>'],
+    changeVerb: ['바꿔', '변경', '치환', '수정'],
+    errorEmptyVerb: ['빈칸', '공백', '삭제', '지워', 'empty', 'blank'],
+
+    // 대상/기능
+    hyphen: ['하이픈', '대시', '-'],
+    comma: ['콤마', '쉼표', ','],
+    mask: ['마스킹', '가림', '별표'],
+    maskAny: ['마스킹', '가림', '별표', '숨김'],
+    maskStar: ['마스킹', '별표'],
+    maskHide: ['마스킹', '가림'],
+    maskTarget: ['계좌', '카드', '번호'],
+    maskPart: ['뒷자리', '중간'],
+    sido: ['시/도', '시도', '광역'],
+    gungu: ['구/군', '구군', '시/군/구'],
+    dong: ['동/읍/면', '동읍면', '상세주소'],
+    onlyDigits: ['숫자만', '숫자 추출', '숫자남겨'],
+    onlyKorean: ['한글만', '한글 추출', '한글남겨'],
+    onlyEnglish: ['영어만', '영문만', 'english only'],
+    special: ['특수문자', '기호'],
+    bracket: ['괄호', 'bracket'],
+    company: ['업체명', '회사명', '상호', '주식회사', '(주)'],
+    position: ['직함', '직위', '직책', '네임'],
+    lower: ['소문자', 'lowercase', '소문자변경'],
+    upper: ['대문자', 'uppercase', '대문자변경'],
+    html: ['html', '태그', 'tag'],
+    emoji: ['이모지', '이모티콘', 'emoji'],
+    domain: ['도메인', 'domain'],
+    date: ['날짜', 'date', '일시'],
+    dateOnly: ['날짜', 'date'],
+    dateSlash: ['yyyy/mm/dd', '/'],
+    dateDot: ['yyyy.mm.dd', '.', '점'],
+    dateHyphen: ['yyyy-mm-dd', '하이픈', '-', '대시'],
+    dateCompact: ['yyyymmdd', '붙여서'],
+    error: ['오류', '에러', '잘못', 'fail', 'error'],
+    numericOp: ['이상', '이하', '초과', '미만', '크면', '작으면', '같으면'],
+    whitespace: ['공백', '스페이스', '빈칸'],
+    garbage: ['가비지', '쓰레기'],
+    middle: ['중간'],
+    name: ['성함', '이름'],
+    email: ['이메일', 'email'],
+    address: ['주소'],
+    addressDetail: ['상세', '뒷부분'],
+    age: ['나이', 'age'],
+    ageCategory: ['범주', '연령대'],
+    truncate: ['절삭', '연월', '일 제거'],
+    exponential: ['지수', 'exponential', 'E+'],
+    building: ['건물명', '아파트명', '빌딩명'],
+    sku: ['sku', '모델명', '상품코드'],
+    unit: ['단위 제거', '수치화', '숫자만'],
+    currency: ['통화', '화폐', '부호 제거'],
+
+    // V4 토큰 파서: 토큰 단위로 판정 (비교 연산자는 ge > le > gt > lt > eq 순으로 우선)
+    nullWord: ['비어', '없으', '공백', '빈값', 'null'],
+    opGe: ['이상', '크거나'],
+    opLe: ['이하', '작거나'],
+    opGt: ['초과', '크면'],
+    opLt: ['미만', '작으면'],
+    opEq: ['같으면', '동일'],
+    tokenAction: ['바꿔', '바꾸', '변경', '치환', '수정', '설정', '채워', '넣어'],
+
+    // 타겟 모호성 검사 (checkNLPTargetAmbiguity)
+    ambiguityAction: [
+        '제거', '삭제', '빼', '지워', '없애', '지우', '정리',
+        '변경', '변환', '교체', '바꿔', '수정', '치환',
+        '대문자', '소문자', 'uppercase', 'lowercase',
+        '패딩', '채워', 'prefix', 'suffix', '붙여', '앞에', '뒤에'
+    ],
+    globalQuantifier: ['전부', '싹', '모두', '다', '전체', 'all', '싹다', '모든'],
+};
+
+export type KeywordGroup = keyof typeof PROMPT_KEYWORDS;
+
+// 완전 일치 단어 목록 (타겟 후보/토큰 전체가 이 단어인지 판정)
+export const PROMPT_WORDS = {
+    // 타겟으로 보지 않는 수량사
+    quantifiers: ['전부', '싹', '모두', '다', '전체', 'all', '싹다', '값', '데이터', '내용', '모든'],
+    // 연결어(채우고, 하고 등)가 타겟으로 오인되는 것을 방지하기 위한 블랙리스트
+    invalidTargets: ['채우고', '하고', '한뒤', '해서', '넣고', '바꾸고', '지우고', '없애고', '변경하고', '삭제하고', '된다면', '있으면', '없으면', '아니면', '그리고', '그런다음', '이어서'],
+    // 일반 명사 (타겟 컬럼명으로 보지 않음)
+    noiseWords: ['패턴', '문구', '단어', '텍스트', '값', '데이터', '내용', '항목', '정보', '필드', '컬럼'],
+    // 패턴으로 쓰지 않는 조사
+    objectParticles: ['을', '를', '이', '가', '은', '는'],
+    // 토큰 끝에서 떼어내는 주격/보조사 (컬럼명 추출)
+    subjectParticles: ['이', '가', '은', '는'],
+    // 값과 동사 사이에 홀로 온 조사 ("'High' 로 바꿔")
+    standaloneParticles: ['으로', '로'],
+};
+
+const WHITESPACE = /\s/;
+
+/**
+ * 한 번의 스캔 결과: 등장한 그룹과 토큰별 그룹
+ */
+export class KeywordScan {
+    constructor(
+        private groupIndex: Map<KeywordGroup, number>,
+        private found: Uint8Array,
+        readonly tokens: string[],
+        private tokenFound: (Set<number> | undefined)[]
+    ) { }
+
+    /** 프롬프트에 그룹의 키워드가 하나라도 포함되어 있는지 */
+    has(group: KeywordGroup): boolean {
+        return this.found[this.groupIndex.get(group) as number] === 1;
+    }
+
+    /** i번째 토큰 안에 그룹의 키워드가 포함되어 있는지 */
+    tokenHas(i: number, group: KeywordGroup): boolean {
+        return this.tokenFound[i]?.has(this.groupIndex.get(group) as number) === true;
+    }
+}
+
+/**
+ * 키워드 표를 컴파일한 Aho-Corasick 오토마타
+ */
+export class KeywordMatcher {
+    private groups: KeywordGroup[];
+    private groupIndex: Map<KeywordGroup, number>;
+    private goto: Map<number, number>[] = [new Map()];   // 상태별 다음 상태 (문자 코드 기준)
+    private fail: number[] = [0];
+    private output: number[][] = [[]];                    // 상태에서 끝나는 키워드들의 그룹 (실패 링크 출력 포함)
+    private depth: number[] = [0];                        // 상태까지의 문자 수
+
+    constructor(table: Record<KeywordGroup, readonly string[]>) {
+        this.groups = Object.keys(table) as KeywordGroup[];
+        this.groupIndex = new Map(this.groups.map((g, i) => [g, i]));
+
+        // 1. 트라이 구성
+        this.groups.forEach((group, g) => {
+            for (const keyword of table[group]) {
+                let state = 0;
+                for (let i = 0; i < keyword.length; i++) {
+                    const c = keyword.charCodeAt(i);
+                    let next = this.goto[state].get(c);
+                    if (next === undefined) {
+                        next = this.goto.length;
+                        this.goto.push(new Map());
+                        this.fail.push(0);
+                        this.output.push([]);
+                        this.depth.push(this.depth[state] + 1);
+                        this.goto[state].set(c, next);
+                    }
+                    state = next;
+                }
+                if (!this.output[state].includes(g)) this.output[state].push(g);
+            }
+        });
+
+        // 2. 너비 우선으로 실패 링크와 출력 병합
+        const queue: number[] = [...this.goto[0].values()];
+        for (let head = 0; head < queue.length; head++) {
+            const state = queue[head];
+            for (const [c, next] of this.goto[state]) {
+                let f = this.fail[state];
+                while (f !== 0 && !this.goto[f].has(c)) f = this.fail[f];
+                const target = this.goto[f].get(c);
+                this.fail[next] = target !== undefined && target !== next ? target : 0;
+                for (const g of this.output[this.fail[next]]) {
+                    if (!this.output[next].includes(g)) this.output[next].push(g);
+                }
+                queue.push(next);
+            }
+        }
+    }
+
+    /**
+     * 텍스트를 한 번 훑어 등장한 그룹을 표시하고, 공백으로 나눈 토큰(split(/\s+/)과 동일)마다
+     * 토큰 안에 완전히 들어 있는 키워드의 그룹을 표시합니다.
+     */
+    scan(text: string): KeywordScan {
+        const found = new Uint8Array(this.groups.length);
+        const tokens: string[] = [];
+        const tokenFound: (Set<number> | undefined)[] = [];
+        let tokenStart = 0;
+        let inSpace = false;
+        let state = 0;
+
+        for (let i = 0; i < text.length; i++) {
+            const c = text.charCodeAt(i);
+            if (WHITESPACE.test(text[i])) {
+                // 공백 구간이 시작되면 토큰을 닫음
+                if (!inSpace) tokens.push(text.slice(tokenStart, i));
+                inSpace = true;
+            } else if (inSpace) {
+                tokenStart = i;
+                inSpace = false;
+            }
+
+            let next = this.goto[state].get(c);
+            while (next === undefined && state !== 0) {
+                state = this.fail[state];
+                next = this.goto[state].get(c);
+            }
+            state = next ?? 0;
+
+            const out = this.output[state];
+            if (out.length === 0) continue;
+            for (const g of out) found[g] = 1;
+            if (inSpace) continue;
+
+            // 토큰 표시: 현재 토큰 안에서 시작하는 가장 긴 일치를 찾으면 그보다 짧은 일치(출력에 병합됨)도 모두 토큰 안에 있음
+            let s = state;
+            while (s !== 0 && i - this.depth[s] + 1 < tokenStart) s = this.fail[s];
+            if (s === 0 || this.output[s].length === 0) continue;
+            let set = tokenFound[tokens.length];
+            if (!set) set = tokenFound[tokens.length] = new Set();
+            for (const g of this.output[s]) set.add(g);
+        }
+        tokens.push(inSpace ? '' : text.slice(tokenStart));
+        return new KeywordScan(this.groupIndex, found, tokens, tokenFound);
+    }
+}
+
+// 모듈 로드 시 한 번만 컴파일
+export const PROMPT_MATCHER = new KeywordMatcher(PROMPT_KEYWORDS);
+
+export const QUANTIFIER_WORDS = new Set(PROMPT_WORDS.quantifiers);
+export const INVALID_TARGET_WORDS = new Set(PROMPT_WORDS.invalidTargets);
+export const NOISE_WORDS = new Set(PROMPT_WORDS.noiseWords);
+export const OBJECT_PARTICLES = new Set(PROMPT_WORDS.objectParticles);
+export const STANDALONE_PARTICLES = new Set(PROMPT_WORDS.standaloneParticles);
+export const SUBJECT_PARTICLE_SUFFIX = new RegExp(`(${PROMPT_WORDS.subjectParticles.join('|')})$`);
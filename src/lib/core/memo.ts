@@ -0,0 +1,93 @@
+/**
+ * 고유값 메모이제이션 (Distinct-value Memo)
+ * 날짜/금액/지역/업체명처럼 행 수에 비해 고유값이 적은 컬럼은 같은 입력이 반복되므로,
+ * 비용이 큰 정제 단계는 고유값마다 한 번만 계산하고 결과를 재사용합니다.
+ * 저장량은 문자 수 기준 상한을 넘으면 오래된 항목부터 비우며,
+ * 고유값이 대부분인 컬럼(ID, 이름 등)은 적중률이 낮으면 캐시를 끄고 원래 함수만 실행합니다.
+ */
+
+export interface MemoStats {
+    column: string;
+    step: string;
+    hits: number;
+    misses: number;
+    evictions: number;
+    size: number;        // 현재 저장된 고유값 수
+    bypassed: boolean;   // 적중률이 낮아 캐시를 끈 경우
+    hitRate: number;     // 0~1
+}
+
+// 단계 하나당 저장 상한 (키 + 결과 문자 수, 약 1MB)
+export const DEFAULT_MEMO_MAX_CHARS = 500000;
+// 이 횟수만큼 새 값을 계산한 시점에 적중률을 확인
+const BYPASS_CHECK_AFTER = 4096;
+const BYPASS_MIN_HIT_RATE = 0.05;
+
+export class ValueMemo {
+    private cache = new Map<string, string>();
+    private chars = 0;
+    hits = 0;
+    misses = 0;
+    evictions = 0;
+    bypassed = false;
+
+    constructor(
+        public readonly column: string,
+        public readonly step: string,
+        private fn: (val: string) => string,
+        private maxChars: number = DEFAULT_MEMO_MAX_CHARS
+    ) { }
+
+    /**
+     * 메모를 거쳐 값을 변환합니다. (변환 목록에 그대로 넣을 수 있도록 화살표 함수로 고정)
+     */
+    readonly apply = (val: string): string => {
+        if (this.bypassed) return this.fn(val);
+
+        const cached = this.cache.get(val);
+        if (cached !== undefined) {
+            this.hits++;
+            return cached;
+        }
+
+        this.misses++;
+        const result = this.fn(val);
+        this.cache.set(val, result);
+        this.chars += val.length + result.length;
+        if (this.chars > this.maxChars) this.evict();
+
+        if (this.misses === BYPASS_CHECK_AFTER && this.hits < (this.hits + this.misses) * BYPASS_MIN_HIT_RATE) {
+            this.bypassed = true;
+            this.cache.clear();
+            this.chars = 0;
+        }
+        return result;
+    };
+
+    /**
+     * 오래된 항목부터 상한의 절반이 될 때까지 비웁니다. (Map의 삽입 순서 사용)
+     */
+    private evict() {
+        const target = this.maxChars / 2;
+        for (const [key, value] of this.cache) {
+            if (this.chars <= target) break;
+            this.cache.delete(key);
+            this.chars -= key.length + value.length;
+            this.evictions++;
+        }
+    }
+
+    stats(): MemoStats {
+        const lookups = this.hits + this.misses;
+        return {
+            column: this.column,
+            step: this.step,
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            size: this.cache.size,
+            bypassed: this.bypassed,
+            hitRate: lookups > 0 ? this.hits / lookups : 0,
+        };
+    }
+}
@@ -0,0 +1,401 @@
+/**
+ * 자연어 프롬프트 분석 (NLP Smart)
+ * processDataLocal 안에서 매 호출마다 수행하던 키워드 탐색/정규식 매칭을 분리한 모듈입니다.
+ * 결과(PromptAnalysis)는 프롬프트에만 의존하므로 정제 계획(plan.ts)에서 한 번만 계산해 재사용합니다.
+ */
+
+import { SafePattern, compileSafePattern } from './safeRegex';
+import { PROMPT_MATCHER, KeywordGroup, QUANTIFIER_WORDS, INVALID_TARGET_WORDS, OBJECT_PARTICLES, STANDALONE_PARTICLES, SUBJECT_PARTICLE_SUFFIX } from './keywords';
+
+// [New] Numeric Condition Logic (e.g. "price가 10000 이상이면 'High'로 바꿔")
+export interface NumericCondition {
+    column: string;
+    value: number;
+    operator: 'ge' | 'le' | 'gt' | 'lt' | 'eq'; // >=, <=, >, <, =
+    targetValue: string;
+}
+
+// [New] Null/Empty Fill Logic (e.g. "grade가 비어있으면 'Unknown'으로 채워")
+export interface NullFilling {
+    column: string;
+    fillValue: string;
+}
+
+export interface PatternMapping {
+    pattern: SafePattern;   // 사용자 패턴은 safeRegex.ts를 거쳐 실행 (백트래킹 폭주 방지)
+    replacement: string;
+}
+
+export interface PromptAnalysis {
+    wantsHyphenRemoval: boolean;
+    wantsCommaRemoval: boolean;
+    wantsUnmask: boolean;
+    wantsSido: boolean;
+    wantsGungu: boolean;
+    wantsOnlyDigits: boolean;
+    wantsOnlyKorean: boolean;
+    wantsOnlyEnglish: boolean;
+    wantsNoSpecial: boolean;
+    wantsNoBrackets: boolean;
+    targetNoBrackets: string | null;
+    wantsCompanyClean: boolean;
+    targetCompanyClean: string | null;
+    wantsPositionRemoval: boolean;
+    targetPositionRemoval: string | null;
+    wantsDongExtraction: boolean;
+    wantsMasking: boolean;
+    wantsLower: boolean;
+    wantsUpper: boolean;
+    lowerTarget: string | null;
+    upperTarget: string | null;
+    wantsNoHtml: boolean;
+    targetNoHtml: string | null;
+    wantsNoEmoji: boolean;
+    targetNoEmoji: string | null;
+    wantsDomain: boolean;
+    prefixValue: string | null;
+    prefixTarget: string | null;
+    suffixValue: string | null;
+    suffixTarget: string | null;
+    paddingLen: number;
+    paddingTarget: string | null;
+    allPotentialTargets: string[];
+    mappings: Record<string, string>;
+    patternMappings: PatternMapping[];
+    /** 실행 시간을 보장할 수 없어 적용하지 않은 사용자 패턴 (이슈로 보고) */
+    rejectedPatterns: string[];
+    nlpDateSeparator: string | null;
+    nlpUseEmptySeparator: boolean;
+    /** 자연어로 지정된 날짜 구분자 (지정이 없으면 null, 'yyyymmdd'는 빈 문자열) */
+    dateSeparator: string | null;
+    wantsEmptyOnError: boolean;
+    numericConditions: NumericCondition[];
+    nullFillings: NullFilling[];
+    // 셀 루프 안에서 평가하던 키워드 조건 (프롬프트에만 의존하므로 미리 계산)
+    wantsWhitespace: boolean;
+    wantsGarbage: boolean;
+    wantsMaskMiddle: boolean;
+    wantsNameMask: boolean;
+    wantsEmailMask: boolean;
+    wantsAddressMask: boolean;
+    wantsAgeCategory: boolean;
+    wantsTruncateDate: boolean;
+    wantsExponential: boolean;
+    wantsBuilding: boolean;
+    wantsSku: boolean;
+    wantsUnit: boolean;
+    wantsCurrency: boolean;
+}
+
+// [Refactoring] Helper to extract target column from complex sentences (e.g. "msg랑 memo에서 html 제거")
+// 키워드 목록별 정규식 (analyzePrompt마다 다시 만들지 않음)
+const conjunctiveRegexCache = new Map<string, RegExp>();
+
+export function extractConjunctiveTarget(lowerPrompt: string, keywords: string[]): string | null {
+    const keywordPattern = keywords.join('|');
+    let finalRegex = conjunctiveRegexCache.get(keywordPattern);
+    if (!finalRegex) {
+        // 연결어 반복 안에 \s+를 두면 공백이 길게 이어진 프롬프트에서 백트래킹이 지수적으로 늘어나므로 \s 한 글자씩 반복
+        const intervener = `(?:(?:[^\\s]+)(?:이랑|하고|와|과|,|\\s)+)?`;
+        finalRegex = new RegExp(`([가-힣a-zA-Z0-9_\\(\\)]+)(?:에서|의|쪽|부분)?(?:에)?\\s*(?:있는|들어있는)?\\s*${intervener}(?:${keywordPattern})`, 'i');
+        conjunctiveRegexCache.set(keywordPattern, finalRegex);
+    }
+
+    const m = lowerPrompt.match(finalRegex);
+    return m ? m[1] : null;
+}
+
+/**
+ * 프롬프트를 분석하여 정제 규칙(플래그, 타겟 컬럼, 치환 매핑, 조건부 로직)을 추출합니다.
+ */
+export function analyzePrompt(prompt: string): PromptAnalysis {
+    const lowerPrompt = prompt.toLowerCase();
+    // 키워드 표(keywords.ts)의 모든 그룹을 한 번의 스캔으로 판정
+    const scan = PROMPT_MATCHER.scan(lowerPrompt);
+    const filterBy = (group: KeywordGroup) => scan.has(group);
+    const hasAction = filterBy('action');
+
+    // --- [NLP 분석] ---
+    const wantsHyphenRemoval = filterBy('hyphen') && filterBy('removeVerb');
+    const wantsCommaRemoval = filterBy('comma') && filterBy('removeVerb');
+    const wantsUnmask = filterBy('mask') && filterBy('unmaskVerb');
+    const wantsSido = filterBy('sido') && filterBy('sidoVerb');
+    const wantsGungu = filterBy('gungu') && filterBy('extractVerb');
+    const wantsOnlyDigits = filterBy('onlyDigits');
+    const wantsOnlyKorean = filterBy('onlyKorean');
+    const wantsOnlyEnglish = filterBy('onlyEnglish');
+    const wantsNoSpecial = filterBy('special') && filterBy('specialVerb');
+    const wantsNoBrackets = filterBy('bracket') && filterBy('bracketVerb');
+    const targetNoBrackets = wantsNoBrackets ? extractConjunctiveTarget(lowerPrompt, ['괄호', 'bracket']) : null;
+
+    const wantsCompanyClean = filterBy('company') && filterBy('cleanVerb');
+    const targetCompanyClean = wantsCompanyClean ? extractConjunctiveTarget(lowerPrompt, ['업체명', '회사명', '상호', '주식회사', '\\(주\\)']) : null;
+
+    const wantsPositionRemoval = filterBy('position') && filterBy('cleanVerb');
+    const targetPositionRemoval = wantsPositionRemoval ? extractConjunctiveTarget(lowerPrompt, ['직함', '직위', '직책', '네임']) : null;
+    const wantsDongExtraction = filterBy('dong') && filterBy('extractVerb');
+    const wantsMasking = filterBy('maskAny') && (filterBy('maskTarget') || filterBy('maskPart'));
+
+    // [NEW NLP Flags]
+    const wantsLower = filterBy('lower');
+    const wantsUpper = filterBy('upper');
+    const wantsNoHtml = filterBy('html') && filterBy('cleanVerb');
+    const targetNoHtml = wantsNoHtml ? extractConjunctiveTarget(lowerPrompt, ['html', '태그', 'tag']) : null;
+
+    const wantsNoEmoji = filterBy('emoji') && filterBy('cleanVerb');
+    const targetNoEmoji = wantsNoEmoji ? extractConjunctiveTarget(lowerPrompt, ['이모지', '이모티콘', 'emoji']) : null;
+    const wantsDomain = filterBy('domain') && filterBy('domainVerb');
+    const wantsPrefixMatch = prompt.match(/(?:([가-힣a-zA-Z0-9_\(\)]+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?(?:앞에|앞에다가|prefix)\s*['"]?([^'"]+)['"]?\s*(?:붙여|붙이|추가|넣어|넣으|끼워|끼우|삽입)/i);
+    const wantsSuffixMatch = prompt.match(/(?:([가-힣a-zA-Z0-9_\(\)]+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?(?:뒤에|뒤에다가|suffix)\s*['"]?([^'"]+)['"]?\s*(?:붙여|붙이|추가|넣어|넣으|끼워|끼우|삽입|붙이고|넣고)/i);
+    // [Modified] Padding command with optional subject capture
+    const wantsPaddingMatch = lowerPrompt.match(/(?:([가-힣a-zA-Z0-9_\(\)]+)(?:은|는|이|가|을|를|의|에서|컬럼|필드)?\s*)?(\d+)\s*(?:자리|글자)(?:\s*로)?(?:\s*(?:0|영|공|제로|공백))?(?:\s*(?:으로))?\s*(?:맞춰|맞추|패딩|padding|채워|채우|만들어|만들|늘려|늘리)/);
+    const wantsPaddingLen = wantsPaddingMatch && wantsPaddingMatch[2] ? parseInt(wantsPaddingMatch[2]) : 0;
+    const wantsPaddingTarget = wantsPaddingMatch && wantsPaddingMatch[1] ? wantsPaddingMatch[1] : null;
+
+    // [New] Contextual Target Extractor
+    // Find the first mentioned potential column name (not a quantifier)
+    // [New] Contextual Target Extractor
+    // Find the first mentioned potential column name (not a quantifier)
+    // [Modified] Add conjunctions (랑, 와, 과, 하고, and, or, comma) to capture "A랑 B에서"
+    const allPotentialTargets = Array.from(lowerPrompt.matchAll(/([가-힣a-zA-Z0-9_\(\)]+)(?:\s*(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에|쪽|부분|랑|와|과|하고|및|and|or|,))/g)).map(m => m[1]);
+    const isQuantifier = (t: string) => QUANTIFIER_WORDS.has(t);
+    const primaryTarget = allPotentialTargets.find(t => !isQuantifier(t)) || null;
+
+    // [New] Upper/Lower targets extracted outside loop
+    let upperTarget = null;
+    if (wantsUpper) {
+        const m = lowerPrompt.match(/(?:([가-힣a-zA-Z0-9_\(\)]+)(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에)?\s*)?(?:대문자|uppercase)/);
+        upperTarget = m && m[1] ? m[1] : null;
+        // If target is a generic quantifier BUT we have a specific primaryTarget, use primaryTarget
+        if (upperTarget && isQuantifier(upperTarget)) {
+            upperTarget = primaryTarget ? primaryTarget : null;
+        } else if (!upperTarget) {
+            upperTarget = primaryTarget;
+        }
+    }
+    let lowerTarget = null;
+    if (wantsLower) {
+        const m = lowerPrompt.match(/(?:([가-힣a-zA-Z0-9_\(\)]+)(?:은|는|이|가|을|를|의|에서|컬럼|필드|앞에|뒤에)?\s*)?(?:소문자|lowercase)/);
+        lowerTarget = m && m[1] ? m[1] : null;
+        if (lowerTarget && isQuantifier(lowerTarget)) {
+            lowerTarget = primaryTarget ? primaryTarget : null;
+        } else if (!lowerTarget) {
+            lowerTarget = primaryTarget;
+        }
+    }
+
+    // [New] Prefix/Suffix targets extracted outside loop
+    // 연결어(채우고, 하고 등)가 타겟으로 오인되는 것을 방지 (keywords.ts의 invalidTargets)
+    const isInvalidTarget = (t: string) => INVALID_TARGET_WORDS.has(t);
+
+    let prefixTarget = wantsPrefixMatch && wantsPrefixMatch[1] ? wantsPrefixMatch[1] : null;
+    if (prefixTarget && (isQuantifier(prefixTarget) || isInvalidTarget(prefixTarget))) {
+        prefixTarget = primaryTarget ? primaryTarget : null;
+    } else if (!prefixTarget && wantsPrefixMatch) {
+        prefixTarget = primaryTarget;
+    }
+
+    let suffixTarget = wantsSuffixMatch && wantsSuffixMatch[1] ? wantsSuffixMatch[1] : null;
+    if (suffixTarget && (isQuantifier(suffixTarget) || isInvalidTarget(suffixTarget))) {
+        suffixTarget = primaryTarget ? primaryTarget : null;
+    } else if (!suffixTarget && wantsSuffixMatch) {
+        suffixTarget = primaryTarget;
+    }
+
+    // Mappings & Pattern Mappings [Rule 4, 5]
+    const mappings: Record<string, string> = {};
+    const patternMappings: PatternMapping[] = [];
+    const rejectedPatterns: string[] = [];
+    // 문법 오류 패턴은 기존처럼 무시하고, 실행 시간을 보장할 수 없는 패턴은 따로 모아 이슈로 보고
+    const addPattern = (source: string, flags: string, replacement: string) => {
+        const pattern = compileSafePattern(source, flags);
+        if (!pattern) return;
+        if (pattern.mode === 'rejected') {
+            if (!rejectedPatterns.includes(source)) rejectedPatterns.push(source);
+            return;
+        }
+        patternMappings.push({ pattern, replacement });
+    };
+
+    // [New] Flexible Pattern Removal (supports unquoted & %d placeholder)
+    if (filterBy('patternRemoveVerb')) {
+        // 1. Quoted/Bracketed patterns (priority)
+        const qMatches = Array.from(lowerPrompt.matchAll(/['"\[\]]([^'"\[\]]+)['"\[\]]\s*(?:패턴|문구|단어|텍스트|값)?(?:은|는|이|가|을|를)?\s*(?:제거|삭제|지워|없애)/g));
+        qMatches.forEach(m => {
+            let p = m[1];
+            if (p.includes('%d')) p = p.replace(/%d/g, '\\d+');
+            addPattern(p, 'g', '');
+        });
+
+        // 2. Unquoted patterns (e.g. "_%d 패턴 제거")
+        const uMatches = Array.from(lowerPrompt.matchAll(/([^\s가-힣0-9]{1,3}[^\s가-힣]*)\s*(?:패턴|문구|단어|텍스트|값)?(?:은|는|이|가|을|를)?\s*(?:제거|삭제|지워|없애)/g));
+        uMatches.forEach(m => {
+            let p = m[1];
+            if (p.includes('%d')) p = p.replace(/%d/g, '\\d+');
+            // Avoid adding single common words as patterns unless specific
+            if (p.length > 0 && !OBJECT_PARTICLES.has(p)) {
+                addPattern(p, 'g', '');
+            }
+        });
+    }
+    if (filterBy('mappingVerb')) {
+        // 복합 치환 지원을 위해 쉼표나 마침표로 구분된 매핑 탐색
+
+        // [수정] 특수문자(@, ., (, ), / 등) 허용 범위 확장
+        // [수정] 중간 노이즈(컬럼, 데이터 등) 처리를 위한 반복 패턴 적용
+        // [수정] 특수문자(@, ., (, ), / 등) 허용 범위 확장
+        // [수정] 중간 노이즈(컬럼, 데이터 등) 처리를 위한 반복 패턴 적용
+        const mappingRegex = /([\[\]%A-Za-z0-9가-힣_\-@./()+]+)(?:\s*(?:컬럼|필드|데이터|값|문구|텍스트|형식|패턴|의))*\s*(?:는|은|->|:|를|을|=>)\s*([\[\]%A-Za-z0-9가-힣_\-\s/.@()+!?'""]+)/gi;
+        const matches = Array.from(prompt.matchAll(mappingRegex));
+        matches.forEach(m => {
+            let from = m[1].trim().toLowerCase();
+            let to = m[2].trim();
+
+            // 전처리: 따옴표, 부사(무조건 등) 제거
+            to = to.replace(/무조건|전부|싹다|모두|절대/g, '').trim();
+
+            // 후속 조사 및 서술어 제거 (반복 제거: '으로 바꿔줘' 처럼 여러 개가 붙은 경우 대비)
+            const suffixRegex = /(?:으로|로|라고|하게|으로\s+변경|로\s+변경|로\s+수정|변경\s*해\s*줘|변경해줘|해\s*줘|해줘|형식으로|형식|포맷으로|포맷|으로\s*바꿔|바꿔줘|바꿔|하고|해주고|니다|입니다|요)$/;
+            let prevTo = "";
+            while (to !== prevTo) {
+                prevTo = to;
+                to = to.replace(suffixRegex, '').trim();
+            }
+
+            // 값의 앞뒤 따옴표 제거
+            to = to.replace(/^['"]|['"]$/g, '');
+            // 구분자(쉼표 등) 제거
+            to = to.replace(/[,;.]$/, '').trim();
+
+            if (['빈칸', '공백', 'empty', 'blank', '없음', '제거'].includes(to)) to = '';
+            if (from && (to !== undefined)) {
+                if (from.includes('%')) {
+                    let regexStr = from
+                        .replace(/[-\/\\^$*+?.()|[\]{}]/g, '\\$&')
+                        .replace(/(?:\\\[)?%d(?:\\\])?/g, '\\d+')
+                        .replace(/(?:\\\[)?%s(?:\\\])?/g, '.+')
+                        .replace(/(?:\\\[)?%(\d+)d(?:\\\])?/g, '\\d{$1}')
+                        .replace(/(?:\\\[)?%(\d+)s(?:\\\])?/g, '.{$1}');
+                    addPattern(`^${regexStr}$`, 'i', to);
+                } else {
+                    mappings[from] = to;
+                }
+            }
+        });
+    }
+
+    // 날짜 포맷 NLP (프로그램 기본 포맷을 잠시 덮어씀) [Rule 5]
+    let nlpDateSeparator: string | null = null;
+    let nlpUseEmptySeparator = false;
+    // [Fix] '일시' 키워드 추가 및 오류 처리 플래그 감지
+    if (filterBy('date')) {
+        if (filterBy('dateSlash')) nlpDateSeparator = '/';
+        else if (filterBy('dateDot')) nlpDateSeparator = '.';
+        else if (filterBy('dateHyphen')) nlpDateSeparator = '-';
+        else if (filterBy('dateCompact')) nlpUseEmptySeparator = true;
+    }
+    const wantsEmptyOnError = filterBy('error') && filterBy('errorEmptyVerb');
+
+    // [New] Numeric Condition Logic (e.g. "price가 10000 이상이면 'High'로 바꿔")
+    // Pattern: [Column] [Value] [Operator] [TargetValue] [Action]
+    const numericConditions: NumericCondition[] = [];
+
+    // [New] Null/Empty Fill Logic (e.g. "grade가 비어있으면 'Unknown'으로 채워")
+    const nullFillings: NullFilling[] = [];
+
+    // Check triggers
+    const triggerNumericOps = filterBy('numericOp');
+    const triggerActions = filterBy('changeVerb');
+
+    // [Revised Logic V4] Unified Token Parser (Numeric + Null + Actions)
+    const hasTrigger = triggerNumericOps || triggerActions || filterBy('nullWord');
+
+    if (hasTrigger) {
+        // 토큰과 토큰별 키워드(연산자/결측 단어/동작)는 위의 스캔에서 이미 표시됨
+        const { tokens } = scan;
+        const operatorGroups: [KeywordGroup, NumericCondition['operator']][] = [['opGe', 'ge'], ['opLe', 'le'], ['opGt', 'gt'], ['opLt', 'lt'], ['opEq', 'eq']];
+
+        // 각 토큰 뒤의 첫 동작 토큰 위치 (뒤에서부터 한 번에 계산)
+        const nextAction = new Array<number>(tokens.length).fill(-1);
+        for (let k = tokens.length - 2; k >= 0; k--) {
+            nextAction[k] = scan.tokenHas(k + 1, 'tokenAction') ? k + 1 : nextAction[k + 1];
+        }
+
+        // 동작 토큰 바로 앞(조사 토큰은 건너뜀)의 값을 꺼냄: 'High'로 바꿔 -> High
+        const findActionValue = (i: number): string => {
+            const actionIdx = nextAction[i];
+            if (actionIdx === -1) return "";
+            let targetIdx = actionIdx - 1;
+            if (targetIdx > i && STANDALONE_PARTICLES.has(tokens[targetIdx])) targetIdx--;
+            const possible = tokens[targetIdx];
+            const quoteMatch = possible.match(/['"]([^'"]+)['"]/);
+            return quoteMatch ? quoteMatch[1] : possible.replace(/(으)?로$/, '');
+        };
+        const previousColumn = (i: number): string => i > 0 ? tokens[i - 1].replace(SUBJECT_PARTICLE_SUFFIX, '').trim() : "";
+
+        for (let i = 0; i < tokens.length; i++) {
+            const token = tokens[i];
+
+            // --- A. Numeric Condition Logic ---
+            if (/^[\d,]+$/.test(token)) {
+                const valNum = parseFloat(token.replace(/,/g, ''));
+                if (!isNaN(valNum)) {
+                    let operator: NumericCondition['operator'] | null = null;
+                    for (let j = 1; j <= 2 && i + j < tokens.length && !operator; j++) {
+                        const match = operatorGroups.find(([group]) => scan.tokenHas(i + j, group));
+                        if (match) operator = match[1];
+                    }
+
+                    if (operator) {
+                        const col = previousColumn(i);
+                        const target = findActionValue(i);
+                        if (col && target) {
+                            numericConditions.push({ column: col, value: valNum, operator: operator, targetValue: target });
+                        }
+                    }
+                }
+            }
+
+            // --- B. Null Filling Logic ---
+            if (scan.tokenHas(i, 'nullWord')) {
+                const col = previousColumn(i);
+                const fillVal = findActionValue(i);
+                if (col && fillVal) {
+                    nullFillings.push({ column: col, fillValue: fillVal });
+                }
+            }
+        }
+    }
+
+    return {
+        wantsHyphenRemoval, wantsCommaRemoval, wantsUnmask, wantsSido, wantsGungu,
+        wantsOnlyDigits, wantsOnlyKorean, wantsOnlyEnglish, wantsNoSpecial,
+        wantsNoBrackets, targetNoBrackets, wantsCompanyClean, targetCompanyClean,
+        wantsPositionRemoval, targetPositionRemoval, wantsDongExtraction, wantsMasking,
+        wantsLower, wantsUpper, lowerTarget, upperTarget,
+        wantsNoHtml, targetNoHtml, wantsNoEmoji, targetNoEmoji, wantsDomain,
+        prefixValue: wantsPrefixMatch ? wantsPrefixMatch[2] : null,
+        prefixTarget,
+        suffixValue: wantsSuffixMatch ? wantsSuffixMatch[2] : null,
+        suffixTarget,
+        paddingLen: wantsPaddingLen,
+        paddingTarget: wantsPaddingTarget,
+        allPotentialTargets, mappings, patternMappings, rejectedPatterns,
+        nlpDateSeparator, nlpUseEmptySeparator,
+        dateSeparator: (nlpDateSeparator !== null || nlpUseEmptySeparator) ? (nlpUseEmptySeparator ? "" : nlpDateSeparator) : null,
+        wantsEmptyOnError, numericConditions, nullFillings,
+        wantsWhitespace: filterBy('whitespace') && hasAction,
+        wantsGarbage: filterBy('garbage'),
+        wantsMaskMiddle: filterBy('middle'),
+        wantsNameMask: filterBy('name') && filterBy('maskStar'),
+        wantsEmailMask: filterBy('email') && filterBy('maskStar'),
+        wantsAddressMask: filterBy('address') && filterBy('addressDetail') && filterBy('maskHide'),
+        wantsAgeCategory: filterBy('age') && filterBy('ageCategory'),
+        wantsTruncateDate: filterBy('dateOnly') && filterBy('truncate'),
+        wantsExponential: filterBy('exponential'),
+        wantsBuilding: filterBy('building'),
+        wantsSku: filterBy('sku'),
+        wantsUnit: filterBy('unit'),
+        wantsCurrency: filterBy('currency'),
+    };
+}
@@ -1,52 +1,167 @@
 import Papa from 'papaparse';
 import * as XLSX from 'xlsx';
 import { DataRow } from '@/types';
+import { listXlsxSheets, streamXlsxRows, supportsXlsxStreaming, XLSX_ROW_BATCH } from './xlsxStream';
+import { DataTable, TableBuilder } from './table';
+import { fileDigest, loadCachedTable, saveCachedTable } from './tableCache';
+
+// CSV를 한 번에 읽어 들이는 바이트 수 (파일 전체 문자열을 만들지 않고 이 크기씩 파싱)
+export const CSV_CHUNK_BYTES = 4 * 1024 * 1024;
 
 /**
- * 파일을 파싱하여 JSON 데이터 배열로 변환하는 함수
- * CSV 및 Excel (.xlsx, .xls) 형식을 지원합니다.
- * 
+ * 파일을 청크 단위로 파싱하여 행 배열 조각을 차례로 넘기는 함수
+ * CSV는 CSV_CHUNK_BYTES씩, XLSX는 시트 XML을 풀면서 XLSX_ROW_BATCH 행씩 넘기므로
+ * 원본 파일 전체 문자열/통합 문서가 파싱 결과와 함께 메모리에 남지 않습니다.
+ * 스트리밍을 지원하지 않는 형식(.xls)이나 환경에서는 SheetJS로 한 번에 읽어 한 조각으로 넘깁니다.
+ *
  * @param file 사용자가 업로드한 파일 객체
- * @returns 파싱된 데이터 행(DataRow)들의 배열을 반환하는 Promise
+ * @param onRows 파싱된 행 조각을 받는 콜백 (파일 순서대로 호출)
+ * @param sheetName (선택) 읽을 Excel 시트 이름 (없으면 첫 번째 시트)
  */
-export async function parseFile(file: File): Promise<DataRow[]> {
-    return new Promise((resolve, reject) => {
-        const fileExtension = file.name.split('.').pop()?.toLowerCase();
+export async function parseFileStream(file: File, onRows: (rows: DataRow[]) => void, sheetName?: string): Promise<void> {
+    const fileExtension = file.name.split('.').pop()?.toLowerCase();
 
-        // 1. CSV 파일 처리
-        if (fileExtension === 'csv') {
+    // 1. CSV 파일 처리
+    if (fileExtension === 'csv') {
+        return new Promise((resolve, reject) => {
             Papa.parse(file, {
                 header: true,          // 첫 줄을 헤더로 인식
                 skipEmptyLines: true,  // 빈 줄 건너뛰기
-                complete: (results) => {
-                    resolve(results.data as DataRow[]);
+                chunkSize: CSV_CHUNK_BYTES,
+                chunk: (results) => {
+                    onRows(results.data as DataRow[]);
                 },
+                complete: () => resolve(),
                 error: (error) => {
                     reject(error);
                 },
             });
-        }
-        // 2. Excel 파일 처리 (xlsx, xls)
-        else if (fileExtension === 'xlsx' || fileExtension === 'xls') {
-            const reader = new FileReader();
-            reader.onload = (e) => {
-                try {
-                    const data = new Uint8Array(e.target?.result as ArrayBuffer);
-                    const workbook = XLSX.read(data, { type: 'array' });
-                    const sheetName = workbook.SheetNames[0]; // 첫 번째 시트만 사용
-                    const sheet = workbook.Sheets[sheetName];
-                    const json = XLSX.utils.sheet_to_json(sheet);
-                    resolve(json as DataRow[]);
-                } catch (error) {
-                    reject(error);
-                }
-            };
-            reader.onerror = (error) => reject(error);
-            reader.readAsArrayBuffer(file);
-        }
-        // 3. 지원하지 않는 형식
-        else {
-            reject(new Error('Unsupported file type'));
-        }
+        });
+    }
+    // 2. Excel 파일 처리 (xlsx는 행 스트리밍)
+    if (fileExtension === 'xlsx' && supportsXlsxStreaming()) {
+        return streamXlsxRows(file, onRows, XLSX_ROW_BATCH, sheetName);
+    }
+    if (fileExtension === 'xlsx' || fileExtension === 'xls') {
+        onRows(await readWorkbookRows(file, sheetName));
+        return;
+    }
+    // 3. 지원하지 않는 형식
+    throw new Error('Unsupported file type');
+}
+
+/**
+ * SheetJS로 통합 문서 전체를 읽습니다. (.xls 및 압축 스트림 미지원 환경)
+ */
+function readWorkbook(file: File): Promise<XLSX.WorkBook> {
+    return new Promise((resolve, reject) => {
+        const reader = new FileReader();
+        reader.onload = (e) => {
+            try {
+                const data = new Uint8Array(e.target?.result as ArrayBuffer);
+                resolve(XLSX.read(data, { type: 'array' }));
+            } catch (error) {
+                reject(error);
+            }
+        };
+        reader.onerror = (error) => reject(error);
+        reader.readAsArrayBuffer(file);
+    });
+}
+
+/**
+ * SheetJS로 시트 하나를 행 배열로 변환합니다. (sheetName이 없으면 첫 번째 시트)
+ */
+async function readWorkbookRows(file: File, sheetName?: string): Promise<DataRow[]> {
+    const workbook = await readWorkbook(file);
+    const sheet = workbook.Sheets[sheetName ?? workbook.SheetNames[0]];
+    if (!sheet) throw new Error('Worksheet not found');
+    return XLSX.utils.sheet_to_json(sheet) as DataRow[];
+}
+
+/**
+ * 일괄 정제의 시트 하나 (CSV는 sheetName이 null)
+ * size는 예상 크기(바이트)로, 큰 시트부터 정제하도록 순서를 정할 때 씁니다.
+ */
+export interface SheetSource {
+    file: File;
+    sheetName: string | null;
+    size: number;
+}
+
+/**
+ * 파일의 시트 목록을 통합 문서 순서로 구합니다. CSV는 시트 하나로 취급합니다.
+ * xlsx는 zip 목차와 workbook.xml만 읽으므로 시트 내용을 풀지 않습니다. (.xls 등 스트리밍 미지원 형식은 통합 문서 전체를 읽음)
+ */
+export async function listFileSheets(file: File): Promise<SheetSource[]> {
+    const fileExtension = file.name.split('.').pop()?.toLowerCase();
+    if (fileExtension === 'csv') return [{ file, sheetName: null, size: file.size }];
+    if (fileExtension === 'xlsx' && supportsXlsxStreaming()) {
+        return (await listXlsxSheets(file)).map(sheet => ({ file, sheetName: sheet.name, size: sheet.size }));
+    }
+    if (fileExtension === 'xlsx' || fileExtension === 'xls') {
+        const names = (await readWorkbook(file)).SheetNames;
+        return names.map(sheetName => ({ file, sheetName, size: file.size / names.length }));
+    }
+    throw new Error('Unsupported file type');
+}
+
+/**
+ * 시트 하나를 사전 인코딩 테이블로 읽습니다. (일괄 정제용, 파싱 결과 캐시는 거치지 않음)
+ */
+export async function parseSheetTable(source: SheetSource): Promise<DataTable> {
+    const builder = new TableBuilder();
+    await parseFileStream(source.file, rows => builder.append(rows), source.sheetName ?? undefined);
+    return builder.finish();
+}
+
+/**
+ * 파일을 파싱하여 JSON 데이터 배열로 변환하는 함수
+ * CSV 및 Excel (.xlsx, .xls) 형식을 지원합니다.
+ *
+ * @param file 사용자가 업로드한 파일 객체
+ * @returns 파싱된 데이터 행(DataRow)들의 배열을 반환하는 Promise
+ */
+export async function parseFile(file: File): Promise<DataRow[]> {
+    const rows: DataRow[] = [];
+    await parseFileStream(file, chunk => {
+        for (const row of chunk) rows.push(row);
     });
+    return rows;
+}
+
+/**
+ * 파일을 청크 단위로 파싱하면서 바로 사전 인코딩 테이블(table.ts)로 쌓습니다.
+ * 행 객체는 조각마다 만들었다가 테이블에 옮긴 뒤 버리므로 전체 행 객체 배열이 메모리에 남지 않습니다.
+ *
+ * @param file 사용자가 업로드한 파일 객체
+ * @param onProgress (선택) 조각을 읽을 때마다 지금까지 읽은 행 수를 받는 콜백
+ */
+export async function parseFileTable(file: File, onProgress?: (rows: number) => void): Promise<DataTable> {
+    const builder = new TableBuilder();
+    await parseFileStream(file, rows => {
+        builder.append(rows);
+        onProgress?.(builder.rowCount);
+    });
+    return builder.finish();
+}
+
+/**
+ * 파싱 결과 캐시(tableCache.ts)를 거쳐 파일을 테이블로 읽습니다.
+ * 같은 내용의 파일을 전에 읽었다면 파싱을 건너뛰고 저장된 컬럼을 불러오며,
+ * 처음 읽는 파일은 파싱한 뒤 화면 표시를 막지 않도록 다음 작업에서 캐시에 저장합니다.
+ *
+ * @param file 사용자가 업로드한 파일 객체
+ * @param onProgress (선택) 조각을 읽을 때마다 지금까지 읽은 행 수를 받는 콜백 (캐시에서 읽으면 호출되지 않음)
+ */
+export async function parseFileTableCached(file: File, onProgress?: (rows: number) => void): Promise<{ table: DataTable; fromCache: boolean }> {
+    const digest = await fileDigest(file);
+    const cached = digest ? await loadCachedTable(digest) : null;
+    if (cached) return { table: cached, fromCache: true };
+
+    const table = await parseFileTable(file, onProgress);
+    if (digest && table.rowCount > 0) {
+        setTimeout(() => void saveCachedTable(digest, file.name, table), 0);
+    }
+    return { table, fromCache: false };
 }
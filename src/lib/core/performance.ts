@@ -1,50 +1,257 @@
+import { DataRow, ProcessingOptions } from '@/types';
+import { processTableTracked } from './processors';
+import { scanTableIssues } from './analyzers';
+import { DataTable, tableFromRows } from './table';
+import { MIN_ROWS_PER_SHARD, FIRST_SHARD_ROWS } from './sharding';
+
+/**
+ * 처리 용량 계획 (Capacity Planner)
+ * 하드웨어 스펙(deviceMemory는 Chrome 계열에서만 제공)으로 등급을 고르는 대신,
+ * 실제 정제/이슈 검사 커널을 합성 행에 잠깐 실행해 측정한 처리량(행/초)과 행당 메모리 증가량으로
+ * 권장 행 수, 샤드 크기, 첫 샤드 크기를 정합니다. 측정 결과는 브라우저에 저장해 다음 방문에 재사용합니다.
+ * 파이썬 엔진은 `laundry_engine/capacity.py`가 같은 방식으로 청크 크기를 정합니다.
+ */
 
 interface PerformanceMetrics {
     tier: 'High' | 'Medium' | 'Low';
     recommendedRows: number;
     memoryGB?: number;
     cores?: number;
+    rowsPerSecond?: number;   // 측정한 코어 하나의 처리량 (측정 전이면 없음)
 }
 
 /**
- * 사용자 시스템의 하드웨어 성능을 추정하여 권장 데이터 처리량을 반환합니다.
- * navigator.deviceMemory는 Chrome 기반 브라우저에서만 제한적으로 지원됩니다.
+ * 보정 측정 결과 (localStorage에 저장)
  */
-export const estimatePerformance = (): PerformanceMetrics => {
-    // 1. 하드웨어 스펙 수집
-    const cores = navigator.hardwareConcurrency || 4; // 기본값 4코어
+export interface ThroughputCalibration {
+    version: number;
+    rowsPerSecond: number;    // 코어 하나의 정제 + 이슈 검사 처리량
+    bytesPerRow: number;      // 원본 + 정제본 + 변경 기록의 행당 메모리
+    memoryBudgetMB: number;   // 데이터에 쓸 수 있는 힙 크기
+    cores: number;
+    measuredAt: number;
+}
+
+export interface CapacityPlan {
+    recommendedRows: number;
+    shardRows: number;        // 워커 샤드 하나의 행 수
+    firstShardRows: number;   // 첫 샤드의 행 수 (미리보기 첫 화면)
+    workers: number;
+}
+
+const STORAGE_KEY = 'data-laundry-calibration';
+const CALIBRATION_VERSION = 1;
+// 저장된 측정값 유효 기간 (브라우저/엔진 업데이트 반영)
+const CALIBRATION_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+
+// 측정 행 수: 예열 후 측정 시간이 MIN_MEASURE_MS를 넘을 때까지 두 배씩 늘림
+const WARMUP_ROWS = 500;
+const MEASURE_ROWS = 2000;
+const MAX_MEASURE_ROWS = 32000;
+const MIN_MEASURE_MS = 30;
+
+// 권장 행 수: 모든 워커로 이 시간 안에 정제할 수 있는 행 수 (메모리 한도와 작은 쪽)
+const TARGET_SECONDS = 20;
+// 샤드 하나의 목표 처리 시간 (전송 비용 대비 충분히 크고, 먼저 끝난 워커가 놀지 않을 만큼 작게)
+const SHARD_SECONDS = 0.25;
+const MAX_SHARD_ROWS = 100000;
+// 첫 샤드의 목표 처리 시간 (미리보기 첫 화면)
+const FIRST_SHARD_SECONDS = 0.05;
+const MIN_FIRST_SHARD_ROWS = 1000;
+// 힙 중 데이터에 쓰는 비율 (워커 전송 사본, 이슈 목록, 화면 렌더링 몫을 남김)
+const DATA_HEAP_RATIO = 0.4;
+// 힙 한도를 알 수 없을 때 가정하는 값 (64비트 브라우저 탭의 보수적인 값)
+const DEFAULT_HEAP_MB = 2048;
+const DEFAULT_CORES = 4;
+
+// 측정 전 가정하는 값 (보정이 끝나면 측정값으로 교체)
+const ASSUMED_ROWS_PER_SECOND = 30000;
+const ASSUMED_BYTES_PER_ROW = 600;
+
+// 측정에 쓰는 체크박스 조합 (자주 쓰는 정제 단계)
+const CALIBRATION_OPTIONS = {
+    removeWhitespace: true, formatMobile: true, formatGeneralPhone: true, formatDate: true, formatNumber: true,
+    cleanEmail: true, cleanGarbage: true, cleanAmount: true, cleanName: true, autoDetect: true
+} as unknown as ProcessingOptions;
+
+let calibration: ThroughputCalibration | null | undefined;
+
+function hardwareCores(): number {
+    return (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || DEFAULT_CORES;
+}
+
+function deviceMemoryGB(): number | undefined {
     // @ts-ignore: deviceMemory is experimental
-    const memory = (navigator as any).deviceMemory || 4; // 기본값 4GB (보수적 접근)
+    return typeof navigator !== 'undefined' ? (navigator as any).deviceMemory : undefined;
+}
 
-    // 2. 성능 점수 계산 (메모리 가중치 70%, 코어 가중치 30%)
-    // 통상적인 8GB 램, 4코어 PC를 'Medium' 기준으로 삼음
+/**
+ * 데이터에 쓸 수 있는 힙 크기(MB): Chrome의 힙 한도 → deviceMemory의 1/4 → 기본값 순서로 사용
+ */
+function memoryBudgetMB(): number {
+    const heapLimit = (globalThis.performance as any)?.memory?.jsHeapSizeLimit as number | undefined;
+    const deviceMemory = deviceMemoryGB();
+    const heapMB = heapLimit ? heapLimit / 1048576 : deviceMemory ? (deviceMemory * 1024) / 4 : DEFAULT_HEAP_MB;
+    return Math.round(heapMB * DATA_HEAP_RATIO);
+}
 
-    let tier: 'High' | 'Medium' | 'Low' = 'Medium';
-    let recommendedRows = 100000; // 기본 10만줄
+/**
+ * 측정용 합성 행 (실제 업로드 파일처럼 형식이 섞이고 값이 대부분 다름)
+ */
+export function syntheticRows(count: number, seed: number = 0): DataRow[] {
+    const surnames = ['김', '이', '박', '최', '정', '강', '조', '윤'];
+    const cities = ['서울시 강남구', '부산광역시 해운대구', '경기도 성남시 분당구', '대구 수성구', '인천 남동구'];
+    const rows: DataRow[] = [];
+    for (let i = 0; i < count; i++) {
+        const n = i + seed;
+        const mid = String(1000 + (n * 7919) % 9000);
+        const last = String(1000 + (n * 104729) % 9000);
+        rows.push({
+            '고객명': ` ${surnames[n % surnames.length]}민${String.fromCharCode(0xAC00 + (n * 31) % 11172)} `,
+            '연락처': n % 3 === 0 ? `010${mid}${last}` : n % 3 === 1 ? `010 ${mid} ${last}` : `010-${mid}-${last}`,
+            '이메일': n % 5 === 0 ? ` USER${n}@Example.COM ` : `user${n}@example.com`,
+            '가입일': n % 2 === 0 ? `2024.${(n % 12) + 1}.${(n % 28) + 1}` : `2023-${String((n % 12) + 1).padStart(2, '0')}-${String((n % 28) + 1).padStart(2, '0')}`,
+            '구매금액': n % 4 === 0 ? `${(n % 90) + 1}만원` : String((n * 137) % 10000000),
+            '주소': `${cities[n % cities.length]} ${n % 300}번길 ${n % 50}`,
+            '메모': n % 7 === 0 ? `★확인필요★ #${n}` : `주문 ${n}`,
+        });
+    }
+    return rows;
+}
 
-    // High Spec: 16GB+ RAM or (8GB RAM + 8 Core+)
-    if (memory >= 8 && cores >= 8) {
-        tier = 'High';
-        recommendedRows = 300000; // 30만줄
+/**
+ * 테이블이 차지하는 메모리 추정치 (번호 배열 + 사전 문자열)
+ */
+function tableBytes(table: DataTable): number {
+    let bytes = 0;
+    for (const column of table.columns) {
+        bytes += column.codes.byteLength;
+        for (const value of column.values) bytes += typeof value === 'string' ? 16 + value.length * 2 : 8;
     }
-    // Low Spec: < 4GB RAM
-    else if (memory < 4) {
-        tier = 'Low';
-        recommendedRows = 30000; // 3만줄
+    return bytes;
+}
+
+function runKernels(table: DataTable) {
+    const { processedData, changes } = processTableTracked(table, '', CALIBRATION_OPTIONS);
+    scanTableIssues(processedData);
+    return { processedData, changes };
+}
+
+/**
+ * 정제/이슈 검사 커널을 합성 행에 실행해 처리량과 행당 메모리를 측정합니다. (메인 스레드에서 약 50~150ms)
+ */
+export function measureThroughput(): ThroughputCalibration {
+    runKernels(tableFromRows(syntheticRows(WARMUP_ROWS)));
+
+    let rows = MEASURE_ROWS;
+    let elapsed = 0;
+    let bytesPerRow = 0;
+    // 측정마다 다른 값을 써서 이전 측정의 고유값 메모가 적중하지 않도록 함
+    for (let seed = WARMUP_ROWS; ; seed += rows, rows *= 2) {
+        const table = tableFromRows(syntheticRows(rows, seed));
+        const started = performance.now();
+        const { processedData, changes } = runKernels(table);
+        elapsed = performance.now() - started;
+        bytesPerRow = (tableBytes(table) + tableBytes(processedData) - processedData.columns.reduce((sum, c) => sum + c.codes.byteLength, 0)
+            + changes.changed.byteLength + changes.cleared.byteLength) / rows;
+        if (elapsed >= MIN_MEASURE_MS || rows >= MAX_MEASURE_ROWS) break;
     }
-    // Medium Spec: 4~8GB RAM
-    else {
-        tier = 'Medium';
-        recommendedRows = 100000; // 10만줄
 
-        // 메모리가 8GB라면 조금 더 쳐줌
-        if (memory >= 8) recommendedRows = 150000;
+    return {
+        version: CALIBRATION_VERSION,
+        rowsPerSecond: Math.round(rows / (Math.max(elapsed, 1) / 1000)),
+        bytesPerRow: Math.round(bytesPerRow),
+        memoryBudgetMB: memoryBudgetMB(),
+        cores: hardwareCores(),
+        measuredAt: Date.now(),
+    };
+}
+
+/**
+ * 측정값으로 권장 행 수와 샤드 크기를 계산합니다.
+ */
+export function planCapacity(measured: Pick<ThroughputCalibration, 'rowsPerSecond' | 'bytesPerRow' | 'memoryBudgetMB' | 'cores'>): CapacityPlan {
+    const workers = Math.max(1, measured.cores - 1);
+    const byTime = measured.rowsPerSecond * workers * TARGET_SECONDS;
+    const byMemory = (measured.memoryBudgetMB * 1048576) / Math.max(1, measured.bytesPerRow);
+    const recommendedRows = Math.max(10000, Math.floor(Math.min(byTime, byMemory) / 10000) * 10000);
+
+    const shardRows = Math.round(Math.min(MAX_SHARD_ROWS, Math.max(FIRST_SHARD_ROWS, measured.rowsPerSecond * SHARD_SECONDS)));
+    const firstShardRows = Math.round(Math.min(shardRows, Math.max(MIN_FIRST_SHARD_ROWS, measured.rowsPerSecond * FIRST_SHARD_SECONDS)));
+    return { recommendedRows, shardRows, firstShardRows, workers };
+}
+
+function loadCalibration(): ThroughputCalibration | null {
+    if (calibration !== undefined) return calibration;
+    calibration = null;
+    try {
+        const saved = typeof localStorage !== 'undefined' ? localStorage.getItem(STORAGE_KEY) : null;
+        if (saved) {
+            const parsed = JSON.parse(saved) as ThroughputCalibration;
+            const fresh = Date.now() - parsed.measuredAt < CALIBRATION_TTL_MS;
+            if (parsed.version === CALIBRATION_VERSION && fresh && parsed.cores === hardwareCores()) calibration = parsed;
+        }
+    } catch {
+        // 저장값이 깨졌으면 다시 측정
     }
+    return calibration;
+}
 
+function toMetrics(plan: CapacityPlan, measured: ThroughputCalibration | null): PerformanceMetrics {
+    const tier = plan.recommendedRows >= 1000000 ? 'High' : plan.recommendedRows < 200000 ? 'Low' : 'Medium';
     return {
         tier,
-        recommendedRows,
-        memoryGB: memory,
-        cores
+        recommendedRows: plan.recommendedRows,
+        memoryGB: deviceMemoryGB(),
+        cores: hardwareCores(),
+        rowsPerSecond: measured?.rowsPerSecond,
     };
+}
+
+/**
+ * 현재 용량 계획 (측정 전이면 가정값으로 계산)
+ */
+export function getCapacityPlan(): CapacityPlan {
+    const measured = loadCalibration();
+    return planCapacity(measured ?? {
+        rowsPerSecond: ASSUMED_ROWS_PER_SECOND,
+        bytesPerRow: ASSUMED_BYTES_PER_ROW,
+        memoryBudgetMB: memoryBudgetMB(),
+        cores: hardwareCores(),
+    });
+}
+
+/**
+ * 워커 풀의 샤드 크기 (측정 전이면 sharding.ts의 기본값)
+ */
+export function getShardSizing(): Pick<CapacityPlan, 'shardRows' | 'firstShardRows'> {
+    if (!loadCalibration()) return { shardRows: MIN_ROWS_PER_SHARD, firstShardRows: FIRST_SHARD_ROWS };
+    const { shardRows, firstShardRows } = getCapacityPlan();
+    return { shardRows, firstShardRows };
+}
+
+/**
+ * 사용자 시스템의 권장 데이터 처리량을 반환합니다. (저장된 측정값이 없으면 가정값 기준, 측정은 calibratePerformance)
+ */
+export const estimatePerformance = (): PerformanceMetrics => {
+    return toMetrics(getCapacityPlan(), loadCalibration());
 };
+
+/**
+ * 처리량을 측정해 저장한 뒤 권장 처리량을 반환합니다. 저장된 측정값이 유효하면 다시 측정하지 않습니다.
+ * 첫 화면 렌더링을 막지 않도록 다음 작업으로 미뤄 실행합니다.
+ */
+export function calibratePerformance(force: boolean = false): Promise<PerformanceMetrics> {
+    if (!force && loadCalibration()) return Promise.resolve(estimatePerformance());
+    return new Promise(resolve => {
+        setTimeout(() => {
+            calibration = measureThroughput();
+            try {
+                localStorage.setItem(STORAGE_KEY, JSON.stringify(calibration));
+            } catch {
+                // 저장 실패(시크릿 모드 등)는 이번 세션에만 사용
+            }
+            resolve(estimatePerformance());
+        }, 0);
+    });
+}
@@ -0,0 +1,252 @@
+import { DataRow, ProcessingOptions, ColumnSpecificOptions } from '@/types';
+import { analyzePrompt, PromptAnalysis } from './nlp';
+import { ColumnTransform, compileColumnTransforms, findNullFilling } from './transforms';
+import { MemoStats } from './memo';
+import { ChangeSet, classifyChange, markChange } from './changes';
+
+/**
+ * 정제 계획(CleaningPlan) 컴파일 및 캐시
+ * 프롬프트 + 헤더 + 옵션 조합을 한 번만 분석해, 컬럼마다 적용할 변환 목록을 미리 확정한 불변 객체로 만듭니다.
+ * 셀 단위 비용은 확정된 함수 목록을 순서대로 실행하는 것뿐이며,
+ * 같은 프리셋을 여러 파일에 다시 적용하면 LRU 캐시에서 계획을 재사용해 프롬프트 분석을 건너뜁니다.
+ */
+
+export interface ColumnPlan {
+    readonly key: string;
+    readonly locked: boolean;
+    readonly transforms: readonly ColumnTransform[];
+    // 원본 값이 없는(null/undefined) 셀은 결측치 채우기 값에서 이어서 처리
+    readonly missingFill: string | null;
+    readonly missingStart: number;
+    // 변환 목록의 서명 (같으면 같은 결과, 증분 재정제에서 컬럼 재사용 판단에 사용)
+    readonly signature: string;
+}
+
+export interface CleaningPlan {
+    readonly key: string;
+    readonly nlp: PromptAnalysis;
+    readonly options: ProcessingOptions;
+    readonly columns: ReadonlyMap<string, ColumnPlan>;
+    readonly lockedColumns: readonly string[];
+    readonly columnOptions: ColumnSpecificOptions;
+}
+
+const DEFAULT_PLAN_CACHE_SIZE = 32;
+
+/**
+ * 컬럼 하나의 정제 단계를 컴파일합니다.
+ */
+export function compileColumnPlan(
+    key: string,
+    nlp: PromptAnalysis,
+    options: ProcessingOptions,
+    locked: boolean = false,
+    colOption?: string | null
+): ColumnPlan {
+    if (locked) return Object.freeze({ key, locked: true, transforms: [], missingFill: null, missingStart: 0, signature: 'locked' });
+
+    const transforms = Object.freeze(compileColumnTransforms(key, nlp, options, colOption));
+    const nullFill = findNullFilling(key, nlp);
+    const missingFill = nullFill ? nullFill.fillValue : null;
+    return Object.freeze({
+        key,
+        locked: false,
+        transforms,
+        missingFill,
+        missingStart: nullFill ? transforms.findIndex(t => t.name === 'nullFill') + 1 : 0,
+        signature: getTransformSignature(transforms, missingFill),
+    });
+}
+
+/**
+ * 변환 목록의 서명: 단계 이름과 각 단계가 참조하는 값(params)으로 만듭니다.
+ * 컬럼명에서 유도된 조건도 params에 포함되므로, 서명이 같은 두 계획은 같은 값에 대해 같은 결과를 냅니다.
+ */
+export function getTransformSignature(transforms: readonly ColumnTransform[], missingFill: string | null = null): string {
+    return JSON.stringify([missingFill, transforms.map(t => (t.params ? [t.name, t.params] : t.name))]);
+}
+
+/**
+ * 컬럼 계획에 따라 한 셀 값을 정제합니다. 잠금 컬럼은 호출측에서 건너뜁니다.
+ */
+export function applyColumnPlan(plan: ColumnPlan, raw: DataRow[string] | undefined): string {
+    const { transforms } = plan;
+    let i = 0;
+    // [Fix] 기본적으로 trim()을 수행하지 않음. 옵션에 따름.
+    let val = String(raw || "");
+    if ((raw === null || raw === undefined) && plan.missingFill !== null) {
+        val = plan.missingFill;
+        i = plan.missingStart;
+    }
+    for (; i < transforms.length; i++) {
+        val = transforms[i].fn(val);
+    }
+    return val;
+}
+
+/**
+ * 헤더에 없던 컬럼이 들어오면 같은 규칙으로 즉석 컴파일합니다 (캐시된 계획은 변경하지 않음).
+ */
+export function getColumnPlan(plan: CleaningPlan, key: string): ColumnPlan {
+    return plan.columns.get(key)
+        || compileColumnPlan(key, plan.nlp, plan.options, plan.lockedColumns.includes(key), plan.columnOptions[key]);
+}
+
+/**
+ * 계획에 따라 한 행을 정제한 새 행을 반환합니다. [Rule 1] 잠금 컬럼은 원본 값을 그대로 유지합니다.
+ */
+export function applyCleaningPlan(plan: CleaningPlan, row: DataRow): DataRow {
+    const newRow = { ...row };
+    for (const key in newRow) {
+        const columnPlan = getColumnPlan(plan, key);
+        if (columnPlan.locked) continue;
+        newRow[key] = applyColumnPlan(columnPlan, newRow[key]);
+    }
+    return newRow;
+}
+
+/**
+ * applyCleaningPlan과 같은 정제를 수행하면서, 바뀐 셀과 빈 셀을 변경 기록에 남깁니다.
+ * @param columnIndex 변경 기록의 헤더 → 컬럼 위치 (헤더에 없는 컬럼은 정제만 하고 기록하지 않음)
+ */
+export function applyCleaningPlanTracked(
+    plan: CleaningPlan,
+    row: DataRow,
+    rowIndex: number,
+    changes: ChangeSet,
+    columnIndex: ReadonlyMap<string, number>
+): DataRow {
+    const newRow = { ...row };
+    for (const key in newRow) {
+        const col = columnIndex.get(key);
+        if (col === undefined && !changes.untracked.includes(key)) changes.untracked.push(key);
+        const columnPlan = getColumnPlan(plan, key);
+        if (columnPlan.locked) {
+            if (col !== undefined && String(row[key] || '').trim()) changes.emptyCells--;
+            continue;
+        }
+        const raw = newRow[key];
+        const val = applyColumnPlan(columnPlan, raw);
+        newRow[key] = val;
+        if (col === undefined) continue;
+        if (val.trim()) changes.emptyCells--;
+        markChange(changes, rowIndex, col, classifyChange(raw, val));
+    }
+    return newRow;
+}
+
+/**
+ * 계획에 포함된 고유값 메모의 적중률 통계 (컬럼/단계별)
+ * 캐시된 계획을 재사용하면 이전 실행의 결과도 누적됩니다.
+ */
+export function getMemoStats(plan: CleaningPlan): MemoStats[] {
+    const stats: MemoStats[] = [];
+    plan.columns.forEach(columnPlan => {
+        for (const t of columnPlan.transforms) {
+            if (t.memo) stats.push(t.memo.stats());
+        }
+    });
+    return stats;
+}
+
+/**
+ * 프롬프트/헤더/옵션 조합의 캐시 키
+ */
+export function getPlanKey(
+    prompt: string,
+    headers: string[],
+    options: ProcessingOptions,
+    lockedColumns: string[] = [],
+    columnOptions: ColumnSpecificOptions = {}
+): string {
+    const enabled = Object.keys(options).filter(k => options[k as keyof ProcessingOptions]).sort();
+    const colOpts = Object.keys(columnOptions).sort().map(k => [k, columnOptions[k]]);
+    return JSON.stringify([prompt, headers, enabled, [...lockedColumns].sort(), colOpts]);
+}
+
+/**
+ * 프롬프트를 한 번 분석하고 헤더별 정제 단계를 확정합니다.
+ */
+export function compileCleaningPlan(
+    prompt: string,
+    headers: string[],
+    options: ProcessingOptions,
+    lockedColumns: string[] = [],
+    columnOptions: ColumnSpecificOptions = {}
+): CleaningPlan {
+    const nlp = analyzePrompt(prompt);
+    const columns = new Map<string, ColumnPlan>();
+    for (const key of headers) {
+        if (columns.has(key)) continue;
+        columns.set(key, compileColumnPlan(key, nlp, options, lockedColumns.includes(key), columnOptions[key]));
+    }
+    return Object.freeze({
+        key: getPlanKey(prompt, headers, options, lockedColumns, columnOptions),
+        nlp,
+        options: { ...options },
+        columns,
+        lockedColumns: [...lockedColumns],
+        columnOptions: { ...columnOptions },
+    });
+}
+
+/**
+ * 정제 계획 LRU 캐시 (Map의 삽입 순서를 사용 순서로 활용)
+ */
+export class PlanCache {
+    private plans = new Map<string, CleaningPlan>();
+    hits = 0;
+    misses = 0;
+
+    constructor(public maxSize: number = DEFAULT_PLAN_CACHE_SIZE) { }
+
+    get size(): number {
+        return this.plans.size;
+    }
+
+    get(
+        prompt: string,
+        headers: string[],
+        options: ProcessingOptions,
+        lockedColumns: string[] = [],
+        columnOptions: ColumnSpecificOptions = {}
+    ): CleaningPlan {
+        const key = getPlanKey(prompt, headers, options, lockedColumns, columnOptions);
+        const cached = this.plans.get(key);
+        if (cached) {
+            this.plans.delete(key);
+            this.plans.set(key, cached);
+            this.hits++;
+            return cached;
+        }
+        this.misses++;
+        const plan = compileCleaningPlan(prompt, headers, options, lockedColumns, columnOptions);
+        this.plans.set(key, plan);
+        while (this.plans.size > this.maxSize) {
+            this.plans.delete(this.plans.keys().next().value as string);
+        }
+        return plan;
+    }
+
+    clear() {
+        this.plans.clear();
+        this.hits = 0;
+        this.misses = 0;
+    }
+}
+
+// 워커/탭 단위 기본 캐시
+export const planCache = new PlanCache();
+
+/**
+ * 기본 캐시에서 정제 계획을 가져오거나 새로 컴파일합니다.
+ */
+export function getCleaningPlan(
+    prompt: string,
+    headers: string[],
+    options: ProcessingOptions,
+    lockedColumns: string[] = [],
+    columnOptions: ColumnSpecificOptions = {}
+): CleaningPlan {
+    return planCache.get(prompt, headers, options, lockedColumns, columnOptions);
+}
@@ -0,0 +1,178 @@
+import { DataRow } from '@/types';
+import { ColumnPlan } from './plan';
+
+/**
+ * 정제 프로파일러 (Opt-in)
+ * 정제가 느릴 때 어느 규칙이 원인인지 보기 위해 규칙(컬럼/단계)별 실행 횟수, 변경한 셀 수, 누적 시간과
+ * 단계(파싱/계획 컴파일/정제/이슈 검사/변경 비교/내보내기)별 시간을 모읍니다.
+ * 프로파일링을 켰을 때만 측정용 실행 함수(applyColumnPlan)를 거치고, 꺼져 있으면 기존 경로를 그대로 실행하므로 비용이 없습니다.
+ * 규칙 시간에는 측정 자체의 비용이 포함되므로 규칙 간 상대 비교용으로 봅니다.
+ * 워커 샤드별 프로파일은 합산하므로 여러 워커의 시간은 경과 시간이 아닌 누적 CPU 시간에 가깝습니다.
+ */
+
+export type ProfileStage = 'parse' | 'compile' | 'clean' | 'detect' | 'diff' | 'export';
+
+export const PROFILE_STAGES: readonly ProfileStage[] = ['parse', 'compile', 'clean', 'detect', 'diff', 'export'];
+
+export interface RuleProfile {
+    column: string;
+    step: string;
+    calls: number;      // 규칙 실행 횟수 (테이블 정제는 고유값마다 한 번)
+    cells: number;      // 규칙을 거친 셀 수 (고유값의 등장 횟수 합)
+    changed: number;    // 규칙이 값을 바꾼 셀 수
+    ms: number;         // 누적 시간 (밀리초)
+}
+
+export interface CleaningProfile {
+    stages: Record<ProfileStage, number>;   // 단계별 시간 (밀리초)
+    rules: RuleProfile[];                   // 누적 시간 순
+    rows: number;
+    shards: number;
+}
+
+const STORAGE_KEY = 'data-laundry-profiling';
+
+let enabled: boolean | undefined;
+
+/**
+ * 프로파일링 사용 여부 (디버그 패널에서 켜며, localStorage에 저장)
+ */
+export function isProfilingEnabled(): boolean {
+    if (enabled !== undefined) return enabled;
+    try {
+        enabled = typeof localStorage !== 'undefined' && localStorage.getItem(STORAGE_KEY) === '1';
+    } catch {
+        enabled = false;
+    }
+    return enabled;
+}
+
+export function setProfilingEnabled(value: boolean) {
+    enabled = value;
+    try {
+        if (value) localStorage.setItem(STORAGE_KEY, '1');
+        else localStorage.removeItem(STORAGE_KEY);
+    } catch {
+        // 저장 실패(시크릿 모드 등)는 이번 세션에만 사용
+    }
+}
+
+function emptyStages(): Record<ProfileStage, number> {
+    return { parse: 0, compile: 0, clean: 0, detect: 0, diff: 0, export: 0 };
+}
+
+export class CleaningProfiler {
+    private stages = emptyStages();
+    private rules = new Map<string, RuleProfile>();
+    // 컬럼 계획별 규칙 집계 (단계 순서와 같은 배열, 셀마다 Map을 찾지 않도록 계획마다 한 번만 만듦)
+    private planRules = new WeakMap<ColumnPlan, RuleProfile[]>();
+    rows = 0;
+    shards = 0;
+
+    /**
+     * fn의 실행 시간을 단계 시간에 더합니다.
+     */
+    time<T>(stage: ProfileStage, fn: () => T): T {
+        const started = performance.now();
+        try {
+            return fn();
+        } finally {
+            this.stages[stage] += performance.now() - started;
+        }
+    }
+
+    addStage(stage: ProfileStage, ms: number) {
+        this.stages[stage] += ms;
+    }
+
+    private rule(column: string, step: string): RuleProfile {
+        const key = `${column}\u0000${step}`;
+        let rule = this.rules.get(key);
+        if (!rule) {
+            rule = { column, step, calls: 0, cells: 0, changed: 0, ms: 0 };
+            this.rules.set(key, rule);
+        }
+        return rule;
+    }
+
+    private rulesOf(plan: ColumnPlan): RuleProfile[] {
+        let rules = this.planRules.get(plan);
+        if (!rules) {
+            rules = plan.transforms.map(t => this.rule(plan.key, t.name));
+            this.planRules.set(plan, rules);
+        }
+        return rules;
+    }
+
+    /**
+     * plan.ts의 applyColumnPlan과 같은 결과를 내면서 단계마다 시간/변경 여부를 기록합니다.
+     * @param weight 이 값이 나타내는 셀 수 (테이블 정제는 고유값의 등장 횟수)
+     */
+    applyColumnPlan(plan: ColumnPlan, raw: DataRow[string] | undefined, weight: number = 1): string {
+        const { transforms } = plan;
+        const rules = this.rulesOf(plan);
+        let i = 0;
+        let val = String(raw || "");
+        if ((raw === null || raw === undefined) && plan.missingFill !== null) {
+            val = plan.missingFill;
+            i = plan.missingStart;
+        }
+        for (; i < transforms.length; i++) {
+            const rule = rules[i];
+            const started = performance.now();
+            const next = transforms[i].fn(val);
+            rule.ms += performance.now() - started;
+            rule.calls++;
+            rule.cells += weight;
+            if (next !== val) rule.changed += weight;
+            val = next;
+        }
+        return val;
+    }
+
+    toProfile(): CleaningProfile {
+        return {
+            stages: { ...this.stages },
+            rules: [...this.rules.values()].map(r => ({ ...r })).sort((a, b) => b.ms - a.ms),
+            rows: this.rows,
+            shards: this.shards,
+        };
+    }
+}
+
+/**
+ * 샤드/단계별 프로파일을 합칩니다. (같은 컬럼/단계의 규칙은 더함)
+ */
+export function mergeProfiles(profiles: (CleaningProfile | undefined)[]): CleaningProfile | undefined {
+    const present = profiles.filter((p): p is CleaningProfile => !!p);
+    if (present.length === 0) return undefined;
+    const stages = emptyStages();
+    const rules = new Map<string, RuleProfile>();
+    let rows = 0;
+    let shards = 0;
+    for (const profile of present) {
+        for (const stage of PROFILE_STAGES) stages[stage] += profile.stages[stage] || 0;
+        for (const r of profile.rules) {
+            const key = `${r.column}\u0000${r.step}`;
+            const total = rules.get(key);
+            if (!total) {
+                rules.set(key, { ...r });
+                continue;
+            }
+            total.calls += r.calls;
+            total.cells += r.cells;
+            total.changed += r.changed;
+            total.ms += r.ms;
+        }
+        rows += profile.rows;
+        shards += profile.shards;
+    }
+    return { stages, rules: [...rules.values()].sort((a, b) => b.ms - a.ms), rows, shards };
+}
+
+/**
+ * 프로파일에 단계 시간을 더한 사본을 만듭니다. (메인 스레드의 파싱/내보내기 시간 기록용)
+ */
+export function withStageTime(profile: CleaningProfile, stage: ProfileStage, ms: number): CleaningProfile {
+    return { ...profile, stages: { ...profile.stages, [stage]: profile.stages[stage] + ms } };
+}
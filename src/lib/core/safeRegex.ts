@@ -0,0 +1,600 @@
+/**
+ * 사용자 정규식 안전 실행 (Safe Regex)
+ * 프롬프트에서 만든 패턴('_%d 패턴 제거', '[...] 삭제', 'A%sB는 C로')은 사용자가 쓴 문자열이 그대로 정규식이 되므로,
+ * `(a+)+` 같은 패턴은 백트래킹이 지수적으로 늘어 셀 하나에서 워커가 멈출 수 있습니다.
+ *
+ * - 컴파일 결과는 소스/플래그별로 전역 캐시에 두고 다시 만들지 않습니다. (계획 캐시가 바뀌어도 재사용)
+ * - 구문을 분석해 백트래킹 양이 제한되는 패턴(중첩 반복 없음, 무한 반복 1개 이하)만 내장 RegExp로 실행하고,
+ *   나머지는 선형 시간 NFA(Pike VM)로 실행합니다. 셀 하나의 비용은 셀 길이 x 명령 수를 넘지 않습니다.
+ * - 역참조/전후방 탐색처럼 NFA로 옮길 수 없는데 안전하다고 볼 수도 없는 패턴은 적용하지 않고 이슈로 보고합니다.
+ */
+
+// 내장 RegExp로 실행할 수 있는 유한 반복 조합 수 상한 (반복 구간 길이의 곱)
+const MAX_NATIVE_FACTOR = 16;
+// 무한 반복이 하나 있는 패턴을 내장 RegExp로 실행하는 셀 길이 상한 (넘으면 NFA, 최악 길이^2 x 조합 수)
+export const NATIVE_MAX_LENGTH = 1000;
+// NFA 명령 수 상한 ({n,m} 반복은 펼쳐서 컴파일하므로 지나치게 큰 반복은 거부)
+const MAX_PROGRAM = 4000;
+// 컴파일 결과 캐시 크기 (넘으면 오래된 항목부터 삭제)
+const MAX_CACHED_PATTERNS = 256;
+
+export type PatternMode = 'native' | 'linear' | 'rejected';
+
+// --- 구문 트리 ---
+
+type Node =
+    | { t: 'char'; c: number }
+    | { t: 'set'; ranges: number[]; negate: boolean }   // ranges = [시작, 끝, 시작, 끝, ...]
+    | { t: 'seq'; items: Node[] }
+    | { t: 'alt'; items: Node[] }
+    | { t: 'group'; index: number; body: Node }         // index 0 = 캡처 없음
+    | { t: 'repeat'; body: Node; min: number; max: number; lazy: boolean }
+    | { t: 'assert'; kind: 'bol' | 'eol' | 'word' | 'notWord' }
+    | { t: 'backref' }
+    | { t: 'look'; body: Node };
+
+const DIGIT_RANGES = [48, 57];
+const WORD_RANGES = [48, 57, 65, 90, 95, 95, 97, 122];
+const SPACE_RANGES = [9, 13, 32, 32, 160, 160, 5760, 5760, 8192, 8202, 8232, 8233, 8239, 8239, 8287, 8287, 12288, 12288, 65279, 65279];
+const LINE_TERMINATORS = [10, 10, 13, 13, 8232, 8233];
+
+class UnsupportedPattern extends Error { }
+
+/**
+ * JS 정규식 소스를 구문 트리로 바꿉니다. (u 플래그 없는 기본 문법, `new RegExp`로 유효성을 확인한 소스만 넘김)
+ */
+class PatternParser {
+    private pos = 0;
+    groups = 0;
+
+    constructor(private src: string) { }
+
+    parse(): Node {
+        const node = this.alternation();
+        if (this.pos < this.src.length) throw new UnsupportedPattern(`unexpected '${this.src[this.pos]}'`);
+        return node;
+    }
+
+    private peek(): string {
+        return this.src[this.pos];
+    }
+
+    private alternation(): Node {
+        const items = [this.sequence()];
+        while (this.peek() === '|') {
+            this.pos++;
+            items.push(this.sequence());
+        }
+        return items.length === 1 ? items[0] : { t: 'alt', items };
+    }
+
+    private sequence(): Node {
+        const items: Node[] = [];
+        while (this.pos < this.src.length && this.peek() !== '|' && this.peek() !== ')') {
+            let atom = this.atom();
+            const repeat = this.quantifier();
+            if (repeat) {
+                if (atom.t === 'assert') throw new UnsupportedPattern('quantified assertion');
+                atom = { t: 'repeat', body: atom, ...repeat };
+            }
+            items.push(atom);
+        }
+        return items.length === 1 ? items[0] : { t: 'seq', items };
+    }
+
+    private quantifier(): { min: number; max: number; lazy: boolean } | null {
+        const ch = this.peek();
+        let min: number, max: number;
+        if (ch === '*') [min, max] = [0, Infinity];
+        else if (ch === '+') [min, max] = [1, Infinity];
+        else if (ch === '?') [min, max] = [0, 1];
+        else if (ch === '{') {
+            // {n}, {n,}, {n,m} 이 아니면 글자 '{' (Annex B)
+            const m = /^\{(\d+)(,(\d*))?\}/.exec(this.src.slice(this.pos));
+            if (!m) return null;
+            min = Number(m[1]);
+            max = m[2] === undefined ? min : m[3] === '' ? Infinity : Number(m[3]);
+            this.pos += m[0].length - 1;
+        } else return null;
+        this.pos++;
+        const lazy = this.peek() === '?';
+        if (lazy) this.pos++;
+        return { min, max, lazy };
+    }
+
+    private atom(): Node {
+        const ch = this.src[this.pos++];
+        switch (ch) {
+            case '.': return { t: 'set', ranges: LINE_TERMINATORS, negate: true };
+            case '^': return { t: 'assert', kind: 'bol' };
+            case '$': return { t: 'assert', kind: 'eol' };
+            case '[': return this.charClass();
+            case '\\': return this.escape(false);
+            case '(': {
+                let index = 0;
+                let look = false;
+                if (this.src.startsWith('?:', this.pos)) this.pos += 2;
+                else if (/^\?<?[=!]/.test(this.src.slice(this.pos, this.pos + 3))) {
+                    look = true;
+                    this.pos += this.src[this.pos + 1] === '<' ? 3 : 2;
+                } else {
+                    if (this.src.startsWith('?<', this.pos)) this.pos = this.src.indexOf('>', this.pos) + 1;
+                    index = ++this.groups;
+                }
+                const body = this.alternation();
+                if (this.src[this.pos++] !== ')') throw new UnsupportedPattern('unclosed group');
+                return look ? { t: 'look', body } : { t: 'group', index, body };
+            }
+            default:
+                return { t: 'char', c: ch.charCodeAt(0) };
+        }
+    }
+
+    private escape(inClass: boolean): Node {
+        const ch = this.src[this.pos++];
+        switch (ch) {
+            case 'd': return { t: 'set', ranges: DIGIT_RANGES, negate: false };
+            case 'D': return { t: 'set', ranges: DIGIT_RANGES, negate: true };
+            case 'w': return { t: 'set', ranges: WORD_RANGES, negate: false };
+            case 'W': return { t: 'set', ranges: WORD_RANGES, negate: true };
+            case 's': return { t: 'set', ranges: SPACE_RANGES, negate: false };
+            case 'S': return { t: 'set', ranges: SPACE_RANGES, negate: true };
+            case 'b': return inClass ? { t: 'char', c: 8 } : { t: 'assert', kind: 'word' };
+            case 'B': return inClass ? { t: 'char', c: 66 } : { t: 'assert', kind: 'notWord' };
+            case 't': return { t: 'char', c: 9 };
+            case 'n': return { t: 'char', c: 10 };
+            case 'v': return { t: 'char', c: 11 };
+            case 'f': return { t: 'char', c: 12 };
+            case 'r': return { t: 'char', c: 13 };
+            case 'k':
+                if (!inClass && this.peek() === '<') throw new UnsupportedPattern('backreference');
+                return { t: 'char', c: 107 };
+            case 'c': {
+                const code = this.src.charCodeAt(this.pos);
+                if (/[a-zA-Z]/.test(this.src[this.pos] ?? '')) {
+                    this.pos++;
+                    return { t: 'char', c: code % 32 };
+                }
+                return { t: 'char', c: 92 };
+            }
+            case 'x':
+            case 'u': {
+                const len = ch === 'x' ? 2 : 4;
+                const hex = this.src.slice(this.pos, this.pos + len);
+                if (new RegExp(`^[0-9a-fA-F]{${len}}$`).test(hex)) {
+                    this.pos += len;
+                    return { t: 'char', c: parseInt(hex, 16) };
+                }
+                return { t: 'char', c: ch.charCodeAt(0) };
+            }
+            default:
+                if (ch >= '1' && ch <= '9' && !inClass) return { t: 'backref' };
+                if (ch >= '0' && ch <= '7') {
+                    // \0 및 8진수 이스케이프 (Annex B)
+                    const m = /^[0-7]{0,2}/.exec(this.src.slice(this.pos))![0];
+                    this.pos += m.length;
+                    return { t: 'char', c: parseInt(ch + m, 8) & 0xff };
+                }
+                return { t: 'char', c: ch.charCodeAt(0) };
+        }
+    }
+
+    private charClass(): Node {
+        const negate = this.peek() === '^';
+        if (negate) this.pos++;
+        const ranges: number[] = [];
+        while (this.pos < this.src.length && this.peek() !== ']') {
+            const start = this.classAtom();
+            if (start.t === 'set') {
+                ranges.push(...setRanges(start));
+                continue;
+            }
+            const lo = (start as { c: number }).c;
+            if (this.peek() === '-' && this.src[this.pos + 1] !== undefined && this.src[this.pos + 1] !== ']') {
+                this.pos++;
+                const end = this.classAtom();
+                if (end.t === 'set') {
+                    // [a-\d] 같은 경우 '-'는 글자
+                    ranges.push(lo, lo, 45, 45, ...setRanges(end));
+                    continue;
+                }
+                ranges.push(lo, (end as { c: number }).c);
+            } else ranges.push(lo, lo);
+        }
+        if (this.src[this.pos++] !== ']') throw new UnsupportedPattern('unclosed class');
+        return { t: 'set', ranges, negate };
+    }
+
+    private classAtom(): Node {
+        const ch = this.src[this.pos++];
+        return ch === '\\' ? this.escape(true) : { t: 'char', c: ch.charCodeAt(0) };
+    }
+}
+
+// 부정 집합을 0~0xffff 범위의 양의 구간으로 바꿈 (문자 집합 안의 \D, \W, \S)
+function setRanges(node: { ranges: number[]; negate: boolean }): number[] {
+    if (!node.negate) return node.ranges;
+    const out: number[] = [];
+    let next = 0;
+    const pairs: [number, number][] = [];
+    for (let i = 0; i < node.ranges.length; i += 2) pairs.push([node.ranges[i], node.ranges[i + 1]]);
+    pairs.sort((a, b) => a[0] - b[0]);
+    for (const [lo, hi] of pairs) {
+        if (lo > next) out.push(next, lo - 1);
+        next = Math.max(next, hi + 1);
+    }
+    if (next <= 0xffff) out.push(next, 0xffff);
+    return out;
+}
+
+// --- 백트래킹 비용 분석 ---
+
+interface Cost {
+    unbounded: number;  // 무한 반복(*, +, {n,}) 수
+    factor: number;     // 유한 반복/선택지 조합 수
+    nested: boolean;    // 반복 안에 반복/선택/역참조가 있음 (지수적 백트래킹 가능)
+}
+
+// 반복 본문이 고정 길이 글자열인지 (반복/선택/역참조/전후방 탐색이 없음)
+function isSimple(node: Node): boolean {
+    switch (node.t) {
+        case 'char': case 'set': case 'assert': return true;
+        case 'seq': return node.items.every(isSimple);
+        case 'group': return isSimple(node.body);
+        default: return false;
+    }
+}
+
+function backtrackCost(node: Node): Cost {
+    switch (node.t) {
+        case 'seq':
+        case 'alt': {
+            const cost: Cost = { unbounded: 0, factor: node.t === 'seq' ? 1 : 0, nested: false };
+            for (const item of node.items) {
+                const c = backtrackCost(item);
+                cost.unbounded += c.unbounded;
+                cost.factor = node.t === 'seq' ? cost.factor * c.factor : cost.factor + c.factor;
+                cost.nested ||= c.nested;
+            }
+            return cost;
+        }
+        case 'group':
+        case 'look':
+            return backtrackCost(node.body);
+        case 'repeat':
+            if (!isSimple(node.body)) return { unbounded: 1, factor: Infinity, nested: true };
+            return node.max === Infinity ? { unbounded: 1, factor: 1, nested: false } : { unbounded: 0, factor: node.max - node.min + 1, nested: false };
+        case 'backref':
+            return { unbounded: 0, factor: 1, nested: true };
+        default:
+            return { unbounded: 0, factor: 1, nested: false };
+    }
+}
+
+// --- 선형 시간 NFA (Pike VM) ---
+
+const OP_CHAR = 0, OP_SET = 1, OP_SPLIT = 2, OP_JMP = 3, OP_SAVE = 4, OP_ASSERT = 5, OP_MATCH = 6, OP_CLEAR = 7, OP_PROGRESS = 8;
+const ASSERT_KINDS = { bol: 0, eol: 1, word: 2, notWord: 3 } as const;
+
+interface Program {
+    op: number[];
+    x: number[];                 // 글자 코드 / 집합 번호 / 분기·이동 대상 / 저장 칸 / 검사 종류 / 지울 첫 칸 / 시작 위치 칸
+    y: number[];                 // 분기 두 번째 대상 / 지울 마지막 칸 다음
+    sets: { ranges: number[]; negate: boolean }[];
+    slots: number;               // 캡처 저장 칸 수 (그룹 수 + 1) x 2 + 펼친 반복의 시작 위치 칸
+}
+
+// 노드 안의 캡처 그룹 번호 범위 [first, last] (없으면 null)
+function groupSpan(node: Node): [number, number] | null {
+    let span: [number, number] | null = null;
+    const visit = (n: Node) => {
+        if (n.t === 'group' && n.index > 0) span = span ? [Math.min(span[0], n.index), Math.max(span[1], n.index)] : [n.index, n.index];
+        if (n.t === 'seq' || n.t === 'alt') n.items.forEach(visit);
+        else if (n.t === 'group' || n.t === 'repeat' || n.t === 'look') visit(n.body);
+    };
+    visit(node);
+    return span;
+}
+
+function compileProgram(root: Node, groups: number): Program {
+    const prog: Program = { op: [], x: [], y: [], sets: [], slots: (groups + 1) * 2 };
+    const emit = (op: number, x = 0, y = 0) => {
+        if (prog.op.length >= MAX_PROGRAM) throw new UnsupportedPattern('program too large');
+        prog.op.push(op);
+        prog.x.push(x);
+        prog.y.push(y);
+        return prog.op.length - 1;
+    };
+    const gen = (node: Node): void => {
+        switch (node.t) {
+            case 'char': emit(OP_CHAR, node.c); break;
+            case 'set': prog.sets.push(node); emit(OP_SET, prog.sets.length - 1); break;
+            case 'assert': emit(OP_ASSERT, ASSERT_KINDS[node.kind]); break;
+            case 'seq': node.items.forEach(gen); break;
+            case 'alt': {
+                const jumps: number[] = [];
+                node.items.forEach((item, i) => {
+                    if (i < node.items.length - 1) {
+                        const split = emit(OP_SPLIT);
+                        prog.x[split] = split + 1;
+                        gen(item);
+                        jumps.push(emit(OP_JMP));
+                        prog.y[split] = prog.op.length;
+                    } else gen(item);
+                });
+                for (const j of jumps) prog.x[j] = prog.op.length;
+                break;
+            }
+            case 'group':
+                if (node.index > 0) emit(OP_SAVE, node.index * 2);
+                gen(node.body);
+                if (node.index > 0) emit(OP_SAVE, node.index * 2 + 1);
+                break;
+            case 'repeat': {
+                // 반복할 때마다 본문 안의 캡처를 비움 (JS는 마지막 반복의 캡처만 남김)
+                const span = groupSpan(node.body);
+                const body = () => {
+                    if (span) emit(OP_CLEAR, span[0] * 2, span[1] * 2 + 2);
+                    gen(node.body);
+                };
+                for (let i = 0; i < node.min; i++) body();
+                const branch = (split: number, body: number, exit: number) => {
+                    prog.x[split] = node.lazy ? exit : body;
+                    prog.y[split] = node.lazy ? body : exit;
+                };
+                if (node.max === Infinity) {
+                    // 빈 반복은 같은 위치에서 분기로 돌아오므로 VM의 중복 제거로 끝남
+                    const split = emit(OP_SPLIT);
+                    body();
+                    emit(OP_JMP, split);
+                    branch(split, split + 1, prog.op.length);
+                } else {
+                    // 최소 횟수를 넘는 반복이 빈 문자열과 일치하면 실패 (JS 규칙, 펼친 반복은 시작 위치를 저장해 확인)
+                    const startSlot = prog.slots++;
+                    const splits: number[] = [];
+                    for (let i = node.min; i < node.max; i++) {
+                        splits.push(emit(OP_SPLIT));
+                        emit(OP_SAVE, startSlot);
+                        body();
+                        emit(OP_PROGRESS, startSlot);
+                    }
+                    for (const s of splits) branch(s, s + 1, prog.op.length);
+                }
+                break;
+            }
+            default:
+                throw new UnsupportedPattern(node.t);
+        }
+    };
+    emit(OP_SAVE, 0);
+    gen(root);
+    emit(OP_SAVE, 1);
+    emit(OP_MATCH);
+    return prog;
+}
+
+// 대소문자 무시 비교용 정규화 (u 플래그 없는 JS 규칙: 한 글자 대문자로 바뀔 때만)
+function canonical(c: number): number {
+    const upper = String.fromCharCode(c).toUpperCase();
+    if (upper.length !== 1) return c;
+    const u = upper.charCodeAt(0);
+    return c >= 128 && u < 128 ? c : u;
+}
+
+function inRanges(ranges: number[], c: number): boolean {
+    for (let i = 0; i < ranges.length; i += 2) if (c >= ranges[i] && c <= ranges[i + 1]) return true;
+    return false;
+}
+
+function isWordChar(text: string, i: number): boolean {
+    if (i < 0 || i >= text.length) return false;
+    return inRanges(WORD_RANGES, text.charCodeAt(i));
+}
+
+class PikeVM {
+    private mark: Int32Array;
+    private generation = 0;
+
+    constructor(private prog: Program, private ignoreCase: boolean) {
+        this.mark = new Int32Array(prog.op.length);
+    }
+
+    private matchSet(index: number, c: number): boolean {
+        const set = this.prog.sets[index];
+        let hit = inRanges(set.ranges, c);
+        if (!hit && this.ignoreCase) {
+            const s = String.fromCharCode(c);
+            const lower = s.toLowerCase(), upper = s.toUpperCase();
+            hit = (lower.length === 1 && inRanges(set.ranges, lower.charCodeAt(0))) || (upper.length === 1 && inRanges(set.ranges, upper.charCodeAt(0)));
+        }
+        return hit !== set.negate;
+    }
+
+    // 엡실론 이동(분기/이동/저장/검사)을 따라가며 글자를 소비하는 명령만 목록에 추가 (우선순위 순서 유지)
+    private add(list: { pc: number; caps: Int32Array }[], pc: number, caps: Int32Array, text: string, pos: number): void {
+        const { op, x, y } = this.prog;
+        if (this.mark[pc] === this.generation) return;
+        this.mark[pc] = this.generation;
+        switch (op[pc]) {
+            case OP_JMP:
+                this.add(list, x[pc], caps, text, pos);
+                break;
+            case OP_SPLIT:
+                this.add(list, x[pc], caps, text, pos);
+                this.add(list, y[pc], caps, text, pos);
+                break;
+            case OP_SAVE: {
+                const copy = caps.slice();
+                copy[x[pc]] = pos;
+                this.add(list, pc + 1, copy, text, pos);
+                break;
+            }
+            case OP_CLEAR: {
+                const copy = caps.slice();
+                copy.fill(-1, x[pc], y[pc]);
+                this.add(list, pc + 1, copy, text, pos);
+                break;
+            }
+            case OP_PROGRESS:
+                if (caps[x[pc]] !== pos) this.add(list, pc + 1, caps, text, pos);
+                break;
+            case OP_ASSERT: {
+                const kind = x[pc];
+                const ok = kind === 0 ? pos === 0
+                    : kind === 1 ? pos === text.length
+                        : (isWordChar(text, pos - 1) !== isWordChar(text, pos)) === (kind === 2);
+                if (ok) this.add(list, pc + 1, caps, text, pos);
+                break;
+            }
+            default:
+                list.push({ pc, caps });
+        }
+    }
+
+    /**
+     * start 위치부터 가장 왼쪽 일치를 찾습니다. (JS와 같은 우선순위: 앞선 선택지/탐욕 반복 우선) 없으면 null
+     */
+    exec(text: string, start: number): Int32Array | null {
+        const { op, x } = this.prog;
+        const empty = new Int32Array(this.prog.slots).fill(-1);
+        let matched: Int32Array | null = null;
+        let clist: { pc: number; caps: Int32Array }[] = [];
+        this.generation++;
+        this.add(clist, 0, empty, text, start);
+        for (let pos = start; ; pos++) {
+            const nlist: { pc: number; caps: Int32Array }[] = [];
+            this.generation++;
+            const c = pos < text.length ? text.charCodeAt(pos) : -1;
+            for (const { pc, caps } of clist) {
+                const o = op[pc];
+                if (o === OP_MATCH) {
+                    // 이 스레드보다 우선순위가 낮은 스레드는 버림
+                    matched = caps;
+                    break;
+                }
+                if (c < 0) continue;
+                const hit = o === OP_CHAR
+                    ? (x[pc] === c || (this.ignoreCase && canonical(x[pc]) === canonical(c)))
+                    : this.matchSet(x[pc], c);
+                if (hit) this.add(nlist, pc + 1, caps, text, pos + 1);
+            }
+            // 아직 일치가 없으면 다음 위치에서 시작하는 스레드를 가장 낮은 우선순위로 추가 (검색)
+            if (!matched && pos < text.length) this.add(nlist, 0, empty, text, pos + 1);
+            if (pos >= text.length || (matched && nlist.length === 0)) break;
+            clist = nlist;
+        }
+        return matched;
+    }
+}
+
+// JS String.prototype.replace의 치환 문자열 규칙 ($$, $&, $`, $', $n, $nn)
+function expandReplacement(template: string, text: string, caps: ArrayLike<number>, groups: number): string {
+    if (!template.includes('$')) return template;
+    const group = (n: number) => (caps[n * 2] < 0 ? '' : text.slice(caps[n * 2], caps[n * 2 + 1]));
+    return template.replace(/\$(\$|&|`|'|\d{1,2})/g, (token, name: string) => {
+        if (name === '$') return '$';
+        if (name === '&') return group(0);
+        if (name === '`') return text.slice(0, caps[0]);
+        if (name === "'") return text.slice(caps[1]);
+        const two = Number(name);
+        if (name.length === 2 && two >= 1 && two <= groups) return group(two);
+        const one = Number(name[0]);
+        if (one >= 1 && one <= groups) return group(one) + name.slice(1);
+        return token;
+    });
+}
+
+/**
+ * 안전하게 실행되도록 컴파일된 사용자 정규식
+ */
+export class SafePattern {
+    readonly global: boolean;
+    private vm: PikeVM | null;
+
+    constructor(
+        readonly source: string,
+        readonly flags: string,
+        private native: RegExp,
+        readonly mode: PatternMode,
+        private guardLength: boolean,   // 긴 셀은 NFA로 (무한 반복이 있는 내장 실행 패턴)
+        program: Program | null,
+        private groups: number,
+        readonly reason: string | null  // 거부 사유 (mode === 'rejected')
+    ) {
+        this.global = flags.includes('g');
+        this.vm = program ? new PikeVM(program, flags.includes('i')) : null;
+    }
+
+    /**
+     * String.prototype.replace와 같은 결과를 돌려줍니다. 거부된 패턴은 값을 그대로 돌려줍니다.
+     */
+    replace(text: string, replacement: string): string {
+        if (this.mode === 'rejected') return text;
+        if (this.mode === 'native' && (!this.guardLength || !this.vm || text.length <= NATIVE_MAX_LENGTH)) {
+            return text.replace(this.native, replacement);
+        }
+        const vm = this.vm!;
+        let out = '';
+        let last = 0;
+        let pos = 0;
+        while (pos <= text.length) {
+            const caps = vm.exec(text, pos);
+            if (!caps) break;
+            out += text.slice(last, caps[0]) + expandReplacement(replacement, text, caps, this.groups);
+            last = caps[1];
+            if (!this.global) break;
+            // 빈 일치는 한 글자 건너뛰어 계속 (JS와 동일)
+            pos = caps[1] === caps[0] ? caps[1] + 1 : caps[1];
+        }
+        return out + text.slice(last);
+    }
+}
+
+const patternCache = new Map<string, SafePattern | null>();
+
+/**
+ * 사용자 정규식을 컴파일합니다. 문법 오류면 null (기존처럼 조용히 무시)
+ * 같은 소스/플래그는 전역 캐시에서 재사용합니다.
+ */
+export function compileSafePattern(source: string, flags = ''): SafePattern | null {
+    const key = `${flags}/${source}`;
+    const cached = patternCache.get(key);
+    if (cached !== undefined) {
+        // 최근 사용 순서 갱신
+        patternCache.delete(key);
+        patternCache.set(key, cached);
+        return cached;
+    }
+
+    let pattern: SafePattern | null;
+    let native: RegExp | null = null;
+    try {
+        native = new RegExp(source, flags);
+    } catch {
+        pattern = null;
+    }
+    if (native) {
+        let tree: Node | null = null;
+        let groups = 0;
+        let program: Program | null = null;
+        let reason: string | null = null;
+        try {
+            const parser = new PatternParser(source);
+            tree = parser.parse();
+            groups = parser.groups;
+            program = compileProgram(tree, groups);
+        } catch (e) {
+            if (!(e instanceof UnsupportedPattern)) throw e;
+            reason = e.message;
+        }
+        const cost = tree ? backtrackCost(tree) : null;
+        const bounded = !!cost && !cost.nested && cost.unbounded <= 1 && cost.factor <= MAX_NATIVE_FACTOR;
+        const mode: PatternMode = bounded ? 'native' : program ? 'linear' : 'rejected';
+        pattern = new SafePattern(source, flags, native, mode, !!cost && cost.unbounded > 0, program, groups,
+            mode === 'rejected' ? (reason ?? 'nested repetition') : null);
+    } else pattern = null;
+
+    patternCache.set(key, pattern);
+    if (patternCache.size > MAX_CACHED_PATTERNS) patternCache.delete(patternCache.keys().next().value!);
+    return pattern;
+}
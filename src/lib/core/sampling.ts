@@ -0,0 +1,201 @@
+import { ProcessingOptions, ColumnSpecificOptions } from '@/types';
+import { processTableTracked } from './processors';
+import { truncateChangeSet } from './changes';
+import { DataTable, TableValue, countCodes, countEmptyCells, headTable, selectTableRows } from './table';
+import { PartialResult } from './sharding';
+
+/**
+ * 표본 추출 (Sampling)
+ * 포맷 추천/날짜 컬럼 감지/정제 미리보기는 전체 행 대신 표본으로 판단합니다.
+ * 상위 N행만 보면 정렬된 파일(앞쪽이 한 종류 값)이나 넓은 파일에서 뒤쪽에만 있는 형식을 놓치므로,
+ * 1) 컬럼마다 값의 모양(숫자/영문/한글/기호 배열)별로 처음 등장한 행을 하나씩 넣고(층화),
+ * 2) 남은 자리는 전체 행에서 균등하게 뽑은 행(저수지 표본)으로 채웁니다.
+ * 미리보기 첫 화면이 정확하도록 상위 PREVIEW_ROWS 행은 항상 포함합니다.
+ */
+
+// 표본 행 수 (이하인 테이블은 전체가 표본)
+export const SAMPLE_ROWS = 1000;
+// 표본에 항상 포함하는 상위 행 수 (정제 미리보기로 먼저 보여주는 행)
+export const PREVIEW_ROWS = 100;
+// 컬럼 하나에서 표본에 넣는 값 모양 수 (자유 텍스트 컬럼이 표본을 다 차지하지 않도록)
+const MAX_SHAPES_PER_COLUMN = 32;
+// 값 모양 문자열의 최대 길이
+const SHAPE_LENGTH = 24;
+const DEFAULT_SEED = 0x5eed;
+
+export interface TableSample {
+    rows: Uint32Array;          // 원본 행 번호 (오름차순)
+    table: DataTable;           // 표본 행만 담은 테이블 (rows 순서)
+    sourceCodes: Uint32Array[]; // 컬럼별 표본 사전 번호 → 원본 사전 번호
+    exhaustive: boolean;        // 전체 행이 표본 (표본 결과 = 전체 결과)
+}
+
+/**
+ * 값의 모양: 숫자는 9, 영문은 a, 한글은 가, 공백은 ' '로 바꾸고 같은 종류가 이어지면 하나로 줄입니다.
+ * 예) '010-1234-5678' → '9-9-9', '2024.01.05' → '9.9.9', 'kim@mail.com' → 'a@a.a'
+ */
+export function valueShape(value: TableValue): string {
+    if (value === undefined) return '\u0000';
+    const text = String(value ?? '');
+    let shape = '';
+    let last = '';
+    for (let i = 0; i < text.length && shape.length < SHAPE_LENGTH; i++) {
+        const c = text.charCodeAt(i);
+        let cls: string;
+        if (c >= 48 && c <= 57) cls = '9';
+        else if ((c >= 65 && c <= 90) || (c >= 97 && c <= 122)) cls = 'a';
+        else if (c >= 0xAC00 && c <= 0xD7A3) cls = '가';
+        else if (c === 32 || c === 9) cls = ' ';
+        else cls = text[i];
+        if (cls !== last) shape += cls;
+        last = cls;
+    }
+    return shape;
+}
+
+/**
+ * 시드가 있는 의사 난수 (같은 파일이면 같은 표본)
+ */
+function seededRandom(seed: number): () => number {
+    let state = seed >>> 0;
+    return () => {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * 0 ~ n-1에서 k개를 균등하게 뽑습니다. (저수지 표본, 건너뛸 개수를 한 번에 계산하는 Algorithm L)
+ */
+function reservoirRows(n: number, k: number, random: () => number): number[] {
+    const picked: number[] = [];
+    for (let i = 0; i < Math.min(n, k); i++) picked.push(i);
+    if (n <= k) return picked;
+    // random()은 0일 수 있으므로 (0, 1] 구간으로 바꿔 사용
+    const uniform = () => 1 - random();
+    let w = Math.exp(Math.log(uniform()) / k);
+    let i = k - 1;
+    while (true) {
+        i += Math.floor(Math.log(uniform()) / Math.log(1 - w)) + 1;
+        if (i >= n) break;
+        picked[Math.floor(random() * k)] = i;
+        w *= Math.exp(Math.log(uniform()) / k);
+    }
+    return picked;
+}
+
+/**
+ * 컬럼에서 표본에 넣을 값 모양별 대표 행을 표시합니다.
+ * 모양은 사전 값마다 한 번만 계산하고, 모양이 많으면 흔한 것 절반 + 드문 것 절반을 고릅니다. (드문 모양이 이슈일 가능성이 큼)
+ */
+function markShapeRows(table: DataTable, col: number, picked: Uint8Array) {
+    const column = table.columns[col];
+    const counts = countCodes(column, table.rowCount);
+    const shapeIds = new Map<string, number>();
+    const shapeOf = new Int32Array(column.values.length).fill(-1);
+    const shapeCounts: number[] = [];
+    column.values.forEach((value, code) => {
+        if (counts[code] === 0) return;
+        const shape = valueShape(value);
+        let id = shapeIds.get(shape);
+        if (id === undefined) {
+            id = shapeCounts.length;
+            shapeIds.set(shape, id);
+            shapeCounts.push(0);
+        }
+        shapeOf[code] = id;
+        shapeCounts[id] += counts[code];
+    });
+
+    let chosen = shapeCounts.map((_, id) => id);
+    if (chosen.length > MAX_SHAPES_PER_COLUMN) {
+        chosen.sort((a, b) => shapeCounts[b] - shapeCounts[a]);
+        const half = MAX_SHAPES_PER_COLUMN / 2;
+        chosen = [...chosen.slice(0, half), ...chosen.slice(-half)];
+    }
+    const wanted = new Uint8Array(shapeCounts.length);
+    for (const id of chosen) wanted[id] = 1;
+
+    // 고른 모양마다 처음 등장한 행 (모두 찾으면 중단)
+    let remaining = chosen.length;
+    const { codes } = column;
+    for (let row = 0; row < table.rowCount && remaining > 0; row++) {
+        const id = shapeOf[codes[row]];
+        if (wanted[id]) {
+            wanted[id] = 0;
+            picked[row] = 1;
+            remaining--;
+        }
+    }
+}
+
+/**
+ * 테이블에서 표본을 뽑습니다.
+ * @param size 목표 표본 행 수 (값 모양이 많으면 넘을 수 있음)
+ */
+export function sampleTable(table: DataTable, size: number = SAMPLE_ROWS, seed: number = DEFAULT_SEED): TableSample {
+    const n = table.rowCount;
+    let rows: Uint32Array;
+    if (n <= size) {
+        rows = new Uint32Array(n);
+        for (let i = 0; i < n; i++) rows[i] = i;
+    } else {
+        const picked = new Uint8Array(n);
+        for (let i = 0; i < Math.min(PREVIEW_ROWS, n); i++) picked[i] = 1;
+        for (let col = 0; col < table.columns.length; col++) markShapeRows(table, col, picked);
+
+        let count = 0;
+        for (let i = 0; i < n; i++) count += picked[i];
+        if (count < size) {
+            const random = seededRandom(seed ^ n);
+            for (const row of reservoirRows(n, size - count, random)) picked[row] = 1;
+        }
+
+        const list: number[] = [];
+        for (let i = 0; i < n; i++) if (picked[i]) list.push(i);
+        rows = Uint32Array.from(list);
+    }
+    const { table: sampled, sourceCodes } = selectTableRows(table, rows);
+    return { rows, table: sampled, sourceCodes, exhaustive: rows.length === n };
+}
+
+// 원본 테이블별 표본 (원본은 제자리에서 수정하지 않으므로 테이블 객체를 키로 사용)
+const sampleCache = new WeakMap<DataTable, TableSample>();
+
+/**
+ * 캐시된 표본을 반환합니다. (없으면 SAMPLE_ROWS 크기로 뽑아 저장)
+ */
+export function getTableSample(table: DataTable): TableSample {
+    let sample = sampleCache.get(table);
+    if (!sample) {
+        sample = sampleTable(table);
+        sampleCache.set(table, sample);
+    }
+    return sample;
+}
+
+/**
+ * 표본에 컴파일된 정제 계획을 먼저 실행해 미리보기를 만듭니다. (전체 정제는 워커 풀에서 이어서 실행)
+ * 표본은 상위 PREVIEW_ROWS 행을 항상 포함하고 정제는 값마다 결정적이므로, 돌려주는 앞 구간은 전체 정제 결과와 같습니다.
+ */
+export function previewCleaning(
+    data: DataTable,
+    sample: TableSample,
+    prompt: string,
+    options: ProcessingOptions,
+    lockedColumns: string[],
+    columnOptions: ColumnSpecificOptions
+): PartialResult {
+    const { processedData, changes } = processTableTracked(sample.table, prompt, options, lockedColumns, columnOptions);
+    const rows = sample.exhaustive ? data.rowCount : Math.min(PREVIEW_ROWS, data.rowCount);
+    const head = headTable(processedData, rows);
+    return {
+        processedData: head,
+        changes: truncateChangeSet(changes, rows, countEmptyCells(head)),
+        readyRows: rows,
+        totalRows: data.rowCount,
+    };
+}
@@ -0,0 +1,290 @@
+import { DataIssue, ProcessingOptions, ProcessingStats, ColumnLimits, ColumnSpecificOptions } from '@/types';
+import { processTableTracked } from './processors';
+import { scanTableIssues, mergeIssueScans, finalizeIssueScan, diffCountsFromChanges, finalizeDiffStats, IssueScan, PackedIssueScan, packIssueScan } from './analyzers';
+import { ChangeSet, createChangeSet, forEachChange, markChange, mergeChangeSets, truncateChangeSet } from './changes';
+import { DataTable, TableValue, sliceTable, mergeSliceValues, headTable } from './table';
+import { EncodedValues, encodeValues, decodeValues, valuesTransferables, codeTransferables } from './transfer';
+import { CleaningProfile, CleaningProfiler, mergeProfiles } from './profiler';
+
+/**
+ * 샤드 단위 병렬 정제
+ * 입력 테이블을 연속 행 구간(샤드)으로 나눠 워커마다 정제/이슈 검사를 수행하고,
+ * 이슈의 affectedRows와 셀 변경 기록은 샤드 시작 위치만큼 보정해 병합합니다.
+ * 워커는 정제한 사전만 돌려보내고, 정제 결과 테이블은 원본 번호 배열을 공유하도록 메인 스레드에서 다시 조립합니다.
+ * 샤드 번호 배열과 워커 결과(정제 사전, 이슈 행 목록, 변경 비트셋)는 형식화 배열 버퍼째 넘깁니다(Transferable, transfer.ts).
+ * 요청에 profile을 켜면 샤드마다 프로파일(profiler.ts)을 모으고, 병합 단계의 시간까지 더해 MergedResult.profile로 돌려줍니다.
+ */
+
+// 샤드 하나의 최소 행 수 기본값 (이보다 작으면 워커 간 전송 비용이 정제 비용보다 커짐, 처리량 측정 후에는 performance.ts 값 사용)
+export const MIN_ROWS_PER_SHARD = 20000;
+// 워커 수 대비 샤드 수 (샤드마다 처리 시간이 달라도 먼저 끝난 워커가 다음 샤드를 가져가도록)
+const SHARDS_PER_WORKER = 2;
+// 첫 샤드의 최대 행 수 기본값 (미리보기 첫 화면에 보일 행이 먼저 도착하도록 작게 나눔)
+export const FIRST_SHARD_ROWS = 5000;
+
+export interface ShardTask {
+    index: number;
+    offset: number;
+    data: DataTable;           // 구간에 등장하는 값만 사전에 남긴 테이블
+}
+
+/**
+ * 메인 스레드가 보관하는 샤드 정보 (워커 결과 사전을 원본 사전 번호로 되돌릴 때 사용)
+ */
+export interface ShardPlan {
+    task: ShardTask;
+    sourceCodes: Uint32Array[];
+}
+
+export interface ShardRequest {
+    prompt: string;
+    options: ProcessingOptions;
+    lockedColumns: string[];
+    columnLimits: ColumnLimits;
+    columnOptions: ColumnSpecificOptions;
+    headers: string[];
+    // 원본 이슈가 캐시되어 있으면 false (정제 결과만 검사)
+    scanOriginal: boolean;
+    // 규칙/단계별 프로파일 수집 (끄면 측정 코드를 거치지 않음)
+    profile?: boolean;
+}
+
+export interface ShardResult {
+    index: number;
+    offset: number;
+    rowCount: number;
+    values: TableValue[][];    // 컬럼별 정제된 사전 (샤드 사전 번호 기준)
+    // 워커에서 받은 결과는 행 목록이 Uint32Array인 채로 병합 (mergeIssueScans가 두 형식 모두 처리)
+    originalScan?: IssueScan | PackedIssueScan;
+    processedScan: IssueScan | PackedIssueScan;
+    changes: ChangeSet;
+    profile?: CleaningProfile;   // 워커는 PROFILE 메시지로 따로 보냄 (worker.ts)
+}
+
+/**
+ * 워커가 돌려보내는 샤드 결과 (PARTIAL 메시지 본문)
+ */
+export interface ShardResultMessage {
+    index: number;
+    offset: number;
+    rowCount: number;
+    values: EncodedValues[];
+    originalScan?: PackedIssueScan;
+    processedScan: PackedIssueScan;
+    changes: ChangeSet;
+}
+
+/**
+ * 앞에서부터 이어서 완료된 구간의 정제 결과 (전체 완료 전 미리보기용)
+ */
+export interface PartialResult {
+    processedData: DataTable;  // 완료된 앞 구간만 담은 테이블 (rowCount = readyRows)
+    changes: ChangeSet;        // 같은 구간의 변경 기록
+    readyRows: number;
+    totalRows: number;
+}
+
+export interface MergedResult {
+    processedData: DataTable;
+    issues: DataIssue[];
+    originalIssues: DataIssue[];
+    stats: ProcessingStats;
+    changes: ChangeSet;
+    profile?: CleaningProfile;   // 프로파일링을 켠 실행만 (샤드 합계 + 병합 단계)
+}
+
+/**
+ * 행 수와 워커 수로 샤드 개수를 정합니다.
+ * @param minShardRows 샤드 하나의 최소 행 수 (측정한 처리량 기준, performance.ts)
+ */
+export function getShardCount(rowCount: number, workerCount: number, minShardRows: number = MIN_ROWS_PER_SHARD): number {
+    const byRows = Math.floor(rowCount / minShardRows);
+    return Math.max(1, Math.min(byRows, workerCount * SHARDS_PER_WORKER));
+}
+
+/**
+ * 테이블을 원래 순서를 유지하는 연속 구간으로 나눕니다.
+ * 여러 샤드로 나눌 때는 첫 샤드를 firstShardRows 행 이하로 잘라 미리보기 첫 화면을 먼저 받습니다.
+ */
+export function splitIntoShards(data: DataTable, shardCount: number, firstShardRows: number = FIRST_SHARD_ROWS): ShardPlan[] {
+    const size = Math.ceil(data.rowCount / Math.max(1, shardCount));
+    const shards: ShardPlan[] = [];
+    const push = (offset: number, end: number) => {
+        const { table, sourceCodes } = sliceTable(data, offset, end);
+        shards.push({ task: { index: shards.length, offset, data: table }, sourceCodes });
+    };
+    let offset = 0;
+    if (shardCount > 1 && size > firstShardRows) {
+        push(0, firstShardRows);
+        offset = firstShardRows;
+    }
+    for (; offset < data.rowCount; offset += size) push(offset, offset + size);
+    return shards;
+}
+
+/**
+ * 샤드 작업을 보낼 때 넘길 버퍼 목록 (번호 배열은 복사 없이 넘기고 사전은 structured clone)
+ * 넘긴 뒤 샤드 테이블은 보내는 쪽에서 쓸 수 없으므로 결과 병합에는 sourceCodes만 사용합니다.
+ */
+export function shardTaskTransferables(task: ShardTask): ArrayBuffer[] {
+    return codeTransferables(task.data);
+}
+
+/**
+ * 샤드 결과를 전송용으로 인코딩합니다. (정제 사전, 이슈 행 목록, 변경 비트셋을 모두 버퍼째 넘김)
+ */
+export function encodeShardResult(result: ShardResult): { message: ShardResultMessage; transfer: ArrayBuffer[] } {
+    const transfer: ArrayBuffer[] = [result.changes.changed.buffer as ArrayBuffer, result.changes.cleared.buffer as ArrayBuffer];
+    const values = result.values.map(v => {
+        const encoded = encodeValues(v);
+        transfer.push(...valuesTransferables(encoded));
+        return encoded;
+    });
+    const pack = (scan: IssueScan | PackedIssueScan) => {
+        const { packed, transfer: buffers } = packIssueScan(scan);
+        transfer.push(...buffers);
+        return packed;
+    };
+    return {
+        message: {
+            index: result.index,
+            offset: result.offset,
+            rowCount: result.rowCount,
+            values,
+            originalScan: result.originalScan && pack(result.originalScan),
+            processedScan: pack(result.processedScan),
+            changes: result.changes,
+        },
+        transfer,
+    };
+}
+
+export function decodeShardResult(message: ShardResultMessage): ShardResult {
+    return {
+        index: message.index,
+        offset: message.offset,
+        rowCount: message.rowCount,
+        values: message.values.map(decodeValues),
+        originalScan: message.originalScan,
+        processedScan: message.processedScan,
+        changes: message.changes,
+    };
+}
+
+/**
+ * 샤드 하나를 정제하고 정제 전/후 이슈 검사 결과를 수집합니다. (워커 내부에서 실행)
+ */
+export function processShard(task: ShardTask, req: ShardRequest): ShardResult {
+    const profiler = req.profile ? new CleaningProfiler() : null;
+    const { processedData, changes } = processTableTracked(task.data, req.prompt, req.options, req.lockedColumns, req.columnOptions, profiler);
+    const scan = () => ({
+        originalScan: req.scanOriginal ? scanTableIssues(task.data, req.headers, req.columnLimits, req.options) : undefined,
+        processedScan: scanTableIssues(processedData, req.headers, req.columnLimits, req.options),
+    });
+    const { originalScan, processedScan } = profiler ? profiler.time('detect', scan) : scan();
+    if (profiler) {
+        profiler.rows = task.data.rowCount;
+        profiler.shards = 1;
+    }
+    return {
+        index: task.index,
+        offset: task.offset,
+        rowCount: task.data.rowCount,
+        values: processedData.columns.map(c => c.values),
+        originalScan,
+        processedScan,
+        changes,
+        profile: profiler?.toProfile(),
+    };
+}
+
+/**
+ * 샤드 결과를 원래 행 순서대로 병합해 최종 테이블/이슈/통계를 만듭니다.
+ * @param data 샤드로 나누기 전의 원본 테이블
+ * @param shards splitIntoShards 결과 (샤드 사전 → 원본 사전 번호)
+ * @param baselineIssues 캐시된 원본 이슈 (없으면 샤드의 원본 검사 결과로 계산)
+ */
+export function mergeShardResults(
+    results: ShardResult[],
+    data: DataTable,
+    shards: ShardPlan[],
+    columnLimits: ColumnLimits,
+    options: ProcessingOptions,
+    baselineIssues?: DataIssue[]
+): MergedResult {
+    const ordered = [...results].sort((a, b) => a.index - b.index);
+    const offsets = ordered.map(r => r.offset);
+    const headers = data.headers;
+    // 샤드 프로파일이 있으면 병합 단계 시간도 잼
+    const profiler = ordered.some(r => r.profile) ? new CleaningProfiler() : null;
+    const timed = <T>(stage: 'clean' | 'detect' | 'diff', fn: () => T): T => (profiler ? profiler.time(stage, fn) : fn());
+
+    const processedData = timed('clean', () => mergeSliceValues(data, ordered.map(r => ({ sourceCodes: shards[r.index].sourceCodes, values: r.values }))));
+
+    const { issues, originalIssues } = timed('detect', () => ({
+        issues: finalizeIssueScan(mergeIssueScans(ordered.map(r => r.processedScan), offsets), columnLimits, options),
+        originalIssues: baselineIssues
+            || finalizeIssueScan(mergeIssueScans(ordered.map(r => r.originalScan!), offsets), columnLimits, options),
+    }));
+    const changes = timed('diff', () => mergeChangeSets(ordered.map(r => r.changes), headers));
+    const stats = timed('diff', () => finalizeDiffStats(diffCountsFromChanges(changes), originalIssues.length, issues.length));
+
+    const profile = profiler ? mergeProfiles([...ordered.map(r => r.profile), profiler.toProfile()]) : undefined;
+    return { processedData, issues, originalIssues, stats, changes, profile };
+}
+
+/**
+ * 순서와 상관없이 도착하는 샤드 결과를 모아, 앞에서부터 이어진 구간의 정제 결과를 만듭니다.
+ * 정제 사전과 변경 비트는 도착할 때마다 전체 크기 누적본에 한 번만 기록하고,
+ * 미리보기용 테이블은 원본 번호 배열의 앞 구간 뷰(복사 없음)에 누적 사전의 사본을 붙여 만듭니다.
+ */
+export class ShardPrefixAssembler {
+    private results: (ShardResult | undefined)[];
+    private values: TableValue[][];
+    private changes: ChangeSet;
+    private ready = 0;  // 앞에서부터 이어서 도착한 샤드 수
+    readyRows = 0;
+
+    constructor(private data: DataTable, private shards: ShardPlan[]) {
+        this.results = new Array(shards.length);
+        this.values = data.columns.map(c => c.values.slice());
+        this.changes = createChangeSet(data.headers, data.rowCount);
+    }
+
+    /**
+     * 샤드 결과를 추가합니다.
+     * @returns 앞에서부터 이어진 구간이 늘어났으면 true
+     */
+    add(result: ShardResult): boolean {
+        this.results[result.index] = result;
+        const { sourceCodes } = this.shards[result.index];
+        result.values.forEach((sliced, col) => {
+            const codes = sourceCodes[col];
+            const target = this.values[col];
+            for (let k = 0; k < codes.length; k++) target[codes[k]] = sliced[k];
+        });
+        forEachChange(result.changes, (row, col, reason) => markChange(this.changes, result.offset + row, col, reason));
+
+        const before = this.ready;
+        while (this.ready < this.results.length && this.results[this.ready]) {
+            this.readyRows += this.results[this.ready]!.rowCount;
+            this.ready++;
+        }
+        return this.ready > before;
+    }
+
+    /**
+     * 지금까지 이어진 앞 구간의 정제 결과
+     */
+    snapshot(): PartialResult {
+        const rows = this.readyRows;
+        const head = headTable(this.data, rows);
+        const processedData = { ...head, columns: head.columns.map((c, col) => ({ values: this.values[col].slice(), codes: c.codes })) };
+
+        const done = this.results.slice(0, this.ready) as ShardResult[];
+        const changes = truncateChangeSet(this.changes, rows, done.reduce((sum, r) => sum + r.changes.emptyCells, 0));
+        changes.untracked = [];
+        for (const r of done) for (const key of r.changes.untracked) if (!changes.untracked.includes(key)) changes.untracked.push(key);
+        return { processedData, changes, readyRows: rows, totalRows: this.data.rowCount };
+    }
+}
@@ -0,0 +1,323 @@
+import { DataRow } from '@/types';
+
+/**
+ * 사전 인코딩 테이블 (Dictionary-encoded Table)
+ * 행마다 객체(키 + 값 문자열 사본)를 두는 대신, 헤더 목록은 한 번만 두고 컬럼마다
+ * 고유값 사전(values)과 행별 사전 번호(codes, 형식화 배열)로 저장합니다.
+ * 반복되는 값(지역, 상태, 날짜 등)은 사전에 한 번만 남고 행마다 1~4바이트 번호만 차지합니다.
+ *
+ * 정제 결과 컬럼은 원본 컬럼의 번호 배열을 공유하고 사전만 새로 만듭니다(copy-on-write).
+ * 번호 배열은 셀을 직접 수정할 때 해당 컬럼만 복사하므로 원본/정제본이 서로 영향을 주지 않습니다.
+ * 워커 간 전달이 가능하도록 클래스가 아닌 일반 객체 + 형식화 배열로 구성합니다. (전송 형식은 transfer.ts)
+ */
+
+// 셀 값 (undefined: 행에 해당 키가 없음)
+export type TableValue = DataRow[string] | undefined;
+export type CodeArray = Uint8Array | Uint16Array | Uint32Array;
+
+// 키가 없는 셀의 사전 번호 (모든 컬럼의 0번 값은 undefined)
+export const MISSING_CODE = 0;
+
+export interface TableColumn {
+    values: TableValue[];   // 사전: 번호 → 값 (정제 결과 사전은 같은 값이 여러 번호에 있을 수 있음)
+    codes: CodeArray;       // 행 → 사전 번호
+}
+
+export interface DataTable {
+    headers: string[];      // 모든 행의 키를 처음 등장한 순서대로 모은 목록
+    rowCount: number;
+    columns: TableColumn[]; // headers 순서
+}
+
+export const EMPTY_TABLE: DataTable = Object.freeze({ headers: [], rowCount: 0, columns: [] }) as DataTable;
+
+const INITIAL_CAPACITY = 1024;
+
+/**
+ * 사전 크기에 맞는 가장 작은 번호 배열을 만듭니다.
+ */
+function createCodeArray(dictionarySize: number, length: number): CodeArray {
+    if (dictionarySize <= 0x100) return new Uint8Array(length);
+    if (dictionarySize <= 0x10000) return new Uint16Array(length);
+    return new Uint32Array(length);
+}
+
+/**
+ * 파싱 조각을 이어 받아 테이블을 만드는 빌더
+ * 값마다 사전 번호를 Map으로 찾아 붙이며, 번호 배열은 두 배씩 늘리다가 finish에서 사전 크기에 맞게 줄입니다.
+ */
+export class TableBuilder {
+    private headers: string[] = [];
+    private columnOf = new Map<string, number>();
+    private lookups: Map<TableValue, number>[] = [];
+    private values: TableValue[][] = [];
+    private codes: Uint32Array[] = [];
+    private rows = 0;
+    private capacity = 0;
+
+    get rowCount(): number {
+        return this.rows;
+    }
+
+    private reserve(rows: number) {
+        if (rows <= this.capacity) return;
+        let capacity = Math.max(this.capacity * 2, INITIAL_CAPACITY);
+        while (capacity < rows) capacity *= 2;
+        this.codes = this.codes.map(old => {
+            const grown = new Uint32Array(capacity);
+            grown.set(old);
+            return grown;
+        });
+        this.capacity = capacity;
+    }
+
+    private addColumn(key: string): number {
+        const col = this.headers.length;
+        this.headers.push(key);
+        this.columnOf.set(key, col);
+        this.lookups.push(new Map<TableValue, number>([[undefined, MISSING_CODE]]));
+        this.values.push([undefined]);
+        // 앞선 행은 이 키가 없으므로 0번(MISSING_CODE)
+        this.codes.push(new Uint32Array(this.capacity));
+        return col;
+    }
+
+    /**
+     * 행 조각을 추가합니다. (처음 보는 키는 새 컬럼이 되며 이전 행에서는 키가 없는 셀로 기록)
+     */
+    append(rows: DataRow[]) {
+        this.reserve(this.rows + rows.length);
+        for (const row of rows) {
+            const r = this.rows++;
+            for (const key in row) {
+                let col = this.columnOf.get(key);
+                if (col === undefined) col = this.addColumn(key);
+                const value = row[key];
+                const lookup = this.lookups[col];
+                let code = lookup.get(value);
+                if (code === undefined) {
+                    code = this.values[col].length;
+                    this.values[col].push(value);
+                    lookup.set(value, code);
+                }
+                this.codes[col][r] = code;
+            }
+        }
+    }
+
+    /**
+     * 테이블을 확정합니다. (빌더는 이후 사용하지 않음)
+     */
+    finish(): DataTable {
+        const columns = this.headers.map((_, col) => {
+            const values = this.values[col];
+            const codes = createCodeArray(values.length, this.rows);
+            codes.set(this.codes[col].subarray(0, this.rows));
+            return { values, codes };
+        });
+        this.lookups = [];
+        this.codes = [];
+        return { headers: [...this.headers], rowCount: this.rows, columns };
+    }
+}
+
+/**
+ * 행 배열로 테이블을 만듭니다.
+ */
+export function tableFromRows(rows: DataRow[]): DataTable {
+    const builder = new TableBuilder();
+    builder.append(rows);
+    return builder.finish();
+}
+
+/**
+ * 헤더 이름 → 컬럼 위치 조회용 인덱스
+ */
+export function getTableColumnIndex(table: DataTable): Map<string, number> {
+    return new Map(table.headers.map((h, i) => [h, i]));
+}
+
+/**
+ * 셀 값 하나를 조회합니다. (범위 밖이면 undefined)
+ */
+export function getTableValue(table: DataTable, row: number, col: number): TableValue {
+    const column = table.columns[col];
+    if (!column || row < 0 || row >= table.rowCount) return undefined;
+    return column.values[column.codes[row]];
+}
+
+/**
+ * 앞 구간만 담은 테이블 (번호 배열은 복사하지 않고 같은 버퍼의 뷰를 사용)
+ */
+export function headTable(table: DataTable, rowCount: number): DataTable {
+    const rows = Math.max(0, Math.min(rowCount, table.rowCount));
+    if (rows === table.rowCount) return table;
+    return {
+        headers: table.headers,
+        rowCount: rows,
+        columns: table.columns.map(c => ({ values: c.values, codes: c.codes.subarray(0, rows) })),
+    };
+}
+
+/**
+ * 행 하나를 객체로 만듭니다. 키가 없는 셀은 객체에도 넣지 않습니다.
+ */
+export function getTableRow(table: DataTable, row: number): DataRow {
+    const out: DataRow = {};
+    const { headers, columns } = table;
+    for (let col = 0; col < headers.length; col++) {
+        const code = columns[col].codes[row];
+        if (code !== MISSING_CODE) out[headers[col]] = columns[col].values[code] as DataRow[string];
+    }
+    return out;
+}
+
+/**
+ * 행 구간을 객체 배열로 만듭니다. (내보내기/미리보기 샘플처럼 필요한 범위만 만들 때 사용)
+ */
+export function getTableRows(table: DataTable, start: number = 0, end: number = table.rowCount): DataRow[] {
+    const rows: DataRow[] = [];
+    for (let i = Math.max(0, start); i < Math.min(end, table.rowCount); i++) rows.push(getTableRow(table, i));
+    return rows;
+}
+
+/**
+ * 사전 번호별 등장 횟수 (사전 크기만큼만 계산하는 검사/집계용)
+ */
+export function countCodes(column: TableColumn, rowCount: number): Uint32Array {
+    const counts = new Uint32Array(column.values.length);
+    const { codes } = column;
+    for (let i = 0; i < rowCount; i++) counts[codes[i]]++;
+    return counts;
+}
+
+/**
+ * 행 구간을 잘라낸 테이블 (사전은 구간에 등장하는 값만 남김)
+ */
+export interface TableSlice {
+    table: DataTable;
+    // 컬럼별 잘라낸 사전 번호 → 원본 사전 번호
+    sourceCodes: Uint32Array[];
+}
+
+/**
+ * 행 구간을 잘라냅니다. 워커로 보내는 샤드가 전체 사전을 복사하지 않도록 구간에 등장하는 값만 사전에 남깁니다.
+ */
+export function sliceTable(table: DataTable, start: number, end: number): TableSlice {
+    const rowCount = Math.max(0, Math.min(end, table.rowCount) - start);
+    const sourceCodes: Uint32Array[] = [];
+    const columns = table.columns.map(column => {
+        const remap = new Int32Array(column.values.length).fill(-1);
+        remap[MISSING_CODE] = MISSING_CODE;
+        const source: number[] = [MISSING_CODE];
+        const values: TableValue[] = [undefined];
+        const { codes } = column;
+        for (let i = 0; i < rowCount; i++) {
+            const code = codes[start + i];
+            if (remap[code] === -1) {
+                remap[code] = values.length;
+                values.push(column.values[code]);
+                source.push(code);
+            }
+        }
+        const sliced = createCodeArray(values.length, rowCount);
+        for (let i = 0; i < rowCount; i++) sliced[i] = remap[codes[start + i]];
+        sourceCodes.push(Uint32Array.from(source));
+        return { values, codes: sliced };
+    });
+    return { table: { headers: [...table.headers], rowCount, columns }, sourceCodes };
+}
+
+/**
+ * 임의의 행들을 골라낸 테이블을 만듭니다. (표본 추출용, 사전은 골라낸 행에 등장하는 값만 남김)
+ * @param rows 원본 행 번호 (이 순서대로 담김)
+ */
+export function selectTableRows(table: DataTable, rows: ArrayLike<number>): TableSlice {
+    const sourceCodes: Uint32Array[] = [];
+    const columns = table.columns.map(column => {
+        const remap = new Map<number, number>([[MISSING_CODE, MISSING_CODE]]);
+        const source: number[] = [MISSING_CODE];
+        const values: TableValue[] = [undefined];
+        const picked = new Uint32Array(rows.length);
+        for (let i = 0; i < rows.length; i++) {
+            const code = column.codes[rows[i]];
+            let mapped = remap.get(code);
+            if (mapped === undefined) {
+                mapped = values.length;
+                remap.set(code, mapped);
+                values.push(column.values[code]);
+                source.push(code);
+            }
+            picked[i] = mapped;
+        }
+        const codes = createCodeArray(values.length, rows.length);
+        codes.set(picked);
+        sourceCodes.push(Uint32Array.from(source));
+        return { values, codes };
+    });
+    return { table: { headers: [...table.headers], rowCount: rows.length, columns }, sourceCodes };
+}
+
+/**
+ * 잘라낸 구간마다 정제한 사전(번호는 잘라낸 사전 기준)을 원본 테이블의 사전으로 되돌려 정제 결과 테이블을 만듭니다.
+ * 정제는 값마다 결정적이므로 어느 구간의 결과를 써도 같으며, 결과 컬럼은 원본 번호 배열을 공유합니다.
+ * 사전이 원본과 같은(바뀐 값이 없는) 컬럼은 원본 컬럼 객체를 그대로 공유합니다.
+ */
+export function mergeSliceValues(source: DataTable, parts: { sourceCodes: Uint32Array[]; values: TableValue[][] }[]): DataTable {
+    const columns = source.columns.map((column, col) => {
+        const values = column.values.slice();
+        for (const part of parts) {
+            const codes = part.sourceCodes[col];
+            const sliced = part.values[col];
+            for (let k = 0; k < codes.length; k++) values[codes[k]] = sliced[k];
+        }
+        const unchanged = values.every((v, i) => v === column.values[i]);
+        return unchanged ? column : { values, codes: column.codes };
+    });
+    return { headers: source.headers, rowCount: source.rowCount, columns };
+}
+
+/**
+ * 컬럼 하나의 여러 셀을 같은 값으로 바꾼 새 테이블을 반환합니다. (React 상태로 쓰므로 해당 컬럼의 번호 배열만 복사)
+ */
+export function setTableCells(table: DataTable, rows: number[], col: number, value: TableValue): DataTable {
+    const column = table.columns[col];
+    if (!column || rows.length === 0) return table;
+
+    let values = column.values;
+    let code = value === undefined ? MISSING_CODE : values.indexOf(value, MISSING_CODE + 1);
+    if (code === -1) {
+        values = [...values, value];
+        code = values.length - 1;
+    }
+
+    const codes = createCodeArray(values.length, table.rowCount);
+    codes.set(column.codes);
+    for (const row of rows) {
+        if (row >= 0 && row < table.rowCount) codes[row] = code;
+    }
+    const columns = table.columns.slice();
+    columns[col] = { values, codes };
+    return { ...table, columns };
+}
+
+/**
+ * 헤더 이름 변경을 반영합니다. (컬럼 데이터는 그대로 공유)
+ */
+export function renameTableColumn(table: DataTable, oldName: string, newName: string): DataTable {
+    return { ...table, headers: table.headers.map(h => (h === oldName ? newName : h)) };
+}
+
+/**
+ * 값이 비어 있는(trim 기준) 셀 수 (사전 번호별로 한 번만 판정)
+ */
+export function countEmptyCells(table: DataTable): number {
+    let empty = 0;
+    for (const column of table.columns) {
+        const counts = countCodes(column, table.rowCount);
+        column.values.forEach((value, code) => {
+            if (counts[code] > 0 && !String(value || '').trim()) empty += counts[code];
+        });
+    }
+    return empty;
+}
@@ -0,0 +1,211 @@
+import { CodeArray, DataTable, TableColumn } from './table';
+import { EncodedValues, decodeValues, encodeValues } from './transfer';
+
+/**
+ * 파싱 결과 캐시 (IndexedDB)
+ * 매달 같은 파일을 다시 여는 경우 XLSX 압축 해제/시트 XML 파싱이 정제보다 오래 걸리므로,
+ * 파일 내용의 SHA-256을 키로 사전 인코딩 테이블(table.ts)을 컬럼 단위로 저장해 두고 다시 열 때 파싱을 건너뜁니다.
+ * 컬럼은 워커 전송과 같은 형식(사전 = UTF-8 바이트 + 끝 위치 + 값 종류, transfer.ts)과 번호 배열 그대로 저장하므로
+ * 읽을 때는 TextDecoder 한 번과 잘라 쓰기만 합니다.
+ * 전체 크기가 MAX_CACHE_BYTES를 넘으면 가장 오래 쓰지 않은 파일부터 지웁니다.
+ */
+
+const DB_NAME = 'data-laundry-cache';
+const DB_VERSION = 1;
+const TABLE_STORE = 'tables';
+const COLUMN_STORE = 'columns';
+const CACHE_VERSION = 1;
+
+// 캐시 전체 크기 상한 / 파일 하나의 상한 (이보다 큰 파일은 저장하지 않음)
+export const MAX_CACHE_BYTES = 512 * 1024 * 1024;
+export const MAX_ENTRY_BYTES = MAX_CACHE_BYTES / 2;
+// 해시 계산 시 한 번에 읽는 크기 (파일 전체를 메모리에 올리지 않음)
+const DIGEST_BLOCK_BYTES = 8 * 1024 * 1024;
+
+interface CachedTableMeta {
+    digest: string;
+    version: number;
+    name: string;
+    headers: string[];
+    rowCount: number;
+    bytes: number;
+    lastUsed: number;
+}
+
+interface CachedColumn {
+    digest: string;
+    index: number;
+    values: EncodedValues;
+    codes: CodeArray;
+}
+
+/**
+ * 파일 내용의 SHA-256 (블록별 해시를 다시 해시한 값)
+ * WebCrypto는 나눠서 해시할 수 없으므로 DIGEST_BLOCK_BYTES씩 읽어 블록 해시를 만들고 크기와 함께 한 번 더 해시합니다.
+ * 해시를 쓸 수 없는 환경(비보안 컨텍스트 등)이면 null
+ */
+export async function fileDigest(file: Blob): Promise<string | null> {
+    const subtle = typeof crypto !== 'undefined' ? crypto.subtle : undefined;
+    if (!subtle) return null;
+    const blockCount = Math.max(1, Math.ceil(file.size / DIGEST_BLOCK_BYTES));
+    const combined = new Uint8Array(blockCount * 32 + 8);
+    for (let i = 0; i < blockCount; i++) {
+        const block = await file.slice(i * DIGEST_BLOCK_BYTES, (i + 1) * DIGEST_BLOCK_BYTES).arrayBuffer();
+        combined.set(new Uint8Array(await subtle.digest('SHA-256', block)), i * 32);
+    }
+    new DataView(combined.buffer).setFloat64(blockCount * 32, file.size);
+    const digest = new Uint8Array(await subtle.digest('SHA-256', combined));
+    return Array.from(digest, b => b.toString(16).padStart(2, '0')).join('');
+}
+
+/**
+ * 테이블을 캐시 저장 형식의 컬럼 목록으로 바꿉니다.
+ */
+export function encodeTableColumns(digest: string, table: DataTable): { columns: CachedColumn[]; bytes: number } {
+    let bytes = 0;
+    const columns = table.columns.map((column, index) => {
+        const values = encodeValues(column.values);
+        // 앞 구간 뷰(headTable 등)는 원래 배열 전체가 저장되지 않도록 필요한 부분만 복사
+        const codes = column.codes.length === table.rowCount ? column.codes : column.codes.slice(0, table.rowCount);
+        bytes += values.text.byteLength + values.ends.byteLength + values.kinds.byteLength + (values.raw?.length ?? 0) * 2 + codes.byteLength;
+        return { digest, index, values, codes };
+    });
+    return { columns, bytes };
+}
+
+/**
+ * 캐시 저장 형식을 테이블로 되돌립니다.
+ */
+export function decodeTableColumns(meta: Pick<CachedTableMeta, 'headers' | 'rowCount'>, columns: CachedColumn[]): DataTable {
+    const ordered = [...columns].sort((a, b) => a.index - b.index);
+    return {
+        headers: [...meta.headers],
+        rowCount: meta.rowCount,
+        columns: ordered.map(decodeColumn),
+    };
+}
+
+function decodeColumn(column: CachedColumn): TableColumn {
+    return { values: decodeValues(column.values), codes: column.codes };
+}
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+function openDatabase(): Promise<IDBDatabase | null> {
+    if (dbPromise) return dbPromise;
+    dbPromise = new Promise(resolve => {
+        if (typeof indexedDB === 'undefined') return resolve(null);
+        const request = indexedDB.open(DB_NAME, DB_VERSION);
+        request.onupgradeneeded = () => {
+            const db = request.result;
+            if (!db.objectStoreNames.contains(TABLE_STORE)) db.createObjectStore(TABLE_STORE, { keyPath: 'digest' });
+            if (!db.objectStoreNames.contains(COLUMN_STORE)) db.createObjectStore(COLUMN_STORE, { keyPath: ['digest', 'index'] });
+        };
+        request.onsuccess = () => resolve(request.result);
+        // 저장소를 쓸 수 없으면(시크릿 모드 등) 캐시 없이 동작
+        request.onerror = () => resolve(null);
+        request.onblocked = () => resolve(null);
+    });
+    return dbPromise;
+}
+
+function requestResult<T>(request: IDBRequest<T>): Promise<T> {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+}
+
+function digestRange(digest: string): IDBKeyRange {
+    return IDBKeyRange.bound([digest, 0], [digest, Infinity]);
+}
+
+/**
+ * 캐시된 테이블을 읽습니다. 없거나 읽을 수 없으면 null
+ * 헤더/행 수 메타데이터를 먼저 읽어 버전과 크기를 확인한 뒤, 컬럼을 하나씩 읽어 바로 디코딩하므로
+ * 저장 형식(UTF-8 사전)은 한 번에 한 컬럼만 메모리에 남습니다.
+ * 파이썬 캐시(table_cache.py)처럼 필요한 컬럼만 나중에 읽지는 않습니다. DataTable의 컬럼은 정제/이슈 검사/미리보기에서
+ * 동기적으로 읽고, 불러온 직후 이슈 검사가 모든 컬럼을 훑으므로 비동기인 IndexedDB 읽기를 미뤄도 얻는 것이 없습니다.
+ */
+export async function loadCachedTable(digest: string): Promise<DataTable | null> {
+    try {
+        const db = await openDatabase();
+        if (!db) return null;
+        const tx = db.transaction([TABLE_STORE, COLUMN_STORE], 'readwrite');
+        const meta = await requestResult(tx.objectStore(TABLE_STORE).get(digest)) as CachedTableMeta | undefined;
+        if (!meta || meta.version !== CACHE_VERSION) return null;
+        // 최근 사용 시각 갱신 (삭제 순서 기준)
+        tx.objectStore(TABLE_STORE).put({ ...meta, lastUsed: Date.now() });
+        const columnStore = tx.objectStore(COLUMN_STORE);
+        const columns: TableColumn[] = [];
+        for (let index = 0; index < meta.headers.length; index++) {
+            const column = await requestResult(columnStore.get([digest, index])) as CachedColumn | undefined;
+            if (!column) return null;
+            columns.push(decodeColumn(column));
+        }
+        await transactionDone(tx);
+        return { headers: [...meta.headers], rowCount: meta.rowCount, columns };
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * 테이블을 캐시에 저장하고, 전체 크기가 상한을 넘으면 오래 쓰지 않은 항목부터 지웁니다.
+ * 실패해도 예외를 던지지 않습니다. (캐시는 없어도 동작해야 함)
+ */
+export async function saveCachedTable(digest: string, name: string, table: DataTable): Promise<boolean> {
+    try {
+        const db = await openDatabase();
+        if (!db) return false;
+        const { columns, bytes } = encodeTableColumns(digest, table);
+        if (bytes > MAX_ENTRY_BYTES) return false;
+
+        const tx = db.transaction([TABLE_STORE, COLUMN_STORE], 'readwrite');
+        const tables = tx.objectStore(TABLE_STORE);
+        const columnStore = tx.objectStore(COLUMN_STORE);
+        columnStore.delete(digestRange(digest));
+        for (const column of columns) columnStore.put(column);
+        const meta: CachedTableMeta = { digest, version: CACHE_VERSION, name, headers: table.headers, rowCount: table.rowCount, bytes, lastUsed: Date.now() };
+        tables.put(meta);
+
+        // 크기 상한 초과분을 오래된 순서로 삭제 (방금 저장한 항목은 제외)
+        const entries = (await requestResult(tables.getAll()) as CachedTableMeta[]).sort((a, b) => a.lastUsed - b.lastUsed);
+        let total = entries.reduce((sum, e) => sum + e.bytes, 0);
+        for (const entry of entries) {
+            if (total <= MAX_CACHE_BYTES) break;
+            if (entry.digest === digest) continue;
+            tables.delete(entry.digest);
+            columnStore.delete(digestRange(entry.digest));
+            total -= entry.bytes;
+        }
+        await transactionDone(tx);
+        return true;
+    } catch {
+        return false;
+    }
+}
+
+/**
+ * 캐시를 모두 지웁니다.
+ */
+export async function clearTableCache(): Promise<void> {
+    try {
+        const db = await openDatabase();
+        if (!db) return;
+        const tx = db.transaction([TABLE_STORE, COLUMN_STORE], 'readwrite');
+        tx.objectStore(TABLE_STORE).clear();
+        tx.objectStore(COLUMN_STORE).clear();
+        await transactionDone(tx);
+    } catch {
+        // 지우지 못한 항목은 다음 저장 때 크기 상한으로 정리됨
+    }
+}
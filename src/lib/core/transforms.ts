@@ -0,0 +1,612 @@
+import { normalizeDate, normalizeDateTime, parseKoreanAmount, GARBAGE_REGEX, COMPANY_SUFFIX_REGEX } from './utils';
+import { ProcessingOptions } from '@/types';
+import { PromptAnalysis, NullFilling } from './nlp';
+import { ValueMemo } from './memo';
+
+/**
+ * 컬럼별 변환(Transform) 빌더
+ * 컬럼명/옵션/프롬프트만으로 결정되는 조건은 컴파일 시점에 한 번만 평가하고,
+ * 값에 따라 달라지는 로직만 함수로 남겨 컬럼별 변환 목록을 만듭니다.
+ * 규칙 적용 순서는 기존 processDataLocal의 셀 루프와 동일합니다.
+ */
+
+export interface ColumnTransform {
+    name: string;                 // 단계 이름 (통계/디버깅용)
+    fn: (val: string) => string;
+    memo?: ValueMemo;             // 고유값 메모 (비용이 큰 단계만, 적중률 통계용)
+    params?: readonly unknown[];  // fn이 참조하는 컴파일 시점 값 (이름 + params가 같으면 같은 변환, 증분 재정제용)
+}
+
+const EMOJI_PATTERN = /([\u2700-\u27BF]|[\uE000-\uF8FF]|\uD83C[\uDC00-\uDFFF]|\uD83D[\uDC00-\uDFFF]|[\u2011-\u26FF]|\uD83E[\uDD10-\uDDFF])/g;
+const HTML_TAG_PATTERN = /<[^>]*>?/gm;
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+const DATE_COL_PATTERN = /날짜|일시|일자|date|time/;
+const EMAIL_COL_PATTERN = /email|이메일/;
+const ADDRESS_COL_PATTERN = /주소|address/;
+const PHONE_SEOUL_REGEX = /^(\d{2})(\d{3,4})(\d{4})$/;
+const PHONE_AREA_REGEX = /^(\d{3})(\d{3,4})(\d{4})$/;
+
+// [Refactoring] Helper to check if a column should be processed based on targets
+export function isTargetColumn(key: string, specificTarget: string | null, allPotentialTargets: string[]): boolean {
+    const lowerKey = key.toLowerCase();
+    if (specificTarget && (lowerKey.includes(specificTarget) || specificTarget.includes(lowerKey))) return true;
+    if (allPotentialTargets.some(t => lowerKey.includes(t))) return true;
+    if (!specificTarget && allPotentialTargets.length === 0) return true;
+    return false;
+}
+
+/**
+ * 헬퍼: 금액 컬럼 패턴 확인
+ */
+export function isAmountColPattern(key: string): boolean {
+    return /금액|가격|비용|매출|입금|출금|잔액|price|amount|cost|balance|fee/.test(key);
+}
+
+/**
+ * 헬퍼: 타겟이 없거나 컬럼명과 부분 일치하는지 확인 (패딩/접두사/접미사/대소문자)
+ */
+function matchesTarget(lowerKey: string, target: string | null): boolean {
+    return !target || lowerKey.includes(target) || target.includes(lowerKey);
+}
+
+/**
+ * 헬퍼: 치환 매핑 존재 여부 (값이 'constructor' 등일 때 Object 프로토타입 속성을 매핑으로 오인하지 않도록 자체 키만 확인)
+ */
+function hasMapping(mappings: Record<string, string>, key: string): boolean {
+    return Object.prototype.hasOwnProperty.call(mappings, key);
+}
+
+/**
+ * 컬럼에 해당하는 결측치 채우기 규칙 (원본 키 기준 부분 일치)
+ */
+export function findNullFilling(key: string, nlp: PromptAnalysis): NullFilling | undefined {
+    return nlp.nullFillings.find(c => key.includes(c.column) || c.column.includes(key));
+}
+
+/**
+ * 한 컬럼에 적용할 정제 단계를 원래 규칙 순서대로 컴파일합니다.
+ * 목록에 포함된 단계만 셀마다 실행하면 기존 processDataLocal과 같은 결과가 나옵니다.
+ * 잠금 컬럼과 원본 값이 없는(null/undefined) 셀의 결측치 채우기는 호출측(plan.ts) 책임입니다.
+ */
+export function compileColumnTransforms(
+    key: string,
+    nlp: PromptAnalysis,
+    options: ProcessingOptions,
+    colOption?: string | null
+): ColumnTransform[] {
+    const steps: ColumnTransform[] = [];
+    // params: 함수가 클로저로 참조하는 값 (같은 이름의 단계라도 값이 다르면 다른 변환으로 취급)
+    const add = (name: string, fn: (val: string) => string, params?: unknown[]) => { steps.push({ name, fn, params }); };
+    // 비용이 큰 정규화 단계는 고유값마다 한 번만 계산 (memo.ts)
+    const addMemo = (name: string, fn: (val: string) => string, params?: unknown[]) => {
+        const memo = new ValueMemo(key, name, fn);
+        steps.push({ name, fn: memo.apply, memo, params });
+    };
+
+    const lowerKey = key.toLowerCase();
+    const targets = nlp.allPotentialTargets;
+    const { mappings } = nlp;
+
+    // [NEW] 0단계: 컬럼 전체 일괄 치환 (Column-based Replacement) [Rule 0]
+    if (hasMapping(mappings, lowerKey)) {
+        const mapped = mappings[lowerKey];
+        add('columnMapping', () => mapped, [mapped]);
+    }
+
+    // [NEW] 0.5단계: 조건부 로직 적용 (Numeric Condition)
+    const numCond = nlp.numericConditions.find(c => lowerKey.includes(c.column) || c.column.includes(lowerKey));
+    if (numCond) {
+        add('numericCondition', val => {
+            // Try parse current value as number (remove all non-numeric chars except dot and minus)
+            const cleanNumStr = val.replace(/[^0-9.-]/g, '');
+            const currentNum = parseFloat(cleanNumStr);
+            if (isNaN(currentNum) || cleanNumStr === '') return val;
+
+            let match = false;
+            switch (numCond.operator) {
+                case 'ge': match = currentNum >= numCond.value; break;
+                case 'le': match = currentNum <= numCond.value; break;
+                case 'gt': match = currentNum > numCond.value; break;
+                case 'lt': match = currentNum < numCond.value; break;
+                case 'eq': match = currentNum === numCond.value; break;
+            }
+            return match ? numCond.targetValue : val;
+        }, [numCond.operator, numCond.value, numCond.targetValue]);
+    }
+
+    // [NEW] 0.6단계: 결측치 채우기 (Null Filling)
+    const nullFill = findNullFilling(key, nlp);
+    if (nullFill) {
+        add('nullFill', val => {
+            const lowerVal = val.toLowerCase().trim();
+            return (val === "" || lowerVal === "null" || lowerVal === "undefined") ? nullFill.fillValue : val;
+        }, [nullFill.fillValue]);
+    }
+
+    // -----------------------------------------------------------------
+    // 1단계: 전역 체크박스 옵션 (Checkbox Options) [Rule 3]
+    // -----------------------------------------------------------------
+    // [Fix] autoDetect가 켜져있을 때만 컬럼명 추론 동작
+    const isPhoneCol = options.autoDetect && /연락처|전화|phone|mobile|tel/.test(lowerKey);
+    if (options.formatMobile || options.formatGeneralPhone || isPhoneCol) {
+        if (nlp.wantsHyphenRemoval) {
+            add('phone', val => val.replace(/[-.\s]/g, ''), ['hyphenRemoval']);
+        } else {
+            const allowMobile = options.formatMobile || isPhoneCol;
+            add('phone', val => {
+                let onlyDigits = val.replace(/\D/g, '');
+                if (onlyDigits.startsWith('82')) onlyDigits = '0' + onlyDigits.substring(2);
+                if (onlyDigits.startsWith('01') && allowMobile) {
+                    if (onlyDigits.length >= 10 && onlyDigits.length <= 11) {
+                        return onlyDigits.replace(/^(01[016789])(\d{3,4})(\d{4})$/, "$1-$2-$3");
+                    }
+                } else if (onlyDigits.startsWith('0') && options.formatGeneralPhone) {
+                    const regex = onlyDigits.startsWith('02') ? /^(\d{2})(\d{3,4})(\d{4})$/ : /^(\d{3})(\d{3,4})(\d{4})$/;
+                    if (regex.test(onlyDigits)) return onlyDigits.replace(regex, "$1-$2-$3");
+                }
+                return val;
+            }, [!!allowMobile, !!options.formatGeneralPhone]);
+        }
+    }
+
+    if (options.removeWhitespace || nlp.wantsWhitespace) {
+        add('whitespace', val => val.replace(/\s+/g, ' ').trim());
+    }
+
+    const isDateCol = options.autoDetect && DATE_COL_PATTERN.test(lowerKey);
+    // nlp 지정 포맷이 없는 경우에만 기본 포맷 적용 (Rule 5)
+    if ((options.formatDate || options.formatDateTime || isDateCol) && nlp.dateSeparator === null) {
+        if (options.formatDateTime) addMemo('date', val => normalizeDateTime(val) || val, ['dateTime']);
+        else addMemo('date', val => normalizeDate(val) || val, ['date']);
+    }
+
+    if (options.formatNumber || options.cleanAmount || (options.autoDetect && isAmountColPattern(lowerKey))) {
+        if (nlp.wantsCommaRemoval) {
+            add('amount', val => val.replace(/,/g, ''), ['commaRemoval']);
+        } else {
+            addMemo('amount', val => {
+                if (/[만천백]/.test(val)) {
+                    const parsed = parseKoreanAmount(val);
+                    return parsed > 0 ? parsed.toLocaleString('en-US') : val;
+                }
+                const cleanVal = val.replace(/,/g, '');
+                if (/^[0-9.-]+$/.test(cleanVal)) {
+                    const num = parseFloat(cleanVal);
+                    if (!isNaN(num)) return num.toLocaleString('en-US');
+                }
+                return val;
+            }, ['format']);
+        }
+    }
+
+    if (options.autoDetect && EMAIL_COL_PATTERN.test(lowerKey)) {
+        if (options.cleanEmail) add('email', val => (val && !EMAIL_PATTERN.test(val)) ? '' : val, ['clean']);
+        else add('email', val => (val.includes('@') && !EMAIL_PATTERN.test(val)) ? '' : val, ['invalidOnly']);
+    }
+
+    if (options.formatZip || (options.autoDetect && (lowerKey.includes('zip') || lowerKey.includes('우편')))) {
+        add('zip', val => {
+            let digits = val.replace(/\D/g, '');
+            if (digits.length > 5 && !val.includes('-')) digits = digits.substring(0, 5);
+            return (digits.length > 0 && digits.length <= 6) ? digits.padStart(5, '0') : val;
+        });
+    }
+
+    if (options.formatBizNum || (options.autoDetect && lowerKey.includes('사업자'))) {
+        add('bizNum', val => {
+            const digits = val.replace(/\D/g, '');
+            return digits.length === 10 ? digits.replace(/(\d{3})(\d{2})(\d{5})/, '$1-$2-$3') : val;
+        });
+    }
+
+    if (options.formatCorpNum || (options.autoDetect && lowerKey.includes('법인'))) {
+        add('corpNum', val => {
+            const digits = val.replace(/\D/g, '');
+            return digits.length === 13 ? digits.replace(/(\d{6})(\d{7})/, '$1-$2') : val;
+        });
+    }
+
+    if (options.formatUrl || (options.autoDetect && lowerKey.includes('url'))) {
+        add('url', val => (val && !val.startsWith('http') && val.includes('.')) ? 'https://' + val : val);
+    }
+
+    if (!nlp.wantsUnmask && (options.maskPersonalData || (options.autoDetect && lowerKey.includes('주민번호')))) {
+        add('rrnMask', val => /\d{6}[-.]?[1-4]\d{6}/.test(val) ? val.replace(/(\d{6})[-.]?([1-4])\d{6}/, '$1-$2******') : val);
+    }
+
+    if (options.cleanGarbage || nlp.wantsGarbage) {
+        add('garbage', val => GARBAGE_REGEX.test(val) ? '' : val);
+    }
+
+    // [NEW] Global Checkbox Options: HTML, Emoji, Case
+    if (options.removeHtml) add('html', val => val.replace(HTML_TAG_PATTERN, ''));
+    if (options.removeEmoji) add('emoji', val => val.replace(EMOJI_PATTERN, ''));
+    if (options.toUpperCase) add('upperCase', val => val.toUpperCase());
+    if (options.toLowerCase) add('lowerCase', val => val.toLowerCase());
+
+    // -----------------------------------------------------------------
+    // 2단계: 자연어 처리 (NLP Smart) [Rule 4]
+    // -----------------------------------------------------------------
+    if (nlp.wantsNoSpecial) add('nlpNoSpecial', val => val.replace(/[^\w\s가-힣]/g, ''));
+    if (nlp.wantsNoBrackets && isTargetColumn(key, nlp.targetNoBrackets, targets)) {
+        addMemo('nlpNoBrackets', val => val.replace(/\(.*?\)|\[.*?\]|\{.*?\}/g, '').trim());
+    }
+    if (nlp.wantsOnlyDigits) add('nlpOnlyDigits', val => val.replace(/\D/g, ''));
+    else if (nlp.wantsOnlyKorean) add('nlpOnlyKorean', val => val.replace(/[^가-힣\s]/g, ''));
+    else if (nlp.wantsOnlyEnglish) add('nlpOnlyEnglish', val => val.replace(/[^a-zA-Z\s]/g, ''));
+
+    if (nlp.wantsNoHtml && isTargetColumn(key, nlp.targetNoHtml, targets)) {
+        add('nlpNoHtml', val => val.replace(HTML_TAG_PATTERN, ''));
+    }
+    if (nlp.wantsNoEmoji && isTargetColumn(key, nlp.targetNoEmoji, targets)) {
+        add('nlpNoEmoji', val => val.replace(EMOJI_PATTERN, ''));
+    }
+
+    if (nlp.paddingLen > 0 && matchesTarget(lowerKey, nlp.paddingTarget)) {
+        const width = nlp.paddingLen;
+        add('nlpPadding', val => /^\d+$/.test(val) ? val.padStart(width, '0') : val, [width]);
+    }
+
+    // [Modified] Prefix/Suffix with target checking handled by pre-extracted targets
+    const { prefixValue, suffixValue } = nlp;
+    if (prefixValue !== null && matchesTarget(lowerKey, nlp.prefixTarget)) {
+        add('nlpPrefix', val => prefixValue + val, [prefixValue]);
+    }
+    if (suffixValue !== null && matchesTarget(lowerKey, nlp.suffixTarget)) {
+        add('nlpSuffix', val => val + suffixValue, [suffixValue]);
+    }
+
+    // [Modified] Upper/Lower moved to END to apply to final result (e.g. after suffix)
+    if (nlp.wantsLower && matchesTarget(lowerKey, nlp.lowerTarget)) add('nlpLower', val => val.toLowerCase());
+    if (nlp.wantsUpper && matchesTarget(lowerKey, nlp.upperTarget)) add('nlpUpper', val => val.toUpperCase());
+
+    if (/주소|지역|address/.test(lowerKey)) {
+        if (nlp.wantsSido) {
+            addMemo('nlpSido', val => {
+                const match = val.match(/^([가-힣]+[시도])/);
+                return match ? match[1] : val.split(' ')[0];
+            });
+        } else if (nlp.wantsGungu) {
+            addMemo('nlpGungu', val => {
+                const parts = val.split(' ');
+                return parts.length >= 2 ? parts[1] : val;
+            });
+        } else if (options.extractDong || nlp.wantsDongExtraction) {
+            addMemo('dong', val => {
+                const match = val.match(/([가-힣0-9]+[동읍면])/);
+                return match ? match[1] : val;
+            });
+        }
+    }
+
+    // 이메일 컬럼이 아니더라도 '@'가 있으면 도메인만 남김 ('@'가 없으면 값 유지)
+    if (nlp.wantsDomain) {
+        add('nlpDomain', val => val.includes('@') ? (val.split('@')[1] || val) : val);
+    }
+
+    // 업체명 정리 [Rule 5]
+    const isCompanyCol = lowerKey.includes('업체') || lowerKey.includes('회사') || lowerKey.includes('상호') || lowerKey.includes('name');
+    const isTargetCompany = isCompanyCol || isTargetColumn(key, nlp.targetCompanyClean, targets);
+    if ((options.cleanCompanyName || nlp.wantsCompanyClean) && isTargetCompany) {
+        addMemo('company', val => val.replace(COMPANY_SUFFIX_REGEX, '').trim());
+    }
+
+    // 직함 제거
+    const isPositionCol = lowerKey.includes('이름') || lowerKey.includes('성함') || lowerKey.includes('담당') || lowerKey.includes('name');
+    const isTargetPosition = isPositionCol || isTargetColumn(key, nlp.targetPositionRemoval, targets);
+    if ((options.removePosition || nlp.wantsPositionRemoval) && isTargetPosition) {
+        addMemo('position', val => val.replace(/\s?(?:대표이사|전무이사|상무이사|부사장|대리|과장|차장|부장|팀장|본부장|실장|사장|대표|이사|전무|상무|위원|교수|의사|간호사|연구원|매니저|책임|선임|수석|주임|사원)$/, '').trim());
+    }
+
+    // 계좌/카드 마스킹
+    if (options.maskAccount || options.maskCard || nlp.wantsMasking) {
+        // [Fix] NLP 요청(wantsMasking)이 있거나 AutoDetect가 켜져있을 때만 이름 기반 동작
+        const isAccountCol = lowerKey.includes('계좌') || lowerKey.includes('account');
+        const isCardCol = lowerKey.includes('카드') || lowerKey.includes('card');
+        const isAccount = options.maskAccount || (isAccountCol && (options.autoDetect || nlp.wantsMasking));
+        const isCard = options.maskCard || (isCardCol && (options.autoDetect || nlp.wantsMasking));
+        const maskMiddle = nlp.wantsMaskMiddle;
+
+        add('accountCardMask', val => {
+            if (!(isAccount || isCard || /^[0-9-]{12,}$/.test(val.replace(/\s/g, '')))) return val;
+            // [Fix] 다시 롤백: 너무 짧거나 형식이 아닌 데이터는 마스킹하지 않음 (이슈로 보고됨)
+            if (val.replace(/[-\s]/g, '').length < 10) return val;
+            if (maskMiddle) return val.length > 8 ? val.substring(0, 4) + "****" + val.substring(8) : val;
+            return val.substring(0, val.length - 4) + "****";
+        }, [!!isAccount, !!isCard, maskMiddle]);
+    }
+
+    // [NEW] 성함 마스킹
+    if (options.maskName || nlp.wantsNameMask) {
+        const isNameCol = /이름|성함|name/.test(lowerKey);
+        add('nameMask', val => {
+            if (!isNameCol && !(val.length >= 2 && val.length <= 4 && /^[가-힣]+$/.test(val))) return val;
+            if (val.length === 2) return val[0] + '*';
+            if (val.length === 3) return val[0] + '*' + val[2];
+            if (val.length > 3) return val[0] + '**' + val[val.length - 1];
+            return val;
+        }, [isNameCol]);
+    }
+
+    // [NEW] 이메일 마스킹
+    if (options.maskEmail || nlp.wantsEmailMask) {
+        add('emailMask', val => {
+            if (!val.includes('@')) return val;
+            const [id, domain] = val.split('@');
+            if (id.length <= 3) return id[0] + '***@' + domain;
+            return id.substring(0, 3) + '****@' + domain;
+        });
+    }
+
+    // [NEW] 상세 주소 마스킹
+    if ((options.maskAddress || nlp.wantsAddressMask) && ADDRESS_COL_PATTERN.test(lowerKey)) {
+        // 번지수, 동호수 패턴 대략적 마스킹 (숫자+하이픈 조합 가림)
+        add('addressMask', val => val.replace(/\d+-\d+/g, '****').replace(/\d+동\s?\d+호/g, '****호').replace(/\d+번길\s?\d+/g, '$1 ****'));
+    }
+
+    // [NEW] 연락처 중간자리 마스킹
+    if (options.maskPhoneMid) {
+        add('phoneMidMask', val => {
+            if (!val.includes('-')) return val;
+            const parts = val.split('-');
+            return parts.length === 3 ? `${parts[0]}-****-${parts[2]}` : val;
+        });
+    }
+
+    // [NEW] 나이 범주화
+    if (options.categoryAge || nlp.wantsAgeCategory) {
+        const isAgeCol = /나이|연령|age/.test(lowerKey);
+        add('ageCategory', val => {
+            if (!isAgeCol && !/^\d{1,2}$/.test(val)) return val;
+            const ageNum = parseInt(val.replace(/\D/g, ''));
+            return !isNaN(ageNum) ? `${Math.floor(ageNum / 10) * 10}대` : val;
+        }, [isAgeCol]);
+    }
+
+    // [NEW] 날짜 절삭 (연/월)
+    if (options.truncateDate || nlp.wantsTruncateDate) {
+        const sep = nlp.nlpDateSeparator || '.';
+        add('truncateDate', val => {
+            const dateDigits = val.replace(/\D/g, '');
+            return dateDigits.length >= 6 ? `${dateDigits.substring(0, 4)}${sep}${dateDigits.substring(4, 6)}` : val;
+        }, [sep]);
+    }
+
+    // [NEW] 엑셀 지수 표기 복원
+    if (options.restoreExponential || nlp.wantsExponential) {
+        add('exponential', val => {
+            if (!(val.includes('E+') || val.includes('e+'))) return val;
+            const num = Number(val);
+            return !isNaN(num) ? num.toLocaleString('fullwide', { useGrouping: false }) : val;
+        });
+    }
+
+    // [NEW] 주소 내 건물명 추출
+    if ((options.extractBuilding || nlp.wantsBuilding) && ADDRESS_COL_PATTERN.test(lowerKey)) {
+        add('building', val => {
+            const bMatch = val.match(/([가-힣0-9A-Za-z]+(?:아파트|빌딩|타워|상가|오피스텔|빌라|하우스|팰리스|캐슬|맨션))/);
+            return bMatch ? bMatch[1] : val;
+        });
+    }
+
+    // [NEW] SKU/모델명 표준화
+    if ((options.normalizeSKU || nlp.wantsSku) && /sku|모델|코드|model/.test(lowerKey)) {
+        add('sku', val => val.toUpperCase().replace(/[-_\s]/g, ''));
+    }
+
+    // [NEW] 단위 수치화
+    if (options.unifyUnit || nlp.wantsUnit) {
+        add('unit', val => /^[0-9.]+\s*(?:kg|g|t|m|cm|mm|평|m2|호|인분|개|p|set|세트)$/i.test(val) ? val.replace(/[^0-9.]/g, '') : val);
+    }
+
+    // [NEW] 통화 표준화
+    if (options.standardizeCurrency || nlp.wantsCurrency) {
+        add('currency', val => /[$\u00A3\u20AC\u00A5\u20A9]/.test(val) ? val.replace(/[$\u00A3\u20AC\u00A5\u20A9,\s]/g, '') : val);
+    }
+
+    // A->B 치환 및 패턴 매핑 적용
+    if (Object.keys(mappings).length > 0) {
+        add('valueMapping', val => {
+            const lowerVal = val.toString().toLowerCase();
+            return hasMapping(mappings, lowerVal) ? mappings[lowerVal] : val;
+        }, [mappings]);
+    }
+
+    // 패턴 매핑 (Regex Replace) - [Fix] 전체 치환이 아닌 해당 부분만 치환
+    for (const pm of nlp.patternMappings) {
+        add('patternMapping', val => pm.pattern.replace(val.toString(), pm.replacement), [pm.pattern.source, pm.pattern.flags, pm.replacement]);
+    }
+
+    // 자연어 날짜 포맷 강제 적용 (Rule 5)
+    // [Fix] 전체 컬럼 적용 방지: 날짜 관련 컬럼일 때만 수행
+    const sep = nlp.dateSeparator;
+    if (sep !== null && DATE_COL_PATTERN.test(lowerKey)) {
+        const emptyOnError = nlp.wantsEmptyOnError;
+        addMemo('nlpDate', val => {
+            // 24/01/02 같은 YY 형식이나 시간 포함 데이터도 처리하기 위해 정규화 먼저 시도
+            let standardDate = normalizeDate(val);
+            // normalizeDate가 실패했다면, YY/MM/DD 패턴에 '20'을 붙여서 재시도
+            if (!standardDate && /^\d{2}[-./]\d{2}[-./]\d{2}/.test(val)) {
+                standardDate = normalizeDate("20" + val);
+            }
+            if (standardDate) return standardDate.replace(/-/g, sep);
+
+            // Fallback: 8자리 숫자
+            const digits = val.replace(/\D/g, '');
+            if (digits.length === 8) {
+                return `${digits.substring(0, 4)}${sep}${digits.substring(4, 6)}${sep}${digits.substring(6, 8)}`;
+            }
+            // [Fix] 오류 시 빈칸 처리 (날짜/일시 컬럼인 경우에만 한정)
+            return emptyOnError ? "" : val;
+        }, [sep, emptyOnError]);
+    }
+
+    // -----------------------------------------------------------------
+    // 3단계: 개별 컬럼 지정 옵션 (Column Option) [Rule 2]
+    // 가장 마지막에 수행되어 전역/자연어 결과를 최종 확고히 함.
+    // 단, 자연어에서 정한 날짜 구분자가 있다면 이를 존중함 (Rule 5)
+    // -----------------------------------------------------------------
+    if (colOption) {
+        addMemo(`columnOption:${colOption}`, val => applySingleColumnOption(val, colOption, sep), [sep]);
+    }
+
+    return steps;
+}
+
+/**
+ * 단일 값에 대해 컬럼 옵션을 적용하는 함수
+ */
+export function applySingleColumnOption(val: string, option: string, nlpSep: string | null): string {
+    if (!val) return val;
+    val = val.trim();
+
+    switch (option) {
+        case 'date':
+            if (nlpSep !== null) {
+                const digits = val.replace(/\D/g, '');
+                if (digits.length === 8) return `${digits.substring(0, 4)}${nlpSep}${digits.substring(4, 6)}${nlpSep}${digits.substring(6, 8)}`;
+                if (/^\d{4}[-./]\d{2}[-./]\d{2}/.test(val)) return val.substring(0, 10).replace(/[-./]/g, nlpSep);
+            }
+            return normalizeDate(val) || val;
+        case 'datetime':
+            return normalizeDateTime(val) || val;
+        case 'mobile':
+            const mDigits = val.replace(/\D/g, '');
+            if (mDigits.length >= 10 && mDigits.length <= 11 && mDigits.startsWith('01')) {
+                return mDigits.replace(/^(01[016789])(\d{3,4})(\d{4})$/, "$1-$2-$3");
+            }
+            return val;
+        case 'phone':
+            const pDigits = val.replace(/\D/g, '');
+            if (pDigits.startsWith('0') && pDigits.length >= 9 && pDigits.length <= 11) {
+                const regex = pDigits.startsWith('02') ? PHONE_SEOUL_REGEX : PHONE_AREA_REGEX;
+                if (regex.test(pDigits)) return pDigits.replace(regex, "$1-$2-$3");
+            }
+            return val;
+        case 'rrn':
+            if (/\d{6}[-.]?[1-4]\d{6}/.test(val)) return val.replace(/(\d{6})[-.]?([1-4])\d{6}/, '$1-$2******');
+            return val;
+        case 'amount':
+            const num = parseFloat(val.replace(/[^0-9.-]/g, ''));
+            return isNaN(num) ? val : num.toLocaleString('en-US');
+        case 'amountKrn':
+            const pAmount = parseKoreanAmount(val);
+            return pAmount > 0 ? pAmount.toLocaleString('en-US') : val;
+        case 'bizNum':
+            const bDigits = val.replace(/\D/g, '');
+            return bDigits.length === 10 ? bDigits.replace(/(\d{3})(\d{2})(\d{5})/, '$1-$2-$3') : val;
+        case 'corpNum':
+            const cDigits = val.replace(/\D/g, '');
+            return cDigits.length === 13 ? cDigits.replace(/(\d{6})(\d{7})/, '$1-$2') : val;
+        case 'zip':
+            let zDigits = val.replace(/\D/g, '');
+            if (zDigits.length > 5 && !val.includes('-')) zDigits = zDigits.substring(0, 5);
+            return zDigits.length > 0 && zDigits.length <= 6 ? zDigits.padStart(5, '0') : val;
+        case 'url':
+            return (!val.startsWith('http') && val.includes('.')) ? 'https://' + val : val;
+        case 'area':
+            return val.replace(/[^0-9.]/g, '');
+        case 'snsId':
+            let id = val.split('?')[0];
+            if (id.includes('/')) {
+                const parts = id.split('/');
+                id = parts[parts.length - 1] || parts[parts.length - 2];
+            }
+            return id.replace('@', '');
+        case 'hashtag':
+            return val.split(/[,,\s]+/).filter(Boolean).map(t => '#' + t.replace(/#/g, '')).join(' ');
+        case 'trackingNum':
+            // [Fix] 엑셀 지수 표기(1.23E+11)가 포함된 경우 먼저 숫자로 복원
+            if (val.includes('E+') || val.includes('e+')) {
+                const num = Number(val);
+                if (!isNaN(num)) val = num.toLocaleString('fullwide', { useGrouping: false });
+            }
+            const tDigits = val.replace(/\D/g, '');
+            // 5자리 이하는 운송장번호가 아닐 확률이 높으므로 원본 유지 (혹은 정책에 따라 변경)
+            return tDigits.length > 5 ? tDigits : val;
+        case 'orderId':
+            return val.replace(/[^a-zA-Z0-9]/g, '');
+        case 'companyClean':
+            return val.replace(COMPANY_SUFFIX_REGEX, '').trim();
+        case 'positionRemove':
+            return val.replace(/\s?(?:대리|과장|차장|부장|팀장|본부장|실장|사장|대표|이사|전무|상무|위원|교수|의사|간호사|연구원)$/, '').trim();
+        case 'dongExtract':
+            const dMatch = val.match(/([가-힣0-9]+[동읍면])/);
+            return dMatch ? dMatch[1] : val;
+        case 'accountMask':
+            // 계좌번호: 10자리 이상이면 마스킹
+            const accVal = val.replace(/[-\s]/g, '');
+            if (accVal.length >= 10) return val.substring(0, val.length - 4) + "****";
+            return val;
+        case 'cardMask':
+            // [NEW] 이미 중간이 마스킹(*)되어 있고 뒷자리가 숫자로 살아있다면 추가 마스킹 건너뛰기
+            if (val.includes('*') && /\d{3,4}$/.test(val)) return val;
+
+            const caVal = val.replace(/[-\s]/g, '');
+            // [Fix] 카드번호 유효 범위: 10자리 ~ 19자리 (20자리 이상은 송장번호 등으로 간주하여 제외)
+            if (caVal.length >= 10 && caVal.length <= 19) {
+                return val.substring(0, val.length - 4) + "****";
+            }
+            return val;
+        case 'nameMask':
+            if (val.length === 2) return val[0] + '*';
+            if (val.length === 3) return val[0] + '*' + val[2];
+            if (val.length > 3) return val[0] + '**' + val[val.length - 1];
+            return val;
+        case 'emailMask':
+            if (val.includes('@')) {
+                const [id, domain] = val.split('@');
+                const maskedId = id.length <= 3 ? id[0] + '***' : id.substring(0, 3) + '****';
+                return maskedId + '@' + domain;
+            }
+            return val;
+        case 'addressMask':
+            return val.replace(/\d+-\d+/g, '****').replace(/\d+동\s?\d+호/g, '****호').replace(/\d+번길\s?\d+/g, '$1 ****');
+        case 'phoneMidMask':
+            if (val.includes('-')) {
+                const parts = val.split('-');
+                if (parts.length === 3) return `${parts[0]}-****-${parts[2]}`;
+            }
+            return val;
+        case 'ageCategory':
+            const ageNum = parseInt(val.replace(/\D/g, ''));
+            return !isNaN(ageNum) ? `${Math.floor(ageNum / 10) * 10}대` : val;
+        case 'dateTruncate':
+            const dateDigits = val.replace(/\D/g, '');
+            if (dateDigits.length >= 6) return `${dateDigits.substring(0, 4)}${nlpSep || '.'}${dateDigits.substring(4, 6)}`;
+            return val;
+        case 'exponentialRestore':
+            if (val.includes('E+') || val.includes('e+')) {
+                const num = Number(val);
+                return !isNaN(num) ? num.toLocaleString('fullwide', { useGrouping: false }) : val;
+            }
+            return val;
+        case 'buildingExtract':
+            const bMatch = val.match(/([가-힣0-9A-Za-z]+(?:아파트|빌딩|타워|상가|오피스텔|빌라|하우스|팰리스|캐슬|맨션))/);
+            return bMatch ? bMatch[1] : val;
+        case 'skuNormalize':
+            return val.toUpperCase().replace(/[-_\s]/g, '');
+        case 'unitUnify':
+            return val.replace(/[^0-9.]/g, '');
+        case 'currencyStandardize':
+            return val.replace(/[$\u00A3\u20AC\u00A5\u20A9,\s]/g, '');
+        case 'trim':
+            return val.replace(/\s+/g, ' ').trim();
+        case 'garbage':
+            return GARBAGE_REGEX.test(val) ? '' : val;
+        case 'nameClean':
+            return val.replace(/[0-9!@#$%^&*()_+={}\[\]|\\;:'",<>?/~`]/g, '').trim();
+        case 'emailClean':
+            return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(val) ? val : '';
+        case 'htmlRemove':
+            return val.replace(/<[^>]*>?/gm, '');
+        case 'emojiRemove':
+            return val.replace(/([\u2700-\u27BF]|[\uE000-\uF8FF]|\uD83C[\uDC00-\uDFFF]|\uD83D[\uDC00-\uDFFF]|[\u2011-\u26FF]|\uD83E[\uDD10-\uDDFF])/g, '');
+        case 'upperCase':
+            return val.toUpperCase();
+        case 'lowerCase':
+            return val.toLowerCase();
+        default:
+            return val;
+    }
+}
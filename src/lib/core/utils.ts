@@ -129,3 +129,8 @@ export function normalizeDateTime(val: string): string | null {
  * 가비지(깨진 문자, 무의미한 데이터) 탐지를 위한 정규식
  */
 export const GARBAGE_REGEX = /Ã|ï¿½|&nbsp;|unknown|N\/A|NaN|undefined|null|[ëìí][\u0080-\u00BF]|ðŸ|[\u1F60-\u1F64][\u0080-\u00BF]|^None$|^X$|^---$|^[!@#$%^&*(),.?":{}|<>+=-]+$/i;
+
+/**
+ * 업체명 법인 형태 표기((주), 주식회사 등) 탐지를 위한 정규식 (업체명 정규화/중복 검사 공통)
+ */
+export const COMPANY_SUFFIX_REGEX = /\((?:주|유|합|사|재|특|협|공|사단|재단|법인)\)|(?:주|유|합|사|재)식회사/g;
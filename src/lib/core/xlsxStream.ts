@@ -0,0 +1,662 @@
+import { DataRow } from '@/types';
+
+/**
+ * XLSX 스트리밍 읽기/쓰기
+ * SheetJS/ExcelJS는 통합 문서 전체를 메모리에 올린 뒤 변환하므로, 큰 시트에서는 원본 바이트 + 통합 문서 + 행 배열이 동시에 존재합니다.
+ * 읽기는 zip 항목을 Blob.slice + DecompressionStream으로 풀면서 <row> 단위로 행을 만들어 넘기고,
+ * 쓰기는 행을 시트 XML로 바로 직렬화해 CompressionStream으로 압축하면서 출력(sink)에 흘려보냅니다 (쓰기 전용).
+ * 행 변환 규칙은 SheetJS `sheet_to_json` 기본값(첫 행 헤더, 빈 셀 키 생략, 빈 행 건너뛰기)과 같습니다.
+ * 압축 스트림 API가 없는 환경에서는 호출 측이 기존 SheetJS/ExcelJS 경로를 사용합니다.
+ */
+
+// 한 번에 넘기는 행 수
+export const XLSX_ROW_BATCH = 5000;
+
+// 셀 스타일 번호 (styles.xml의 cellXfs 순서)
+export const XLSX_STYLE_NONE = 0;
+export const XLSX_STYLE_MODIFIED = 1;   // 노란색 + 테두리 (수정됨)
+export const XLSX_STYLE_CLEARED = 2;    // 붉은색 + 테두리 (가비지 제거됨)
+
+/**
+ * 스트리밍 읽기/쓰기에 필요한 API(압축 스트림, 텍스트 디코더 스트림) 지원 여부
+ */
+export function supportsXlsxStreaming(): boolean {
+    return typeof DecompressionStream !== 'undefined'
+        && typeof CompressionStream !== 'undefined'
+        && typeof TextDecoderStream !== 'undefined';
+}
+
+// ---------------------------------------------------------------------------
+// zip 읽기
+// ---------------------------------------------------------------------------
+
+interface ZipEntry {
+    method: number;
+    compressedSize: number;
+    size: number;           // 압축을 푼 크기
+    localOffset: number;
+}
+
+async function readView(blob: Blob, start: number, end: number): Promise<DataView> {
+    return new DataView(await blob.slice(start, end).arrayBuffer());
+}
+
+/**
+ * 파일 끝의 중앙 디렉터리만 읽어 항목 위치를 구합니다. (zip64는 지원하지 않음)
+ */
+async function readZipEntries(blob: Blob): Promise<Map<string, ZipEntry>> {
+    const tailStart = Math.max(0, blob.size - 22 - 0xffff);
+    const tail = await readView(blob, tailStart, blob.size);
+    let eocd = -1;
+    for (let i = tail.byteLength - 22; i >= 0; i--) {
+        if (tail.getUint32(i, true) === 0x06054b50) { eocd = i; break; }
+    }
+    if (eocd < 0) throw new Error('Invalid XLSX file');
+
+    const count = tail.getUint16(eocd + 10, true);
+    const dirSize = tail.getUint32(eocd + 12, true);
+    const dirOffset = tail.getUint32(eocd + 16, true);
+    if (dirOffset === 0xffffffff) throw new Error('ZIP64 XLSX is not supported');
+
+    const dir = await readView(blob, dirOffset, dirOffset + dirSize);
+    const decoder = new TextDecoder();
+    const entries = new Map<string, ZipEntry>();
+    let p = 0;
+    for (let i = 0; i < count; i++) {
+        if (dir.getUint32(p, true) !== 0x02014b50) throw new Error('Invalid XLSX file');
+        const nameLength = dir.getUint16(p + 28, true);
+        const name = decoder.decode(new Uint8Array(dir.buffer, dir.byteOffset + p + 46, nameLength));
+        entries.set(name, {
+            method: dir.getUint16(p + 10, true),
+            compressedSize: dir.getUint32(p + 20, true),
+            size: dir.getUint32(p + 24, true),
+            localOffset: dir.getUint32(p + 42, true),
+        });
+        p += 46 + nameLength + dir.getUint16(p + 30, true) + dir.getUint16(p + 32, true);
+    }
+    return entries;
+}
+
+/**
+ * zip 항목 하나를 압축을 풀면서 문자열 스트림으로 엽니다.
+ */
+async function openEntry(blob: Blob, entry: ZipEntry): Promise<ReadableStream<string>> {
+    const header = await readView(blob, entry.localOffset, entry.localOffset + 30);
+    const start = entry.localOffset + 30 + header.getUint16(26, true) + header.getUint16(28, true);
+    if (entry.method !== 0 && entry.method !== 8) throw new Error('Unsupported XLSX compression');
+    const raw = blob.slice(start, start + entry.compressedSize).stream();
+    const bytes = entry.method === 8 ? raw.pipeThrough(new DecompressionStream('deflate-raw')) : raw;
+    return bytes.pipeThrough(new TextDecoderStream());
+}
+
+async function readEntryText(blob: Blob, entry: ZipEntry): Promise<string> {
+    const reader = (await openEntry(blob, entry)).getReader();
+    let text = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) return text;
+        text += value;
+    }
+}
+
+// ---------------------------------------------------------------------------
+// XML 조각 해석
+// ---------------------------------------------------------------------------
+
+const TAG_END_CHARS = ' \t\r\n>/';
+
+function findTag(buf: string, open: string, from: number): number {
+    for (let i = buf.indexOf(open, from); i >= 0; i = buf.indexOf(open, i + 1)) {
+        const next = buf[i + open.length];
+        // 태그 이름 뒤 글자가 아직 도착하지 않았으면 여기서 멈춤 (다음 조각과 이어서 판단)
+        if (next === undefined || TAG_END_CHARS.includes(next)) return i;
+    }
+    return -1;
+}
+
+/**
+ * 문자열 스트림에서 <tag ...>...</tag> 요소를 도착하는 대로 하나씩 꺼냅니다. (같은 이름의 중첩 요소는 없다고 가정)
+ */
+async function* scanElements(stream: ReadableStream<string>, tag: string): AsyncGenerator<string> {
+    const reader = stream.getReader();
+    const open = `<${tag}`;
+    const close = `</${tag}>`;
+    let buf = '';
+    let done = false;
+    for (;;) {
+        let pos = 0;
+        for (;;) {
+            const start = findTag(buf, open, pos);
+            if (start < 0 || start + open.length >= buf.length) {
+                pos = start < 0 ? Math.max(pos, buf.length - open.length) : start;
+                break;
+            }
+            const gt = buf.indexOf('>', start);
+            if (gt < 0) { pos = start; break; }
+            let end = gt + 1;
+            if (buf[gt - 1] !== '/') {
+                const closeAt = buf.indexOf(close, gt);
+                if (closeAt < 0) { pos = start; break; }
+                end = closeAt + close.length;
+            }
+            yield buf.slice(start, end);
+            pos = end;
+        }
+        buf = buf.slice(pos);
+        if (done) return;
+        const chunk = await reader.read();
+        if (chunk.done) done = true;
+        else buf += chunk.value;
+    }
+}
+
+const NUMERIC_ENTITY_REGEX = /&#(x[0-9a-fA-F]+|\d+);/g;
+// 엑셀이 XML에 쓸 수 없는 문자를 표기하는 방식 (_x000D_ 등)
+const ESCAPED_CHAR_REGEX = /_x([0-9a-fA-F]{4})_/g;
+
+function unescapeXml(text: string): string {
+    if (text.includes('&')) {
+        if (text.includes('&#')) {
+            text = text.replace(NUMERIC_ENTITY_REGEX, (_, code: string) =>
+                String.fromCodePoint(code[0] === 'x' ? parseInt(code.slice(1), 16) : parseInt(code, 10)));
+        }
+        text = text.replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&quot;/g, '"').replace(/&apos;/g, "'").replace(/&amp;/g, '&');
+    }
+    if (text.includes('_x')) text = text.replace(ESCAPED_CHAR_REGEX, (_, hex) => String.fromCharCode(parseInt(hex, 16)));
+    return text;
+}
+
+const TEXT_REGEX = /<t(?:\s[^>]*)?>([\s\S]*?)<\/t>/g;
+const PHONETIC_REGEX = /<rPh[\s>][\s\S]*?<\/rPh>/g;
+
+/**
+ * <si> 또는 <is> 안의 텍스트 (서식 있는 텍스트는 이어 붙이고, 후리가나(rPh)는 제외)
+ */
+function richText(xml: string): string {
+    if (xml.includes('<rPh')) xml = xml.replace(PHONETIC_REGEX, '');
+    let text = '';
+    TEXT_REGEX.lastIndex = 0;
+    for (let m = TEXT_REGEX.exec(xml); m; m = TEXT_REGEX.exec(xml)) text += m[1];
+    return unescapeXml(text);
+}
+
+function attr(xml: string, name: string): string | null {
+    const m = new RegExp(`\\s${name}="([^"]*)"`).exec(xml);
+    return m ? m[1] : null;
+}
+
+function columnIndex(ref: string): number {
+    let col = 0;
+    for (let i = 0; i < ref.length; i++) {
+        const code = ref.charCodeAt(i);
+        if (code < 65 || code > 90) break;
+        col = col * 26 + (code - 64);
+    }
+    return col - 1;
+}
+
+const CELL_REGEX = /<c(?=[\s>/])([^>]*?)(?:\/>|>([\s\S]*?)<\/c>)/g;
+const CELL_REF_REGEX = /\sr="([A-Z]+)\d*"/;
+const CELL_TYPE_REGEX = /\st="(\w+)"/;
+const VALUE_REGEX = /<v(?:\s[^>]*)?>([\s\S]*?)<\/v>/;
+
+/**
+ * <row> 요소의 셀을 (컬럼 번호, 값) 쌍으로 해석합니다. 값이 없는 셀과 오류 셀은 건너뜁니다.
+ */
+function parseRowCells(xml: string, sharedStrings: string[], onCell: (col: number, value: string | number | boolean) => void) {
+    let col = -1;
+    CELL_REGEX.lastIndex = 0;
+    for (let m = CELL_REGEX.exec(xml); m; m = CELL_REGEX.exec(xml)) {
+        const attrs = m[1];
+        const ref = CELL_REF_REGEX.exec(attrs);
+        col = ref ? columnIndex(ref[1]) : col + 1;
+        const body = m[2];
+        if (!body) continue;
+        const type = CELL_TYPE_REGEX.exec(attrs)?.[1] || 'n';
+        if (type === 'inlineStr') {
+            onCell(col, richText(body));
+            continue;
+        }
+        const raw = VALUE_REGEX.exec(body);
+        if (!raw) continue;
+        switch (type) {
+            case 's': onCell(col, sharedStrings[parseInt(raw[1], 10)] ?? ''); break;
+            case 'b': onCell(col, raw[1] === '1'); break;
+            case 'e': break;
+            case 'n': onCell(col, parseFloat(raw[1])); break;
+            default: onCell(col, unescapeXml(raw[1]));   // str(수식 문자열), d(ISO 날짜)
+        }
+    }
+}
+
+function resolveTarget(target: string): string {
+    return target.startsWith('/') ? target.slice(1) : `xl/${target.replace(/^\.\//, '')}`;
+}
+
+/**
+ * 시트 목록(통합 문서 순서의 이름과 zip 경로)과 공유 문자열 표의 zip 경로를 구합니다.
+ */
+async function locateParts(blob: Blob, entries: Map<string, ZipEntry>): Promise<{ sheets: { name: string; path: string }[]; sharedStrings: string | null }> {
+    const workbook = entries.get('xl/workbook.xml');
+    const rels = entries.get('xl/_rels/workbook.xml.rels');
+    const fallback = [{ name: 'Sheet1', path: 'xl/worksheets/sheet1.xml' }];
+    let sharedStrings: string | null = entries.has('xl/sharedStrings.xml') ? 'xl/sharedStrings.xml' : null;
+    if (!workbook || !rels) return { sheets: fallback, sharedStrings };
+
+    const relXml = await readEntryText(blob, rels);
+    const targets = new Map<string, string>();
+    for (const m of relXml.matchAll(/<Relationship\s[^>]*>/g)) {
+        const id = attr(m[0], 'Id');
+        const target = attr(m[0], 'Target');
+        if (!id || !target) continue;
+        targets.set(id, resolveTarget(target));
+        if ((attr(m[0], 'Type') || '').endsWith('/sharedStrings')) sharedStrings = resolveTarget(target);
+    }
+    const sheets: { name: string; path: string }[] = [];
+    for (const m of (await readEntryText(blob, workbook)).matchAll(/<sheet\s[^>]*>/g)) {
+        const relId = /\s[\w]+:id="([^"]+)"/.exec(m[0]);
+        if (relId && targets.has(relId[1])) {
+            sheets.push({ name: unescapeXml(attr(m[0], 'name') || ''), path: targets.get(relId[1]) as string });
+        }
+    }
+    return { sheets: sheets.length > 0 ? sheets : fallback, sharedStrings };
+}
+
+/**
+ * 통합 문서 시트 정보 (size는 압축을 푼 시트 XML 크기로, 일괄 정제의 작업 순서를 정할 때 씀)
+ */
+export interface XlsxSheetInfo {
+    name: string;
+    size: number;
+}
+
+/**
+ * XLSX 파일의 시트 목록을 통합 문서 순서로 구합니다. (zip 중앙 디렉터리와 workbook.xml만 읽음)
+ */
+export async function listXlsxSheets(blob: Blob): Promise<XlsxSheetInfo[]> {
+    const entries = await readZipEntries(blob);
+    const { sheets } = await locateParts(blob, entries);
+    return sheets.filter(s => entries.has(s.path)).map(s => ({ name: s.name, size: (entries.get(s.path) as ZipEntry).size }));
+}
+
+/**
+ * SheetJS `sheet_to_json`과 같은 규칙으로 헤더 이름을 붙입니다. (빈 칸은 __EMPTY, 중복은 _1, _2 ...)
+ */
+function createHeaderNamer() {
+    const counts = new Map<string, number>();
+    return (value: string): string => {
+        let counter = counts.get(value) || 0;
+        if (!counter) {
+            counts.set(value, 1);
+            return value;
+        }
+        let name: string;
+        do { name = `${value}_${counter++}`; } while (counts.has(name));
+        counts.set(value, counter);
+        counts.set(name, 1);
+        return name;
+    };
+}
+
+/**
+ * XLSX 파일의 시트를 행 단위로 읽어 batchSize 행씩 onRows로 넘깁니다. sheetName이 없으면 첫 번째 시트를 읽습니다.
+ * 메모리에는 공유 문자열 표와 현재 배치만 유지됩니다.
+ */
+export async function streamXlsxRows(blob: Blob, onRows: (rows: DataRow[]) => void, batchSize: number = XLSX_ROW_BATCH, sheetName?: string): Promise<void> {
+    const entries = await readZipEntries(blob);
+    const parts = await locateParts(blob, entries);
+    const sheet = sheetName === undefined ? parts.sheets[0] : parts.sheets.find(s => s.name === sheetName);
+    const sheetEntry = sheet && entries.get(sheet.path);
+    if (!sheetEntry) throw new Error('Worksheet not found');
+
+    const sharedStrings: string[] = [];
+    const sstEntry = parts.sharedStrings ? entries.get(parts.sharedStrings) : undefined;
+    if (sstEntry) {
+        for await (const si of scanElements(await openEntry(blob, sstEntry), 'si')) sharedStrings.push(richText(si));
+    }
+
+    // 시트 범위(dimension)가 있으면 헤더 행의 빈 칸도 SheetJS처럼 __EMPTY 컬럼으로 취급
+    const stream = await openEntry(blob, sheetEntry);
+    const [dimensionStream, rowStream] = stream.tee();
+    const dimension = await readDimension(dimensionStream);
+
+    const nameHeader = createHeaderNamer();
+    let headers: string[] | null = null;
+    let firstCol = 0;
+    let batch: DataRow[] = [];
+
+    for await (const rowXml of scanElements(rowStream, 'row')) {
+        if (!headers) {
+            const values: (string | number | boolean)[] = [];
+            let minCol = Infinity;
+            parseRowCells(rowXml, sharedStrings, (col, value) => {
+                values[col] = value;
+                minCol = Math.min(minCol, col);
+            });
+            if (minCol === Infinity) continue;
+            firstCol = dimension ? Math.min(dimension.first, minCol) : minCol;
+            const lastCol = Math.max(values.length - 1, dimension ? dimension.last : 0);
+            headers = [];
+            for (let c = firstCol; c <= lastCol; c++) {
+                headers[c - firstCol] = nameHeader(values[c] === undefined ? '__EMPTY' : String(values[c]));
+            }
+            continue;
+        }
+
+        const row: DataRow = {};
+        let empty = true;
+        const hdr = headers;
+        parseRowCells(rowXml, sharedStrings, (col, value) => {
+            const idx = col - firstCol;
+            if (idx < 0) return;
+            while (hdr.length <= idx) hdr.push(nameHeader('__EMPTY'));
+            row[hdr[idx]] = value;
+            empty = false;
+        });
+        if (empty) continue;
+        batch.push(row);
+        if (batch.length >= batchSize) {
+            onRows(batch);
+            batch = [];
+        }
+    }
+    if (batch.length > 0) onRows(batch);
+}
+
+/**
+ * 시트 앞부분에서 <dimension ref="A1:H100"/>의 컬럼 범위를 읽습니다. (sheetData 시작 전까지만 확인)
+ */
+async function readDimension(stream: ReadableStream<string>): Promise<{ first: number; last: number } | null> {
+    const reader = stream.getReader();
+    let head = '';
+    try {
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            head += value;
+            if (head.includes('<sheetData')) break;
+        }
+    } finally {
+        reader.cancel().catch(() => { });
+    }
+    const m = /<dimension\s[^>]*ref="([A-Z]+)\d*(?::([A-Z]+)\d*)?"/.exec(head);
+    if (!m) return null;
+    return { first: columnIndex(m[1]), last: columnIndex(m[2] || m[1]) };
+}
+
+// ---------------------------------------------------------------------------
+// zip 쓰기
+// ---------------------------------------------------------------------------
+
+/**
+ * 압축된 바이트를 받아 가는 출력 (파일 스트림, Blob 조각 목록 등)
+ */
+export interface ByteSink {
+    write(chunk: Uint8Array): Promise<void> | void;
+}
+
+const CRC_TABLE = (() => {
+    const table = new Uint32Array(256);
+    for (let n = 0; n < 256; n++) {
+        let c = n;
+        for (let k = 0; k < 8; k++) c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+        table[n] = c >>> 0;
+    }
+    return table;
+})();
+
+function crc32(crc: number, bytes: Uint8Array): number {
+    let c = crc ^ 0xffffffff;
+    for (let i = 0; i < bytes.length; i++) c = CRC_TABLE[(c ^ bytes[i]) & 0xff] ^ (c >>> 8);
+    return (c ^ 0xffffffff) >>> 0;
+}
+
+interface CentralRecord {
+    name: Uint8Array;
+    crc: number;
+    compressedSize: number;
+    size: number;
+    offset: number;
+}
+
+/**
+ * 항목을 순서대로 압축하며 바로 내보내는 zip 작성기
+ * 크기와 CRC는 항목 뒤의 데이터 디스크립터에 기록하므로 내용 전체를 모아 둘 필요가 없습니다.
+ * XLSX 작성기 외에 일괄 정제 결과 묶음(batch.ts)도 이 작성기로 만듭니다.
+ */
+export class ZipStreamWriter {
+    private offset = 0;
+    private records: CentralRecord[] = [];
+    private current: {
+        record: CentralRecord;
+        writer: WritableStreamDefaultWriter<BufferSource>;
+        pump: Promise<void>;
+    } | null = null;
+    private encoder = new TextEncoder();
+
+    constructor(private sink: ByteSink) { }
+
+    private async emit(bytes: Uint8Array) {
+        await this.sink.write(bytes);
+        this.offset += bytes.length;
+    }
+
+    async begin(name: string) {
+        const nameBytes = this.encoder.encode(name);
+        const header = new DataView(new ArrayBuffer(30));
+        header.setUint32(0, 0x04034b50, true);
+        header.setUint16(4, 20, true);              // 필요 버전 2.0
+        header.setUint16(6, 0x0808, true);          // 데이터 디스크립터 사용 + UTF-8 이름
+        header.setUint16(8, 8, true);               // deflate
+        header.setUint16(12, 0x21, true);           // 1980-01-01
+        header.setUint16(26, nameBytes.length, true);
+        const record: CentralRecord = { name: nameBytes, crc: 0, compressedSize: 0, size: 0, offset: this.offset };
+        await this.emit(new Uint8Array(header.buffer));
+        await this.emit(nameBytes);
+
+        const compressor = new CompressionStream('deflate-raw');
+        const reader = compressor.readable.getReader();
+        const pump = (async () => {
+            for (;;) {
+                const { done, value } = await reader.read();
+                if (done) return;
+                record.compressedSize += value.length;
+                await this.emit(value);
+            }
+        })();
+        this.current = { record, writer: compressor.writable.getWriter(), pump };
+    }
+
+    async write(text: string) {
+        if (!this.current || !text) return;
+        const bytes = this.encoder.encode(text);
+        this.current.record.crc = crc32(this.current.record.crc, bytes);
+        this.current.record.size += bytes.length;
+        await this.current.writer.write(bytes);
+    }
+
+    async end() {
+        if (!this.current) return;
+        const { record, writer, pump } = this.current;
+        this.current = null;
+        await writer.close();
+        await pump;
+        const descriptor = new DataView(new ArrayBuffer(16));
+        descriptor.setUint32(0, 0x08074b50, true);
+        descriptor.setUint32(4, record.crc, true);
+        descriptor.setUint32(8, record.compressedSize, true);
+        descriptor.setUint32(12, record.size, true);
+        await this.emit(new Uint8Array(descriptor.buffer));
+        if (record.size > 0xffffffff || this.offset > 0xffffffff) throw new Error('XLSX output exceeds 4GB');
+        this.records.push(record);
+    }
+
+    async add(name: string, text: string) {
+        await this.begin(name);
+        await this.write(text);
+        await this.end();
+    }
+
+    async close() {
+        const dirOffset = this.offset;
+        for (const r of this.records) {
+            const entry = new DataView(new ArrayBuffer(46));
+            entry.setUint32(0, 0x02014b50, true);
+            entry.setUint16(4, 20, true);
+            entry.setUint16(6, 20, true);
+            entry.setUint16(8, 0x0808, true);
+            entry.setUint16(10, 8, true);
+            entry.setUint16(14, 0x21, true);
+            entry.setUint32(16, r.crc, true);
+            entry.setUint32(20, r.compressedSize, true);
+            entry.setUint32(24, r.size, true);
+            entry.setUint16(28, r.name.length, true);
+            entry.setUint32(42, r.offset, true);
+            await this.emit(new Uint8Array(entry.buffer));
+            await this.emit(r.name);
+        }
+        const end = new DataView(new ArrayBuffer(22));
+        end.setUint32(0, 0x06054b50, true);
+        end.setUint16(8, this.records.length, true);
+        end.setUint16(10, this.records.length, true);
+        end.setUint32(12, this.offset - dirOffset, true);
+        end.setUint32(16, dirOffset, true);
+        await this.emit(new Uint8Array(end.buffer));
+    }
+}
+
+// ---------------------------------------------------------------------------
+// XLSX 쓰기
+// ---------------------------------------------------------------------------
+
+const XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n';
+const MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main';
+const REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships';
+const PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships';
+
+const CONTENT_TYPES = `${XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">`
+    + '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    + '<Default Extension="xml" ContentType="application/xml"/>'
+    + '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    + '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    + '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    + '</Types>';
+
+const ROOT_RELS = `${XML_HEADER}<Relationships xmlns="${PKG_REL_NS}">`
+    + `<Relationship Id="rId1" Type="${REL_NS}/officeDocument" Target="xl/workbook.xml"/>`
+    + '</Relationships>';
+
+const WORKBOOK_RELS = `${XML_HEADER}<Relationships xmlns="${PKG_REL_NS}">`
+    + `<Relationship Id="rId1" Type="${REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>`
+    + `<Relationship Id="rId2" Type="${REL_NS}/styles" Target="styles.xml"/>`
+    + '</Relationships>';
+
+// 하이라이트 색상은 기존 ExcelJS 내보내기와 동일 (노란색 FFFFF9C4, 붉은색 FFFFCDD2, 얇은 테두리)
+const STYLES = `${XML_HEADER}<styleSheet xmlns="${MAIN_NS}">`
+    + '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    + '<fills count="4"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill>'
+    + '<fill><patternFill patternType="solid"><fgColor rgb="FFFFF9C4"/></patternFill></fill>'
+    + '<fill><patternFill patternType="solid"><fgColor rgb="FFFFCDD2"/></patternFill></fill></fills>'
+    + '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    + '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border></borders>'
+    + '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    + '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    + '<xf numFmtId="0" fontId="0" fillId="2" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
+    + '<xf numFmtId="0" fontId="0" fillId="3" borderId="1" xfId="0" applyFill="1" applyBorder="1"/></cellXfs>'
+    + '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    + '</styleSheet>';
+
+const ESCAPE_TEST_REGEX = /[<>&"\x00-\x08\x0B\x0C\x0E-\x1F\uFFFE\uFFFF]|_x[0-9a-fA-F]{4}_/;
+// XML에 쓸 수 없는 제어 문자는 엑셀 방식(_xHHHH_)으로 표기하고, 원래 있던 _xHHHH_ 문자열은 _x005F_로 보호
+const INVALID_XML_REGEX = /[\x00-\x08\x0B\x0C\x0E-\x1F\uFFFE\uFFFF]|_x[0-9a-fA-F]{4}_/;
+
+function escapeXml(text: string): string {
+    if (!ESCAPE_TEST_REGEX.test(text)) return text;
+    if (INVALID_XML_REGEX.test(text)) {
+        text = text
+            .replace(ESCAPED_CHAR_REGEX, '_x005F_x$1_')
+            .replace(/[\x00-\x08\x0B\x0C\x0E-\x1F\uFFFE\uFFFF]/g, c => `_x${c.charCodeAt(0).toString(16).toUpperCase().padStart(4, '0')}_`);
+    }
+    return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+}
+
+function columnName(index: number): string {
+    let name = '';
+    for (let n = index + 1; n > 0; n = Math.floor((n - 1) / 26)) name = String.fromCharCode(65 + ((n - 1) % 26)) + name;
+    return name;
+}
+
+function cellXml(ref: string, value: DataRow[string] | undefined, style: number): string {
+    const s = style ? ` s="${style}"` : '';
+    if (value === null || value === undefined) return style ? `<c r="${ref}"${s}/>` : '';
+    if (typeof value === 'number' && Number.isFinite(value)) return `<c r="${ref}"${s}><v>${value}</v></c>`;
+    if (typeof value === 'boolean') return `<c r="${ref}"${s} t="b"><v>${value ? 1 : 0}</v></c>`;
+    const text = String(value);
+    const space = /^\s|\s$/.test(text) ? ' xml:space="preserve"' : '';
+    return `<c r="${ref}"${s} t="inlineStr"><is><t${space}>${escapeXml(text)}</t></is></c>`;
+}
+
+export interface XlsxWriterOptions {
+    sheetName?: string;
+    columnWidth?: number;   // 모든 컬럼에 적용할 너비 (없으면 엑셀 기본값)
+}
+
+/**
+ * 쓰기 전용 XLSX 작성기
+ * 헤더 행을 쓴 뒤 writeRows로 받은 행을 즉시 시트 XML로 바꿔 압축/출력하므로, 메모리에는 현재 배치만 남습니다.
+ * 문자열은 공유 문자열 표 대신 인라인 문자열로 기록합니다.
+ */
+export class XlsxStreamWriter {
+    private zip: ZipStreamWriter;
+    private refs: string[];
+    private rowNumber = 1;
+
+    constructor(sink: ByteSink, private headers: string[], private options: XlsxWriterOptions = {}) {
+        this.zip = new ZipStreamWriter(sink);
+        this.refs = headers.map((_, i) => columnName(i));
+    }
+
+    async open() {
+        const sheetName = escapeXml(this.options.sheetName || 'Sheet1');
+        await this.zip.add('[Content_Types].xml', CONTENT_TYPES);
+        await this.zip.add('_rels/.rels', ROOT_RELS);
+        await this.zip.add('xl/workbook.xml', `${XML_HEADER}<workbook xmlns="${MAIN_NS}" xmlns:r="${REL_NS}">`
+            + `<sheets><sheet name="${sheetName}" sheetId="1" r:id="rId1"/></sheets></workbook>`);
+        await this.zip.add('xl/_rels/workbook.xml.rels', WORKBOOK_RELS);
+        await this.zip.add('xl/styles.xml', STYLES);
+
+        await this.zip.begin('xl/worksheets/sheet1.xml');
+        let head = `${XML_HEADER}<worksheet xmlns="${MAIN_NS}" xmlns:r="${REL_NS}">`;
+        if (this.options.columnWidth && this.headers.length > 0) {
+            head += `<cols><col min="1" max="${this.headers.length}" width="${this.options.columnWidth}" customWidth="1"/></cols>`;
+        }
+        head += '<sheetData>';
+        head += `<row r="1">${this.headers.map((h, i) => cellXml(`${this.refs[i]}1`, h, XLSX_STYLE_NONE)).join('')}</row>`;
+        await this.zip.write(head);
+    }
+
+    /**
+     * 데이터 행을 이어서 기록합니다.
+     * @param styleOf (선택) 셀 스타일 번호 조회 (rowIndex: 데이터 행 번호(0부터), col: headers 기준 컬럼 번호)
+     */
+    async writeRows(rows: DataRow[], styleOf?: (rowIndex: number, col: number) => number) {
+        const { headers, refs } = this;
+        let xml = '';
+        for (const row of rows) {
+            const r = ++this.rowNumber;
+            const rowIndex = r - 2;
+            xml += `<row r="${r}">`;
+            for (let c = 0; c < headers.length; c++) {
+                xml += cellXml(`${refs[c]}${r}`, row[headers[c]], styleOf ? styleOf(rowIndex, c) : XLSX_STYLE_NONE);
+            }
+            xml += '</row>';
+        }
+        await this.zip.write(xml);
+    }
+
+    async close() {
+        await this.zip.write('</sheetData></worksheet>');
+        await this.zip.end();
+        await this.zip.close();
+    }
+}
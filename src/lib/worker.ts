@@ -1,49 +1,52 @@
-import { DataRow, ProcessingOptions, ColumnSpecificOptions } from '@/types';
-import { processDataLocal, applyColumnOptions, restoreLockedColumns } from './core/processors';
-import { detectDataIssues, calculateDiffStats } from './core/analyzers';
+import { DataIssue } from '@/types';
+import { processShard, encodeShardResult, ShardTask, ShardRequest, ShardResultMessage } from './core/sharding';
+import { CleaningProfile } from './core/profiler';
+import { DataTable } from './core/table';
+import { detectDuplicateIssue } from './core/dedup';
 
 // Worker 메시지 타입 정의
 export type WorkerMessage =
-    | { type: 'PROCESS', data: DataRow[], prompt: string, options: ProcessingOptions, lockedColumns: string[], columnLimits: Record<string, number>, columnOptions: ColumnSpecificOptions };
+    // 워커 풀(workerPool.ts)의 샤드 단위 작업 (번호 배열은 복사 없이 넘어옴)
+    | { type: 'PROCESS_SHARD', task: ShardTask, request: ShardRequest }
+    // 정제 결과의 중복/유사 중복 행 검사 (기준 컬럼만 담은 테이블, core/dedup.ts)
+    | { type: 'DETECT_DUPLICATES', table: DataTable, keys: string[] };
 
 // Worker 응답 타입 정의
 export type WorkerResponse =
-    | { type: 'PROGRESS', progress: number, message: string }
-    | { type: 'COMPLETE', processedData: DataRow[], issues: any[], stats: any }
+    // 샤드 하나의 정제 결과 (메인 스레드는 앞에서부터 이어진 구간을 먼저 화면에 표시)
+    | { type: 'PARTIAL', result: ShardResultMessage }
+    // 프로파일링을 켠 요청의 샤드 프로파일 (같은 샤드의 PARTIAL 바로 앞에 보냄, core/profiler.ts)
+    | { type: 'PROFILE', index: number, profile: CleaningProfile }
+    // 중복 검사 결과 (중복이 없으면 null)
+    | { type: 'DUPLICATES', issue: DataIssue | null }
     | { type: 'ERROR', error: string };
 
-self.onmessage = async (e: MessageEvent<WorkerMessage>) => {
-    const { type, data, prompt, options, lockedColumns, columnLimits, columnOptions } = e.data;
-
-    if (type === 'PROCESS') {
+self.onmessage = (e: MessageEvent<WorkerMessage>) => {
+    if (e.data.type === 'DETECT_DUPLICATES') {
         try {
-            // 원본 데이터 백업 (잠금 복구용 - worker에 전달된 시점의 상태)
-            const originalDataBackup = data;
-            // =================================================================================
-            // [Local Engine] Unified Priority Engine
-            // Order: Lock > Column Option > NLP > Checkbox
-            // =================================================================================
-            self.postMessage({ type: 'PROGRESS', progress: 50, message: '⚡ 로컬 엔진으로 5대 원칙 기반 정제 중...' });
-
-            // 모든 위계 질서가 내부에서 처리됨 (Rule 1~5)
-            const currentData = processDataLocal(data, prompt, options, lockedColumns, columnOptions);
-
-            // Step 3: Issue Detection (Completed)
-            self.postMessage({ type: 'PROGRESS', progress: 95, message: '최종 리포트 생성 중...' });
-            const currentIssues = detectDataIssues(currentData, columnLimits, options);
-            const originalIssues = detectDataIssues(data, columnLimits, options);
-            const stats = calculateDiffStats(data, currentData, originalIssues.length, currentIssues.length);
-
-            // Step 5: Complete
-            self.postMessage({
-                type: 'COMPLETE',
-                processedData: currentData,
-                issues: currentIssues,
-                stats: stats
-            });
-
+            const response: WorkerResponse = { type: 'DUPLICATES', issue: detectDuplicateIssue(e.data.table, e.data.keys) };
+            self.postMessage(response);
         } catch (err: any) {
             self.postMessage({ type: 'ERROR', error: err.message || String(err) });
         }
+        return;
+    }
+    if (e.data.type !== 'PROCESS_SHARD') return;
+    try {
+        // =================================================================================
+        // [Local Engine] Unified Priority Engine
+        // Order: Lock > Column Option > NLP > Checkbox (processTableTracked 내부에서 처리)
+        // =================================================================================
+        const result = processShard(e.data.task, e.data.request);
+        if (result.profile) {
+            const profile: WorkerResponse = { type: 'PROFILE', index: result.index, profile: result.profile };
+            self.postMessage(profile);
+        }
+        const { message, transfer } = encodeShardResult(result);
+        // 정제 사전/이슈 행 목록/변경 비트셋은 버퍼째 넘김 (메인 스레드에서 값마다 역직렬화하지 않음)
+        const response: WorkerResponse = { type: 'PARTIAL', result: message };
+        self.postMessage(response, { transfer });
+    } catch (err: any) {
+        self.postMessage({ type: 'ERROR', error: err.message || String(err) });
     }
 };
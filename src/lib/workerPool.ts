@@ -0,0 +1,310 @@
+import { DataIssue, ProcessingOptions, ColumnLimits, ColumnSpecificOptions } from '@/types';
+import { WorkerMessage, WorkerResponse } from './worker';
+import { getShardCount, splitIntoShards, mergeShardResults, shardTaskTransferables, decodeShardResult, ShardPrefixAssembler, ShardPlan, ShardRequest, ShardResult, ShardTask, MergedResult, PartialResult } from './core/sharding';
+import { DataTable, getTableColumnIndex } from './core/table';
+import { getShardSizing } from './core/performance';
+import { CleaningProfile } from './core/profiler';
+
+/**
+ * 정제 워커 풀
+ * 입력을 샤드로 나눠 여러 Web Worker에 분배하고, 끝난 워커에 다음 샤드를 넘겨 모든 코어를 사용합니다.
+ * 결과는 샤드 순서대로 병합되므로 단일 워커 실행과 행 순서/이슈/통계가 동일합니다.
+ * 샤드는 구간에 등장하는 값만 사전에 남긴 사전 인코딩 테이블(table.ts)로 보내 전송량을 줄이고 번호 배열은 버퍼째 넘깁니다.
+ * 워커 결과는 사전/이슈 행 목록/변경 비트셋을 형식화 배열 버퍼로 받아(Transferable) 메인 스레드의 역직렬화 비용을 줄입니다.
+ * 샤드가 끝날 때마다(PARTIAL) 앞에서부터 이어진 구간의 결과를 onPartial로 넘겨 전체 완료 전에 화면에 표시합니다.
+ * 샤드 크기는 측정한 처리량으로 정합니다. (performance.ts, 측정 전이면 sharding.ts 기본값)
+ * 여러 시트를 일괄 정제할 때(runBatch)는 모든 시트의 샤드를 대기열 하나로 모아 큰 시트부터 나눠 줍니다.
+ * 작업에 profile을 켜면 워커가 샤드마다 보내는 PROFILE 메시지를 해당 샤드 결과에 붙여 병합합니다.
+ * 정제 결과의 중복 검사(detectDuplicates)는 정제 워커와 별도의 워커 하나에서 실행해 정제 취소/재시작과 서로 영향을 주지 않습니다.
+ */
+
+// 브라우저가 코어 수를 알려주지 않을 때의 기본값 (performance.ts와 동일)
+const DEFAULT_CORES = 4;
+const MAX_POOL_SIZE = 16;
+
+export interface PoolJob {
+    data: DataTable;
+    prompt: string;
+    options: ProcessingOptions;
+    lockedColumns: string[];
+    columnLimits: ColumnLimits;
+    columnOptions: ColumnSpecificOptions;
+    baselineIssues?: DataIssue[];   // 캐시된 원본 이슈 (있으면 워커는 정제 결과만 검사)
+    profile?: boolean;              // 규칙/단계별 프로파일 수집 (결과의 profile, core/profiler.ts)
+}
+
+export type PoolProgressHandler = (progress: number, message: string) => void;
+export type PoolPartialHandler = (partial: PartialResult) => void;
+
+/**
+ * 새 작업이 시작되어 이전 작업이 중단된 경우의 에러 (호출측에서 무시)
+ */
+export class PoolCancelledError extends Error {
+    constructor() {
+        super('정제 작업이 취소되었습니다.');
+        this.name = 'PoolCancelledError';
+    }
+}
+
+// 대기열의 샤드 하나 (job: runBatch의 작업 번호)
+interface QueuedShard {
+    task: ShardTask;
+    request: ShardRequest;
+    job: number;
+}
+
+function shardRequest(job: PoolJob): ShardRequest {
+    return {
+        prompt: job.prompt,
+        options: job.options,
+        lockedColumns: job.lockedColumns,
+        columnLimits: job.columnLimits,
+        columnOptions: job.columnOptions,
+        headers: job.data.headers,
+        scanOriginal: !job.baselineIssues,
+        profile: job.profile,
+    };
+}
+
+// 작업 크기 (일괄 정제의 샤드 순서 기준)
+function jobCost(job: PoolJob): number {
+    return job.data.rowCount * job.data.headers.length;
+}
+
+/**
+ * 워커 수: UI 스레드 몫으로 코어 하나를 남깁니다.
+ */
+export function getPoolSize(): number {
+    const cores = (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || DEFAULT_CORES;
+    return Math.max(1, Math.min(cores - 1, MAX_POOL_SIZE));
+}
+
+export class CleaningWorkerPool {
+    private workers: Worker[] = [];
+    private rejectCurrent: ((err: Error) => void) | null = null;
+    private duplicateWorker: Worker | null = null;
+    private rejectDuplicates: ((err: Error) => void) | null = null;
+
+    constructor(private createWorker: () => Worker, public readonly size: number = getPoolSize()) { }
+
+    /**
+     * 데이터를 샤드 단위로 정제합니다. 실행 중인 작업이 있으면 워커를 교체하고 이전 작업을 취소합니다.
+     * @param onProgress 진행률 (완료된 실제 행 수 기준)
+     * @param onPartial 앞에서부터 이어진 완료 구간이 늘어날 때마다 호출 (마지막 샤드가 끝나면 호출하지 않고 resolve)
+     */
+    run(job: PoolJob, onProgress?: PoolProgressHandler, onPartial?: PoolPartialHandler): Promise<MergedResult> {
+        this.cancel();
+
+        const { shardRows, firstShardRows } = getShardSizing();
+        const shards = splitIntoShards(job.data, getShardCount(job.data.rowCount, this.size, shardRows), firstShardRows);
+        const merge = (results: ShardResult[]) => mergeShardResults(results, job.data, shards, job.columnLimits, job.options, job.baselineIssues);
+        if (shards.length === 0) return Promise.resolve(merge([]));
+
+        const request = shardRequest(job);
+        const totalRows = job.data.rowCount;
+        onProgress?.(5, `⚡ 로컬 엔진으로 5대 원칙 기반 정제 중... (워커 ${Math.min(this.size, shards.length)}개)`);
+
+        const results: ShardResult[] = [];
+        const prefix = onPartial ? new ShardPrefixAssembler(job.data, shards) : null;
+        let doneRows = 0;
+        return this.execute(shards.map(({ task }) => ({ task, request, job: 0 })), (_, result) => {
+            results.push(result);
+            doneRows += result.rowCount;
+            onProgress?.(
+                5 + Math.round((doneRows / totalRows) * 90),
+                `⚡ 로컬 엔진으로 5대 원칙 기반 정제 중... (${doneRows.toLocaleString()} / ${totalRows.toLocaleString()}행)`
+            );
+            if (results.length < shards.length && prefix?.add(result)) onPartial?.(prefix.snapshot());
+        }).then(() => {
+            onProgress?.(95, '최종 리포트 생성 중...');
+            return merge(results);
+        });
+    }
+
+    /**
+     * 여러 작업(시트)을 한 번에 정제합니다. 실행 중인 작업이 있으면 취소합니다.
+     * 모든 작업의 샤드를 대기열 하나에 넣어 끝난 워커가 다음 샤드를 가져가므로, 큰 시트는 샤드로 나뉘어 여러 워커가 나눠 처리합니다.
+     * 샤드는 큰 작업(행 수 x 컬럼 수)부터 보내 마지막에 큰 작업 하나의 샤드만 남아 도는 일이 없게 합니다.
+     * @param onJobDone 작업의 모든 샤드가 끝나 병합될 때마다 호출 (jobs 기준 번호, 끝나는 순서는 jobs 순서와 다를 수 있음)
+     * @param onProgress 진행률 (전체 작업의 완료된 행 수 기준)
+     */
+    runBatch(jobs: PoolJob[], onJobDone: (index: number, result: MergedResult) => void, onProgress?: PoolProgressHandler): Promise<void> {
+        this.cancel();
+
+        const { shardRows } = getShardSizing();
+        const order = jobs.map((_, i) => i).sort((a, b) => jobCost(jobs[b]) - jobCost(jobs[a]));
+        const queue: QueuedShard[] = [];
+        // 작업별 샤드 계획과 아직 병합하지 않은 결과 (병합한 작업은 null로 비워 메모리 해제)
+        const pending: ({ shards: ShardPlan[]; results: ShardResult[] } | null)[] = jobs.map(() => null);
+        for (const i of order) {
+            const job = jobs[i];
+            // 미리보기가 없으므로 첫 샤드를 작게 자르지 않음
+            const shards = splitIntoShards(job.data, getShardCount(job.data.rowCount, this.size, shardRows), Infinity);
+            if (shards.length === 0) {
+                onJobDone(i, mergeShardResults([], job.data, shards, job.columnLimits, job.options, job.baselineIssues));
+                continue;
+            }
+            pending[i] = { shards, results: [] };
+            const request = shardRequest(job);
+            for (const { task } of shards) queue.push({ task, request, job: i });
+        }
+        if (queue.length === 0) return Promise.resolve();
+
+        const totalRows = jobs.reduce((sum, job) => sum + job.data.rowCount, 0);
+        let doneRows = 0;
+        onProgress?.(5, `⚡ ${jobs.length}개 시트 일괄 정제 중... (워커 ${Math.min(this.size, queue.length)}개)`);
+        return this.execute(queue, (shard, result) => {
+            doneRows += result.rowCount;
+            onProgress?.(
+                5 + Math.round((doneRows / totalRows) * 90),
+                `⚡ ${jobs.length}개 시트 일괄 정제 중... (${doneRows.toLocaleString()} / ${totalRows.toLocaleString()}행)`
+            );
+            const state = pending[shard.job];
+            if (!state) return;
+            state.results.push(result);
+            if (state.results.length < state.shards.length) return;
+            pending[shard.job] = null;
+            const job = jobs[shard.job];
+            onJobDone(shard.job, mergeShardResults(state.results, job.data, state.shards, job.columnLimits, job.options, job.baselineIssues));
+        });
+    }
+
+    /**
+     * 샤드 대기열을 워커들에 나눠 실행합니다. 끝난 워커에는 다음 샤드를 넘기고, 샤드 결과마다 onResult를 호출합니다.
+     * 모든 샤드가 끝나면 resolve하고, 워커 오류나 onResult의 예외가 있으면 워커를 종료하고 reject합니다.
+     */
+    private execute(queue: QueuedShard[], onResult: (shard: QueuedShard, result: ShardResult) => void): Promise<void> {
+        const workerCount = Math.min(this.size, queue.length);
+        while (this.workers.length < workerCount) this.workers.push(this.createWorker());
+
+        return new Promise<void>((resolve, reject) => {
+            this.rejectCurrent = reject;
+            // 워커마다 처리 중인 샤드 (워커는 한 번에 샤드 하나만 받음)
+            const inflight = new Map<Worker, QueuedShard>();
+            // PARTIAL 앞에 도착한 샤드 프로파일 (워커마다 샤드 하나씩만 처리하므로 워커 기준으로 보관)
+            const profiles = new Map<Worker, CleaningProfile>();
+            let next = 0;
+            let done = 0;
+
+            const dispatch = (worker: Worker) => {
+                if (next >= queue.length) return;
+                // 샤드 번호 배열은 워커로 넘어가므로 보낸 뒤에는 sourceCodes만 사용
+                const shard = queue[next++];
+                inflight.set(worker, shard);
+                const message: WorkerMessage = { type: 'PROCESS_SHARD', task: shard.task, request: shard.request };
+                worker.postMessage(message, shardTaskTransferables(shard.task));
+            };
+
+            const fail = (error: string) => {
+                this.terminateWorkers();
+                reject(new Error(error));
+            };
+
+            this.workers.slice(0, workerCount).forEach(worker => {
+                worker.onmessage = (e: MessageEvent<WorkerResponse>) => {
+                    const response = e.data;
+                    if (response.type === 'PARTIAL') {
+                        const shard = inflight.get(worker) as QueuedShard;
+                        const result = decodeShardResult(response.result);
+                        const profile = profiles.get(worker);
+                        if (profile) {
+                            result.profile = profile;
+                            profiles.delete(worker);
+                        }
+                        if (++done < queue.length) dispatch(worker);
+                        else this.rejectCurrent = null;
+                        try {
+                            onResult(shard, result);
+                        } catch (err: any) {
+                            fail(err.message || String(err));
+                            return;
+                        }
+                        if (done === queue.length) resolve();
+                    } else if (response.type === 'PROFILE') {
+                        profiles.set(worker, response.profile);
+                    } else if (response.type === 'ERROR') {
+                        fail(response.error);
+                    }
+                };
+                worker.onerror = (e: ErrorEvent) => fail(e.message || '워커 실행 중 오류가 발생했습니다.');
+                dispatch(worker);
+            });
+        });
+    }
+
+    /**
+     * 중복/유사 중복 행을 검사합니다. (core/dedup.ts의 detectDuplicateIssue를 워커에서 실행)
+     * 기준 컬럼만 담은 테이블을 복사해 보내며, 이전 검사가 끝나기 전에 다시 호출하면 이전 검사를 취소합니다.
+     */
+    detectDuplicates(table: DataTable, keys: string[]): Promise<DataIssue | null> {
+        this.cancelDuplicates();
+        const columnIndex = getTableColumnIndex(table);
+        const cols = keys.map(k => columnIndex.get(k)).filter((c): c is number => c !== undefined);
+        if (cols.length === 0 || table.rowCount < 2) return Promise.resolve(null);
+
+        // 번호 배열은 화면의 정제 결과와 공유하므로 넘기지 않고 복사
+        const subset: DataTable = { headers: cols.map(c => table.headers[c]), rowCount: table.rowCount, columns: cols.map(c => table.columns[c]) };
+        const message: WorkerMessage = { type: 'DETECT_DUPLICATES', table: subset, keys: subset.headers };
+        const worker = this.duplicateWorker ?? (this.duplicateWorker = this.createWorker());
+        return new Promise<DataIssue | null>((resolve, reject) => {
+            this.rejectDuplicates = reject;
+            const fail = (error: string) => {
+                this.rejectDuplicates = null;
+                this.terminateDuplicateWorker();
+                reject(new Error(error));
+            };
+            worker.onmessage = (e: MessageEvent<WorkerResponse>) => {
+                const response = e.data;
+                if (response.type === 'DUPLICATES') {
+                    this.rejectDuplicates = null;
+                    resolve(response.issue);
+                } else if (response.type === 'ERROR') {
+                    fail(response.error);
+                }
+            };
+            worker.onerror = (e: ErrorEvent) => fail(e.message || '워커 실행 중 오류가 발생했습니다.');
+            worker.postMessage(message);
+        });
+    }
+
+    /**
+     * 진행 중인 중복 검사를 취소합니다. (검사 워커를 종료해 중단)
+     */
+    cancelDuplicates() {
+        if (!this.rejectDuplicates) return;
+        const reject = this.rejectDuplicates;
+        this.rejectDuplicates = null;
+        this.terminateDuplicateWorker();
+        reject(new PoolCancelledError());
+    }
+
+    private terminateDuplicateWorker() {
+        this.duplicateWorker?.terminate();
+        this.duplicateWorker = null;
+    }
+
+    /**
+     * 실행 중인 작업을 취소합니다. (진행 중인 샤드는 워커를 종료해 중단)
+     */
+    cancel() {
+        if (!this.rejectCurrent) return;
+        const reject = this.rejectCurrent;
+        this.rejectCurrent = null;
+        this.workers.forEach(w => w.terminate());
+        this.workers = [];
+        reject(new PoolCancelledError());
+    }
+
+    terminate() {
+        this.terminateWorkers();
+        this.rejectDuplicates = null;
+        this.terminateDuplicateWorker();
+    }
+
+    // 정제 워커만 종료 (중복 검사 워커는 유지)
+    private terminateWorkers() {
+        this.rejectCurrent = null;
+        this.workers.forEach(w => w.terminate());
+        this.workers = [];
+    }
+}
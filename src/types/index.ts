@@ -67,8 +67,9 @@ export type DataIssue = {
     message: string;                  // 사용자에게 보여줄 메시지
     suggestion?: Partial<ProcessingOptions>; // 해결을 위한 추천 옵션
     promptSuggestion?: string;        // 자연어 처리를 위한 추천 프롬프트
-    fixType?: 'maxLength';            // 특정 수정 로직이 필요한 경우 (예: 길이 제한)
+    fixType?: 'maxLength' | 'duplicate'; // 특정 수정 로직이 필요한 경우 (예: 길이 제한, 중복 행)
     affectedRows?: number[];          // 해당 이슈가 발견된 행의 인덱스 목록
+    duplicateGroups?: number[][];     // 중복 행 그룹 목록 (fixType이 'duplicate'일 때, core/dedup.ts)
 };
 
 /**